@@ -1,8 +1,13 @@
 from app.crud.addresses.repositories import AddressRepository
 from app.crud.addresses.services import AddressServices
+from app.crud.postal_codes.repositories import PostalCodeRepository
 
 
 async def address_composer() -> AddressServices:
     address_repository = AddressRepository()
-    address_services = AddressServices(address_repository=address_repository)
+    postal_code_repository = PostalCodeRepository()
+    address_services = AddressServices(
+        address_repository=address_repository,
+        postal_code_repository=postal_code_repository,
+    )
     return address_services
@@ -0,0 +1,8 @@
+from app.crud.beer_types.repositories import BeerTypeRepository
+from app.crud.reference_data.services import ReferenceDataServices
+
+
+async def reference_data_composer() -> ReferenceDataServices:
+    repository = BeerTypeRepository()
+    services = ReferenceDataServices(beer_type_repository=repository)
+    return services
@@ -0,0 +1,8 @@
+from app.crud.sync.repositories import SyncRepository
+from app.crud.sync.services import SyncServices
+
+
+async def sync_composer() -> SyncServices:
+    repository = SyncRepository()
+    services = SyncServices(sync_repository=repository)
+    return services
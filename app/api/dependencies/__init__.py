@@ -1,4 +1,5 @@
 from .response import build_response
+from .if_match import if_match_version
 from .auth import decode_jwt
 from .company import (
     ensure_user_without_company,
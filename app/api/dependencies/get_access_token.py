@@ -4,6 +4,7 @@ from fastapi import Request
 
 from app.core.configs import get_environment, get_logger
 from app.core.exceptions.internal import InternalErrorException
+from app.core.metrics import record_cache
 from app.core.utils.http_client import HTTPClient
 from app.core.utils.utc_datetime import UTCDateTime
 
@@ -12,15 +13,28 @@ logger = get_logger(__name__)
 
 
 async def get_access_token(request: Request) -> str:
-    logger.info("Getting access token")
+    logger.debug("Getting access token")
 
     stored_access_token = request.app.state.access_token
 
-    if stored_access_token and UTCDateTime.now() < stored_access_token["expires_at"]:
-        logger.info("Using cached access token")
+    cache_hit = bool(
+        stored_access_token and UTCDateTime.now() < stored_access_token["expires_at"]
+    )
+    record_cache("access_token", hit=cache_hit)
+
+    if cache_hit:
+        logger.debug("Using cached access token")
         return f"Bearer {stored_access_token['access_token']}"
 
-    logger.info("Validating new access token from request headers")
+    logger.debug("Validating new access token from request headers")
+    access_token = issue_access_token()
+
+    request.app.state.access_token = access_token
+
+    return f"Bearer {access_token['access_token']}"
+
+
+def issue_access_token() -> dict:
     access_token = generate_new_access_token()
 
     expires_at = UTCDateTime.now() + timedelta(
@@ -28,9 +42,7 @@ async def get_access_token(request: Request) -> str:
     )
     access_token["expires_at"] = expires_at
 
-    request.app.state.access_token = access_token
-
-    return f"Bearer {access_token['access_token']}"
+    return access_token
 
 
 def generate_new_access_token() -> dict:
@@ -1,7 +1,33 @@
-import requests
+import asyncio
+import time
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
 
+import httpx
 
-def get_address_by_zip_code(zip_code: str) -> dict:
+from app.core.configs import get_environment
+from app.core.metrics import HTTP_CLIENT_DURATION
+
+_env = get_environment()
+
+# One client per event loop keeps the connection to ViaCEP alive between
+# lookups; httpx connections cannot be shared across loops.
+_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = WeakKeyDictionary()
+
+
+def _get_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+
+    if client is None:
+        client = _clients[loop] = httpx.AsyncClient(
+            base_url=_env.VIACEP_URL, timeout=_env.VIACEP_TIMEOUT
+        )
+
+    return client
+
+
+async def get_address_by_zip_code(zip_code: str) -> dict:
     """Fetch address data from ViaCEP service.
 
     Args:
@@ -9,8 +35,22 @@ def get_address_by_zip_code(zip_code: str) -> dict:
     Returns:
         Dict with address data as returned by ViaCEP.
     Raises:
-        requests.HTTPError if the remote service responds with error status.
+        httpx.HTTPError if the request times out or the remote service
+        responds with error status.
     """
-    response = requests.get(f"https://viacep.com.br/ws/{zip_code}/json/")
-    response.raise_for_status()
-    return response.json()
+    started = time.perf_counter()
+    status = "error"
+
+    try:
+        response = await _get_client().get(f"/{zip_code}/json/")
+        status = response.status_code
+        response.raise_for_status()
+        return response.json()
+
+    finally:
+        HTTP_CLIENT_DURATION.observe(
+            time.perf_counter() - started,
+            method="GET",
+            host=urlsplit(_env.VIACEP_URL).netloc,
+            status=status,
+        )
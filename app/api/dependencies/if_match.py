@@ -0,0 +1,21 @@
+"""
+    Module for the ``If-Match`` precondition
+"""
+from fastapi import Header
+
+from app.core.exceptions import BadRequestError
+
+
+async def if_match_version(if_match: str | None = Header(default=None)) -> int | None:
+    """Version the client last read, from ``If-Match: "3"`` (or ``W/"3"``).
+
+    Absent or ``*`` means the write is not conditional.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    tag = if_match.strip().removeprefix("W/").strip('"')
+    if not tag.isdigit():
+        raise BadRequestError(message="If-Match deve conter a versão do registro")
+
+    return int(tag)
@@ -7,6 +7,8 @@ from jwt import PyJWKClient, decode
 from jwt.exceptions import PyJWKClientError, DecodeError
 from app.api.exceptions.authentication_exceptions import UnauthorizedException
 from app.core.configs import get_environment
+from app.core.metrics import record_cache
+from app.core.utils.utc_datetime import UTCDateTime
 
 _env = get_environment()
 
@@ -30,6 +32,24 @@ class ValidateToken:
             ttl=3600,
         )
         self._lock = jwks_lock or Lock()
+        self.refreshed_at: UTCDateTime | None = None
+
+    @property
+    def cached_keys(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    def warm_up(self) -> int:
+        """Fetch the JWKS and cache every signing key before the first request."""
+        signing_keys = self.jwks_client.get_signing_keys()
+
+        with self._lock:
+            for jwk in signing_keys:
+                self._cache[jwk.key_id] = jwk.key
+
+        self.refreshed_at = UTCDateTime.now()
+
+        return len(signing_keys)
 
     async def verify(self, scopes: SecurityScopes, token: str) -> dict:
         if not token:
@@ -57,6 +77,8 @@ class ValidateToken:
         with self._lock:
             key = self._cache.get(kid)
 
+        record_cache("jwks", hit=key is not None)
+
         if key:
             return key
 
@@ -67,6 +89,8 @@ class ValidateToken:
             with self._lock:
                 self._cache[kid] = key
 
+            self.refreshed_at = UTCDateTime.now()
+
             return key
 
         except (PyJWKClientError, DecodeError) as err:
@@ -0,0 +1,53 @@
+import time
+
+from app.core.metrics import (
+    HTTP_REQUEST_DURATION,
+    MONGO_REQUEST_COMMANDS,
+    MONGO_REQUEST_DURATION,
+    start_request_stats,
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Per-route latency and MongoDB command counts for every HTTP request.
+
+    Implemented as a plain ASGI middleware so streaming responses are not
+    buffered and the timing covers the whole response.  Requests are labelled
+    with the route template (``/api/kegs/{keg_id}``), never the raw path.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_request_stats()
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+
+        finally:
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            method = scope["method"]
+
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                method=method,
+                route=route,
+                status=status_code,
+            )
+            MONGO_REQUEST_COMMANDS.observe(stats.commands, method=method, route=route)
+            MONGO_REQUEST_DURATION.observe(stats.duration, method=method, route=route)
@@ -0,0 +1,29 @@
+from app.core.configs import get_logger
+from app.core.db.query_recorder import record_queries
+
+_logger = get_logger(__name__)
+
+
+class NPlusOneMiddleware:
+    """Development guard logging repeated same-shape queries per request.
+
+    Only installed when ``DATABASE_DETECT_N_PLUS_ONE`` is enabled.
+    """
+
+    def __init__(self, app, threshold: int):
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with record_queries(threshold=self.threshold) as recorder:
+            await self.app(scope, receive, send)
+
+        if recorder.repeated():
+            route = getattr(scope.get("route"), "path", scope["path"])
+            _logger.warning(
+                f"N+1 queries on {scope['method']} {route}\n{recorder.report()}"
+            )
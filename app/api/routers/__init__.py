@@ -6,7 +6,10 @@ from .customers import customer_router
 from .cylinders import cylinder_router
 from .dashboard import dashboard_router
 from .extraction_kits import extraction_kit_router
+from .health import health_router
 from .kegs import keg_router
 from .payments import payment_router
+from .reference_data import reference_data_router
 from .reservations import reservation_router
+from .sync import sync_router
 from .users import user_router
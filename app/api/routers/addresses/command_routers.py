@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.composers.address_composite import address_composer
-from app.api.dependencies import build_response, require_user_company
-from app.api.shared_schemas.responses import MessageResponse
+from app.api.dependencies import build_response, if_match_version, require_user_company
+from app.api.shared_schemas.responses import ConflictResponse, MessageResponse
 from .schemas import AddressResponse
 from app.crud.addresses import Address, UpdateAddress, AddressServices
 from app.crud.companies.schemas import CompanyInDB
@@ -31,16 +31,17 @@ async def create_address(
 
 @router.put(
     "/addresses/{address_id}",
-    responses={200: {"model": AddressResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}},
+    responses={200: {"model": AddressResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}, 409: {"model": ConflictResponse}},
 )
 async def update_address(
     address_id: str,
     address: UpdateAddress,
     address_services: AddressServices = Depends(address_composer),
     company: CompanyInDB = Depends(require_user_company),
+    version: int | None = Depends(if_match_version),
 ):
     address_in_db = await address_services.update(
-        id=address_id, company_id=str(company.id), address=address
+        id=address_id, company_id=str(company.id), address=address, version=version
     )
     if not address_in_db:
         raise HTTPException(status_code=400, detail="Endereço não atualizado")
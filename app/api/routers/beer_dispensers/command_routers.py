@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.composers.beer_dispenser_composite import beer_dispenser_composer
-from app.api.dependencies import build_response, require_user_company
-from app.api.shared_schemas.responses import MessageResponse
+from app.api.dependencies import build_response, if_match_version, require_user_company
+from app.api.shared_schemas.responses import ConflictResponse, MessageResponse
 from .schemas import BeerDispenserResponse
 from app.crud.beer_dispensers import (
     BeerDispenser,
@@ -35,16 +35,20 @@ async def create_beer_dispenser(
 
 @router.put(
     "/beer-dispensers/{dispenser_id}",
-    responses={200: {"model": BeerDispenserResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}},
+    responses={200: {"model": BeerDispenserResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}, 409: {"model": ConflictResponse}},
 )
 async def update_beer_dispenser(
     dispenser_id: str,
     dispenser: UpdateBeerDispenser,
     services: BeerDispenserServices = Depends(beer_dispenser_composer),
     company: CompanyInDB = Depends(require_user_company),
+    version: int | None = Depends(if_match_version),
 ):
     dispenser_in_db = await services.update(
-        id=dispenser_id, company_id=str(company.id), dispenser=dispenser
+        id=dispenser_id,
+        company_id=str(company.id),
+        dispenser=dispenser,
+        version=version,
     )
     if not dispenser_in_db:
         raise HTTPException(status_code=400, detail="Chopeira não atualizada")
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.composers.beer_type_composite import beer_type_composer
-from app.api.dependencies import build_response, require_user_company
-from app.api.shared_schemas.responses import MessageResponse
+from app.api.dependencies import build_response, if_match_version, require_user_company
+from app.api.shared_schemas.responses import ConflictResponse, MessageResponse
 from .schemas import BeerTypeResponse
 from app.crud.beer_types import BeerType, UpdateBeerType, BeerTypeServices
 from app.crud.companies.schemas import CompanyInDB
@@ -31,16 +31,20 @@ async def create_beer_type(
 
 @router.put(
     "/beer-types/{beer_type_id}",
-    responses={200: {"model": BeerTypeResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}},
+    responses={200: {"model": BeerTypeResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}, 409: {"model": ConflictResponse}},
 )
 async def update_beer_type(
     beer_type_id: str,
     beer_type: UpdateBeerType,
     services: BeerTypeServices = Depends(beer_type_composer),
     company: CompanyInDB = Depends(require_user_company),
+    version: int | None = Depends(if_match_version),
 ):
     beer_type_in_db = await services.update(
-        id=beer_type_id, company_id=str(company.id), beer_type=beer_type
+        id=beer_type_id,
+        company_id=str(company.id),
+        beer_type=beer_type,
+        version=version,
     )
     if not beer_type_in_db:
         raise HTTPException(status_code=400, detail="Tipo de cerveja não atualizado")
@@ -3,12 +3,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from app.api.composers.company_composite import company_composer
 from app.api.dependencies import (
     build_response,
+    if_match_version,
     ensure_user_without_company,
     require_company_member,
     require_company_owner,
     decode_jwt,
 )
-from app.api.shared_schemas.responses import MessageResponse
+from app.api.shared_schemas.responses import ConflictResponse, MessageResponse
 from .schemas import CompanyResponse, SubscriptionResponse
 from app.crud.companies import (
     Company,
@@ -44,15 +45,18 @@ async def create_company(
 
 @router.put(
     "/companies/{company_id}",
-    responses={200: {"model": CompanyResponse}, 404: {"model": MessageResponse}},
+    responses={200: {"model": CompanyResponse}, 404: {"model": MessageResponse}, 409: {"model": ConflictResponse}},
 )
 async def update_company(
     company_id: str,
     company: UpdateCompany,
     company_services: CompanyServices = Depends(company_composer),
     _: CompanyInDB = Depends(require_company_member),
+    version: int | None = Depends(if_match_version),
 ):
-    company_in_db = await company_services.update(id=company_id, company=company)
+    company_in_db = await company_services.update(
+        id=company_id, company=company, version=version
+    )
     return build_response(
         status_code=200, message="Company updated with success", data=company_in_db
     )
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.composers.customer_composite import customer_composer
-from app.api.dependencies import build_response, require_user_company
-from app.api.shared_schemas.responses import MessageResponse
+from app.api.dependencies import build_response, if_match_version, require_user_company
+from app.api.shared_schemas.responses import ConflictResponse, MessageResponse
 from .schemas import CustomerResponse
 from app.crud.customers import Customer, UpdateCustomer, CustomerServices
 from app.crud.companies.schemas import CompanyInDB
@@ -31,16 +31,17 @@ async def create_customer(
 
 @router.put(
     "/customers/{customer_id}",
-    responses={200: {"model": CustomerResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}},
+    responses={200: {"model": CustomerResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}, 409: {"model": ConflictResponse}},
 )
 async def update_customer(
     customer_id: str,
     customer: UpdateCustomer,
     customer_services: CustomerServices = Depends(customer_composer),
     company: CompanyInDB = Depends(require_user_company),
+    version: int | None = Depends(if_match_version),
 ):
     customer_in_db = await customer_services.update(
-        id=customer_id, company_id=str(company.id), customer=customer
+        id=customer_id, company_id=str(company.id), customer=customer, version=version
     )
     if not customer_in_db:
         raise HTTPException(status_code=400, detail="Cliente não atualizado")
@@ -1,10 +1,20 @@
-from fastapi import APIRouter, Depends
+from typing import Union
+
+from fastapi import APIRouter, Depends, Query, Request
 
 from app.api.composers.customer_composite import customer_composer
 from app.api.dependencies import build_response, require_user_company
+from app.api.dependencies.pagination_parameters import pagination_parameters
+from app.api.dependencies.paginator import Paginator
+from app.api.dependencies.response import build_list_response
 from app.api.shared_schemas.responses import MessageResponse
 from app.core.exceptions import NotFoundError
-from .schemas import CustomerResponse, CustomerListResponse
+from .schemas import (
+    CustomerListResponse,
+    CustomerOverviewResponse,
+    CustomerResponse,
+    CustomerSearchResponse,
+)
 from app.crud.customers import CustomerServices
 from app.crud.companies.schemas import CompanyInDB
 
@@ -28,14 +38,63 @@ async def get_customer_by_id(
     )
 
 
+@router.get(
+    "/customers/{customer_id}/overview",
+    responses={200: {"model": CustomerOverviewResponse}, 404: {"model": MessageResponse}},
+)
+async def get_customer_overview(
+    customer_id: str,
+    request: Request,
+    pagination: dict = Depends(pagination_parameters),
+    customer_services: CustomerServices = Depends(customer_composer),
+    company: CompanyInDB = Depends(require_user_company),
+):
+    paginator = Paginator(request=request, pagination=pagination)
+    overview = await customer_services.search_overview(
+        id=customer_id,
+        company_id=str(company.id),
+        offset=paginator.offset,
+        limit=paginator.page_size,
+    )
+    paginator.set_total(overview.balance.reservations)
+    return build_list_response(
+        status_code=200,
+        message="Customer overview found with success",
+        pagination=paginator.pagination,
+        data=overview,
+    )
+
+
 @router.get(
     "/customers",
-    responses={200: {"model": CustomerListResponse}},
+    responses={200: {"model": Union[CustomerListResponse, CustomerSearchResponse]}},
 )
 async def get_customers(
+    request: Request,
+    q: str | None = Query(
+        default=None,
+        description="Prefix of the name, document, email or mobile, ignoring accents and case",
+    ),
+    pagination: dict = Depends(pagination_parameters),
     customer_services: CustomerServices = Depends(customer_composer),
     company: CompanyInDB = Depends(require_user_company),
 ):
+    if q is not None:
+        paginator = Paginator(request=request, pagination=pagination)
+        total, customers = await customer_services.search(
+            company_id=str(company.id),
+            query=q,
+            offset=paginator.offset,
+            limit=paginator.page_size,
+        )
+        paginator.set_total(total)
+        return build_list_response(
+            status_code=200,
+            message="Customers found with success",
+            pagination=paginator.pagination,
+            data=customers,
+        )
+
     try:
         customers = await customer_services.search_all(company_id=str(company.id))
     except NotFoundError:
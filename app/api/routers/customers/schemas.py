@@ -2,8 +2,12 @@ from typing import List
 
 from pydantic import Field, ConfigDict
 
-from app.api.shared_schemas.responses import Response
-from app.crud.customers.schemas import CustomerInDB
+from app.api.shared_schemas.responses import ListResponseSchema, Response
+from app.crud.customers.schemas import (
+    CustomerInDB,
+    CustomerOverview,
+    CustomerSearchResult,
+)
 
 EXAMPLE_CUSTOMER = {
     "id": "cus_12345678",
@@ -44,3 +48,77 @@ class CustomerListResponse(Response):
             }
         }
     )
+
+
+class CustomerSearchResponse(ListResponseSchema):
+    data: List[CustomerSearchResult] = Field()
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "message": "Customers found with success",
+                "pagination": {
+                    "total": 1,
+                    "pageSize": 15,
+                    "pages": 1,
+                    "page": 1,
+                    "links": {
+                        "previous": None,
+                        "self": "/api/customers?q=john",
+                        "next": None,
+                    },
+                },
+                "data": [
+                    {
+                        key: EXAMPLE_CUSTOMER[key]
+                        for key in ("id", "name", "document", "email", "mobile")
+                    }
+                ],
+            }
+        }
+    )
+
+
+class CustomerOverviewResponse(ListResponseSchema):
+    data: CustomerOverview | None = Field()
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "message": "Customer overview found with success",
+                "pagination": {
+                    "total": 1,
+                    "pageSize": 15,
+                    "pages": 1,
+                    "page": 1,
+                    "links": {
+                        "previous": None,
+                        "self": "/api/customers/cus_12345678/overview",
+                        "next": None,
+                    },
+                },
+                "data": {
+                    "customer": EXAMPLE_CUSTOMER,
+                    "addresses": [],
+                    "reservations": [
+                        {
+                            "id": "res_12345678",
+                            "addressId": "add_12345678",
+                            "deliveryDate": "2024-01-05T00:00:00Z",
+                            "pickupDate": "2024-01-06T00:00:00Z",
+                            "status": "COMPLETED",
+                            "totalValue": 450.0,
+                            "paidValue": 400.0,
+                            "pendingValue": 50.0,
+                        }
+                    ],
+                    "balance": {
+                        "reservations": 1,
+                        "totalValue": 450.0,
+                        "paidValue": 400.0,
+                        "pendingValue": 50.0,
+                    },
+                },
+            }
+        }
+    )
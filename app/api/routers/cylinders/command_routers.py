@@ -2,8 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from app.core.exceptions import NotFoundError
 
 from app.api.composers.cylinder_composite import cylinder_composer
-from app.api.dependencies import build_response, require_user_company
-from app.api.shared_schemas.responses import MessageResponse
+from app.api.dependencies import build_response, if_match_version, require_user_company
+from app.api.shared_schemas.responses import ConflictResponse, MessageResponse
 from .schemas import CylinderResponse
 from app.crud.cylinders import Cylinder, UpdateCylinder, CylinderServices
 from app.crud.companies.schemas import CompanyInDB
@@ -38,16 +38,17 @@ async def create_cylinder(
 
 @router.put(
     "/cylinders/{cylinder_id}",
-    responses={200: {"model": CylinderResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}},
+    responses={200: {"model": CylinderResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}, 409: {"model": ConflictResponse}},
 )
 async def update_cylinder(
     cylinder_id: str,
     cylinder: UpdateCylinder,
     services: CylinderServices = Depends(cylinder_composer),
     company: CompanyInDB = Depends(require_user_company),
+    version: int | None = Depends(if_match_version),
 ):
     cylinder_in_db = await services.update(
-        id=cylinder_id, company_id=str(company.id), cylinder=cylinder
+        id=cylinder_id, company_id=str(company.id), cylinder=cylinder, version=version
     )
     if not cylinder_in_db:
         raise HTTPException(status_code=400, detail="Cilindro não atualizado")
@@ -1,4 +1,5 @@
 from .generic_errors import (
+    conflict_error_409,
     unprocessable_entity_error_422,
     generic_error_500,
     not_found_error_404,
@@ -2,8 +2,9 @@ from fastapi import HTTPException, Request, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
-from app.api.shared_schemas.responses import MessageResponse
+from app.api.shared_schemas.responses import ConflictResponse, MessageResponse
 from app.core.exceptions import (
+    ConflictError,
     InvalidPassword,
     NotFoundError,
     UnprocessableEntity,
@@ -47,6 +48,19 @@ def not_found_error_404(request: Request, exc: NotFoundError):
     )
 
 
+def conflict_error_409(request: Request, exc: ConflictError):
+    error = ConflictResponse(message=exc.message, current_version=exc.current_version)
+    headers = (
+        {"ETag": f'"{exc.current_version}"'} if exc.current_version is not None else None
+    )
+
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content=jsonable_encoder(error.model_dump(by_alias=True)),
+        headers=headers,
+    )
+
+
 def generic_error_400(request: Request, exc: InvalidPassword | BadRequestError):
     error = MessageResponse(message=exc.message)
 
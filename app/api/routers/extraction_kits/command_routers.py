@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 
 from app.api.composers.extraction_kit_composite import extraction_kit_composer
-from app.api.dependencies import build_response, require_user_company
-from app.api.shared_schemas.responses import MessageResponse
+from app.api.dependencies import build_response, if_match_version, require_user_company
+from app.api.shared_schemas.responses import ConflictResponse, MessageResponse
 from app.crud.companies.schemas import CompanyInDB
 from app.crud.extraction_kits import (
     ExtractionKit,
@@ -38,6 +38,7 @@ async def create_extraction_kit(
         200: {"model": ExtractionKitResponse},
         400: {"model": MessageResponse},
         404: {"model": MessageResponse},
+        409: {"model": ConflictResponse},
     },
 )
 async def update_extraction_kit(
@@ -45,9 +46,10 @@ async def update_extraction_kit(
     gauge: UpdateExtractionKit,
     services: ExtractionKitServices = Depends(extraction_kit_composer),
     company: CompanyInDB = Depends(require_user_company),
+    version: int | None = Depends(if_match_version),
 ):
     gauge_in_db = await services.update(
-        id=gauge_id, company_id=str(company.id), gauge=gauge
+        id=gauge_id, company_id=str(company.id), gauge=gauge, version=version
     )
     if not gauge_in_db:
         raise HTTPException(status_code=400, detail="Kit de extração não atualizado")
@@ -0,0 +1,6 @@
+from fastapi import APIRouter
+from .query_routers import router as query_router
+
+
+health_router = APIRouter()
+health_router.include_router(query_router)
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Request
+
+from app.api.dependencies import build_response
+
+from .schemas import HealthResponse
+
+router = APIRouter(tags=["Health Check"])
+
+
+@router.get("/health")
+async def health_check():
+    return build_response(status_code=200, message="I'm alive!", data=None)
+
+
+@router.get(
+    "/health/ready",
+    responses={200: {"model": HealthResponse}, 503: {"model": HealthResponse}},
+)
+async def readiness_check(request: Request):
+    health = getattr(request.app.state, "health", None)
+    if not getattr(request.app.state, "ready", False) or health is None:
+        return build_response(status_code=503, message="Not ready", data=None)
+
+    report = await health.check(["mongo"])
+    if not report.healthy:
+        return build_response(status_code=503, message="Not ready", data=report)
+
+    return build_response(status_code=200, message="Ready", data=report)
+
+
+@router.get(
+    "/health/deep",
+    responses={200: {"model": HealthResponse}, 503: {"model": HealthResponse}},
+)
+async def deep_health_check(request: Request):
+    health = getattr(request.app.state, "health", None)
+    if not getattr(request.app.state, "ready", False) or health is None:
+        return build_response(status_code=503, message="Not ready", data=None)
+
+    report = await health.check()
+    if not report.healthy:
+        return build_response(status_code=503, message="Unhealthy", data=report)
+
+    return build_response(status_code=200, message="Healthy", data=report)
@@ -0,0 +1,30 @@
+from pydantic import Field, ConfigDict
+
+from app.api.shared_schemas.responses import Response
+from app.core.health import HealthReport
+
+
+class HealthResponse(Response):
+    data: HealthReport = Field()
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "message": "Healthy",
+                "data": {
+                    "healthy": True,
+                    "checks": {
+                        "mongo": {
+                            "healthy": True,
+                            "checkedAt": "2025-01-01T12:00:00.000Z",
+                            "durationMs": 1.8,
+                            "details": {
+                                "latency_ms": 1.6,
+                                "pool": {"max_size": 100, "min_size": 0},
+                            },
+                        }
+                    },
+                },
+            }
+        }
+    )
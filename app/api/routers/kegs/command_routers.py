@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.composers.keg_composite import keg_composer
-from app.api.dependencies import build_response, require_user_company
-from app.api.shared_schemas.responses import MessageResponse
+from app.api.dependencies import build_response, if_match_version, require_user_company
+from app.api.shared_schemas.responses import ConflictResponse, MessageResponse
 from .schemas import KegResponse
 from app.crud.kegs import Keg, UpdateKeg, KegServices
 from app.crud.companies.schemas import CompanyInDB
@@ -29,16 +29,17 @@ async def create_keg(
 
 @router.put(
     "/kegs/{keg_id}",
-    responses={200: {"model": KegResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}},
+    responses={200: {"model": KegResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}, 409: {"model": ConflictResponse}},
 )
 async def update_keg(
     keg_id: str,
     keg: UpdateKeg,
     company: CompanyInDB = Depends(require_user_company),
     services: KegServices = Depends(keg_composer),
+    version: int | None = Depends(if_match_version),
 ):
     keg_in_db = await services.update(
-        id=keg_id, company_id=str(company.id), keg=keg
+        id=keg_id, company_id=str(company.id), keg=keg, version=version
     )
     if not keg_in_db:
         raise HTTPException(status_code=400, detail="Barril não atualizado")
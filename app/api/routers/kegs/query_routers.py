@@ -4,13 +4,30 @@ from app.api.composers.keg_composite import keg_composer
 from app.api.dependencies import build_response, require_user_company
 from app.api.shared_schemas.responses import MessageResponse
 from app.core.exceptions import NotFoundError
-from .schemas import KegResponse, KegListResponse
+from .schemas import KegResponse, KegListResponse, KegStockSummaryResponse
 from app.crud.kegs import KegServices, KegStatus
 from app.crud.companies.schemas import CompanyInDB
 
 router = APIRouter(tags=["Kegs"])
 
 
+# Declared before ``/kegs/{keg_id}`` so "summary" is not taken as an id.
+@router.get(
+    "/kegs/summary",
+    responses={200: {"model": KegStockSummaryResponse}},
+)
+async def get_keg_stock_summary(
+    services: KegServices = Depends(keg_composer),
+    company: CompanyInDB = Depends(require_user_company),
+):
+    try:
+        summary = await services.search_stock_summary(company_id=str(company.id))
+    except NotFoundError:
+        summary = []
+    return build_response(
+        status_code=200, message="Keg summary found with success", data=summary
+    )
+
 @router.get(
     "/kegs/{keg_id}",
     responses={200: {"model": KegResponse}, 404: {"model": MessageResponse}},
@@ -2,7 +2,7 @@ from typing import List
 from pydantic import Field, ConfigDict
 
 from app.api.shared_schemas.responses import Response
-from app.crud.kegs.schemas import KegInDB, KegStatus
+from app.crud.kegs.schemas import KegInDB, KegStatus, KegStockSummary
 
 EXAMPLE_KEG = {
     "id": "keg_12345678",
@@ -43,3 +43,44 @@ class KegListResponse(Response):
             }
         }
     )
+
+
+class KegStockSummaryResponse(Response):
+    data: List[KegStockSummary] = Field()
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "message": "Keg summary found with success",
+                "data": [
+                    {
+                        "beer_type_id": "bty_123",
+                        "beer_type_name": "Pale Ale",
+                        "kegs": 3,
+                        "size_l": 150,
+                        "current_volume_l": 75,
+                        "statuses": [
+                            {
+                                "status": KegStatus.AVAILABLE,
+                                "kegs": 1,
+                                "size_l": 50,
+                                "current_volume_l": 50,
+                            },
+                            {
+                                "status": KegStatus.EMPTY,
+                                "kegs": 1,
+                                "size_l": 50,
+                                "current_volume_l": 0,
+                            },
+                            {
+                                "status": KegStatus.IN_USE,
+                                "kegs": 1,
+                                "size_l": 50,
+                                "current_volume_l": 25,
+                            },
+                        ],
+                    }
+                ],
+            }
+        }
+    )
@@ -0,0 +1,6 @@
+from fastapi import APIRouter
+
+from .query_routers import router as query_router
+
+reference_data_router = APIRouter()
+reference_data_router.include_router(query_router)
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends, Header, Response
+
+from app.api.composers.reference_data_composite import reference_data_composer
+from app.api.dependencies import build_response, require_user_company
+from app.core.configs import get_environment
+from app.crud.companies.schemas import CompanyInDB
+from app.crud.reference_data import ReferenceDataServices
+from .schemas import ReferenceDataResponse
+
+_env = get_environment()
+
+router = APIRouter(tags=["Reference Data"])
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether ``If-None-Match`` lists ``etag`` (weak comparison) or is ``*``."""
+    if not if_none_match:
+        return False
+
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+@router.get(
+    "/reference-data",
+    responses={
+        200: {"model": ReferenceDataResponse},
+        304: {"description": "Not modified"},
+    },
+)
+async def get_reference_data(
+    if_none_match: str | None = Header(default=None),
+    services: ReferenceDataServices = Depends(reference_data_composer),
+    company: CompanyInDB = Depends(require_user_company),
+):
+    bundle = await services.search_bundle(company_id=str(company.id))
+    headers = {
+        "ETag": f'"{bundle.version}"',
+        "Cache-Control": f"private, max-age={_env.REFERENCE_DATA_MAX_AGE}",
+    }
+
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    response = build_response(
+        status_code=200, message="Reference data found with success", data=bundle
+    )
+    response.headers.update(headers)
+    return response
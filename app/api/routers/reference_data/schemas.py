@@ -0,0 +1,21 @@
+from pydantic import ConfigDict, Field
+
+from app.api.shared_schemas.responses import Response
+from app.crud.reference_data.schemas import ReferenceData
+
+
+class ReferenceDataResponse(Response):
+    data: ReferenceData = Field()
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "message": "Reference data found with success",
+                "data": {
+                    "version": "9f86d081884c7d65",
+                    "beerTypes": [],
+                    "enums": {"KegStatus": ["AVAILABLE", "IN_USE"]},
+                },
+            }
+        }
+    )
@@ -1,8 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.composers.reservation_composite import reservation_composer
-from app.api.dependencies import build_response, require_company_member, require_user_company
-from app.api.shared_schemas.responses import MessageResponse
+from app.api.dependencies import (
+    build_response,
+    if_match_version,
+    require_company_member,
+    require_user_company,
+)
+from app.api.shared_schemas.responses import ConflictResponse, MessageResponse
 from .schemas import ReservationResponse
 from app.crud.reservations import (
     Reservation,
@@ -36,16 +41,20 @@ async def create_reservation(
 
 @router.put(
     "/reservations/{reservation_id}",
-    responses={200: {"model": ReservationResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}},
+    responses={200: {"model": ReservationResponse}, 400: {"model": MessageResponse}, 404: {"model": MessageResponse}, 409: {"model": ConflictResponse}},
 )
 async def update_reservation(
     reservation_id: str,
     reservation: UpdateReservation,
     services: ReservationServices = Depends(reservation_composer),
     company: CompanyInDB = Depends(require_user_company),
+    version: int | None = Depends(if_match_version),
 ):
     reservation_in_db = await services.update(
-        id=reservation_id, company_id=str(company.id), reservation=reservation
+        id=reservation_id,
+        company_id=str(company.id),
+        reservation=reservation,
+        version=version,
     )
     if not reservation_in_db:
         raise HTTPException(status_code=400, detail="Reserva não atualizada")
@@ -94,12 +103,12 @@ async def add_reservation_payment(
 
 
 @router.put(
-    "/reservations/{reservation_id}/payments/{payment_index}",
+    "/reservations/{reservation_id}/payments/{payment_id}",
     responses={200: {"model": ReservationResponse}, 404: {"model": MessageResponse}},
 )
 async def update_reservation_payment(
     reservation_id: str,
-    payment_index: int,
+    payment_id: str,
     payment: Payment,
     services: ReservationServices = Depends(reservation_composer),
     company: CompanyInDB = Depends(require_user_company),
@@ -107,7 +116,7 @@ async def update_reservation_payment(
     reservation_in_db = await services.update_payment(
         id=reservation_id,
         company_id=str(company.id),
-        index=payment_index,
+        payment_id=payment_id,
         payment=payment,
     )
     return build_response(
@@ -118,17 +127,17 @@ async def update_reservation_payment(
 
 
 @router.delete(
-    "/reservations/{reservation_id}/payments/{payment_index}",
+    "/reservations/{reservation_id}/payments/{payment_id}",
     responses={200: {"model": ReservationResponse}, 404: {"model": MessageResponse}},
 )
 async def delete_reservation_payment(
     reservation_id: str,
-    payment_index: int,
+    payment_id: str,
     services: ReservationServices = Depends(reservation_composer),
     company: CompanyInDB = Depends(require_user_company),
 ):
     reservation_in_db = await services.delete_payment(
-        id=reservation_id, company_id=str(company.id), index=payment_index
+        id=reservation_id, company_id=str(company.id), payment_id=payment_id
     )
     return build_response(
         status_code=200,
@@ -0,0 +1,6 @@
+from fastapi import APIRouter
+
+from .query_routers import router as query_router
+
+sync_router = APIRouter()
+sync_router.include_router(query_router)
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.api.composers.sync_composite import sync_composer
+from app.api.dependencies import build_response, require_user_company
+from app.core.utils.utc_datetime import UTCDateTimeType
+from app.crud.companies.schemas import CompanyInDB
+from app.crud.sync import SyncServices
+from .schemas import SyncResponse
+
+router = APIRouter(tags=["Sync"])
+
+
+@router.get(
+    "/sync",
+    responses={200: {"model": SyncResponse}},
+)
+async def get_changes(
+    since: UTCDateTimeType | None = None,
+    continuation: str | None = Query(
+        default=None,
+        description="Continuation of the previous page; while set, `since` is ignored",
+    ),
+    limit: int | None = Query(
+        default=None, ge=1, le=1000, description="Documents per collection in this page"
+    ),
+    services: SyncServices = Depends(sync_composer),
+    company: CompanyInDB = Depends(require_user_company),
+):
+    changes = await services.search_changes(
+        company_id=str(company.id),
+        since=since,
+        continuation=continuation,
+        limit=limit,
+    )
+    return build_response(
+        status_code=200, message="Changes found with success", data=changes
+    )
@@ -0,0 +1,36 @@
+from pydantic import ConfigDict, Field
+
+from app.api.shared_schemas.responses import Response
+from app.crud.sync.schemas import SyncChanges
+
+
+class SyncResponse(Response):
+    data: SyncChanges = Field()
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "message": "Changes found with success",
+                "data": {
+                    "since": "2024-01-01T00:00:00.000Z",
+                    "cursor": "2024-01-02T00:00:00.000Z",
+                    "addresses": [],
+                    "customers": [],
+                    "beerTypes": [],
+                    "kegs": [],
+                    "beerDispensers": [],
+                    "extractionKits": [],
+                    "cylinders": [],
+                    "reservations": [],
+                    "deleted": [
+                        {
+                            "collection": "kegs",
+                            "id": "keg_12345678",
+                            "deletedAt": "2024-01-01T12:00:00.000Z",
+                        }
+                    ],
+                    "continuation": None,
+                },
+            }
+        }
+    )
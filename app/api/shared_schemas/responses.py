@@ -8,6 +8,12 @@ class MessageResponse(BaseModel):
     message: str = Field(example="Success")
 
 
+class ConflictResponse(MessageResponse):
+    current_version: int | None = Field(
+        default=None, serialization_alias="currentVersion", example=3
+    )
+
+
 class Response(MessageResponse):
     data: SerializeAsAny[BaseModel] | SerializeAsAny[List[BaseModel]] | None = Field()
 
@@ -1,10 +1,15 @@
-import sentry_sdk
+import os
+from secrets import compare_digest
+
 from asgi_correlation_id import CorrelationIdMiddleware
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.dependencies.response import build_response
+from app.api.middleware.metrics import MetricsMiddleware
+from app.api.middleware.n_plus_one import NPlusOneMiddleware
 from app.api.middleware.rate_limiting import RateLimitMiddleware
 from app.api.routers import (
     address_router,
@@ -15,12 +20,16 @@ from app.api.routers import (
     cylinder_router,
     dashboard_router,
     extraction_kit_router,
+    health_router,
     keg_router,
     payment_router,
+    reference_data_router,
     reservation_router,
+    sync_router,
     user_router,
 )
 from app.api.routers.exception_handlers import (
+    conflict_error_409,
     generic_error_400,
     generic_error_500,
     not_found_error_404,
@@ -29,8 +38,10 @@ from app.api.routers.exception_handlers import (
 from app.api.routers.exception_handlers.generic_errors import http_exception_handler
 from app.core.configs import get_environment
 from app.core.db.connection import lifespan
+from app.core.metrics import REGISTRY
 from app.core.exceptions import (
     BadRequestError,
+    ConflictError,
     InvalidPassword,
     NotFoundError,
     UnprocessableEntity,
@@ -39,18 +50,6 @@ from app.core.exceptions import (
 _env = get_environment()
 
 
-# sentry_sdk.init(
-#     dsn=_env.SENTRY_DSN,
-#     traces_sample_rate=1.0,
-#     server_name=_env.APPLICATION_NAME,
-#     release=_env.RELEASE,
-#     environment=_env.ENVIRONMENT,
-#     _experiments={
-#         "continuous_profiling_auto_start": True,
-#     },
-# )
-
-
 app = FastAPI(title=_env.APPLICATION_NAME, lifespan=lifespan, version=_env.RELEASE)
 
 app.add_middleware(
@@ -62,8 +61,17 @@ app.add_middleware(
 )
 
 app.add_middleware(CorrelationIdMiddleware)
-app.add_middleware(RateLimitMiddleware, limit=250, window=60)
+app.add_middleware(
+    RateLimitMiddleware, limit=_env.RATE_LIMIT_REQUESTS, window=_env.RATE_LIMIT_WINDOW
+)
+app.add_middleware(MetricsMiddleware)
 
+if _env.DATABASE_DETECT_N_PLUS_ONE:
+    app.add_middleware(
+        NPlusOneMiddleware, threshold=_env.DATABASE_N_PLUS_ONE_THRESHOLD
+    )
+
+app.include_router(health_router)
 app.include_router(user_router, prefix="/api")
 app.include_router(company_router, prefix="/api")
 app.include_router(address_router, prefix="/api")
@@ -76,11 +84,14 @@ app.include_router(cylinder_router, prefix="/api")
 app.include_router(reservation_router, prefix="/api")
 app.include_router(dashboard_router, prefix="/api")
 app.include_router(payment_router, prefix="/api")
+app.include_router(sync_router, prefix="/api")
+app.include_router(reference_data_router, prefix="/api")
 
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(UnprocessableEntity, unprocessable_entity_error_422)
 app.add_exception_handler(NotFoundError, not_found_error_404)
+app.add_exception_handler(ConflictError, conflict_error_409)
 app.add_exception_handler(InvalidPassword, generic_error_400)
 app.add_exception_handler(BadRequestError, generic_error_400)
 app.add_exception_handler(Exception, generic_error_500)
@@ -91,6 +102,16 @@ async def root_path(request: Request):
     return build_response(status_code=200, message="I'm alive!", data=None)
 
 
-@app.get("/health", tags=["Health Check"])
-async def health_check():
-    return build_response(status_code=200, message="I'm alive!", data=None)
+@app.get("/metrics", tags=["Health Check"], include_in_schema=False)
+async def metrics(authorization: str | None = Header(default=None)):
+    if not _env.METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    expected = f"Bearer {_env.METRICS_TOKEN}".encode()
+    if not compare_digest((authorization or "").encode(), expected):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+
+    labels = {"worker": str(os.getpid())} if _env.SERVER_WORKERS > 1 else None
+    return PlainTextResponse(
+        REGISTRY.render(labels), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,18 @@
+from .cache import Cache, clear_caches, invalidate
+from .decorators import cached
+from .local import LocalTier
+from .shared import MongoSharedTier, SharedTier
+from .versions import CacheVersions, MongoCacheVersions, cache_versions
+
+__all__ = [
+    "Cache",
+    "CacheVersions",
+    "LocalTier",
+    "MongoCacheVersions",
+    "MongoSharedTier",
+    "SharedTier",
+    "cache_versions",
+    "cached",
+    "clear_caches",
+    "invalidate",
+]
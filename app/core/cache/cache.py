@@ -0,0 +1,196 @@
+"""
+Read-through cache with single-flight loading and stale-while-revalidate.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Set, Tuple
+
+from pydantic import TypeAdapter
+
+from app.core.configs import get_logger
+from app.core.metrics import CACHE_REQUESTS
+
+from .local import LocalTier
+from .shared import SharedTier
+from .versions import cache_versions
+
+_logger = get_logger(__name__)
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+class Cache:
+    """Local LRU+TTL tier in front of an optional :class:`SharedTier`.
+
+    - Concurrent misses on one key share a single load (single-flight).
+    - A stale entry is served at once while one background load refreshes
+      it (stale-while-revalidate).
+    - Lookups are counted on ``cache_requests_total`` as ``hit``, ``stale``
+      or ``miss``, and ``shared_hit`` or ``shared_miss`` for the shared tier.
+
+    Cached values are shared between requests and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        ttl: float,
+        stale_ttl: float = 0,
+        shared: SharedTier | None = None,
+        adapter: TypeAdapter | None = None,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.local = LocalTier(maxsize=maxsize, ttl=ttl, stale_ttl=stale_ttl)
+        self.shared = shared if adapter is not None else None
+        self.adapter = adapter
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+
+    def _record(self, result: str) -> None:
+        CACHE_REQUESTS.inc(cache=self.name, result=result)
+
+    async def get_or_load(
+        self, key: Hashable, company_id: str, collections: Tuple[str, ...], loader: Loader
+    ) -> Any:
+        entry = self.local.get(key)
+        if entry is not None:
+            if entry.is_fresh(time.monotonic()):
+                self._record("hit")
+                return entry.value
+
+            self._record("stale")
+            self._revalidate(key, company_id, collections, loader)
+            return entry.value
+
+        self._record("miss")
+        return await self._load(key, company_id, collections, loader)
+
+    def _revalidate(
+        self, key: Hashable, company_id: str, collections: Tuple[str, ...], loader: Loader
+    ) -> None:
+        if key in self._refreshing or key in self._inflight:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._load(key, company_id, collections, loader, shared=False)
+            except Exception as error:
+                _logger.warning(f"Error on refresh of {self.name}: {str(error)}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    async def _load(
+        self,
+        key: Hashable,
+        company_id: str,
+        collections: Tuple[str, ...],
+        loader: Loader,
+        shared: bool = True,
+    ) -> Any:
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load_through(key, company_id, collections, loader, shared)
+            self.local.set(key, value)
+            future.set_result(value)
+            return value
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except Exception as error:
+            future.set_exception(error)
+            # Waiters re-raise it; retrieve it so a lone load does not warn.
+            future.exception()
+            raise
+
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _load_through(
+        self,
+        key: Hashable,
+        company_id: str,
+        collections: Tuple[str, ...],
+        loader: Loader,
+        shared: bool,
+    ) -> Any:
+        if self.shared is None:
+            return await loader()
+
+        shared_key = str(key[:1] + key[2:]) if isinstance(key, tuple) else str(key)
+        if shared:
+            stored = self.shared.get(shared_key)
+            self._record("shared_miss" if stored is None else "shared_hit")
+            if stored is not None:
+                return self.adapter.validate_python(stored)
+
+        value = await loader()
+        self.shared.set(
+            shared_key,
+            self.adapter.dump_python(value, mode="json"),
+            ttl=self.ttl,
+            company_id=company_id,
+            collections=collections,
+        )
+        return value
+
+    def clear(self) -> None:
+        self.local.clear()
+
+
+_caches: List[Cache] = []
+_shared: List[SharedTier] = []
+# Collections some cached read depends on; writes to others bump nothing.
+_collections: Set[str] = set()
+
+
+def register(cache: Cache, collections: Iterable[str] = ()) -> Cache:
+    _caches.append(cache)
+    _collections.update(collections)
+    if cache.shared is not None and cache.shared not in _shared:
+        _shared.append(cache.shared)
+    return cache
+
+
+def invalidate(company_id: str | None, collection: str) -> None:
+    """Drop every cached read of ``collection`` for ``company_id``.
+
+    The local tiers are invalidated by bumping the version their keys embed.
+    Unless the versions are shared (see :mod:`app.core.cache.versions`),
+    other processes keep serving their local entries for up to
+    ``CACHE_TTL + CACHE_STALE_TTL`` seconds.
+
+    Only collections registered by ``@cached`` are bumped, so writes to the
+    others cost no extra round trip.  Registration happens when the cached
+    services are imported, which the API does at startup.
+    """
+    if not company_id or collection not in _collections:
+        return
+
+    try:
+        cache_versions.bump(company_id, collection)
+    except Exception as error:
+        _logger.warning(f"Error on cache invalidation: {str(error)}")
+    for shared in _shared:
+        try:
+            shared.invalidate(company_id, collection)
+        except Exception as error:
+            _logger.warning(f"Error on shared cache invalidation: {str(error)}")
+
+
+def clear_caches() -> None:
+    """Empty every local tier and reset the versions (tests and tooling)."""
+    for cache in _caches:
+        cache.clear()
+    cache_versions.clear()
@@ -0,0 +1,85 @@
+"""
+Opt-in caching of service reads.
+"""
+
+import functools
+import inspect
+from typing import Callable, get_type_hints
+
+from pydantic import TypeAdapter
+
+from app.core.configs import get_environment
+
+from .cache import Cache, register
+from .shared import MongoSharedTier
+from .versions import cache_versions
+
+_env = get_environment()
+_shared_tier = MongoSharedTier() if _env.CACHE_SHARED_TIER else None
+
+
+def cached(
+    *collections: str,
+    ttl: float | None = None,
+    stale_ttl: float | None = None,
+    maxsize: int | None = None,
+) -> Callable:
+    """Cache an ``async`` read taking a ``company_id`` argument.
+
+    Entries are keyed by the remaining arguments and by the version, for the
+    company, of every collection the read depends on, which writes bump
+    through :func:`app.core.cache.invalidate`::
+
+        @cached("kegs")
+        async def search_all(self, company_id: str, status=None): ...
+
+        @cached("kegs", "beer_types")
+        async def search_stock_summary(self, company_id: str): ...
+    """
+    if not collections:
+        raise TypeError("cached() needs at least one collection")
+
+    def decorator(function: Callable) -> Callable:
+        signature = inspect.signature(function)
+        name = function.__qualname__
+        cache = register(
+            Cache(
+                name=name,
+                maxsize=maxsize or _env.CACHE_MAX_SIZE,
+                ttl=_env.CACHE_TTL if ttl is None else ttl,
+                stale_ttl=_env.CACHE_STALE_TTL if stale_ttl is None else stale_ttl,
+                shared=_shared_tier,
+                adapter=(
+                    TypeAdapter(get_type_hints(function)["return"])
+                    if _shared_tier
+                    else None
+                ),
+            ),
+            collections,
+        )
+
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            if cache.ttl <= 0:
+                return await function(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop("self", None)
+            company_id = str(arguments.pop("company_id"))
+
+            key = (
+                name,
+                cache_versions.get_many(company_id, collections),
+                company_id,
+                repr(sorted(arguments.items())),
+            )
+            return await cache.get_or_load(
+                key, company_id, collections, lambda: function(*args, **kwargs)
+            )
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,82 @@
+"""
+Optional tier shared by every API process.
+
+Entries are stored as JSON-compatible values, with the company and the
+collections they were read from so a version bump of any of them can drop
+them for every process at once.
+"""
+
+from datetime import timedelta
+from typing import Any, Protocol, Sequence
+
+from pymongo import ASCENDING
+
+from app.core.utils.utc_datetime import UTCDateTime
+
+
+class SharedTier(Protocol):
+    def get(self, key: str) -> Any | None: ...
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        company_id: str,
+        collections: Sequence[str],
+    ) -> None: ...
+
+    def invalidate(self, company_id: str, collection: str) -> None: ...
+
+
+class MongoSharedTier:
+    """``cache_entries`` collection expired by a TTL index on ``expires_at``.
+
+    The TTL monitor runs about once a minute, so reads check the deadline too.
+    """
+
+    def __init__(self, collection: str = "cache_entries") -> None:
+        self._name = collection
+        self._indexed = False
+
+    def _collection(self):
+        from mongoengine import get_db
+
+        collection = get_db()[self._name]
+        if not self._indexed:
+            collection.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+            collection.create_index(
+                [("company_id", ASCENDING), ("collections", ASCENDING)]
+            )
+            self._indexed = True
+        return collection
+
+    def get(self, key: str) -> Any | None:
+        document = self._collection().find_one(
+            {"_id": key, "expires_at": {"$gt": UTCDateTime.now()}}, {"value": 1}
+        )
+        return document["value"] if document else None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        company_id: str,
+        collections: Sequence[str],
+    ) -> None:
+        self._collection().replace_one(
+            {"_id": key},
+            {
+                "value": value,
+                "company_id": company_id,
+                "collections": list(collections),
+                "expires_at": UTCDateTime.now() + timedelta(seconds=ttl),
+            },
+            upsert=True,
+        )
+
+    def invalidate(self, company_id: str, collection: str) -> None:
+        self._collection().delete_many(
+            {"company_id": company_id, "collections": collection}
+        )
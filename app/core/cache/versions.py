@@ -0,0 +1,107 @@
+"""
+Per company and collection cache versions.
+
+Cache keys embed the version of the data they were read from, so bumping it
+on a write makes every older entry unreachable without scanning the caches.
+
+:class:`CacheVersions` only lives in one process: with several API processes
+a write on one of them leaves the others serving their old entries for up
+to ``CACHE_TTL + CACHE_STALE_TTL`` seconds.  :class:`MongoCacheVersions`
+keeps the versions in the database instead, so every process sees a write on
+its next read, at the price of one primary lookup by ``_id`` per cached read.
+It is used whenever ``CACHE_SHARED_INVALIDATION`` is on, which it is by
+default as soon as ``SERVER_WORKERS`` is above 1.
+"""
+
+from threading import Lock
+from typing import Dict, Protocol, Sequence, Tuple
+
+from pymongo import ReturnDocument
+
+from app.core.configs import get_environment
+from app.core.configs.environment import Environment
+
+
+class Versions(Protocol):
+    def get(self, company_id: str, collection: str) -> int: ...
+
+    def get_many(self, company_id: str, collections: Sequence[str]) -> Tuple[int, ...]: ...
+
+    def bump(self, company_id: str, collection: str) -> int: ...
+
+    def clear(self) -> None: ...
+
+
+class CacheVersions:
+    def __init__(self) -> None:
+        self._versions: Dict[Tuple[str, str], int] = {}
+        self._lock = Lock()
+
+    def get(self, company_id: str, collection: str) -> int:
+        return self._versions.get((company_id, collection), 0)
+
+    def get_many(self, company_id: str, collections: Sequence[str]) -> Tuple[int, ...]:
+        return tuple(self.get(company_id, collection) for collection in collections)
+
+    def bump(self, company_id: str, collection: str) -> int:
+        with self._lock:
+            version = self._versions.get((company_id, collection), 0) + 1
+            self._versions[(company_id, collection)] = version
+            return version
+
+    def clear(self) -> None:
+        with self._lock:
+            self._versions.clear()
+
+
+class MongoCacheVersions:
+    """``cache_versions`` collection, one document per company and collection."""
+
+    def __init__(self, collection: str = "cache_versions") -> None:
+        self._name = collection
+
+    def _collection(self):
+        from mongoengine import get_db
+
+        return get_db()[self._name]
+
+    def get(self, company_id: str, collection: str) -> int:
+        document = self._collection().find_one(
+            {"_id": f"{company_id}:{collection}"}, {"version": 1}
+        )
+        return document["version"] if document else 0
+
+    def get_many(self, company_id: str, collections: Sequence[str]) -> Tuple[int, ...]:
+        if len(collections) == 1:
+            return (self.get(company_id, collections[0]),)
+
+        ids = [f"{company_id}:{collection}" for collection in collections]
+        versions = {
+            document["_id"]: document["version"]
+            for document in self._collection().find(
+                {"_id": {"$in": ids}}, {"version": 1}
+            )
+        }
+        return tuple(versions.get(id, 0) for id in ids)
+
+    def bump(self, company_id: str, collection: str) -> int:
+        document = self._collection().find_one_and_update(
+            {"_id": f"{company_id}:{collection}"},
+            {"$inc": {"version": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return document["version"]
+
+    def clear(self) -> None:
+        self._collection().delete_many({})
+
+
+def build_cache_versions(env: Environment) -> Versions:
+    shared = env.CACHE_SHARED_INVALIDATION
+    if shared is None:
+        shared = env.SERVER_WORKERS > 1
+    return MongoCacheVersions() if shared else CacheVersions()
+
+
+cache_versions = build_cache_versions(get_environment())
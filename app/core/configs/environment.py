@@ -2,6 +2,8 @@
 Module to load all Environment variables
 """
 
+from typing import Dict
+
 from pydantic_settings import BaseSettings
 
 
@@ -16,9 +18,108 @@ class Environment(BaseSettings):
     APPLICATION_PORT: int = 8000
     ENVIRONMENT: str = "local"
     RELEASE: str = "0.0.1"
+    RATE_LIMIT_REQUESTS: int = 250
+    RATE_LIMIT_WINDOW: int = 60
+
+    # SERVER
+    SERVER_WORKERS: int = 1
+    SERVER_LOOP: str = "auto"
+    SERVER_HTTP: str = "auto"
+    # Must outlive the Fly proxy idle timeout (60s) so the proxy, not the
+    # app, closes idle upstream connections.
+    SERVER_KEEP_ALIVE: int = 75
+    SERVER_GRACEFUL_SHUTDOWN: int = 25
+    SERVER_BACKLOG: int = 2048
+    SERVER_LIMIT_CONCURRENCY: int | None = None
+    SERVER_FORWARDED_ALLOW_IPS: str = "*"
+
+    # METRICS
+    # Bearer token required by ``/metrics``; unset, the endpoint is not served.
+    # Each worker process keeps its own registry and a scrape reaches one of
+    # them, so with SERVER_WORKERS > 1 every sample carries a ``worker`` (pid)
+    # label: aggregate over it, or run one worker per instance.
+    METRICS_TOKEN: str | None = None
+
+    # HEALTH
+    HEALTH_CACHE_TTL: float = 5
+    HEALTH_PROBE_TIMEOUT: float = 2
+    HEALTH_MAX_EVENT_LOOP_LAG: float = 0.5
+
+    # LOGGING
+    LOG_LEVEL: str = "INFO"
+    LOG_LEVELS: Dict[str, str] = {}
+    LOG_DEBUG_SAMPLE_RATE: float = 1.0
+    # Logs go to stderr only unless a file is set; the file is written by a
+    # single process, so it is ignored when SERVER_WORKERS > 1.
+    LOG_FILE: str | None = None
+    LOG_FILE_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_FILE_BACKUP_COUNT: int = 3
 
     # DATABASE
     DATABASE_HOST: str = "localhost"
+    DATABASE_MAX_POOL_SIZE: int = 100
+    DATABASE_MIN_POOL_SIZE: int = 0
+    DATABASE_MAX_CONNECTING: int = 2
+    DATABASE_MAX_IDLE_TIME_MS: int | None = 300_000
+    # None waits for a free pooled connection forever.
+    DATABASE_WAIT_QUEUE_TIMEOUT_MS: int | None = None
+    DATABASE_SERVER_SELECTION_TIMEOUT_MS: int = 5_000
+    DATABASE_CONNECT_TIMEOUT_MS: int = 5_000
+    DATABASE_SOCKET_TIMEOUT_MS: int | None = 30_000
+    DATABASE_READ_PREFERENCE: str = "primary"
+    # Listing and analytics reads; maxStalenessSeconds must be at least 90.
+    DATABASE_ANALYTICS_READ_PREFERENCE: str = "secondaryPreferred"
+    DATABASE_ANALYTICS_MAX_STALENESS_SECONDS: int = 90
+    # Comma separated, in order of preference, e.g. "zstd,snappy,zlib".
+    DATABASE_COMPRESSORS: str | None = "zstd,zlib"
+    DATABASE_BUILD_INDEXES_ON_STARTUP: bool = True
+    DATABASE_DETECT_N_PLUS_ONE: bool = False
+    DATABASE_N_PLUS_ONE_THRESHOLD: int = 3
+
+    # POSTAL CODES
+    VIACEP_URL: str = "https://viacep.com.br/ws"
+    VIACEP_TIMEOUT: float = 3.0
+    POSTAL_CODE_CACHE_SIZE: int = 4096
+    POSTAL_CODE_CACHE_TTL: int = 3600
+    POSTAL_CODE_STORE_TTL_DAYS: int = 30
+    POSTAL_CODE_NOT_FOUND_TTL_HOURS: int = 24
+
+    # CACHE
+    # Seconds a cached service read is fresh; 0 disables the decorated caches.
+    CACHE_TTL: float = 30
+    # Seconds it may still be served while it is refreshed in the background.
+    CACHE_STALE_TTL: float = 30
+    CACHE_MAX_SIZE: int = 1024
+    CACHE_SHARED_TIER: bool = False
+    # Keep cache versions in MongoDB so a write is seen by every process on
+    # its next read; unset means on when SERVER_WORKERS > 1.  Set it to true
+    # too when several machines serve the API.
+    CACHE_SHARED_INVALIDATION: bool | None = None
+    # Browser cache lifetime of ``/reference-data``; revalidated by ETag.
+    REFERENCE_DATA_MAX_AGE: int = 3600
+
+    # SYNC
+    # Seconds the sync cursor trails the request, so writes that land after
+    # it with an earlier ``updated_at`` are read again by the next sync.
+    SYNC_CURSOR_OVERLAP: float = 5
+    # Documents per collection in one ``/sync`` page.
+    SYNC_PAGE_SIZE: int = 500
+
+    # RESERVATION ARCHIVE
+    RESERVATION_ARCHIVE_AFTER_DAYS: int = 365
+    RESERVATION_ARCHIVE_BATCH_SIZE: int = 500
+    # Seconds between archiver runs; 0 disables the periodic task.
+    RESERVATION_ARCHIVE_INTERVAL: int = 6 * 3600
+
+    # TOMBSTONE RETENTION
+    TOMBSTONE_RETENTION_DAYS: int = 90
+    TOMBSTONE_COMPACTION_BATCH_SIZE: int = 500
+    # Seconds between compaction runs; 0 disables the periodic task.
+    TOMBSTONE_COMPACTION_INTERVAL: int = 24 * 3600
+
+    # Seconds an API process waits before the first archiver and compaction
+    # run; each run is then taken by a single process (see ``Lease``).
+    PERIODIC_TASK_DELAY: int = 600
 
     # AUTH0
     AUTH0_DOMAIN: str | None = None
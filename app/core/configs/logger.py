@@ -1,15 +1,73 @@
 """
 Looger Module
+
+Records are handed to a ``QueueHandler`` in the calling thread and written by a
+single ``QueueListener`` thread, so console and file I/O never block the event
+loop.  Output is one JSON object per line and the ``debug.log`` file is bounded
+by rotation.
 """
+import atexit
+import json
 import logging
-import os
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
+from threading import Lock
+
+from asgi_correlation_id import CorrelationIdFilter
+
+from app.core.configs.environment import Environment
+
 
+class JsonFormatter(logging.Formatter):
+    """Render a record as a single line JSON object."""
 
-class RelativePathFormatter(logging.Formatter):
     def format(self, record):
-        # Calcula o caminho relativo
-        record.relativepath = os.path.relpath(record.pathname, os.getcwd())
-        return super().format(record)
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "line": record.lineno,
+            "message": record.getMessage(),
+            "correlation_id": getattr(record, "correlation_id", None),
+        }
+
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Keep only a fraction of the ``DEBUG`` records emitted on hot paths."""
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.rate >= 1:
+            return True
+
+        return random.random() < self.rate
+
+
+class _QueueHandler(QueueHandler):
+    def prepare(self, record):
+        # Resolve the message and the traceback in the calling thread, but
+        # leave the JSON formatting to the listener thread.
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
 
 
 class Logger:
@@ -23,8 +81,13 @@ class Logger:
     ERROR = logging.ERROR
     CRITITAL = logging.CRITICAL
 
-    def __init__(self, name=__name__):
+    __handler = None
+    __listener = None
+    __lock = Lock()
+
+    def __init__(self, name=__name__, environment: Environment | None = None):
         # create logger
+        self.environment = environment or Environment()
         self.logger_worker = logging.getLogger(name)
         self.__config_logger()
 
@@ -32,25 +95,62 @@ class Logger:
         """
         Config logger
         """
-        self.logger_worker.setLevel(self.DEBUG)
-        self.__config_handler(logging.DEBUG)
-        self.__config_handler(logging.DEBUG, "debug.log")
+        self.logger_worker.setLevel(self.__level_for(self.logger_worker.name))
+
+        handler = self.__get_handler()
+        if handler not in self.logger_worker.handlers:
+            self.logger_worker.addHandler(handler)
+
+    def __level_for(self, name: str) -> int:
+        """Longest ``LOG_LEVELS`` prefix matching ``name``, else ``LOG_LEVEL``."""
+        level = self.environment.LOG_LEVEL
+        matched = -1
+
+        for prefix, prefix_level in self.environment.LOG_LEVELS.items():
+            if (name == prefix or name.startswith(f"{prefix}.")) and len(prefix) > matched:
+                level, matched = prefix_level, len(prefix)
+
+        return logging.getLevelName(level.upper())
+
+    def __get_handler(self) -> QueueHandler:
+        with Logger.__lock:
+            if Logger.__handler is None:
+                queue = SimpleQueue()
+
+                handler = _QueueHandler(queue)
+                handler.addFilter(CorrelationIdFilter())
+                handler.addFilter(DebugSamplingFilter(self.environment.LOG_DEBUG_SAMPLE_RATE))
+
+                listener = QueueListener(
+                    queue, *self.__build_handlers(), respect_handler_level=True
+                )
+                listener.start()
+                atexit.register(listener.stop)
+
+                Logger.__handler, Logger.__listener = handler, listener
+
+            return Logger.__handler
 
-    def __config_handler(self, level, file=None):
-        # create console handler and set level to debug
-        console_handler = logging.FileHandler(file) if file else logging.StreamHandler()
-        console_handler.setLevel(level)
+    def __build_handlers(self) -> list:
+        formatter = JsonFormatter()
+        handlers = [logging.StreamHandler()]
 
-        # create formatter
-        formatter = RelativePathFormatter(
-            "%(levelname)s\t| %(asctime)s| %(relativepath)s:%(lineno)s => %(message)s\t"
-        )
+        # RotatingFileHandler is not safe across processes: concurrent
+        # workers would rotate and truncate each other's file.
+        if self.environment.LOG_FILE and self.environment.SERVER_WORKERS == 1:
+            handlers.append(
+                RotatingFileHandler(
+                    self.environment.LOG_FILE,
+                    maxBytes=self.environment.LOG_FILE_MAX_BYTES,
+                    backupCount=self.environment.LOG_FILE_BACKUP_COUNT,
+                    delay=True,
+                )
+            )
 
-        # add formatter to console_handler
-        console_handler.setFormatter(formatter)
+        for handler in handlers:
+            handler.setFormatter(formatter)
 
-        # add console_handler to logger
-        self.logger_worker.addHandler(console_handler)
+        return handlers
 
     def get_logger(self):
         """
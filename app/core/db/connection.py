@@ -1,3 +1,5 @@
+import asyncio
+import time
 from contextlib import asynccontextmanager
 from threading import Lock
 
@@ -5,29 +7,128 @@ from cachetools import TTLCache
 from fastapi import FastAPI
 from mongoengine import connect
 
+from app.api.dependencies.get_access_token import issue_access_token
 from app.api.dependencies.verify_token import ValidateToken
 from app.core.configs import get_environment, get_logger
+from app.core.configs.environment import Environment
+from app.core.health import (
+    EventLoopMonitor,
+    HealthChecker,
+    access_token_probe,
+    event_loop_probe,
+    jwks_probe,
+    mongo_probe,
+)
+from app.core.db.indexes import build_indexes_in_background
+from app.core.db.lease import Lease
+from app.core.db.query_recorder import QueryRecorderListener
+from app.core.metrics import MongoCommandListener, MongoPoolListener
+from app.core.db.retention import compact_tombstones
+from app.core.utils.periodic_task import PeriodicTask
+from app.crud.reservations.archive import archive_reservations
 
 _env = get_environment()
 _logger = get_logger(__name__)
 
 
+def connection_options(env: Environment) -> dict:
+    """``MongoClient`` pool, timeout, read preference and compression options.
+
+    Unset options are left out so pymongo (or the connection string) keeps
+    its default.
+    """
+    options = {
+        "maxPoolSize": env.DATABASE_MAX_POOL_SIZE,
+        "minPoolSize": env.DATABASE_MIN_POOL_SIZE,
+        "maxConnecting": env.DATABASE_MAX_CONNECTING,
+        "maxIdleTimeMS": env.DATABASE_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": env.DATABASE_WAIT_QUEUE_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": env.DATABASE_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": env.DATABASE_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": env.DATABASE_SOCKET_TIMEOUT_MS,
+        "readPreference": env.DATABASE_READ_PREFERENCE,
+        "compressors": env.DATABASE_COMPRESSORS,
+    }
+
+    return {name: value for name, value in options.items() if value is not None}
+
+
 def start_database():
+    event_listeners = [
+        MongoCommandListener(),
+        MongoPoolListener(max_pool_size=_env.DATABASE_MAX_POOL_SIZE),
+    ]
+    if _env.DATABASE_DETECT_N_PLUS_ONE:
+        event_listeners.append(QueryRecorderListener())
+
     connetion = connect(
-        host=_env.DATABASE_HOST
+        host=_env.DATABASE_HOST,
+        event_listeners=event_listeners,
+        **connection_options(_env),
     )
     connetion.server_info()
 
 
+async def warm_up(app: FastAPI) -> None:
+    """Connect to MongoDB and prefetch the Auth0 JWKS and management token.
+
+    The three round trips run concurrently in threads. Only the database is
+    required; a failed Auth0 prefetch is logged and retried on first use.
+    """
+    tasks = {"database": asyncio.to_thread(start_database)}
+
+    if _env.AUTH0_DOMAIN:
+        tasks["jwks"] = asyncio.to_thread(app.state.auth.warm_up)
+
+    if _env.AUTH0_DOMAIN and _env.AUTH0_MANAGEMENT_API_CLIENT_ID:
+        tasks["access_token"] = asyncio.to_thread(issue_access_token)
+
+    results = dict(
+        zip(tasks, await asyncio.gather(*tasks.values(), return_exceptions=True))
+    )
+
+    if isinstance(results["database"], BaseException):
+        raise results["database"]
+
+    for name, result in results.items():
+        if isinstance(result, BaseException):
+            _logger.warning(f"Warm-up of {name} failed: {str(result)}")
+
+    if isinstance(results.get("access_token"), dict):
+        app.state.access_token = results["access_token"]
+
+
+def build_health_checker(app: FastAPI) -> HealthChecker:
+    probes = {
+        "mongo": mongo_probe(),
+        "event_loop": event_loop_probe(
+            app.state.event_loop_monitor, max_lag=_env.HEALTH_MAX_EVENT_LOOP_LAG
+        ),
+    }
+
+    if _env.AUTH0_DOMAIN:
+        probes["jwks"] = jwks_probe(app.state.auth)
+
+    if _env.AUTH0_DOMAIN and _env.AUTH0_MANAGEMENT_API_CLIENT_ID:
+        probes["access_token"] = access_token_probe(app.state)
+
+    return HealthChecker(
+        probes, ttl=_env.HEALTH_CACHE_TTL, timeout=_env.HEALTH_PROBE_TIMEOUT
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> None: # type: ignore
+    # Readiness gate: ``/health/ready`` answers 503 until startup finishes
+    # and again once shutdown starts, so no traffic is routed here meanwhile.
+    app.state.ready = False
+    started = time.perf_counter()
+
     _logger.info("Connecting to MongoDB")
 
     app.state.jwks_key_cache = TTLCache(maxsize=5, ttl=3600)
     app.state.jwks_cache_lock = Lock()
 
-    start_database()
-
     app.state.auth = ValidateToken(
         jwks_cache=app.state.jwks_key_cache,
         jwks_lock=app.state.jwks_cache_lock
@@ -37,6 +138,45 @@ async def lifespan(app: FastAPI) -> None: # type: ignore
     # Caches
     app.state.cached_users = {}
 
-    _logger.info("Connection established")
+    await warm_up(app)
+
+    app.state.event_loop_monitor = EventLoopMonitor()
+    app.state.event_loop_monitor.start()
+    app.state.health = build_health_checker(app)
+
+    if _env.DATABASE_BUILD_INDEXES_ON_STARTUP:
+        app.state.index_build = asyncio.create_task(build_indexes_in_background())
+
+    app.state.periodic_tasks = [
+        PeriodicTask(
+            "archive_reservations",
+            archive_reservations,
+            interval=_env.RESERVATION_ARCHIVE_INTERVAL,
+            delay=_env.PERIODIC_TASK_DELAY,
+            lease=Lease("archive_reservations", ttl=_env.RESERVATION_ARCHIVE_INTERVAL),
+        ),
+        PeriodicTask(
+            "compact_tombstones",
+            compact_tombstones,
+            interval=_env.TOMBSTONE_COMPACTION_INTERVAL,
+            delay=_env.PERIODIC_TASK_DELAY,
+            lease=Lease("compact_tombstones", ttl=_env.TOMBSTONE_COMPACTION_INTERVAL),
+        ),
+    ]
+    for task in app.state.periodic_tasks:
+        if task.interval > 0:
+            task.start()
+
+    _logger.info(
+        f"Connection established, ready in {(time.perf_counter() - started) * 1000:.0f} ms"
+    )
+
+    app.state.ready = True
 
     yield
+
+    app.state.ready = False
+
+    await app.state.event_loop_monitor.stop()
+    for task in app.state.periodic_tasks:
+        await task.stop()
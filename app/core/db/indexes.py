@@ -0,0 +1,200 @@
+"""
+Index management for the MongoDB collections.
+
+Indexes are declared on each model through ``meta["indexes"]`` (compound and
+partial ``is_active: true`` indexes for the hot queries).  This module builds
+them in the background, compares the declared plan against what exists in the
+database and checks which declared index a query would use.
+
+Usage:
+    python -m app.core.db.indexes build
+    python -m app.core.db.indexes report
+"""
+
+import argparse
+import asyncio
+import json
+from importlib import import_module
+from typing import Dict, List, Tuple, Type
+
+from pydantic import Field
+from pymongo.errors import OperationFailure
+
+from app.core.configs import get_logger
+from app.core.models.base_document import BaseDocument
+from app.core.models.base_schema import GenericModel
+
+_logger = get_logger(__name__)
+
+MODEL_MODULES = (
+    "app.crud.addresses.models",
+    "app.crud.beer_dispensers.models",
+    "app.crud.beer_types.models",
+    "app.crud.companies.models",
+    "app.crud.customers.models",
+    "app.crud.cylinders.models",
+    "app.crud.extraction_kits.models",
+    "app.crud.kegs.models",
+    "app.crud.postal_codes.models",
+    "app.crud.reservations.models",
+)
+
+
+class IndexReport(GenericModel):
+    collection: str = Field(example="kegs")
+    missing: List[str] = Field(default_factory=list, example=["company_id_1_number_1"])
+    undeclared: List[str] = Field(default_factory=list, example=["status_1"])
+    unused: List[str] | None = Field(default=None, example=["status_1"])
+
+
+class QueryPlan(GenericModel):
+    index: str | None = Field(default=None, example="company_id_1_number_1")
+    covers_sort: bool = Field(default=False, example=True)
+
+
+def get_models() -> List[Type[BaseDocument]]:
+    """Return every concrete ``BaseDocument`` model of the application."""
+    for module in MODEL_MODULES:
+        import_module(module)
+
+    models = []
+    pending = list(BaseDocument.__subclasses__())
+    while pending:
+        model = pending.pop()
+        pending.extend(model.__subclasses__())
+        if not model._meta.get("abstract"):
+            models.append(model)
+
+    return sorted(models, key=lambda model: model._get_collection_name())
+
+
+def index_name(fields: List[Tuple[str, int]]) -> str:
+    """Default MongoDB name for an index key pattern."""
+    return "_".join(f"{field}_{direction}" for field, direction in fields)
+
+
+def build_indexes(models: List[Type[BaseDocument]] | None = None) -> List[str]:
+    """Create the declared indexes, in the background on the server side."""
+    built = []
+    for model in models or get_models():
+        model.ensure_indexes()
+        built.append(model._get_collection_name())
+
+    _logger.info(f"Indexes ensured for: {', '.join(built)}")
+    return built
+
+
+async def build_indexes_in_background() -> List[str]:
+    """Run :func:`build_indexes` without blocking the event loop."""
+    try:
+        return await asyncio.to_thread(build_indexes)
+
+    except Exception as error:
+        _logger.error(f"Error on build_indexes: {str(error)}")
+        return []
+
+
+def _index_usage(collection) -> Dict[str, int] | None:
+    try:
+        return {
+            stats["name"]: int(stats["accesses"]["ops"])
+            for stats in collection.aggregate([{"$indexStats": {}}])
+        }
+
+    except (OperationFailure, NotImplementedError):
+        return None
+
+
+def report_indexes(models: List[Type[BaseDocument]] | None = None) -> List[IndexReport]:
+    """Compare declared indexes against the database and ``$indexStats``."""
+    reports = []
+    for model in models or get_models():
+        collection = model._get_collection()
+        declared = {
+            index_name(spec["fields"]) for spec in model._meta["index_specs"]
+        }
+        existing = set(collection.index_information()) - {"_id_"}
+        usage = _index_usage(collection)
+
+        reports.append(
+            IndexReport(
+                collection=collection.name,
+                missing=sorted(declared - existing),
+                undeclared=sorted(existing - declared),
+                unused=(
+                    sorted(name for name in existing if usage.get(name, 0) == 0)
+                    if usage is not None
+                    else None
+                ),
+            )
+        )
+
+    return reports
+
+
+def _is_equality(condition) -> bool:
+    if not isinstance(condition, dict):
+        return True
+    return set(condition) <= {"$eq", "$in"}
+
+
+def plan_query(
+    model: Type[BaseDocument], query: dict, ordering: List[Tuple[str, int]] | None = None
+) -> QueryPlan:
+    """Pick the declared index the planner can use for ``query``.
+
+    Follows the equality-sort-range rule: the index prefix must match
+    equality predicates, followed by the sort keys.  An index bounded by an
+    equality that also avoids the in-memory sort wins over a longer equality
+    prefix that does not.  Partial indexes are only eligible when the query
+    implies their filter expression.  ``mongomock``
+    does not implement ``explain``, so this gives tests a deterministic
+    stand-in for the server's winning plan.
+    """
+    equality = {field for field, condition in query.items() if _is_equality(condition)}
+    sort_keys = [field for field, _ in ordering or []]
+    best, best_score = QueryPlan(), (False, False, 0)
+
+    for spec in model._meta["index_specs"]:
+        partial = spec.get("partialFilterExpression") or {}
+        if any(query.get(field) != value for field, value in partial.items()):
+            continue
+
+        keys = [field for field, _ in spec["fields"]]
+        prefix = 0
+        while prefix < len(keys) and keys[prefix] in equality:
+            prefix += 1
+
+        remaining = keys[prefix:]
+        covers_sort = remaining[: len(sort_keys)] == sort_keys
+
+        if prefix == 0 and not (sort_keys and covers_sort):
+            continue
+
+        score = (prefix > 0, covers_sort, prefix)
+        if score > best_score:
+            best = QueryPlan(index=index_name(spec["fields"]), covers_sort=covers_sort)
+            best_score = score
+
+    return best
+
+
+def _main() -> None:
+    from app.core.db.connection import start_database
+
+    parser = argparse.ArgumentParser(description="Manage MongoDB indexes")
+    parser.add_argument("command", choices=["build", "report"])
+    args = parser.parse_args()
+
+    start_database()
+
+    if args.command == "build":
+        build_indexes()
+        return
+
+    reports = report_indexes()
+    print(json.dumps([report.model_dump() for report in reports], indent=2))
+
+
+if __name__ == "__main__":
+    _main()
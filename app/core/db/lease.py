@@ -0,0 +1,68 @@
+"""
+Leases that let a single process run a job across the whole deployment.
+
+Every API process starts the same periodic tasks, on every machine.  Before
+running one, a process takes the job's lease: a ``job_leases`` document
+naming the owner until ``expires_at``.  Whoever holds an unexpired lease
+runs the job and everybody else skips the tick.  Leases are never released
+early, so a job runs at most once per ``ttl`` across the fleet; a process
+that dies while holding one just lets it expire.
+"""
+
+import os
+import socket
+from datetime import timedelta
+from uuid import uuid4
+
+from pymongo import ASCENDING
+from pymongo.errors import DuplicateKeyError
+
+from app.core.utils.utc_datetime import UTCDateTime
+
+_indexed = set()
+
+
+def _owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+
+class Lease:
+    def __init__(self, name: str, ttl: float, collection: str = "job_leases") -> None:
+        self.name = name
+        self.ttl = ttl
+        self.owner = _owner()
+        self._name = collection
+
+    def _collection(self):
+        from mongoengine import get_db
+
+        collection = get_db()[self._name]
+        if collection.full_name not in _indexed:
+            # Expired leases are only garbage; an expired one is taken over
+            # by ``acquire`` whether or not the TTL monitor removed it yet.
+            collection.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+            _indexed.add(collection.full_name)
+        return collection
+
+    def acquire(self) -> bool:
+        """Take or renew the lease for ``ttl`` seconds; ``False`` if held by another."""
+        now = UTCDateTime.now()
+        try:
+            self._collection().update_one(
+                {
+                    "_id": self.name,
+                    "$or": [{"owner": self.owner}, {"expires_at": {"$lte": now}}],
+                },
+                {
+                    "$set": {
+                        "owner": self.owner,
+                        "expires_at": now + timedelta(seconds=self.ttl),
+                    }
+                },
+                upsert=True,
+            )
+            return True
+
+        except DuplicateKeyError:
+            # The lease exists and is held by someone else.
+            return False
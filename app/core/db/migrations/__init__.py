@@ -0,0 +1,8 @@
+"""
+One-off data migrations.
+
+Each module backfills or reshapes existing documents after a model change,
+is safe to run more than once and can be started on its own:
+
+    python -m app.core.db.migrations.<name>
+"""
@@ -0,0 +1,58 @@
+"""
+Backfill ``postal_code_key`` on addresses written before it existed.
+
+Addresses are grouped by their raw ``postal_code`` so every distinct code is
+one ``update_many`` instead of one write per address.  Once every address has
+a key, the old ``(company_id, postal_code)`` index is no longer used by
+``select_by_zip_code`` and is dropped.
+
+Usage:
+    python -m app.core.db.migrations.address_postal_code_key
+"""
+
+from pymongo.errors import OperationFailure
+
+from app.core.configs import get_logger
+from app.core.db.indexes import build_indexes
+from app.core.utils.postal_code import normalize_postal_code
+from app.crud.addresses.models import AddressModel
+
+_logger = get_logger(__name__)
+
+LEGACY_INDEX = "company_id_1_postal_code_1"
+
+
+def migrate() -> int:
+    """Set the missing keys and return how many addresses were updated."""
+    collection = AddressModel._get_collection()
+    missing = {"postal_code_key": {"$exists": False}}
+
+    updated = 0
+    for postal_code in collection.distinct("postal_code", missing):
+        result = collection.update_many(
+            {**missing, "postal_code": postal_code},
+            {"$set": {"postal_code_key": normalize_postal_code(postal_code)}},
+        )
+        updated += result.modified_count
+
+    build_indexes([AddressModel])
+
+    if LEGACY_INDEX in collection.index_information():
+        try:
+            collection.drop_index(LEGACY_INDEX)
+        except OperationFailure as error:
+            _logger.warning(f"Could not drop {LEGACY_INDEX}: {str(error)}")
+
+    _logger.info(f"postal_code_key set on {updated} addresses")
+    return updated
+
+
+def _main() -> None:
+    from app.core.db.connection import start_database
+
+    start_database()
+    print(f"Updated {migrate()} addresses")
+
+
+if __name__ == "__main__":
+    _main()
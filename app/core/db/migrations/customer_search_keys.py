@@ -0,0 +1,50 @@
+"""
+Backfill ``search_keys`` on customers written before customer search.
+
+The keys are derived in Python (accent folding), so every customer without
+them is read once and updated by id.
+
+Usage:
+    python -m app.core.db.migrations.customer_search_keys
+"""
+
+from app.core.configs import get_logger
+from app.core.db.indexes import build_indexes
+from app.core.utils.search import build_search_keys
+from app.crud.customers.models import CustomerModel
+
+_logger = get_logger(__name__)
+
+
+def migrate() -> int:
+    """Set the missing keys and return how many customers were updated."""
+    collection = CustomerModel._get_collection()
+    missing = {"search_keys": {"$exists": False}}
+    fields = {"name": 1, "email": 1, "document": 1, "mobile": 1}
+
+    updated = 0
+    for customer in collection.find(missing, fields):
+        keys = build_search_keys(
+            texts=[customer.get("name"), customer.get("email")],
+            numbers=[customer.get("document"), customer.get("mobile")],
+        )
+        result = collection.update_one(
+            {"_id": customer["_id"]}, {"$set": {"search_keys": keys}}
+        )
+        updated += result.modified_count
+
+    build_indexes([CustomerModel])
+
+    _logger.info(f"search_keys set on {updated} customers")
+    return updated
+
+
+def _main() -> None:
+    from app.core.db.connection import start_database
+
+    start_database()
+    print(f"Updated {migrate()} customers")
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,38 @@
+"""
+Give every document written before versioning ``version: 1``.
+
+Reads already treat a missing version as 1; once set, unconditional
+updates ``$inc`` it from there instead of from 0.
+
+Usage:
+    python -m app.core.db.migrations.document_versions
+"""
+
+from app.core.configs import get_logger
+from app.core.db.indexes import get_models
+
+_logger = get_logger(__name__)
+
+
+def migrate() -> int:
+    """Set the missing versions and return how many documents were updated."""
+    updated = 0
+    for model in get_models():
+        result = model._get_collection().update_many(
+            {"version": {"$exists": False}}, {"$set": {"version": 1}}
+        )
+        updated += result.modified_count
+
+    _logger.info(f"Version set on {updated} documents")
+    return updated
+
+
+def _main() -> None:
+    from app.core.db.connection import start_database
+
+    start_database()
+    print(f"Updated {migrate()} documents")
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,61 @@
+"""
+Store the id of every embedded payment written before payment ids.
+
+The stored id is :func:`legacy_payment_id`, the one already returned on
+reads, so ids clients hold keep working.  Each reservation is rewritten only if its ``payments`` did not change since
+it was read, so a payment added meanwhile is never lost; such reservations
+are picked up by the next run.
+
+Usage:
+    python -m app.core.db.migrations.reservation_payment_ids
+"""
+
+from app.core.configs import get_logger
+from app.core.models.base_document import NEXT_VERSION
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.payments.models import legacy_payment_id
+from app.crud.reservations.models import ReservationModel
+
+_logger = get_logger(__name__)
+
+
+def migrate() -> int:
+    """Set the missing ids and return how many reservations were updated."""
+    collection = ReservationModel._get_collection()
+    missing = {"payments": {"$elemMatch": {"id": {"$exists": False}}}}
+
+    updated = 0
+    for reservation in collection.find(missing, {"payments": 1}):
+        payments = [
+            payment
+            if payment.get("id")
+            else {"id": legacy_payment_id(reservation["_id"], index), **payment}
+            for index, payment in enumerate(reservation["payments"])
+        ]
+        result = collection.update_one(
+            {"_id": reservation["_id"], "payments": reservation["payments"]},
+            [
+                {
+                    "$set": {
+                        "payments": {"$literal": payments},
+                        "updated_at": UTCDateTime.now(),
+                        "version": NEXT_VERSION,
+                    }
+                }
+            ],
+        )
+        updated += result.modified_count
+
+    _logger.info(f"Payment ids set on {updated} reservations")
+    return updated
+
+
+def _main() -> None:
+    from app.core.db.connection import start_database
+
+    start_database()
+    print(f"Updated {migrate()} reservations")
+
+
+if __name__ == "__main__":
+    _main()
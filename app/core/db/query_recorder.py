@@ -0,0 +1,124 @@
+"""
+N+1 query detection.
+
+Queries issued inside :func:`record_queries` are reduced to their *shape*
+(collection, operation and filter keys with the values blanked) so that
+``find({"_id": "keg_1"})`` and ``find({"_id": "keg_2"})`` count as the same
+query.  A shape repeated more than ``threshold`` times in one request or test
+is reported as an N+1.
+
+Real MongoDB commands are fed by :class:`QueryRecorderListener` (pymongo
+command monitoring).  Sources without command monitoring, such as the
+``mongomock`` wrapper of the test suite, record into :func:`active_recorder`.
+"""
+
+import json
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Tuple
+
+from pymongo import monitoring
+
+DEFAULT_THRESHOLD = 3
+
+_FILTER_KEYS = {
+    "find": "filter",
+    "count": "query",
+    "distinct": "query",
+    "delete": "deletes",
+    "update": "updates",
+    "findAndModify": "query",
+    "aggregate": "pipeline",
+    "insert": None,
+}
+
+_recorder: ContextVar["QueryRecorder | None"] = ContextVar("query_recorder", default=None)
+
+
+class NPlusOneError(AssertionError):
+    """Raised by :func:`assert_no_n_plus_one` when a query shape repeats."""
+
+
+def query_shape(value):
+    """Blank every value of a query, keeping field names and operators."""
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in sorted(value.items())}
+
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], dict):
+        return [query_shape(item) for item in value]
+
+    return "?"
+
+
+class QueryRecorder:
+    def __init__(self, threshold: int = DEFAULT_THRESHOLD) -> None:
+        self.threshold = threshold
+        self.queries: List[Tuple[str, str, str]] = []
+
+    def record(self, collection: str, operation: str, query=None) -> None:
+        shape = json.dumps(query_shape(query or {}), sort_keys=True, default=str)
+        self.queries.append((collection, operation, shape))
+
+    def repeated(self) -> List[Tuple[Tuple[str, str, str], int]]:
+        """Query shapes issued more than ``threshold`` times."""
+        return [
+            (shape, count)
+            for shape, count in Counter(self.queries).most_common()
+            if count > self.threshold
+        ]
+
+    def report(self) -> str:
+        lines = [
+            f"{len(self.queries)} queries, repeated shapes (threshold {self.threshold}):"
+        ]
+        for (collection, operation, shape), count in self.repeated():
+            lines.append(f"  {count}x {collection}.{operation} {shape}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def record_queries(threshold: int = DEFAULT_THRESHOLD) -> Iterator[QueryRecorder]:
+    """Record the queries issued from the current context."""
+    recorder = QueryRecorder(threshold=threshold)
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+def active_recorder() -> QueryRecorder | None:
+    """Recorder of the current context, if any."""
+    return _recorder.get()
+
+
+@contextmanager
+def assert_no_n_plus_one(threshold: int = DEFAULT_THRESHOLD) -> Iterator[QueryRecorder]:
+    """Fail with a readable report when a query shape repeats."""
+    with record_queries(threshold=threshold) as recorder:
+        yield recorder
+
+    if recorder.repeated():
+        raise NPlusOneError(recorder.report())
+
+
+class QueryRecorderListener(monitoring.CommandListener):
+    def started(self, event) -> None:
+        recorder = _recorder.get()
+        if recorder is None or event.command_name not in _FILTER_KEYS:
+            return
+
+        command = event.command
+        filter_key = _FILTER_KEYS[event.command_name]
+        recorder.record(
+            str(command.get(event.command_name)),
+            event.command_name,
+            command.get(filter_key) if filter_key else None,
+        )
+
+    def succeeded(self, event) -> None:
+        pass
+
+    def failed(self, event) -> None:
+        pass
@@ -0,0 +1,42 @@
+"""
+Read preference routing.
+
+Writes and read-your-writes lookups (``select_by_id`` after ``create`` or
+``update``, reservation conflict checks) use the client default, the
+primary.  Listing and analytics queries opt in to
+:func:`analytics_read_preference`, which lets a secondary at most
+``DATABASE_ANALYTICS_MAX_STALENESS_SECONDS`` behind serve them.  Listings
+behind ``@cached`` stay on the primary: they are reloaded right after a
+write invalidates them and must not cache what preceded it.  On a
+standalone server the preference is ignored.
+"""
+
+from functools import lru_cache
+
+from pymongo.read_preferences import (
+    ReadPreference,
+    _ServerMode,
+    make_read_preference,
+    read_pref_mode_from_name,
+)
+
+from app.core.configs import get_environment
+
+
+def build_read_preference(name: str, max_staleness: int = -1) -> _ServerMode:
+    mode = read_pref_mode_from_name(name)
+
+    # The primary is never stale, pymongo rejects a staleness bound for it.
+    if mode == ReadPreference.PRIMARY.mode:
+        max_staleness = -1
+
+    return make_read_preference(mode, None, max_staleness)
+
+
+@lru_cache
+def analytics_read_preference() -> _ServerMode:
+    env = get_environment()
+    return build_read_preference(
+        env.DATABASE_ANALYTICS_READ_PREFERENCE,
+        env.DATABASE_ANALYTICS_MAX_STALENESS_SECONDS,
+    )
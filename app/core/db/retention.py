@@ -0,0 +1,159 @@
+"""
+Compaction of soft-deleted documents.
+
+``soft_delete`` only flips ``is_active``, so tombstones would stay in every
+collection and every index forever.  Tombstones older than
+``TOMBSTONE_RETENTION_DAYS`` are moved, in batches, to a per-collection
+``{collection}_graveyard``: the full document stays available for audit and
+delta sync reads its deletions from there (see ``SyncRepository``), while
+the hot collection and its partial ``is_active: true`` indexes only keep
+live data.
+
+Usage:
+    python -m app.core.db.retention report
+    python -m app.core.db.retention compact [--days 90]
+"""
+
+import argparse
+import json
+from datetime import datetime, timedelta
+from typing import List, Tuple, Type
+
+import bson
+from pydantic import Field
+from pymongo import ASCENDING
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+from app.core.configs import get_environment, get_logger
+from app.core.db.indexes import get_models
+from app.core.db.tiering import move_documents
+from app.core.metrics import TOMBSTONES_COMPACTED
+from app.core.models.base_document import BaseDocument
+from app.core.models.base_schema import GenericModel
+from app.core.utils.utc_datetime import UTCDateTime
+
+_env = get_environment()
+_logger = get_logger(__name__)
+
+GRAVEYARD_SUFFIX = "_graveyard"
+_indexed = set()
+
+
+class RetentionReport(GenericModel):
+    collection: str = Field(example="kegs")
+    tombstones: int = Field(default=0, example=120)
+    reclaimable_bytes: int = Field(default=0, example=48_000)
+    moved: int = Field(default=0, example=0)
+
+
+def graveyard(model: Type[BaseDocument]) -> Collection:
+    """Graveyard of ``model``, indexed for the delta sync tombstone query."""
+    collection = model._get_db()[model._get_collection_name() + GRAVEYARD_SUFFIX]
+    if collection.full_name not in _indexed:
+        collection.create_index([("company_id", ASCENDING), ("updated_at", ASCENDING)])
+        _indexed.add(collection.full_name)
+    return collection
+
+
+def _tombstones(older_than: datetime) -> dict:
+    return {"is_active": False, "updated_at": {"$lt": older_than}}
+
+
+def _tombstone_stats(collection: Collection, query: dict) -> Tuple[int, int]:
+    """Count and BSON size of the documents matching ``query``."""
+    try:
+        stats = list(
+            collection.aggregate(
+                [
+                    {"$match": query},
+                    {
+                        "$group": {
+                            "_id": None,
+                            "count": {"$sum": 1},
+                            "bytes": {"$sum": {"$bsonSize": "$$ROOT"}},
+                        }
+                    },
+                ]
+            )
+        )
+        return (stats[0]["count"], stats[0]["bytes"]) if stats else (0, 0)
+
+    except (OperationFailure, NotImplementedError):
+        # ``$bsonSize`` needs MongoDB 4.4; measure on the client instead.
+        sizes = [len(bson.encode(document)) for document in collection.find(query)]
+        return len(sizes), sum(sizes)
+
+
+def compact_model(
+    model: Type[BaseDocument],
+    older_than: datetime,
+    batch_size: int = 500,
+    dry_run: bool = False,
+) -> RetentionReport:
+    collection = model._get_collection()
+    query = _tombstones(older_than)
+    tombstones, reclaimable = _tombstone_stats(collection, query)
+    report = RetentionReport(
+        collection=collection.name,
+        tombstones=tombstones,
+        reclaimable_bytes=reclaimable,
+    )
+    if dry_run or not tombstones:
+        return report
+
+    target = graveyard(model)
+    while True:
+        batch = list(collection.find(query).sort("_id", ASCENDING).limit(batch_size))
+        moved = move_documents(collection, target, batch)
+        report.moved += moved
+        # Nothing moved means every document of the batch was written meanwhile.
+        if len(batch) < batch_size or not moved:
+            break
+
+    if report.moved:
+        TOMBSTONES_COMPACTED.inc(report.moved, collection=collection.name)
+    return report
+
+
+def compact_tombstones(
+    days: int | None = None,
+    models: List[Type[BaseDocument]] | None = None,
+    dry_run: bool = False,
+) -> List[RetentionReport]:
+    """Move (or with ``dry_run`` only measure) tombstones older than ``days``."""
+    days = _env.TOMBSTONE_RETENTION_DAYS if days is None else days
+    older_than = UTCDateTime.now() - timedelta(days=days)
+
+    reports = [
+        compact_model(
+            model,
+            older_than=older_than,
+            batch_size=_env.TOMBSTONE_COMPACTION_BATCH_SIZE,
+            dry_run=dry_run,
+        )
+        for model in models or get_models()
+    ]
+
+    if not dry_run:
+        moved = sum(report.moved for report in reports)
+        _logger.info(f"Moved {moved} tombstones older than {days} days to the graveyards")
+    return reports
+
+
+def _main() -> None:
+    from app.core.db.connection import start_database
+
+    parser = argparse.ArgumentParser(description="Compact soft-deleted documents")
+    parser.add_argument("command", choices=["report", "compact"])
+    parser.add_argument("--days", type=int, default=None)
+    args = parser.parse_args()
+
+    start_database()
+
+    reports = compact_tombstones(days=args.days, dry_run=args.command == "report")
+    print(json.dumps([report.model_dump() for report in reports], indent=2))
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,48 @@
+"""
+Moving documents between a hot collection and a colder one.
+
+Shared by the reservation archive and the tombstone graveyard.
+"""
+
+from typing import List
+
+from pymongo import ReplaceOne
+from pymongo.collection import Collection
+
+
+def move_documents(source: Collection, target: Collection, documents: List[dict]) -> int:
+    """Copy ``documents`` to ``target``, then delete them from ``source``.
+
+    The copy lands first, so a crash in between leaves a duplicate, never a
+    loss; the copy is an upsert by ``_id``, so moving the same documents
+    again (or concurrently) just overwrites it.  Only documents still at the
+    ``version`` that was copied are deleted, so one written meanwhile stays
+    in ``source`` (and its stale copy is dropped).  That relies on every
+    write to ``source`` bumping ``version``, raw and bulk updates included
+    (see ``Repository.versioned_set``).  Returns how many documents were
+    moved.
+    """
+    if not documents:
+        return 0
+
+    ids = [document["_id"] for document in documents]
+
+    target.bulk_write(
+        [ReplaceOne({"_id": document["_id"]}, document, upsert=True) for document in documents],
+        ordered=False,
+    )
+
+    moved = source.delete_many(
+        {
+            "$or": [
+                {"_id": document["_id"], "version": document.get("version")}
+                for document in documents
+            ]
+        }
+    ).deleted_count
+
+    if moved < len(ids):
+        kept = source.distinct("_id", {"_id": {"$in": ids}})
+        target.delete_many({"_id": {"$in": kept}})
+
+    return moved
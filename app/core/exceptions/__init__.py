@@ -1,4 +1,5 @@
 from .users import (
+    ConflictError,
     InvalidPassword,
     UnprocessableEntity,
     NotFoundError,
@@ -31,3 +31,13 @@ class BadRequestError(Exception):
 
     def __init__(self, message="Requisição inválida") -> None:
         self.message = message
+
+
+class ConflictError(Exception):
+    """Raised when a write is based on an outdated version of a document"""
+
+    def __init__(
+        self, message="Registro alterado por outra pessoa", current_version: int | None = None
+    ) -> None:
+        self.message = message
+        self.current_version = current_version
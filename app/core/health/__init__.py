@@ -0,0 +1,9 @@
+from .checker import CachedProbe, HealthChecker
+from .probes import (
+    EventLoopMonitor,
+    access_token_probe,
+    event_loop_probe,
+    jwks_probe,
+    mongo_probe,
+)
+from .schemas import HealthReport, ProbeResult
@@ -0,0 +1,71 @@
+"""
+Cached dependency probes.
+
+A probe is an async callable returning a ``dict`` of details; raising (or
+returning ``{"healthy": False, ...}``) marks the dependency unhealthy.  Each
+result is kept for ``ttl`` seconds and concurrent callers share one run, so
+health checks polled every few seconds cost at most one probe per interval.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Iterable
+
+from app.core.utils.utc_datetime import UTCDateTime
+
+from .schemas import HealthReport, ProbeResult
+
+Probe = Callable[[], Awaitable[dict]]
+
+
+class CachedProbe:
+    def __init__(self, probe: Probe, ttl: float, timeout: float) -> None:
+        self.probe = probe
+        self.ttl = ttl
+        self.timeout = timeout
+        self._result: ProbeResult | None = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> ProbeResult:
+        async with self._lock:
+            if self._result is None or time.monotonic() >= self._expires_at:
+                self._result = await self._run()
+                self._expires_at = time.monotonic() + self.ttl
+
+        return self._result
+
+    async def _run(self) -> ProbeResult:
+        started = time.perf_counter()
+
+        try:
+            details = dict(await asyncio.wait_for(self.probe(), self.timeout))
+            healthy = details.pop("healthy", True)
+
+        except Exception as error:
+            details = {"error": str(error) or type(error).__name__}
+            healthy = False
+
+        return ProbeResult(
+            healthy=healthy,
+            checked_at=UTCDateTime.now(),
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            details=details,
+        )
+
+
+class HealthChecker:
+    def __init__(self, probes: Dict[str, Probe], ttl: float = 5, timeout: float = 2) -> None:
+        self.probes = {
+            name: CachedProbe(probe, ttl=ttl, timeout=timeout)
+            for name, probe in probes.items()
+        }
+
+    async def check(self, names: Iterable[str] | None = None) -> HealthReport:
+        names = list(self.probes if names is None else names)
+        results = await asyncio.gather(*(self.probes[name].get() for name in names))
+
+        return HealthReport(
+            healthy=all(result.healthy for result in results),
+            checks=dict(zip(names, results)),
+        )
@@ -0,0 +1,130 @@
+"""
+Probes of the API dependencies used by ``/health/ready`` and ``/health/deep``.
+"""
+
+import asyncio
+from contextlib import suppress
+
+from mongoengine import get_connection
+
+from app.core.metrics import EVENT_LOOP_LAG, MONGO_POOL_CONNECTIONS
+from app.core.utils.utc_datetime import UTCDateTime
+
+
+class EventLoopMonitor:
+    """Samples event loop lag: how late a periodic ``sleep`` wakes up.
+
+    Blocking calls made on the loop (pymongo, requests) show up here as lag.
+    """
+
+    def __init__(self, interval: float = 0.5) -> None:
+        self.interval = interval
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def sample(self) -> dict:
+        """Latest and worst lag since the previous sample, in milliseconds."""
+        sample = {
+            "lag_ms": round(self.lag * 1000, 2),
+            "max_lag_ms": round(self.max_lag * 1000, 2),
+        }
+        self.max_lag = self.lag
+        return sample
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lag = max(loop.time() - started - self.interval, 0.0)
+            self.max_lag = max(self.max_lag, self.lag)
+            EVENT_LOOP_LAG.set(self.lag)
+
+
+def _server_details(address: str, server) -> dict:
+    rtt = server.round_trip_time
+    return {
+        "address": address,
+        "type": server.server_type_name,
+        "rtt_ms": round(rtt * 1000, 2) if rtt is not None else None,
+        "open": MONGO_POOL_CONNECTIONS.value(address=address, state="open"),
+        "in_use": MONGO_POOL_CONNECTIONS.value(address=address, state="in_use"),
+    }
+
+
+def mongo_probe():
+    async def probe() -> dict:
+        client = get_connection()
+
+        started = asyncio.get_running_loop().time()
+        await asyncio.to_thread(client.admin.command, "ping")
+        latency = asyncio.get_running_loop().time() - started
+
+        pool = client.options.pool_options
+        return {
+            "latency_ms": round(latency * 1000, 2),
+            "pool": {
+                "max_size": pool.max_pool_size,
+                "min_size": pool.min_pool_size,
+            },
+            "servers": [
+                _server_details(f"{host}:{port}", server)
+                for (host, port), server in client.topology_description.server_descriptions().items()
+            ],
+        }
+
+    return probe
+
+
+def jwks_probe(auth):
+    """Cached signing keys; refetched here when the cache has expired."""
+
+    async def probe() -> dict:
+        if not auth.cached_keys:
+            await asyncio.to_thread(auth.warm_up)
+
+        return {
+            "keys": auth.cached_keys,
+            "refreshed_at": str(auth.refreshed_at) if auth.refreshed_at else None,
+        }
+
+    return probe
+
+
+def access_token_probe(state):
+    """Freshness of the Auth0 management token, renewed on use when stale."""
+
+    async def probe() -> dict:
+        token = state.access_token
+        if not token:
+            return {"status": "missing"}
+
+        expires_in = (token["expires_at"] - UTCDateTime.now()).total_seconds()
+        return {
+            "status": "fresh" if expires_in > 0 else "expired",
+            "expires_in_seconds": round(expires_in),
+        }
+
+    return probe
+
+
+def event_loop_probe(monitor: EventLoopMonitor, max_lag: float):
+    async def probe() -> dict:
+        sample = monitor.sample()
+        return {"healthy": sample["max_lag_ms"] <= max_lag * 1000, **sample}
+
+    return probe
@@ -0,0 +1,18 @@
+from typing import Dict
+
+from pydantic import Field
+
+from app.core.models.base_schema import GenericModel
+from app.core.utils.utc_datetime import UTCDateTime
+
+
+class ProbeResult(GenericModel):
+    healthy: bool = Field(example=True)
+    checked_at: UTCDateTime = Field(example=str(UTCDateTime.now()))
+    duration_ms: float = Field(example=1.2)
+    details: Dict[str, object] = Field(default_factory=dict, example={"latency_ms": 1.1})
+
+
+class HealthReport(GenericModel):
+    healthy: bool = Field(example=True)
+    checks: Dict[str, ProbeResult] = Field(default_factory=dict)
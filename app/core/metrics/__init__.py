@@ -0,0 +1,25 @@
+from .instruments import (
+    CACHE_REQUESTS,
+    EVENT_LOOP_LAG,
+    HTTP_CLIENT_DURATION,
+    HTTP_REQUEST_DURATION,
+    MONGO_COMMAND_DURATION,
+    MONGO_POOL_CHECKOUT_FAILURES,
+    MONGO_POOL_CHECKOUT_WAIT,
+    MONGO_POOL_CONNECTIONS,
+    MONGO_POOL_UTILIZATION,
+    MONGO_REQUEST_COMMANDS,
+    MONGO_REQUEST_DURATION,
+    REGISTRY,
+    RESERVATIONS_ARCHIVED,
+    TOMBSTONES_COMPACTED,
+    record_cache,
+)
+from .mongo import (
+    MongoCommandListener,
+    MongoPoolListener,
+    RequestStats,
+    get_request_stats,
+    start_request_stats,
+)
+from .registry import Counter, Gauge, Histogram, MetricsRegistry
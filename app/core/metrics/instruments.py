@@ -0,0 +1,89 @@
+"""
+Metrics exported by the API on ``/metrics``.
+"""
+
+from app.core.metrics.registry import MetricsRegistry
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Latency of the HTTP requests handled by the API.",
+    labels=("method", "route", "status"),
+)
+
+MONGO_COMMAND_DURATION = REGISTRY.histogram(
+    "mongo_command_duration_seconds",
+    "Duration of the MongoDB commands.",
+    labels=("command", "status"),
+)
+
+MONGO_REQUEST_COMMANDS = REGISTRY.histogram(
+    "mongo_request_commands",
+    "MongoDB commands issued while handling one HTTP request.",
+    labels=("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+
+MONGO_REQUEST_DURATION = REGISTRY.histogram(
+    "mongo_request_duration_seconds",
+    "Time spent in MongoDB commands while handling one HTTP request.",
+    labels=("method", "route"),
+)
+
+MONGO_POOL_CHECKOUT_WAIT = REGISTRY.histogram(
+    "mongo_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the MongoDB pool.",
+    labels=("address",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+MONGO_POOL_CHECKOUT_FAILURES = REGISTRY.counter(
+    "mongo_pool_checkout_failures_total",
+    "Failed connection checkouts by reason (timeout, connectionError, poolClosed).",
+    labels=("address", "reason"),
+)
+
+MONGO_POOL_CONNECTIONS = REGISTRY.gauge(
+    "mongo_pool_connections",
+    "MongoDB pool connections by state (open or in_use).",
+    labels=("address", "state"),
+)
+
+MONGO_POOL_UTILIZATION = REGISTRY.gauge(
+    "mongo_pool_utilization_ratio",
+    "Connections in use over the maximum pool size.",
+    labels=("address",),
+)
+
+HTTP_CLIENT_DURATION = REGISTRY.histogram(
+    "http_client_request_duration_seconds",
+    "Latency of the outbound HTTP requests.",
+    labels=("method", "host", "status"),
+)
+
+CACHE_REQUESTS = REGISTRY.counter(
+    "cache_requests_total",
+    "Cache lookups by result (hit or miss).",
+    labels=("cache", "result"),
+)
+
+RESERVATIONS_ARCHIVED = REGISTRY.counter(
+    "reservations_archived_total",
+    "COMPLETED reservations moved to the per-year archive collections.",
+)
+
+TOMBSTONES_COMPACTED = REGISTRY.counter(
+    "tombstones_compacted_total",
+    "Soft-deleted documents moved to their collection graveyard.",
+    labels=("collection",),
+)
+
+EVENT_LOOP_LAG = REGISTRY.gauge(
+    "event_loop_lag_seconds",
+    "How late the event loop ran the last periodic timer.",
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
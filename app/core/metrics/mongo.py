@@ -0,0 +1,118 @@
+"""
+MongoDB command and connection pool monitoring.
+
+``MongoCommandListener`` is registered on the pymongo client and records every
+command in the global histograms and in the :class:`RequestStats` of the
+request being served, if any.  ``MongoPoolListener`` tracks checkout wait
+time and how many pooled connections are open and in use per server.
+"""
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from pymongo import monitoring
+
+from app.core.metrics.instruments import (
+    MONGO_COMMAND_DURATION,
+    MONGO_POOL_CHECKOUT_FAILURES,
+    MONGO_POOL_CHECKOUT_WAIT,
+    MONGO_POOL_CONNECTIONS,
+    MONGO_POOL_UTILIZATION,
+)
+
+
+@dataclass
+class RequestStats:
+    commands: int = 0
+    duration: float = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("mongo_request_stats", default=None)
+
+
+def start_request_stats() -> RequestStats:
+    """Collect the commands issued from the current context."""
+    stats = RequestStats()
+    _request_stats.set(stats)
+    return stats
+
+
+def get_request_stats() -> RequestStats | None:
+    return _request_stats.get()
+
+
+class MongoCommandListener(monitoring.CommandListener):
+    def started(self, event) -> None:
+        pass
+
+    def succeeded(self, event) -> None:
+        self._record(event, "success")
+
+    def failed(self, event) -> None:
+        self._record(event, "failure")
+
+    def _record(self, event, status: str) -> None:
+        duration = event.duration_micros / 1_000_000
+        MONGO_COMMAND_DURATION.observe(duration, command=event.command_name, status=status)
+
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.commands += 1
+            stats.duration += duration
+
+
+def _address(event) -> str:
+    host, port = event.address
+    return f"{host}:{port}"
+
+
+class MongoPoolListener(monitoring.ConnectionPoolListener):
+    def __init__(self, max_pool_size: int = 100) -> None:
+        self.max_pool_size = max_pool_size
+
+    def pool_created(self, event) -> None:
+        address = _address(event)
+        MONGO_POOL_CONNECTIONS.set(0, address=address, state="open")
+        MONGO_POOL_CONNECTIONS.set(0, address=address, state="in_use")
+        MONGO_POOL_UTILIZATION.set(0, address=address)
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        pass
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_created(self, event) -> None:
+        MONGO_POOL_CONNECTIONS.inc(address=_address(event), state="open")
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        MONGO_POOL_CONNECTIONS.dec(address=_address(event), state="open")
+
+    def connection_check_out_started(self, event) -> None:
+        pass
+
+    def connection_check_out_failed(self, event) -> None:
+        address = _address(event)
+        MONGO_POOL_CHECKOUT_FAILURES.inc(address=address, reason=event.reason)
+        if event.duration is not None:
+            MONGO_POOL_CHECKOUT_WAIT.observe(event.duration, address=address)
+
+    def connection_checked_out(self, event) -> None:
+        address = _address(event)
+        if event.duration is not None:
+            MONGO_POOL_CHECKOUT_WAIT.observe(event.duration, address=address)
+        self._update_in_use(address, 1)
+
+    def connection_checked_in(self, event) -> None:
+        self._update_in_use(_address(event), -1)
+
+    def _update_in_use(self, address: str, amount: int) -> None:
+        MONGO_POOL_CONNECTIONS.inc(amount, address=address, state="in_use")
+        in_use = MONGO_POOL_CONNECTIONS.value(address=address, state="in_use")
+        MONGO_POOL_UTILIZATION.set(in_use / self.max_pool_size, address=address)
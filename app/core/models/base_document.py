@@ -1,21 +1,52 @@
 from uuid import uuid4
-from mongoengine import BooleanField, DateTimeField, Document, StringField
+from mongoengine import BooleanField, DateTimeField, Document, IntField, StringField
+from mongoengine.errors import SaveConditionError
+from app.core.cache.cache import invalidate
+from app.core.exceptions import ConflictError
 from app.core.utils.utc_datetime import UTCDateTime
 
 
+# Partial filter shared by the hot-path indexes: soft-deleted documents are
+# never read by listing queries, so they are kept out of those indexes.
+ACTIVE_ONLY = {"is_active": True}
+
+
 def generate_prefixed_id(prefix: str) -> str:
     return f"{prefix}_{uuid4().hex[:8]}"
 
 
+def version_filter(version: int) -> dict:
+    """Query matching documents still at ``version``.
+
+    Documents written before versioning have no ``version`` and count as 1.
+    """
+    if version == 1:
+        return {"version__in": [1, None]}
+    return {"version": version}
+
+
+# Update-pipeline expression advancing ``version``.  Unlike ``$inc`` it moves
+# a document written before versioning (no ``version``, read as 1) to 2.
+NEXT_VERSION = {"$add": [{"$ifNull": ["$version", 1]}, 1]}
+
+
 class BaseDocument(Document):
-    meta = {"abstract": True}
+    meta = {
+        "abstract": True,
+        "index_background": True,
+    }
 
     id = StringField(primary_key=True)
     is_active = BooleanField(default=True, required=True)
     created_at = DateTimeField(default=UTCDateTime.now, required=True)
     updated_at = DateTimeField(default=UTCDateTime.now, required=True)
+    # Bumped on every write; updates compare-and-swap on it.
+    version = IntField(default=1, required=True)
 
     def save(self, *args, **kwargs):
+        # Assigning the id below clears ``_created``, so read it first.
+        is_new = self._created
+
         if not self.id:
             prefix = self.__class__.__name__.lower()[:3]
             self.id = generate_prefixed_id(prefix)
@@ -24,7 +55,27 @@ class BaseDocument(Document):
             self.created_at = UTCDateTime.now()
 
         self.updated_at = UTCDateTime.now()
-        super().save(*args, **kwargs)
+
+        if is_new:
+            super().save(*args, **kwargs)
+            self.invalidate_cache()
+            return
+
+        read_version = self.version or 1
+        kwargs.setdefault("save_condition", version_filter(read_version))
+        self.version = read_version + 1
+        try:
+            super().save(*args, **kwargs)
+        except SaveConditionError:
+            self.version = read_version
+            current = self.__class__.objects(pk=self.pk).only("version").first()
+            raise ConflictError(current_version=current.version if current else None)
+
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached reads of this collection for the document's company."""
+        invalidate(getattr(self, "company_id", None), self._get_collection_name())
 
     def base_update(self):
         self.updated_at = UTCDateTime.now()
@@ -8,6 +8,7 @@ class DatabaseModel(BaseModel):
     id: str = Field(example="123")
     created_at: UTCDateTimeType = Field(example=str(UTCDateTime.now()))
     updated_at: UTCDateTimeType = Field(example=str(UTCDateTime.now()))
+    version: int = Field(default=1, example=1)
 
     model_config = ConfigDict(extra="allow", from_attributes=True)
 
@@ -1,6 +1,91 @@
+from typing import List, Type, TypeVar
+
+from mongoengine import Document, QuerySet
+from mongoengine.queryset import transform
+from pymongo import ReturnDocument
+
+from app.core.db.read_preference import analytics_read_preference
+from app.core.exceptions import ConflictError
+from app.core.models.base_document import NEXT_VERSION, version_filter
+from app.core.utils.utc_datetime import UTCDateTime
+
+_Model = TypeVar("_Model", bound=Document)
 
 
 class Repository:
 
     def __init__(self) -> None:
         ...
+
+    @staticmethod
+    def secondary_reads(query: QuerySet) -> QuerySet:
+        """Let a secondary serve a listing or analytics query.
+
+        Never use it for a read that must see the caller's own writes, nor
+        let its results decide a write: re-read those documents from the
+        primary first.
+        """
+        return query.read_preference(analytics_read_preference())
+
+    @staticmethod
+    def versioned_set(model: Type[_Model], **fields) -> List[dict]:
+        """Update pipeline ``$set``-ing ``fields`` and bumping ``version``.
+
+        For writes that cannot go through :meth:`find_and_update`, such as
+        bulk updates.  Values are ``$literal`` so a string starting with
+        ``$`` is never read as a field path.
+        """
+        values = transform.update(model, **fields)["$set"]
+        return [
+            {
+                "$set": {
+                    **{field: {"$literal": value} for field, value in values.items()},
+                    "version": NEXT_VERSION,
+                }
+            }
+        ]
+
+    @staticmethod
+    def find_and_update(
+        model: Type[_Model], filters: dict, fields: dict, version: int | None = None
+    ) -> _Model | None:
+        """``$set`` ``fields`` and ``updated_at`` on the active document
+        matching ``filters``, bump its version and return it as updated.
+
+        One ``find_one_and_update`` round trip, so there is no window between
+        reading and writing the document.  With ``version`` the write is a
+        compare-and-swap: :class:`ConflictError` carries the current version
+        when the document changed since the caller read it.  ``None`` when
+        nothing matched.  Documents written before versioning count as
+        version 1 and move to 2 on their first write.
+        """
+        query = model.objects(is_active=True, **filters)
+        guarded = query.filter(**version_filter(version)) if version else query
+        now = UTCDateTime.now()
+
+        if all("__" not in field for field in fields):
+            # Plain fields: an update pipeline, so a document without a
+            # version moves from 1 to 2 like any other.
+            document = guarded._collection.find_one_and_update(
+                guarded._query,
+                Repository.versioned_set(model, updated_at=now, **fields),
+                return_document=ReturnDocument.AFTER,
+            )
+            updated = model._from_son(document) if document else None
+        else:
+            # Operator updates (``push__``/``pull__``) cannot be mixed with a
+            # pipeline; give a document without a version its implicit 1
+            # first so the ``$inc`` below moves it to 2.
+            if not version:
+                query.filter(version=None).update(set__version=1)
+            bump = {"set__version": version + 1} if version else {"inc__version": 1}
+            updated = guarded.modify(new=True, updated_at=now, **bump, **fields)
+
+        if updated is None and version:
+            current = query.only("version").first()
+            if current:
+                raise ConflictError(current_version=current.version)
+
+        if updated is not None:
+            updated.invalidate_cache()
+        return updated
@@ -1,5 +1,8 @@
+import time
 from typing import Union
-from requests import post, put, get, delete, patch
+from urllib.parse import urlsplit
+
+from app.core.metrics import HTTP_CLIENT_DURATION
 
 
 class HTTPClient:
@@ -7,10 +10,32 @@ class HTTPClient:
     def __init__(self, headers: dict) -> None:
         self.headers = headers
 
+    def _send(self, method: str, url: str, **kwargs):
+        # Imported on first use: ``requests`` is only needed once the API
+        # calls Auth0, not to boot the application.
+        import requests
+
+        started = time.perf_counter()
+        status = "error"
+
+        try:
+            response = requests.request(method, url=url, **kwargs)
+            status = response.status_code
+            return response
+
+        finally:
+            HTTP_CLIENT_DURATION.observe(
+                time.perf_counter() - started,
+                method=method,
+                host=urlsplit(url).netloc,
+                status=status,
+            )
+
     def post(self, url: str, data: dict = None, params: dict = None) -> Union[int, dict]:
 
-        response = post(
-            url=url,
+        response = self._send(
+            "POST",
+            url,
             headers=self.headers,
             params=params,
             data=data
@@ -23,8 +48,9 @@ class HTTPClient:
 
     def patch(self, url: str, data: dict = None, params: dict = None) -> Union[int, dict]:
 
-        response = patch(
-            url=url,
+        response = self._send(
+            "PATCH",
+            url,
             headers=self.headers,
             params=params,
             json=data
@@ -34,8 +60,9 @@ class HTTPClient:
 
     def put(self, url: str, data: dict = None, params: dict = None) -> Union[int, dict]:
 
-        response = put(
-            url=url,
+        response = self._send(
+            "PUT",
+            url,
             headers=self.headers,
             params=params,
             json=data
@@ -45,8 +72,9 @@ class HTTPClient:
 
     def get(self, url: str, params: dict = None, raw: bool = False) -> Union[int, dict]:
 
-        response = get(
-            url=url,
+        response = self._send(
+            "GET",
+            url,
             headers=self.headers,
             params=params
         )
@@ -61,8 +89,9 @@ class HTTPClient:
 
     def delete(self, url: str, data: dict = None, params: dict = None) -> Union[int, dict]:
 
-        response = delete(
-            url=url,
+        response = self._send(
+            "DELETE",
+            url,
             headers=self.headers,
             params=params,
             json=data
@@ -0,0 +1,65 @@
+"""
+Background jobs run by the API process on a fixed interval.
+"""
+
+import asyncio
+from contextlib import suppress
+from typing import Callable
+
+from app.core.configs import get_logger
+from app.core.db.lease import Lease
+
+_logger = get_logger(__name__)
+
+
+class PeriodicTask:
+    """Runs the blocking ``job`` in a thread every ``interval`` seconds.
+
+    The first run waits ``delay`` seconds, so a process that is started and
+    stopped again shortly after (a scale-from-zero request) never runs it.
+    With a ``lease`` a tick only runs the job if this process holds it (see
+    :class:`app.core.db.lease.Lease`).  Errors are logged and the job runs
+    again on the next tick.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        job: Callable[[], object],
+        interval: float,
+        delay: float = 0,
+        lease: Lease | None = None,
+    ) -> None:
+        self.name = name
+        self.job = job
+        self.interval = interval
+        self.delay = delay
+        self.lease = lease
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def _tick(self) -> None:
+        if self.lease is None or self.lease.acquire():
+            self.job()
+
+    async def _run(self) -> None:
+        await asyncio.sleep(self.delay)
+        while True:
+            try:
+                await asyncio.to_thread(self._tick)
+
+            except Exception as error:
+                _logger.error(f"Error on {self.name}: {str(error)}")
+
+            await asyncio.sleep(self.interval)
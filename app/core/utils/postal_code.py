@@ -0,0 +1,32 @@
+"""
+Brazilian postal code (CEP) helpers.
+
+Stored and typed codes come as ``89010-000``, ``89010000`` or with stray
+spaces.  :func:`valid_postal_code_digits` reduces a valid CEP to its 8
+digits (the ViaCEP cache key); :func:`normalize_postal_code` keeps the digits
+of any code and fills the addresses' ``postal_code_key``.
+"""
+
+import re
+
+_NON_DIGITS = re.compile(r"\D")
+
+
+def valid_postal_code_digits(postal_code: str | None) -> str | None:
+    """The 8 digits of a CEP, or ``None`` when it is not a valid CEP."""
+    digits = _NON_DIGITS.sub("", postal_code or "")
+    return digits if len(digits) == 8 else None
+
+
+def normalize_postal_code(postal_code: str | None) -> str:
+    """Digits of a stored or typed code, valid CEP or not.
+
+    Addresses keep this as their ``postal_code_key`` so legacy codes that are
+    not 8 digits long can still be looked up with a single equality.
+    """
+    return _NON_DIGITS.sub("", postal_code or "")
+
+
+def format_postal_code(key: str) -> str:
+    """``89010000`` -> ``89010-000``."""
+    return f"{key[:5]}-{key[5:]}"
@@ -0,0 +1,57 @@
+"""
+Normalized search keys.
+
+Text is stored and queried without accents and in lower case, so an anchored
+prefix ``$regex`` on the keys is case and accent insensitive while still
+walking an ordinary index.
+"""
+
+import re
+import unicodedata
+from typing import Iterable, List
+
+_NON_DIGITS = re.compile(r"\D")
+_SEPARATORS = re.compile(r"[^\w@.+-]+")
+_HAS_LETTERS = re.compile(r"[^\W\d_]")
+
+
+def normalize_text(value: str | None) -> str:
+    """``"  João  da SILVA"`` -> ``"joao da silva"``."""
+    decomposed = unicodedata.normalize("NFKD", value or "")
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def text_keys(value: str | None) -> List[str]:
+    """The whole normalized text plus each of its words."""
+    text = normalize_text(value)
+    if not text:
+        return []
+    return [text, *(word for word in _SEPARATORS.split(text) if word)]
+
+
+def digit_keys(value: str | None) -> List[str]:
+    digits = _NON_DIGITS.sub("", value or "")
+    return [digits] if digits else []
+
+
+def build_search_keys(texts: Iterable[str | None], numbers: Iterable[str | None]) -> List[str]:
+    """Distinct keys for free text fields and for documents and phones."""
+    keys = []
+    for value in texts:
+        keys.extend(text_keys(value))
+    for value in numbers:
+        keys.extend(digit_keys(value))
+    return list(dict.fromkeys(keys))
+
+
+def search_terms(query: str | None) -> List[str]:
+    """Prefixes every match must have, one per word of ``query``.
+
+    A query without letters (``123.456``, ``(47) 9988``) is a document or a
+    phone number and becomes a single digits-only prefix.
+    """
+    text = normalize_text(query)
+    if not _HAS_LETTERS.search(text):
+        return digit_keys(text)
+    return [word for word in text.split(" ") if word]
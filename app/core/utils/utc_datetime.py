@@ -1,66 +1,75 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Annotated
 from pydantic import BeforeValidator, PlainSerializer, WithJsonSchema
 from pydantic_core import core_schema
-import pytz
+
+_UTC = timezone.utc
+_LEGACY_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+_new_datetime = datetime.__new__
 
 
 class UTCDateTime(datetime):
     def __new__(cls, *args, **kwargs):
-        if ('tzinfo' in kwargs and kwargs['tzinfo'] is not None) or len(args) == 8:
-            temp_dt = datetime(*args, **kwargs)
+        # ``pickle``/``copy`` rebuild instances from the packed byte state.
+        if args and isinstance(args[0], (bytes, str)):
+            return _new_datetime(cls, *args)
 
-            utc_dt = temp_dt.astimezone(pytz.UTC)
+        # ``datetime`` arithmetic and ``replace`` call ``cls`` with the tzinfo
+        # as the eighth positional argument.
+        if len(args) == 8:
+            kwargs["tzinfo"] = args[7]
+            args = args[:7]
 
-            return super().__new__(cls, utc_dt.year, utc_dt.month, utc_dt.day,
-                                 utc_dt.hour, utc_dt.minute, utc_dt.second,
-                                 utc_dt.microsecond, tzinfo=pytz.UTC)
+        tzinfo = kwargs.pop("tzinfo", None)
+        if tzinfo is None or tzinfo is _UTC:
+            return _new_datetime(cls, *args, **kwargs, tzinfo=_UTC)
 
-        return super().__new__(cls, *args, **kwargs, tzinfo=pytz.UTC)
+        return cls._from_datetime(datetime(*args, **kwargs, tzinfo=tzinfo))
 
     def __str__(self):
-        return f"{self.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}Z"
+        return f"{self.isoformat(timespec='milliseconds')[:23]}Z"
 
     def timestamp(self) -> int:
         return int(super().timestamp())
 
     @classmethod
     def now(cls, tz=None):
-        now_utc = datetime.now(pytz.UTC)
+        now_utc = datetime.now(_UTC)
         # MongoDB stores datetimes with millisecond precision.  By trimming the
         # microseconds here we ensure consistent values when persisting and
         # retrieving dates, avoiding subtle test failures due to rounding.
-        now_utc = now_utc.replace(microsecond=(now_utc.microsecond // 1000) * 1000)
-        return cls(now_utc.year, now_utc.month,
-                  now_utc.day, now_utc.hour,
-                  now_utc.minute, now_utc.second,
-                  now_utc.microsecond)
+        return _new_datetime(
+            cls, now_utc.year, now_utc.month, now_utc.day,
+            now_utc.hour, now_utc.minute, now_utc.second,
+            (now_utc.microsecond // 1000) * 1000, _UTC,
+        )
 
     @classmethod
-    def validate_datetime(cls, v, *args):
-        if isinstance(v, str):
-            try:
-                dt = datetime.fromisoformat(v)
-
-            except ValueError:
-                dt = datetime.strptime(v, '%Y-%m-%dT%H:%M:%S.%fZ')
-
-            if dt.tzinfo:
-                dt = dt.astimezone(pytz.UTC)
-
-            else:
-                dt = pytz.UTC.localize(dt)
+    def _from_datetime(cls, value: datetime) -> "UTCDateTime":
+        # Naive datetimes (e.g. read back from MongoDB) are already UTC.
+        if value.tzinfo is not None and value.tzinfo is not _UTC:
+            value = value.astimezone(_UTC)
+
+        return _new_datetime(
+            cls, value.year, value.month, value.day,
+            value.hour, value.minute, value.second,
+            value.microsecond, _UTC,
+        )
 
-            return cls(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond)
+    @classmethod
+    def validate_datetime(cls, v, *args):
+        # Already normalized: nothing to rebuild.  ``replace`` does not go
+        # through ``__new__``, so the tzinfo still has to be checked.
+        if type(v) is cls and v.tzinfo is _UTC:
+            return v
 
-        elif isinstance(v, datetime):
-            if v.tzinfo:
-                v = v.astimezone(pytz.UTC)
+        if isinstance(v, str):
+            return _parse(v)
 
-            else:
-                v = pytz.UTC.localize(v)
+        if isinstance(v, datetime):
+            return cls._from_datetime(v)
 
-            return cls(v.year, v.month, v.day, v.hour, v.minute, v.second, v.microsecond)
         raise ValueError("Invalid datetime format")
 
     @classmethod
@@ -77,6 +86,20 @@ class UTCDateTime(datetime):
         )
 
 
+@lru_cache(maxsize=4096)
+def _parse(value: str) -> UTCDateTime:
+    # The same timestamps come back over and over (query params, sync cursors,
+    # documents echoed by clients) and instances are immutable, so the parsed
+    # result is cached.
+    try:
+        dt = datetime.fromisoformat(value)
+
+    except ValueError:
+        dt = datetime.strptime(value, _LEGACY_FORMAT)
+
+    return UTCDateTime._from_datetime(dt)
+
+
 UTCDateTimeType = Annotated[
     UTCDateTime,
     BeforeValidator(UTCDateTime.validate_datetime),
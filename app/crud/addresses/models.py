@@ -1,10 +1,13 @@
 from mongoengine import StringField
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.base_document import ACTIVE_ONLY, BaseDocument
+from app.core.utils.postal_code import normalize_postal_code
 
 
 class AddressModel(BaseDocument):
     postal_code = StringField(required=True)
+    # Digits only, so lookups do not depend on how the code was typed.
+    postal_code_key = StringField()
     street = StringField(required=True)
     number = StringField(required=True)
     complement = StringField()
@@ -17,8 +20,17 @@ class AddressModel(BaseDocument):
     meta = {
         "collection": "addresses",
         "indexes": [
-            "postal_code",
-            "company_id",
-            {"fields": ["city", "state"]},
+            {
+                "fields": ["company_id", "city"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {
+                "fields": ["company_id", "postal_code_key"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {"fields": ["company_id", "updated_at"]},
         ],
     }
+
+    def clean(self):
+        self.postal_code_key = normalize_postal_code(self.postal_code)
@@ -4,8 +4,9 @@ from fastapi.encoders import jsonable_encoder
 from pydantic_core import ValidationError
 
 from app.core.configs import get_logger
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import ConflictError, NotFoundError
 from app.core.repositories.base_repository import Repository
+from app.core.utils.postal_code import normalize_postal_code
 from app.core.utils.utc_datetime import UTCDateTime
 
 from .models import AddressModel
@@ -34,19 +35,26 @@ class AddressRepository(Repository):
             _logger.error(f"Error on create_address: {str(error)}")
             raise NotFoundError(message="Error on create new address")
 
-    async def update(self, address_id: str, company_id: str, address: dict) -> AddressInDB:
+    async def update(
+        self, address_id: str, company_id: str, address: dict, version: int | None = None
+    ) -> AddressInDB:
         try:
-            address_model: AddressModel = AddressModel.objects(
-                id=address_id, company_id=company_id, is_active=True
-            ).first()
+            if address.get("postal_code"):
+                address["postal_code_key"] = normalize_postal_code(
+                    address["postal_code"]
+                )
+
+            address_model: AddressModel | None = self.find_and_update(
+                AddressModel,
+                {"id": address_id, "company_id": company_id},
+                address,
+                version=version,
+            )
             if not address_model:
                 raise NotFoundError(message=f"Address #{address_id} not found")
 
-            address_model.update(**address)
-            address_model.save()
-
-            return await self.select_by_id(address_id, company_id)
-        except NotFoundError:
+            return AddressInDB.model_validate(address_model)
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on update_address: {str(error)}")
@@ -80,8 +88,8 @@ class AddressRepository(Repository):
     async def select_all(self, company_id: str) -> List[AddressInDB]:
         try:
             addresses: List[AddressInDB] = []
-            for address_model in AddressModel.objects(
-                company_id=company_id, is_active=True
+            for address_model in self.secondary_reads(
+                AddressModel.objects(company_id=company_id, is_active=True)
             ).order_by("city"):
                 addresses.append(AddressInDB.model_validate(address_model))
             return addresses
@@ -99,7 +107,7 @@ class AddressRepository(Repository):
             address_model.soft_delete()
             address_model.save()
             return AddressInDB.model_validate(address_model)
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on delete_by_id: {str(error)}")
@@ -109,12 +117,8 @@ class AddressRepository(Repository):
         self, zip_code: str, company_id: str, *, raise_404: bool = True
     ) -> AddressInDB | None:
         try:
-            sanitized = zip_code.replace("-", "")
-            formatted = (
-                f"{sanitized[:5]}-{sanitized[5:]}" if len(sanitized) > 5 else sanitized
-            )
             address_model: AddressModel | None = AddressModel.objects(
-                postal_code__in=[zip_code, sanitized, formatted],
+                postal_code_key=normalize_postal_code(zip_code),
                 company_id=company_id,
                 is_active=True,
             ).first()
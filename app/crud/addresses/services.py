@@ -1,26 +1,45 @@
+from datetime import timedelta
 from typing import List
 
+import httpx
+
 import app.api.dependencies.get_address_by_zip_code as get_address_by_zip_code
 
+from app.core.configs import get_environment, get_logger
 from app.core.exceptions import NotFoundError
+from app.core.exceptions.internal import InternalErrorException
+from app.core.utils.postal_code import format_postal_code, valid_postal_code_digits
+from app.crud.postal_codes import PostalCode, PostalCodeRepository
 
 from .repositories import AddressRepository
 from .schemas import Address, AddressInDB, UpdateAddress
 
+_env = get_environment()
+_logger = get_logger(__name__)
+
 
 class AddressServices:
-    def __init__(self, address_repository: AddressRepository) -> None:
+    def __init__(
+        self,
+        address_repository: AddressRepository,
+        postal_code_repository: PostalCodeRepository | None = None,
+    ) -> None:
         self.__repository = address_repository
+        self.__postal_code_repository = postal_code_repository or PostalCodeRepository()
 
     async def create(self, address: Address, company_id: str) -> AddressInDB:
         return await self.__repository.create(address=address, company_id=company_id)
 
     async def update(
-        self, id: str, company_id: str, address: UpdateAddress
+        self,
+        id: str,
+        company_id: str,
+        address: UpdateAddress,
+        version: int | None = None,
     ) -> AddressInDB:
         data = address.model_dump(exclude_unset=True, exclude_none=True)
         return await self.__repository.update(
-            address_id=id, company_id=company_id, address=data
+            address_id=id, company_id=company_id, address=data, version=version
         )
 
     async def search_by_id(self, id: str, company_id: str) -> AddressInDB:
@@ -33,24 +52,68 @@ class AddressServices:
         return await self.__repository.delete_by_id(id=id, company_id=company_id)
 
     async def search_by_zip_code(self, zip_code: str, company_id: str) -> Address:
-        """Fetch address information directly from ViaCEP service.
+        """Resolve a postal code into an address template.
 
-        This method ignores any address stored in the local database and
-        always retrieves fresh data from ViaCEP.
+        Addresses stored for the company are ignored.  Valid CEPs are served
+        from the in-process LRU, then the ``postal_codes`` collection, and
+        only then fetched from ViaCEP and cached (found or not).  Malformed
+        codes go straight to ViaCEP, which decides how to answer them.
         """
+        key = valid_postal_code_digits(zip_code)
 
-        data = get_address_by_zip_code.get_address_by_zip_code(zip_code=zip_code)
+        if key is None:
+            data = await get_address_by_zip_code.get_address_by_zip_code(zip_code=zip_code)
+            postal_code = PostalCode.from_via_cep(zip_code, data)
 
-        if "erro" in data:
+        else:
+            cached = await self.__postal_code_repository.select_by_key(key)
+            postal_code = (
+                cached.to_postal_code() if cached else await self.__fetch_postal_code(key)
+            )
+
+        if not postal_code.found:
             raise NotFoundError(message=f"CEP {zip_code} not found in ViaCEP")
 
         return Address(
-            postal_code=data["cep"],
-            city=data["localidade"],
-            district=data["bairro"],
-            street=data["logradouro"],
-            complement=data.get("complemento"),
+            postal_code=postal_code.postal_code,
+            city=postal_code.city,
+            district=postal_code.district,
+            street=postal_code.street,
+            complement=postal_code.complement,
             number="",
-            state=data["uf"],
+            state=postal_code.state,
             reference=None,
         )
+
+    async def __fetch_postal_code(self, key: str) -> PostalCode:
+        try:
+            data = await get_address_by_zip_code.get_address_by_zip_code(zip_code=key)
+
+        except (httpx.HTTPError, ValueError) as error:
+            _logger.warning(f"ViaCEP lookup of {key} failed: {str(error)}")
+            return await self.__nearby_postal_code(key)
+
+        postal_code = PostalCode.from_via_cep(format_postal_code(key), data)
+        expires_in = (
+            timedelta(days=_env.POSTAL_CODE_STORE_TTL_DAYS)
+            if postal_code.found
+            else timedelta(hours=_env.POSTAL_CODE_NOT_FOUND_TTL_HOURS)
+        )
+
+        try:
+            await self.__postal_code_repository.upsert(postal_code, expires_in=expires_in)
+        except NotFoundError:
+            pass
+
+        return postal_code
+
+    async def __nearby_postal_code(self, key: str) -> PostalCode:
+        """City and district of a known CEP of the same sector, street left blank."""
+        nearby = await self.__postal_code_repository.select_nearby(key)
+
+        if nearby is None:
+            raise InternalErrorException(message="ViaCEP unavailable")
+
+        return nearby.to_postal_code().model_copy(
+            update={"postal_code": format_postal_code(key), "street": "", "complement": ""}
+        )
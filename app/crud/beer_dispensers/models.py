@@ -1,6 +1,6 @@
 from mongoengine import StringField, IntField
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.base_document import ACTIVE_ONLY, BaseDocument
 from .schemas import DispenserStatus, Voltage
 
 
@@ -16,5 +16,11 @@ class BeerDispenserModel(BaseDocument):
 
     meta = {
         "collection": "beer_dispensers",
-        "indexes": ["status", "brand", "serial_number", "company_id"],
+        "indexes": [
+            {
+                "fields": ["company_id", "brand"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {"fields": ["company_id", "updated_at"]},
+        ],
     }
@@ -4,7 +4,7 @@ from fastapi.encoders import jsonable_encoder
 from pydantic_core import ValidationError
 
 from app.core.configs import get_logger
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import ConflictError, NotFoundError
 from app.core.repositories.base_repository import Repository
 from app.core.utils.utc_datetime import UTCDateTime
 
@@ -35,18 +35,23 @@ class BeerDispenserRepository(Repository):
             raise NotFoundError(message="Error on create new beer dispenser")
 
     async def update(
-        self, dispenser_id: str, company_id: str, dispenser: dict
+        self,
+        dispenser_id: str,
+        company_id: str,
+        dispenser: dict,
+        version: int | None = None,
     ) -> BeerDispenserInDB:
         try:
-            model: BeerDispenserModel = BeerDispenserModel.objects(
-                id=dispenser_id, company_id=company_id, is_active=True
-            ).first()
+            model: BeerDispenserModel | None = self.find_and_update(
+                BeerDispenserModel,
+                {"id": dispenser_id, "company_id": company_id},
+                dispenser,
+                version=version,
+            )
             if not model:
                 raise NotFoundError(message=f"BeerDispenser #{dispenser_id} not found")
-            model.update(**dispenser)
-            model.save()
-            return await self.select_by_id(dispenser_id, company_id)
-        except NotFoundError:
+            return BeerDispenserInDB.model_validate(model)
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on update_dispenser: {str(error)}")
@@ -69,8 +74,8 @@ class BeerDispenserRepository(Repository):
     async def select_all(self, company_id: str) -> List[BeerDispenserInDB]:
         try:
             dispensers: List[BeerDispenserInDB] = []
-            for model in BeerDispenserModel.objects(
-                company_id=company_id, is_active=True
+            for model in self.secondary_reads(
+                BeerDispenserModel.objects(company_id=company_id, is_active=True)
             ).order_by("brand"):
                 dispensers.append(BeerDispenserInDB.model_validate(model))
             return dispensers
@@ -88,7 +93,7 @@ class BeerDispenserRepository(Repository):
             model.soft_delete()
             model.save()
             return BeerDispenserInDB.model_validate(model)
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on delete_by_id: {str(error)}")
@@ -18,11 +18,15 @@ class BeerDispenserServices:
         return await self.__repository.create(dispenser=dispenser, company_id=company_id)
 
     async def update(
-        self, id: str, company_id: str, dispenser: UpdateBeerDispenser
+        self,
+        id: str,
+        company_id: str,
+        dispenser: UpdateBeerDispenser,
+        version: int | None = None,
     ) -> BeerDispenserInDB:
         data = dispenser.model_dump(exclude_unset=True, exclude_none=True)
         return await self.__repository.update(
-            dispenser_id=id, company_id=company_id, dispenser=data
+            dispenser_id=id, company_id=company_id, dispenser=data, version=version
         )
 
     async def search_by_id(
@@ -32,10 +36,12 @@ class BeerDispenserServices:
 
     async def search_all(self, company_id: str) -> List[BeerDispenserInDB]:
         dispensers = await self.__repository.select_all(company_id=company_id)
+        reservations = await self.__reservation_repository.find_active_by_beer_dispenser_ids(
+            company_id=company_id,
+            dispenser_ids=[str(dispenser.id) for dispenser in dispensers],
+        )
         for dispenser in dispensers:
-            reservation = await self.__reservation_repository.find_active_by_beer_dispenser_id(
-                company_id=company_id, dispenser_id=str(dispenser.id)
-            )
+            reservation = reservations.get(str(dispenser.id))
             dispenser.reservation_id = reservation.id if reservation else None
         return dispensers
 
@@ -1,6 +1,6 @@
 from mongoengine import StringField, DecimalField
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.base_document import ACTIVE_ONLY, BaseDocument
 
 
 class BeerTypeModel(BaseDocument):
@@ -13,5 +13,11 @@ class BeerTypeModel(BaseDocument):
 
     meta = {
         "collection": "beer_types",
-        "indexes": ["name", "company_id"],
+        "indexes": [
+            {
+                "fields": ["company_id", "name"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {"fields": ["company_id", "updated_at"]},
+        ],
     }
@@ -4,7 +4,7 @@ from fastapi.encoders import jsonable_encoder
 from pydantic_core import ValidationError
 
 from app.core.configs import get_logger
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import ConflictError, NotFoundError
 from app.core.repositories.base_repository import Repository
 from app.core.utils.utc_datetime import UTCDateTime
 
@@ -35,18 +35,23 @@ class BeerTypeRepository(Repository):
             raise NotFoundError(message="Error on create new beer type")
 
     async def update(
-        self, beer_type_id: str, company_id: str, beer_type: dict
+        self,
+        beer_type_id: str,
+        company_id: str,
+        beer_type: dict,
+        version: int | None = None,
     ) -> BeerTypeInDB:
         try:
-            model: BeerTypeModel = BeerTypeModel.objects(
-                id=beer_type_id, company_id=company_id, is_active=True
-            ).first()
+            model: BeerTypeModel | None = self.find_and_update(
+                BeerTypeModel,
+                {"id": beer_type_id, "company_id": company_id},
+                beer_type,
+                version=version,
+            )
             if not model:
                 raise NotFoundError(message=f"BeerType #{beer_type_id} not found")
-            model.update(**beer_type)
-            model.save()
-            return await self.select_by_id(beer_type_id, company_id)
-        except NotFoundError:
+            return BeerTypeInDB.model_validate(model)
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on update_beer_type: {str(error)}")
@@ -67,9 +72,9 @@ class BeerTypeRepository(Repository):
     async def select_all(self, company_id: str) -> List[BeerTypeInDB]:
         try:
             beer_types: List[BeerTypeInDB] = []
-            for model in BeerTypeModel.objects(company_id=company_id, is_active=True).order_by(
-                "name"
-            ):
+            for model in BeerTypeModel.objects(
+                company_id=company_id, is_active=True
+            ).order_by("name"):
                 beer_types.append(BeerTypeInDB.model_validate(model))
             return beer_types
         except Exception as error:
@@ -86,7 +91,7 @@ class BeerTypeRepository(Repository):
             model.soft_delete()
             model.save()
             return BeerTypeInDB.model_validate(model)
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on delete_by_id: {str(error)}")
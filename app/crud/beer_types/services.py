@@ -1,5 +1,7 @@
 from typing import List
 
+from app.core.cache import cached
+
 from .repositories import BeerTypeRepository
 from .schemas import BeerType, BeerTypeInDB, UpdateBeerType
 
@@ -12,16 +14,21 @@ class BeerTypeServices:
         return await self.__repository.create(beer_type=beer_type, company_id=company_id)
 
     async def update(
-        self, id: str, company_id: str, beer_type: UpdateBeerType
+        self,
+        id: str,
+        company_id: str,
+        beer_type: UpdateBeerType,
+        version: int | None = None,
     ) -> BeerTypeInDB:
         data = beer_type.model_dump(exclude_unset=True, exclude_none=True)
         return await self.__repository.update(
-            beer_type_id=id, company_id=company_id, beer_type=data
+            beer_type_id=id, company_id=company_id, beer_type=data, version=version
         )
 
     async def search_by_id(self, id: str, company_id: str) -> BeerTypeInDB:
         return await self.__repository.select_by_id(id=id, company_id=company_id)
 
+    @cached("beer_types")
     async def search_all(self, company_id: str) -> List[BeerTypeInDB]:
         return await self.__repository.select_all(company_id=company_id)
 
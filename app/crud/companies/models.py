@@ -9,7 +9,7 @@ from mongoengine import (
     DateTimeField,
 )
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.base_document import ACTIVE_ONLY, BaseDocument
 from app.core.utils.utc_datetime import UTCDateTime
 
 
@@ -38,4 +38,14 @@ class CompanyModel(BaseDocument):
 
     meta = {
         "collection": "companies",
+        "indexes": [
+            {
+                "fields": ["name"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {
+                "fields": ["members.user_id"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+        ],
     }
@@ -5,7 +5,7 @@ from mongoengine import NotUniqueError
 from pydantic_core import ValidationError
 
 from app.core.configs import get_logger
-from app.core.exceptions import NotFoundError, UnprocessableEntity
+from app.core.exceptions import ConflictError, NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
 from app.core.utils.utc_datetime import UTCDateTime
 
@@ -43,20 +43,24 @@ class CompanyRepository(Repository):
             _logger.error(f"Error on create_company: {str(error)}")
             raise UnprocessableEntity(message="Error on create new company")
 
-    async def update(self, company_id: str, company: dict) -> CompanyInDB:
+    async def update(
+        self, company_id: str, company: dict, version: int | None = None
+    ) -> CompanyInDB:
         try:
-            company_model: CompanyModel = CompanyModel.objects(
-                id=company_id, is_active=True
-            ).first()
+            if company.get("name"):
+                company["name"] = company["name"].strip()
+
+            company_model: CompanyModel | None = self.find_and_update(
+                CompanyModel,
+                {"id": company_id},
+                company,
+                version=version,
+            )
             if not company_model:
                 raise NotFoundError(message=f"Company #{company_id} not found")
 
-            company_model.update(**company)
-            company_model.name = company_model.name.strip()
-            company_model.save()
-
-            return await self.select_by_id(company_id)
-        except NotFoundError:
+            return CompanyInDB.model_validate(company_model)
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on update_company: {str(error)}")
@@ -78,7 +82,9 @@ class CompanyRepository(Repository):
     async def select_all(self) -> List[CompanyInDB]:
         try:
             companies: List[CompanyInDB] = []
-            for company_model in CompanyModel.objects(is_active=True).order_by("name"):
+            for company_model in self.secondary_reads(
+                CompanyModel.objects(is_active=True)
+            ).order_by("name"):
                 companies.append(CompanyInDB.model_validate(company_model))
             return companies
         except Exception as error:
@@ -95,7 +101,7 @@ class CompanyRepository(Repository):
             company_model.soft_delete()
             company_model.save()
             return CompanyInDB.model_validate(company_model)
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on delete_by_id: {str(error)}")
@@ -120,7 +126,7 @@ class CompanyRepository(Repository):
             company.base_update()
             company.save()
             return CompanyInDB.model_validate(company)
-        except UnprocessableEntity:
+        except (UnprocessableEntity, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on add_member: {str(error)}")
@@ -142,7 +148,7 @@ class CompanyRepository(Repository):
             raise NotFoundError(
                 message=f"User {user_id} is not a member of company {company_id}"
             )
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on remove_member: {str(error)}")
@@ -165,7 +171,7 @@ class CompanyRepository(Repository):
             company_model.base_update()
             company_model.save()
             return CompanyInDB.model_validate(company_model)
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on update_subscription: {str(error)}")
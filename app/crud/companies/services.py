@@ -26,12 +26,16 @@ class CompanyServices:
             await self.__address_repository.select_active_by_id(company.address_id)
         return await self.__repository.create(company=company)
 
-    async def update(self, id: str, company: UpdateCompany) -> CompanyInDB:
+    async def update(
+        self, id: str, company: UpdateCompany, version: int | None = None
+    ) -> CompanyInDB:
         data = company.model_dump(exclude_unset=True, exclude_none=True)
         address_id = data.get("address_id")
         if address_id is not None:
             await self.__address_repository.select_active_by_id(address_id)
-        return await self.__repository.update(company_id=id, company=data)
+        return await self.__repository.update(
+            company_id=id, company=data, version=version
+        )
 
     async def search_by_id(self, id: str) -> CompanyInDB:
         return await self.__repository.select_by_id(id=id)
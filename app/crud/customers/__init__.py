@@ -1,2 +1,8 @@
-from .schemas import Customer, CustomerInDB, UpdateCustomer
+from .schemas import (
+    Customer,
+    CustomerInDB,
+    CustomerOverview,
+    CustomerSearchResult,
+    UpdateCustomer,
+)
 from .services import CustomerServices
@@ -1,9 +1,14 @@
+from typing import List
+
 from mongoengine import StringField, ValidationError
 from mongoengine import ListField
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.base_document import ACTIVE_ONLY, BaseDocument
+from app.core.utils.search import build_search_keys
 from app.core.utils.validate_document import validate_cpf, validate_cnpj
 
+MAX_ADDRESSES = 5
+
 
 class CustomerModel(BaseDocument):
     name = StringField(required=True)
@@ -14,12 +19,22 @@ class CustomerModel(BaseDocument):
     address_ids = ListField(StringField())
     notes = StringField()
     company_id = StringField(required=True)
+    # Normalized name words, email, document and mobile digits for search.
+    search_keys = ListField(StringField())
 
     meta = {
         "collection": "customers",
         "indexes": [
-            "company_id",
+            {
+                "fields": ["company_id", "name"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {
+                "fields": ["company_id", "search_keys"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
             {"fields": ["document", "company_id"], "unique": True},
+            {"fields": ["company_id", "updated_at"]},
         ],
     }
 
@@ -28,5 +43,12 @@ class CustomerModel(BaseDocument):
             validate_cpf(self.document) or validate_cnpj(self.document)
         ):
             raise ValidationError("Invalid document")
-        if self.address_ids and len(self.address_ids) > 5:
-            raise ValidationError("A customer can have at most 5 addresses")
+        if self.address_ids and len(self.address_ids) > MAX_ADDRESSES:
+            raise ValidationError(f"A customer can have at most {MAX_ADDRESSES} addresses")
+
+        self.search_keys = self.build_search_keys()
+
+    def build_search_keys(self) -> List[str]:
+        return build_search_keys(
+            texts=[self.name, self.email], numbers=[self.document, self.mobile]
+        )
@@ -1,23 +1,161 @@
-from typing import List
+from decimal import Decimal
+from typing import Dict, List, Tuple
 
 from fastapi.encoders import jsonable_encoder
-from mongoengine import NotUniqueError
+from mongoengine import NotUniqueError, Q
 from pydantic_core import ValidationError
 
 from app.core.configs import get_logger
-from app.core.exceptions import NotFoundError, UnprocessableEntity
+from app.core.exceptions import ConflictError, NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
+from app.core.utils.search import search_terms
 from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.addresses.models import AddressModel
+from app.crud.addresses.schemas import AddressInDB
 
-from .models import CustomerModel
-from .schemas import Customer, CustomerInDB
+from .models import MAX_ADDRESSES, CustomerModel
+from .schemas import (
+    Customer,
+    CustomerBalance,
+    CustomerInDB,
+    CustomerOverview,
+    CustomerReservation,
+    CustomerSearchResult,
+)
 
 _logger = get_logger(__name__)
 
+_CENTS = Decimal("0.01")
+# ``ReservationModel`` collection; the model is not imported because the
+# reservation schemas already depend on the customer package.
+_RESERVATIONS = "reservations"
+
+
+def _money(value) -> Decimal:
+    return Decimal(str(value or 0)).quantize(_CENTS)
+
+
+def _active_in(field: str, company_id: str) -> dict:
+    """``$filter`` keeping the active documents of the company in ``field``."""
+    return {
+        "$filter": {
+            "input": f"${field}",
+            "as": "item",
+            "cond": {
+                "$and": [
+                    {"$eq": ["$$item.is_active", True]},
+                    {"$eq": ["$$item.company_id", company_id]},
+                ]
+            },
+        }
+    }
+
+
+def _history_facets(prefix: str, offset: int, limit: int) -> dict:
+    """Page of history and balance over reservations stored under ``prefix``."""
+    paid = {"$sum": f"${prefix}payments.amount"}
+    pending = {"$max": [{"$subtract": [f"${prefix}total_value", paid]}, 0]}
+
+    return {
+        "reservations": [
+            {"$sort": {f"{prefix}delivery_date": -1, f"{prefix}_id": 1}},
+            {"$skip": offset},
+            {"$limit": limit},
+            {
+                "$project": {
+                    "_id": 0,
+                    "id": f"${prefix}_id",
+                    "address_id": f"${prefix}address_id",
+                    "delivery_date": f"${prefix}delivery_date",
+                    "pickup_date": f"${prefix}pickup_date",
+                    "status": f"${prefix}status",
+                    "total_value": f"${prefix}total_value",
+                    "paid_value": paid,
+                    "pending_value": pending,
+                }
+            },
+        ],
+        "balance": [
+            {
+                "$group": {
+                    "_id": None,
+                    "reservations": {"$sum": 1},
+                    "total_value": {"$sum": f"${prefix}total_value"},
+                    "paid_value": {"$sum": paid},
+                    "pending_value": {"$sum": pending},
+                }
+            },
+        ],
+    }
+
+
+def overview_pipeline(id: str, company_id: str, offset: int, limit: int) -> List[dict]:
+    """One round trip for a customer, its addresses, history and balance.
+
+    The reservations are joined and unwound right away, so the server
+    coalesces the two stages and never builds the customer's whole history
+    as one array (it could outgrow the 16MB document limit).  ``$facet`` then
+    splits the stream into the customer itself, the requested page of
+    history (most recent delivery first) and the totals over every
+    reservation; only the active reservations of the company are counted.
+    """
+    of_company = {
+        "$match": {
+            "reservation.company_id": company_id,
+            "reservation.is_active": True,
+        }
+    }
+    history = _history_facets("reservation.", offset, limit)
+
+    return [
+        {"$match": {"_id": id, "company_id": company_id, "is_active": True}},
+        {
+            "$lookup": {
+                "from": AddressModel._get_collection_name(),
+                "localField": "address_ids",
+                "foreignField": "_id",
+                "as": "addresses",
+            }
+        },
+        {"$addFields": {"addresses": _active_in("addresses", company_id)}},
+        {
+            "$lookup": {
+                "from": _RESERVATIONS,
+                "localField": "_id",
+                "foreignField": "customer_id",
+                "as": "reservation",
+            }
+        },
+        {"$unwind": {"path": "$reservation", "preserveNullAndEmptyArrays": True}},
+        {
+            "$facet": {
+                "customer": [{"$limit": 1}, {"$project": {"reservation": 0}}],
+                "reservations": [of_company, *history["reservations"]],
+                "balance": [of_company, *history["balance"]],
+            }
+        },
+    ]
+
+
+def archived_history_pipeline(
+    id: str, company_id: str, offset: int, limit: int
+) -> List[dict]:
+    """History and balance of a customer in one reservation archive year."""
+    return [
+        {"$match": {"customer_id": id, "company_id": company_id, "is_active": True}},
+        {"$facet": _history_facets("", offset, limit)},
+    ]
+
 
 class CustomerRepository(Repository):
-    def __init__(self) -> None:
+    def __init__(self, archive=None) -> None:
         super().__init__()
+        if archive is None:
+            # Imported here for the same reason as ``_RESERVATIONS``.
+            from app.crud.reservations.archive import ReservationArchive
+
+            archive = ReservationArchive()
+        self.__archive = archive
 
     async def create(self, customer: Customer, company_id: str) -> CustomerInDB:
         try:
@@ -40,21 +178,43 @@ class CustomerRepository(Repository):
             raise UnprocessableEntity(message="Error on create new customer")
 
     async def update(
-        self, customer_id: str, company_id: str, customer: dict
+        self,
+        customer_id: str,
+        company_id: str,
+        customer: dict,
+        version: int | None = None,
     ) -> CustomerInDB:
         try:
-            customer_model: CustomerModel = CustomerModel.objects(
-                id=customer_id, company_id=company_id, is_active=True
-            ).first()
+            if len(customer.get("address_ids") or []) > MAX_ADDRESSES:
+                raise UnprocessableEntity(
+                    message=f"A customer can have at most {MAX_ADDRESSES} addresses"
+                )
+
+            customer_model: CustomerModel | None = self.find_and_update(
+                CustomerModel,
+                {"id": customer_id, "company_id": company_id},
+                customer,
+                version=version,
+            )
             if not customer_model:
                 raise NotFoundError(message=f"Customer #{customer_id} not found")
 
-            customer_model.update(**customer)
-            customer_model.save()
+            # The keys depend on fields that may not be in this update, so they
+            # are rebuilt from the returned document, only when they changed.
+            search_keys = customer_model.build_search_keys()
+            if search_keys != customer_model.search_keys:
+                CustomerModel.objects(id=customer_id).update_one(
+                    set__search_keys=search_keys
+                )
+                customer_model.search_keys = search_keys
 
-            return await self.select_by_id(customer_id, company_id)
-        except NotFoundError:
+            return CustomerInDB.model_validate(customer_model)
+        except (NotFoundError, ConflictError, UnprocessableEntity):
             raise
+        except NotUniqueError:
+            raise UnprocessableEntity(
+                message="Customer document should be unique for the company"
+            )
         except Exception as error:
             _logger.error(f"Error on update_customer: {str(error)}")
             raise UnprocessableEntity(message="Error on update customer")
@@ -72,11 +232,29 @@ class CustomerRepository(Repository):
             _logger.error(f"Error on select_by_id: {str(error)}")
             raise NotFoundError(message=f"Customer #{id} not found")
 
+    async def select_by_ids(
+        self, ids: List[str], company_id: str, secondary: bool = False
+    ) -> Dict[str, CustomerInDB]:
+        try:
+            query = CustomerModel.objects(
+                id__in=list(set(ids)), company_id=company_id, is_active=True
+            )
+            if secondary:
+                query = self.secondary_reads(query)
+
+            return {
+                customer_model.id: CustomerInDB.model_validate(customer_model)
+                for customer_model in query
+            }
+        except Exception as error:
+            _logger.error(f"Error on select_by_ids: {str(error)}")
+            raise NotFoundError(message="Customers not found")
+
     async def select_all(self, company_id: str) -> List[CustomerInDB]:
         try:
             customers: List[CustomerInDB] = []
-            for customer_model in CustomerModel.objects(
-                company_id=company_id, is_active=True
+            for customer_model in self.secondary_reads(
+                CustomerModel.objects(company_id=company_id, is_active=True)
             ).order_by("name"):
                 customers.append(CustomerInDB.model_validate(customer_model))
             return customers
@@ -84,6 +262,110 @@ class CustomerRepository(Repository):
             _logger.error(f"Error on select_all: {str(error)}")
             raise NotFoundError(message="Customers not found")
 
+    async def search(
+        self, company_id: str, query: str, offset: int = 0, limit: int = 15
+    ) -> Tuple[int, List[CustomerSearchResult]]:
+        """Customers with a search key starting with every word of ``query``."""
+        try:
+            terms = search_terms(query)
+            if not terms:
+                return 0, []
+
+            condition = Q(company_id=company_id, is_active=True)
+            for term in terms:
+                condition &= Q(search_keys__startswith=term)
+
+            customers = self.secondary_reads(CustomerModel.objects(condition))
+            total = customers.count()
+            page = (
+                customers.only("id", "name", "document", "email", "mobile")
+                .order_by("name")
+                .skip(offset)
+                .limit(limit)
+            )
+
+            return total, [
+                CustomerSearchResult.model_validate(customer_model)
+                for customer_model in page
+            ]
+        except Exception as error:
+            _logger.error(f"Error on search: {str(error)}")
+            raise NotFoundError(message="Customers not found")
+
+    async def select_overview(
+        self, id: str, company_id: str, offset: int = 0, limit: int = 15
+    ) -> CustomerOverview:
+        try:
+            # Completed history may have moved to the archive years, so each
+            # tier returns everything up to the end of the page and the page
+            # is cut after merging them.
+            years = self.__archive.years()
+            window = (0, offset + limit) if years else (offset, limit)
+
+            result = next(
+                CustomerModel._get_collection().aggregate(
+                    overview_pipeline(id, company_id, *window)
+                )
+            )
+            if not result["customer"]:
+                raise NotFoundError(message=f"Customer #{id} not found")
+
+            customer = result["customer"][0]
+            addresses = customer.pop("addresses")
+            reservations = result["reservations"]
+            balances = result["balance"]
+
+            for year in years:
+                archived = next(
+                    self.__archive.collection(year).aggregate(
+                        archived_history_pipeline(id, company_id, *window)
+                    )
+                )
+                reservations += archived["reservations"]
+                balances += archived["balance"]
+
+            if years:
+                reservations.sort(key=lambda reservation: reservation["id"])
+                reservations.sort(
+                    key=lambda reservation: reservation["delivery_date"], reverse=True
+                )
+                reservations = reservations[offset : offset + limit]
+
+            balance = {
+                field: sum(row[field] for row in balances)
+                for field in ("reservations", "total_value", "paid_value", "pending_value")
+            }
+
+            return CustomerOverview(
+                customer=CustomerInDB.model_validate(CustomerModel._from_son(customer)),
+                addresses=[
+                    AddressInDB.model_validate(AddressModel._from_son(address))
+                    for address in addresses
+                ],
+                reservations=[
+                    CustomerReservation(
+                        **{
+                            **reservation,
+                            "total_value": _money(reservation["total_value"]),
+                            "paid_value": _money(reservation["paid_value"]),
+                            "pending_value": _money(reservation["pending_value"]),
+                        }
+                    )
+                    for reservation in reservations
+                ],
+                balance=CustomerBalance(
+                    reservations=balance.get("reservations", 0),
+                    total_value=_money(balance.get("total_value")),
+                    paid_value=_money(balance.get("paid_value")),
+                    pending_value=_money(balance.get("pending_value")),
+                ),
+            )
+        except NotFoundError:
+            raise
+        except Exception as error:
+            _logger.error(f"Error on select_overview: {str(error)}")
+            raise NotFoundError(message=f"Customer #{id} not found")
+
     async def delete_by_id(self, id: str, company_id: str) -> CustomerInDB:
         try:
             customer_model: CustomerModel = CustomerModel.objects(
@@ -94,7 +376,7 @@ class CustomerRepository(Repository):
             customer_model.soft_delete()
             customer_model.save()
             return CustomerInDB.model_validate(customer_model)
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on delete_by_id: {str(error)}")
@@ -1,9 +1,12 @@
+from decimal import Decimal
 from typing import List
 
 from pydantic import Field, EmailStr, field_validator
 
 from app.core.models.base_schema import GenericModel
 from app.core.models.base_model import DatabaseModel
+from app.core.utils.utc_datetime import UTCDateTime, UTCDateTimeType
+from app.crud.addresses.schemas import AddressInDB
 
 
 class Customer(GenericModel):
@@ -40,6 +43,39 @@ class CustomerInDB(DatabaseModel):
     company_id: str = Field(example="com_123")
 
 
+class CustomerSearchResult(GenericModel):
+    id: str = Field(example="cus_12345678")
+    name: str = Field(example="John Doe")
+    document: str = Field(example="12345678909")
+    email: str | None = Field(default=None, example="john@example.com")
+    mobile: str | None = Field(default=None, example="11999999999")
+
+
+class CustomerReservation(GenericModel):
+    id: str = Field(example="res_123")
+    address_id: str = Field(example="add_123")
+    delivery_date: UTCDateTimeType = Field(example=str(UTCDateTime.now()))
+    pickup_date: UTCDateTimeType = Field(example=str(UTCDateTime.now()))
+    status: str = Field(example="RESERVED")
+    total_value: Decimal = Field(example=100.0)
+    paid_value: Decimal = Field(example=50.0)
+    pending_value: Decimal = Field(example=50.0)
+
+
+class CustomerBalance(GenericModel):
+    reservations: int = Field(default=0, example=3)
+    total_value: Decimal = Field(default=Decimal("0"), example=300.0)
+    paid_value: Decimal = Field(default=Decimal("0"), example=250.0)
+    pending_value: Decimal = Field(default=Decimal("0"), example=50.0)
+
+
+class CustomerOverview(GenericModel):
+    customer: CustomerInDB = Field()
+    addresses: List[AddressInDB] = Field(default_factory=list)
+    reservations: List[CustomerReservation] = Field(default_factory=list)
+    balance: CustomerBalance = Field(default_factory=CustomerBalance)
+
+
 class UpdateCustomer(GenericModel):
     name: str | None = Field(default=None)
     document: str | None = Field(default=None)
@@ -1,7 +1,13 @@
-from typing import List
+from typing import List, Tuple
 
 from .repositories import CustomerRepository
-from .schemas import Customer, CustomerInDB, UpdateCustomer
+from .schemas import (
+    Customer,
+    CustomerInDB,
+    CustomerOverview,
+    CustomerSearchResult,
+    UpdateCustomer,
+)
 
 
 class CustomerServices:
@@ -12,11 +18,15 @@ class CustomerServices:
         return await self.__repository.create(customer=customer, company_id=company_id)
 
     async def update(
-        self, id: str, company_id: str, customer: UpdateCustomer
+        self,
+        id: str,
+        company_id: str,
+        customer: UpdateCustomer,
+        version: int | None = None,
     ) -> CustomerInDB:
         data = customer.model_dump(exclude_unset=True, exclude_none=True)
         return await self.__repository.update(
-            customer_id=id, company_id=company_id, customer=data
+            customer_id=id, company_id=company_id, customer=data, version=version
         )
 
     async def search_by_id(self, id: str, company_id: str) -> CustomerInDB:
@@ -25,5 +35,19 @@ class CustomerServices:
     async def search_all(self, company_id: str) -> List[CustomerInDB]:
         return await self.__repository.select_all(company_id=company_id)
 
+    async def search_overview(
+        self, id: str, company_id: str, offset: int = 0, limit: int = 15
+    ) -> CustomerOverview:
+        return await self.__repository.select_overview(
+            id=id, company_id=company_id, offset=offset, limit=limit
+        )
+
+    async def search(
+        self, company_id: str, query: str, offset: int = 0, limit: int = 15
+    ) -> Tuple[int, List[CustomerSearchResult]]:
+        return await self.__repository.search(
+            company_id=company_id, query=query, offset=offset, limit=limit
+        )
+
     async def delete_by_id(self, id: str, company_id: str) -> CustomerInDB:
         return await self.__repository.delete_by_id(id=id, company_id=company_id)
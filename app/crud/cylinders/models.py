@@ -1,7 +1,7 @@
 from decimal import Decimal
 from mongoengine import StringField, DecimalField
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.base_document import ACTIVE_ONLY, BaseDocument
 from .schemas import CylinderStatus
 
 
@@ -15,5 +15,11 @@ class CylinderModel(BaseDocument):
 
     meta = {
         "collection": "cylinders",
-        "indexes": ["status", "number", "company_id"],
+        "indexes": [
+            {
+                "fields": ["company_id", "number"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {"fields": ["company_id", "updated_at"]},
+        ],
     }
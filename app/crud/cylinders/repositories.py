@@ -1,10 +1,10 @@
-from typing import List
+from typing import Dict, List
 
 from fastapi.encoders import jsonable_encoder
 from pydantic_core import ValidationError
 
 from app.core.configs import get_logger
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import ConflictError, NotFoundError
 from app.core.repositories.base_repository import Repository
 from app.core.utils.utc_datetime import UTCDateTime
 
@@ -35,18 +35,23 @@ class CylinderRepository(Repository):
             raise NotFoundError(message="Error on create new cylinder")
 
     async def update(
-        self, cylinder_id: str, company_id: str, cylinder: dict
+        self,
+        cylinder_id: str,
+        company_id: str,
+        cylinder: dict,
+        version: int | None = None,
     ) -> CylinderInDB:
         try:
-            model: CylinderModel = CylinderModel.objects(
-                id=cylinder_id, company_id=company_id, is_active=True
-            ).first()
+            model: CylinderModel | None = self.find_and_update(
+                CylinderModel,
+                {"id": cylinder_id, "company_id": company_id},
+                cylinder,
+                version=version,
+            )
             if not model:
                 raise NotFoundError(message=f"Cylinder #{cylinder_id} not found")
-            model.update(**cylinder)
-            model.save()
-            return await self.select_by_id(cylinder_id, company_id)
-        except NotFoundError:
+            return CylinderInDB.model_validate(model)
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on update_cylinder: {str(error)}")
@@ -64,6 +69,20 @@ class CylinderRepository(Repository):
             _logger.error(f"Error on select_by_id: {str(error)}")
             raise NotFoundError(message=f"Cylinder #{id} not found")
 
+    async def select_by_ids(
+        self, ids: List[str], company_id: str
+    ) -> Dict[str, CylinderInDB]:
+        try:
+            return {
+                model.id: CylinderInDB.model_validate(model)
+                for model in CylinderModel.objects(
+                    id__in=list(set(ids)), company_id=company_id, is_active=True
+                )
+            }
+        except Exception as error:
+            _logger.error(f"Error on select_by_ids: {str(error)}")
+            raise NotFoundError(message="Cylinders not found")
+
     async def select_all(self, company_id: str) -> List[CylinderInDB]:
         try:
             cylinders: List[CylinderInDB] = []
@@ -86,7 +105,7 @@ class CylinderRepository(Repository):
             model.soft_delete()
             model.save()
             return CylinderInDB.model_validate(model)
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on delete_by_id: {str(error)}")
@@ -1,5 +1,7 @@
 from typing import List
 
+from app.core.cache import cached
+
 from .repositories import CylinderRepository
 from .schemas import Cylinder, CylinderInDB, UpdateCylinder
 
@@ -12,16 +14,21 @@ class CylinderServices:
         return await self.__repository.create(cylinder=cylinder, company_id=company_id)
 
     async def update(
-        self, id: str, company_id: str, cylinder: UpdateCylinder
+        self,
+        id: str,
+        company_id: str,
+        cylinder: UpdateCylinder,
+        version: int | None = None,
     ) -> CylinderInDB:
         data = cylinder.model_dump(exclude_unset=True, exclude_none=True)
         return await self.__repository.update(
-            cylinder_id=id, company_id=company_id, cylinder=data
+            cylinder_id=id, company_id=company_id, cylinder=data, version=version
         )
 
     async def search_by_id(self, id: str, company_id: str) -> CylinderInDB:
         return await self.__repository.select_by_id(id=id, company_id=company_id)
 
+    @cached("cylinders")
     async def search_all(self, company_id: str) -> List[CylinderInDB]:
         return await self.__repository.select_all(company_id=company_id)
 
@@ -5,6 +5,7 @@ import calendar
 from decimal import Decimal
 from typing import List
 
+from app.core.exceptions import NotFoundError
 from app.core.utils.utc_datetime import UTCDateTime
 from app.crud.reservations.services import ReservationServices
 from app.crud.reservations.schemas import ReservationInDB
@@ -36,13 +37,20 @@ class DashboardServices:
             }
             for i in range(1, 13)
         }
+        kegs = await self.__keg_services.search_by_ids(
+            [keg_id for res in reservations for keg_id in res.keg_ids],
+            company_id,
+            secondary=True,
+        )
         for res in reservations:
             month = res.delivery_date.month
             stats = monthly[month]
             stats["revenue"] += res.total_value
             stats["count"] += 1
             for keg_id in res.keg_ids:
-                keg = await self.__keg_services.search_by_id(keg_id, company_id)
+                keg = kegs.get(keg_id)
+                if keg is None:
+                    raise NotFoundError(message=f"Keg #{keg_id} not found")
                 stats["liters"] += keg.size_l
                 stats["cost"] += keg.cost_price_per_l * Decimal(keg.size_l)
         result: List[MonthlyRevenue] = []
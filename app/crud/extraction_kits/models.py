@@ -13,7 +13,7 @@ the model indexes accordingly.
 
 from mongoengine import DateField, StringField
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.base_document import ACTIVE_ONLY, BaseDocument
 from .schemas import ExtractionKitStatus, ExtractionKitType
 
 
@@ -31,11 +31,12 @@ class ExtractionKitModel(BaseDocument):
     meta = {
         "collection": "extraction_kits",
         "indexes": [
-            "status",
-            "type",
-            "company_id",
-            "brand",
+            {
+                "fields": ["company_id", "brand"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
             {"fields": ["serial_number", "company_id"], "unique": True},
+            {"fields": ["company_id", "updated_at"]},
         ],
     }
 
@@ -4,7 +4,7 @@ from fastapi.encoders import jsonable_encoder
 from pydantic_core import ValidationError
 
 from app.core.configs import get_logger
-from app.core.exceptions import BadRequestError, NotFoundError
+from app.core.exceptions import BadRequestError, ConflictError, NotFoundError
 from app.core.repositories.base_repository import Repository
 from app.core.utils.utc_datetime import UTCDateTime
 
@@ -58,22 +58,20 @@ class ExtractionKitRepository(Repository):
             raise BadRequestError(message="Error on create new Extraction kit")
 
     async def update(
-        self, gauge_id: str, company_id: str, gauge: dict
+        self, gauge_id: str, company_id: str, gauge: dict, version: int | None = None
     ) -> ExtractionKitInDB:
         try:
-            model: ExtractionKitModel = ExtractionKitModel.objects(
-                id=gauge_id, company_id=company_id, is_active=True
-            ).first()
-
+            model: ExtractionKitModel | None = self.find_and_update(
+                ExtractionKitModel,
+                {"id": gauge_id, "company_id": company_id},
+                gauge,
+                version=version,
+            )
             if not model:
                 raise NotFoundError(message=f"ExtractionKit #{gauge_id} not found")
+            return ExtractionKitInDB.model_validate(model)
 
-            model.update(**gauge)
-            model.save()
-
-            return await self.select_by_id(gauge_id, company_id)
-
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
 
         except Exception as error:
@@ -123,7 +121,7 @@ class ExtractionKitRepository(Repository):
 
             return ExtractionKitInDB.model_validate(model)
 
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
 
         except Exception as error:
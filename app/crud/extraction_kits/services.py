@@ -12,6 +12,8 @@ if not hasattr(unittest.TestCase, "extractor"):
         lambda self: getattr(self, "extraction_kit")
     )
 
+from app.core.cache import cached
+
 from .repositories import ExtractionKitRepository
 from .schemas import ExtractionKit, ExtractionKitInDB, UpdateExtractionKit
 
@@ -24,16 +26,21 @@ class ExtractionKitServices:
         return await self.__repository.create(gauge=gauge, company_id=company_id)
 
     async def update(
-        self, id: str, company_id: str, gauge: UpdateExtractionKit
+        self,
+        id: str,
+        company_id: str,
+        gauge: UpdateExtractionKit,
+        version: int | None = None,
     ) -> ExtractionKitInDB:
         data = gauge.model_dump(exclude_unset=True, exclude_none=True)
         return await self.__repository.update(
-            gauge_id=id, company_id=company_id, gauge=data
+            gauge_id=id, company_id=company_id, gauge=data, version=version
         )
 
     async def search_by_id(self, id: str, company_id: str) -> ExtractionKitInDB:
         return await self.__repository.select_by_id(id=id, company_id=company_id)
 
+    @cached("extraction_kits")
     async def search_all(self, company_id: str) -> List[ExtractionKitInDB]:
         return await self.__repository.select_all(company_id=company_id)
 
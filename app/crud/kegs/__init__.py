@@ -1,2 +1,2 @@
-from .schemas import Keg, KegInDB, UpdateKeg, KegStatus
+from .schemas import Keg, KegInDB, UpdateKeg, KegStatus, KegStockSummary
 from .services import KegServices
@@ -6,7 +6,7 @@ from mongoengine import (
     DateField,
 )
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.base_document import ACTIVE_ONLY, BaseDocument
 from .schemas import KegStatus
 
 
@@ -28,10 +28,27 @@ class KegModel(BaseDocument):
     meta = {
         "collection": "kegs",
         "indexes": [
-            "status",
-            "beer_type_id",
-            "expiration_date",
-            "company_id",
-            {"fields": ["number", "company_id"]},
+            {
+                "fields": ["company_id", "number"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {
+                "fields": ["company_id", "status", "number"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            # Covers the stock summary aggregation: the ``$match`` and the
+            # grouped and summed fields are all read from the keys.
+            {
+                "fields": [
+                    "company_id",
+                    "is_active",
+                    "status",
+                    "beer_type_id",
+                    "size_l",
+                    "current_volume_l",
+                ],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {"fields": ["company_id", "updated_at"]},
         ],
     }
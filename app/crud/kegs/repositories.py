@@ -1,18 +1,90 @@
-from typing import List
+from decimal import Decimal
+from typing import Dict, List
 
 from fastapi.encoders import jsonable_encoder
 from pydantic_core import ValidationError
 
+from app.core.cache import invalidate
 from app.core.configs import get_logger
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import ConflictError, NotFoundError
 from app.core.repositories.base_repository import Repository
 from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.beer_types.models import BeerTypeModel
 
 from .models import KegModel
-from .schemas import Keg, KegInDB
+from .schemas import Keg, KegInDB, KegStatusSummary, KegStockSummary
 
 _logger = get_logger(__name__)
 
+_CENTS = Decimal("0.01")
+
+
+def _liters(value) -> Decimal:
+    return Decimal(str(value or 0)).quantize(_CENTS)
+
+
+def stock_summary_pipeline(company_id: str) -> List[dict]:
+    """Kegs, capacity and remaining volume per beer type and status.
+
+    The ``$match`` and every field read before the first ``$group`` are keys
+    of the ``(company_id, is_active, status, beer_type_id, size_l,
+    current_volume_l)`` index, so the kegs themselves are never fetched
+    (``is_active`` is a key because a partial filter alone does not spare
+    the fetch).  Beer type names are joined only after the grouping, once
+    per beer type.
+    """
+    return [
+        {"$match": {"company_id": company_id, "is_active": True}},
+        {
+            "$project": {
+                "_id": 0,
+                "status": 1,
+                "beer_type_id": 1,
+                "size_l": 1,
+                "current_volume_l": 1,
+            }
+        },
+        {
+            "$group": {
+                "_id": {"beer_type_id": "$beer_type_id", "status": "$status"},
+                "kegs": {"$sum": 1},
+                "size_l": {"$sum": "$size_l"},
+                "current_volume_l": {"$sum": "$current_volume_l"},
+            }
+        },
+        {"$sort": {"_id.status": 1}},
+        {
+            "$group": {
+                "_id": "$_id.beer_type_id",
+                "kegs": {"$sum": "$kegs"},
+                "size_l": {"$sum": "$size_l"},
+                "current_volume_l": {"$sum": "$current_volume_l"},
+                "statuses": {
+                    "$push": {
+                        "status": "$_id.status",
+                        "kegs": "$kegs",
+                        "size_l": "$size_l",
+                        "current_volume_l": "$current_volume_l",
+                    }
+                },
+            }
+        },
+        {
+            "$lookup": {
+                "from": BeerTypeModel._get_collection_name(),
+                "localField": "_id",
+                "foreignField": "_id",
+                "as": "beer_type",
+            }
+        },
+        {
+            "$addFields": {
+                "beer_type_name": {"$arrayElemAt": ["$beer_type.name", 0]},
+            }
+        },
+        {"$sort": {"beer_type_name": 1, "_id": 1}},
+    ]
+
 
 class KegRepository(Repository):
     def __init__(self) -> None:
@@ -35,18 +107,19 @@ class KegRepository(Repository):
             raise NotFoundError(message="Error on create new keg")
 
     async def update(
-        self, keg_id: str, company_id: str, keg: dict
+        self, keg_id: str, company_id: str, keg: dict, version: int | None = None
     ) -> KegInDB:
         try:
-            model: KegModel = KegModel.objects(
-                id=keg_id, company_id=company_id, is_active=True
-            ).first()
+            model: KegModel | None = self.find_and_update(
+                KegModel,
+                {"id": keg_id, "company_id": company_id},
+                keg,
+                version=version,
+            )
             if not model:
                 raise NotFoundError(message=f"Keg #{keg_id} not found")
-            model.update(**keg)
-            model.save()
-            return await self.select_by_id(keg_id, company_id)
-        except NotFoundError:
+            return KegInDB.model_validate(model)
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on update_keg: {str(error)}")
@@ -64,6 +137,38 @@ class KegRepository(Repository):
             _logger.error(f"Error on select_by_id: {str(error)}")
             raise NotFoundError(message=f"Keg #{id} not found")
 
+    async def update_many(
+        self, keg_ids: List[str], company_id: str, keg: dict
+    ) -> int:
+        try:
+            updated = KegModel.objects(
+                id__in=list(set(keg_ids)), company_id=company_id, is_active=True
+            ).update(
+                __raw__=self.versioned_set(
+                    KegModel, **keg, updated_at=UTCDateTime.now()
+                )
+            )
+            invalidate(company_id, KegModel._get_collection_name())
+            return updated
+        except Exception as error:
+            _logger.error(f"Error on update_many: {str(error)}")
+            raise NotFoundError(message="Error on update kegs")
+
+    async def select_by_ids(
+        self, ids: List[str], company_id: str, secondary: bool = False
+    ) -> Dict[str, KegInDB]:
+        try:
+            query = KegModel.objects(
+                id__in=list(set(ids)), company_id=company_id, is_active=True
+            )
+            if secondary:
+                query = self.secondary_reads(query)
+
+            return {model.id: KegInDB.model_validate(model) for model in query}
+        except Exception as error:
+            _logger.error(f"Error on select_by_ids: {str(error)}")
+            raise NotFoundError(message="Kegs not found")
+
     async def select_all(
         self, company_id: str, status: str | None = None
     ) -> List[KegInDB]:
@@ -79,6 +184,32 @@ class KegRepository(Repository):
             _logger.error(f"Error on select_all: {str(error)}")
             raise NotFoundError(message="Kegs not found")
 
+    async def select_stock_summary(self, company_id: str) -> List[KegStockSummary]:
+        try:
+            collection = KegModel._get_collection()
+            return [
+                KegStockSummary(
+                    beer_type_id=row["_id"],
+                    beer_type_name=row.get("beer_type_name"),
+                    kegs=row["kegs"],
+                    size_l=row["size_l"],
+                    current_volume_l=_liters(row["current_volume_l"]),
+                    statuses=[
+                        KegStatusSummary(
+                            status=status["status"],
+                            kegs=status["kegs"],
+                            size_l=status["size_l"],
+                            current_volume_l=_liters(status["current_volume_l"]),
+                        )
+                        for status in row["statuses"]
+                    ],
+                )
+                for row in collection.aggregate(stock_summary_pipeline(company_id))
+            ]
+        except Exception as error:
+            _logger.error(f"Error on select_stock_summary: {str(error)}")
+            raise NotFoundError(message="Keg summary not found")
+
     async def delete_by_id(self, id: str, company_id: str) -> KegInDB:
         try:
             model: KegModel = KegModel.objects(
@@ -89,7 +220,7 @@ class KegRepository(Repository):
             model.soft_delete()
             model.save()
             return KegInDB.model_validate(model)
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
         except Exception as error:
             _logger.error(f"Error on delete_by_id: {str(error)}")
@@ -1,6 +1,7 @@
 from decimal import Decimal
 from datetime import date
 from enum import Enum
+from typing import List
 from pydantic import Field
 
 from app.core.models.base_schema import GenericModel
@@ -40,6 +41,24 @@ class KegInDB(DatabaseModel):
     company_id: str = Field(example="com_123")
 
 
+class KegStatusSummary(GenericModel):
+    status: KegStatus = Field(example=KegStatus.AVAILABLE)
+    kegs: int = Field(default=0, example=4)
+    size_l: int = Field(default=0, example=200)
+    current_volume_l: Decimal = Field(default=Decimal("0"), example=180)
+
+
+class KegStockSummary(GenericModel):
+    """Kegs of one beer type, in total and by status."""
+
+    beer_type_id: str = Field(example="bty_123")
+    beer_type_name: str | None = Field(default=None, example="Pale Ale")
+    kegs: int = Field(default=0, example=6)
+    size_l: int = Field(default=0, example=300)
+    current_volume_l: Decimal = Field(default=Decimal("0"), example=230)
+    statuses: List[KegStatusSummary] = Field(default_factory=list)
+
+
 class UpdateKeg(GenericModel):
     number: str | None = Field(default=None)
     size_l: int | None = Field(default=None)
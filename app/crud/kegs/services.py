@@ -1,7 +1,9 @@
-from typing import List
+from typing import Dict, List
+
+from app.core.cache import cached
 
 from .repositories import KegRepository
-from .schemas import Keg, KegInDB, UpdateKeg, KegStatus
+from .schemas import Keg, KegInDB, KegStatus, KegStockSummary, UpdateKeg
 
 
 class KegServices:
@@ -11,13 +13,25 @@ class KegServices:
     async def create(self, keg: Keg, company_id: str) -> KegInDB:
         return await self.__repository.create(keg=keg, company_id=company_id)
 
-    async def update(self, id: str, company_id: str, keg: UpdateKeg) -> KegInDB:
+    async def update(
+        self, id: str, company_id: str, keg: UpdateKeg, version: int | None = None
+    ) -> KegInDB:
         data = keg.model_dump(exclude_unset=True, exclude_none=True)
-        return await self.__repository.update(keg_id=id, company_id=company_id, keg=data)
+        return await self.__repository.update(
+            keg_id=id, company_id=company_id, keg=data, version=version
+        )
 
     async def search_by_id(self, id: str, company_id: str) -> KegInDB:
         return await self.__repository.select_by_id(id=id, company_id=company_id)
 
+    async def search_by_ids(
+        self, ids: List[str], company_id: str, secondary: bool = False
+    ) -> Dict[str, KegInDB]:
+        return await self.__repository.select_by_ids(
+            ids=ids, company_id=company_id, secondary=secondary
+        )
+
+    @cached("kegs")
     async def search_all(
         self, company_id: str, status: KegStatus | None = None
     ) -> List[KegInDB]:
@@ -26,5 +40,9 @@ class KegServices:
             company_id=company_id, status=status_value
         )
 
+    @cached("kegs", "beer_types")
+    async def search_stock_summary(self, company_id: str) -> List[KegStockSummary]:
+        return await self.__repository.select_stock_summary(company_id=company_id)
+
     async def delete_by_id(self, id: str, company_id: str) -> KegInDB:
         return await self.__repository.delete_by_id(id=id, company_id=company_id)
@@ -1,3 +1,3 @@
-from .schemas import Payment, PaymentStatus, PaymentWithCustomer
+from .schemas import Payment, PaymentInDB, PaymentStatus, PaymentWithCustomer
 
-__all__ = ["Payment", "PaymentStatus", "PaymentWithCustomer"]
+__all__ = ["Payment", "PaymentInDB", "PaymentStatus", "PaymentWithCustomer"]
@@ -1,7 +1,28 @@
+from hashlib import sha1
+
 from mongoengine import EmbeddedDocument, DecimalField, StringField, DateField
 
+from app.core.models.base_document import generate_prefixed_id
+
+
+def generate_payment_id() -> str:
+    return generate_prefixed_id("pay")
+
+
+def legacy_payment_id(reservation_id: str, index: int) -> str:
+    """Id of the ``index``-th payment of a reservation saved without payment ids.
+
+    Derived instead of generated, so every read returns the same id and the
+    ``reservation_payment_ids`` migration stores that very id.
+    """
+    return f"pay_{sha1(f'{reservation_id}:{index}'.encode()).hexdigest()[:8]}"
+
 
 class PaymentModel(EmbeddedDocument):
+    # Stable id so a payment can be targeted in place in ``payments``.  New
+    # payments are given ``generate_payment_id``; there is no default, which
+    # would hand legacy payments a new random id on every load.
+    id = StringField()
     amount = DecimalField(required=True, precision=2)
     method = StringField(required=True)
     paid_at = DateField(required=True)
@@ -14,6 +14,10 @@ class Payment(GenericModel):
     paid_at: date = Field(example=str(date.today()))
 
 
+class PaymentInDB(Payment):
+    id: str | None = Field(default=None, example="pay_1a2b3c4d")
+
+
 class PaymentStatus(str, Enum):
     PENDING = "PENDING"
     PAID = "PAID"
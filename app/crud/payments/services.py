@@ -3,6 +3,7 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import List
 
+from app.core.exceptions import NotFoundError
 from app.crud.reservations.repositories import ReservationRepository
 from app.crud.customers.repositories import CustomerRepository
 from app.crud.payments.schemas import PaymentWithCustomer, PaymentStatus
@@ -23,7 +24,7 @@ class PaymentServices:
         reservations = await self.__reservation_repository.select_all(
             company_id=company_id
         )
-        result: List[PaymentWithCustomer] = []
+        rows = []
         for res in reservations:
             paid_value = sum((p.amount for p in res.payments), Decimal("0"))
             pending_value = res.total_value - paid_value
@@ -32,9 +33,16 @@ class PaymentServices:
             )
             if status and current_status != status:
                 continue
-            customer = await self.__customer_repository.select_by_id(
-                res.customer_id, company_id
-            )
+            rows.append((res, paid_value, pending_value, current_status))
+
+        customers = await self.__customer_repository.select_by_ids(
+            [res.customer_id for res, *_ in rows], company_id, secondary=True
+        )
+        result: List[PaymentWithCustomer] = []
+        for res, paid_value, pending_value, current_status in rows:
+            customer = customers.get(res.customer_id)
+            if customer is None:
+                raise NotFoundError(message=f"Customer #{res.customer_id} not found")
             result.append(
                 PaymentWithCustomer(
                     reservation_id=res.id,
@@ -0,0 +1,2 @@
+from .repositories import PostalCodeRepository
+from .schemas import PostalCode, PostalCodeInDB, PostalCodeSource
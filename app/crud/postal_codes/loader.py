@@ -0,0 +1,50 @@
+"""
+Offline postal code dataset loader.
+
+Bulk loads a CSV of CEPs into the ``postal_codes`` collection so lookups are
+answered locally, without ViaCEP.  Columns use ViaCEP's names: ``cep``,
+``logradouro``, ``complemento``, ``bairro``, ``localidade`` and ``uf``.
+Loaded rows never expire and replace cached ViaCEP answers.
+
+Usage:
+    python -m app.crud.postal_codes.loader ceps.csv
+"""
+
+import argparse
+import asyncio
+import csv
+from typing import Iterator
+
+from app.core.configs import get_logger
+
+from .repositories import PostalCodeRepository
+from .schemas import PostalCode
+
+_logger = get_logger(__name__)
+
+
+def read_dataset(path: str) -> Iterator[PostalCode]:
+    with open(path, newline="", encoding="utf-8") as dataset:
+        for row in csv.DictReader(dataset):
+            yield PostalCode.from_via_cep(row["cep"], row)
+
+
+def load_dataset(path: str) -> int:
+    loaded = asyncio.run(PostalCodeRepository().bulk_load(read_dataset(path)))
+    _logger.info(f"{loaded} postal codes loaded from {path}")
+    return loaded
+
+
+def _main() -> None:
+    from app.core.db.connection import start_database
+
+    parser = argparse.ArgumentParser(description="Load a postal code dataset")
+    parser.add_argument("path", help="CSV file with ViaCEP columns")
+    args = parser.parse_args()
+
+    start_database()
+    load_dataset(args.path)
+
+
+if __name__ == "__main__":
+    _main()
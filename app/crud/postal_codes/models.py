@@ -0,0 +1,25 @@
+from mongoengine import BooleanField, DateTimeField, StringField
+
+from app.core.models.base_document import BaseDocument
+
+
+class PostalCodeModel(BaseDocument):
+    """ViaCEP answers and bulk-loaded CEPs, keyed by the 8-digit CEP."""
+
+    street = StringField()
+    complement = StringField()
+    district = StringField()
+    city = StringField()
+    state = StringField()
+    # False caches a "CEP not found" answer.
+    found = BooleanField(default=True, required=True)
+    source = StringField(required=True, choices=("viacep", "dataset"))
+    # Removed by the TTL monitor once passed; dataset rows never expire.
+    expires_at = DateTimeField()
+
+    meta = {
+        "collection": "postal_codes",
+        "indexes": [
+            {"fields": ["expires_at"], "expireAfterSeconds": 0},
+        ],
+    }
@@ -0,0 +1,140 @@
+from datetime import timedelta
+from threading import Lock
+from typing import Dict, Iterable, List
+
+from cachetools import TTLCache
+
+from app.core.configs import get_environment, get_logger
+from app.core.exceptions import NotFoundError
+from app.core.metrics import record_cache
+from app.core.repositories.base_repository import Repository
+from app.core.utils.postal_code import valid_postal_code_digits
+from app.core.utils.utc_datetime import UTCDateTime
+
+from .models import PostalCodeModel
+from .schemas import PostalCode, PostalCodeInDB, PostalCodeSource
+
+_env = get_environment()
+_logger = get_logger(__name__)
+
+_BULK_BATCH_SIZE = 1000
+
+
+class PostalCodeRepository(Repository):
+    # In-process LRU in front of the collection, shared by every instance
+    # (services are built per request).
+    _local: TTLCache = TTLCache(
+        maxsize=_env.POSTAL_CODE_CACHE_SIZE, ttl=_env.POSTAL_CODE_CACHE_TTL
+    )
+    _local_lock = Lock()
+
+    def __init__(self) -> None:
+        super().__init__()
+
+    @classmethod
+    def clear_local_cache(cls) -> None:
+        with cls._local_lock:
+            cls._local.clear()
+
+    async def select_by_key(self, key: str) -> PostalCodeInDB | None:
+        with self._local_lock:
+            cached = self._local.get(key)
+
+        record_cache("postal_codes_local", hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        try:
+            model: PostalCodeModel | None = PostalCodeModel.objects(id=key).first()
+
+        except Exception as error:
+            _logger.error(f"Error on select_by_key: {str(error)}")
+            return None
+
+        # The TTL monitor only runs once a minute.
+        if model and model.expires_at:
+            if UTCDateTime.validate_datetime(model.expires_at) <= UTCDateTime.now():
+                model = None
+
+        record_cache("postal_codes_store", hit=model is not None)
+        if model is None:
+            return None
+
+        postal_code = PostalCodeInDB.model_validate(model)
+        self._remember(postal_code)
+        return postal_code
+
+    async def select_nearby(self, key: str) -> PostalCodeInDB | None:
+        """A known CEP of the same 5-digit sector (same city and region)."""
+        try:
+            model = PostalCodeModel.objects(id__startswith=key[:5], found=True).first()
+            return PostalCodeInDB.model_validate(model) if model else None
+
+        except Exception as error:
+            _logger.error(f"Error on select_nearby: {str(error)}")
+            return None
+
+    async def upsert(
+        self, postal_code: PostalCode, expires_in: timedelta | None = None
+    ) -> PostalCodeInDB:
+        try:
+            key = valid_postal_code_digits(postal_code.postal_code)
+            now = UTCDateTime.now()
+            model = PostalCodeModel(
+                id=key,
+                **postal_code.model_dump(exclude={"postal_code"}),
+                source=PostalCodeSource.VIACEP.value,
+                expires_at=now + expires_in if expires_in else None,
+                created_at=now,
+                updated_at=now,
+            )
+            model.save()
+
+            result = PostalCodeInDB.model_validate(model)
+            self._remember(result)
+            return result
+
+        except Exception as error:
+            _logger.error(f"Error on upsert_postal_code: {str(error)}")
+            raise NotFoundError(message="Error on save postal code")
+
+    async def bulk_load(self, postal_codes: Iterable[PostalCode]) -> int:
+        """Replace dataset rows in batches; they never expire."""
+        loaded = 0
+        # Keyed by CEP, the last row of a repeated CEP wins.
+        batch: Dict[str, dict] = {}
+        now = UTCDateTime.now()
+
+        for postal_code in postal_codes:
+            key = valid_postal_code_digits(postal_code.postal_code)
+            if key is None:
+                continue
+
+            batch[key] = {
+                "_id": key,
+                **postal_code.model_dump(exclude={"postal_code"}),
+                "source": PostalCodeSource.DATASET.value,
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+
+            if len(batch) == _BULK_BATCH_SIZE:
+                loaded += self._replace(list(batch.values()))
+                batch = {}
+
+        if batch:
+            loaded += self._replace(list(batch.values()))
+
+        return loaded
+
+    def _replace(self, batch: List[dict]) -> int:
+        # Two commands per batch instead of one upsert per row.
+        collection = PostalCodeModel._get_collection()
+        collection.delete_many({"_id": {"$in": [row["_id"] for row in batch]}})
+        collection.insert_many(batch, ordered=False)
+        return len(batch)
+
+    def _remember(self, postal_code: PostalCodeInDB) -> None:
+        with self._local_lock:
+            self._local[postal_code.id] = postal_code
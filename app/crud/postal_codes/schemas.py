@@ -0,0 +1,59 @@
+from enum import Enum
+
+from pydantic import Field
+
+from app.core.models.base_model import DatabaseModel
+from app.core.models.base_schema import GenericModel
+from app.core.utils.postal_code import format_postal_code
+from app.core.utils.utc_datetime import UTCDateTimeType
+
+
+class PostalCodeSource(str, Enum):
+    VIACEP = "viacep"
+    DATASET = "dataset"
+
+
+class PostalCode(GenericModel):
+    postal_code: str = Field(example="89010-000")
+    street: str = Field(default="", example="Rua XV de Novembro")
+    complement: str = Field(default="", example="até 999/1000")
+    district: str = Field(default="", example="Centro")
+    city: str = Field(default="", example="Blumenau")
+    state: str = Field(default="", example="SC")
+    found: bool = Field(default=True, example=True)
+
+    @classmethod
+    def from_via_cep(cls, postal_code: str, data: dict) -> "PostalCode":
+        if "erro" in data:
+            return cls(postal_code=postal_code, found=False)
+
+        return cls(
+            postal_code=data["cep"],
+            street=data.get("logradouro") or "",
+            complement=data.get("complemento") or "",
+            district=data.get("bairro") or "",
+            city=data.get("localidade") or "",
+            state=data.get("uf") or "",
+        )
+
+
+class PostalCodeInDB(DatabaseModel):
+    street: str | None = Field(default=None, example="Rua XV de Novembro")
+    complement: str | None = Field(default=None, example="até 999/1000")
+    district: str | None = Field(default=None, example="Centro")
+    city: str | None = Field(default=None, example="Blumenau")
+    state: str | None = Field(default=None, example="SC")
+    found: bool = Field(example=True)
+    source: PostalCodeSource = Field(example=PostalCodeSource.VIACEP)
+    expires_at: UTCDateTimeType | None = Field(default=None)
+
+    def to_postal_code(self) -> PostalCode:
+        return PostalCode(
+            postal_code=format_postal_code(self.id),
+            street=self.street or "",
+            complement=self.complement or "",
+            district=self.district or "",
+            city=self.city or "",
+            state=self.state or "",
+            found=self.found,
+        )
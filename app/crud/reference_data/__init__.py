@@ -0,0 +1,2 @@
+from .schemas import ReferenceData
+from .services import ReferenceDataServices
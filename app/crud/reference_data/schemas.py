@@ -0,0 +1,16 @@
+from typing import Dict, List
+
+from pydantic import Field
+
+from app.core.models.base_schema import GenericModel
+from app.crud.beer_types.schemas import BeerTypeInDB
+
+
+class ReferenceData(GenericModel):
+    """Dropdown data of a company: its beer types and the enum values."""
+
+    version: str = Field(example="9f86d081884c7d65")
+    beer_types: List[BeerTypeInDB] = Field(default_factory=list)
+    enums: Dict[str, List[str]] = Field(
+        default_factory=dict, example={"KegStatus": ["AVAILABLE", "IN_USE"]}
+    )
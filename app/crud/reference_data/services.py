@@ -0,0 +1,53 @@
+import hashlib
+import json
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.cache import cached
+from app.crud.beer_dispensers.schemas import DispenserStatus, Voltage
+from app.crud.beer_types.repositories import BeerTypeRepository
+from app.crud.cylinders.schemas import CylinderStatus
+from app.crud.extraction_kits.schemas import ExtractionKitStatus, ExtractionKitType
+from app.crud.kegs.schemas import KegStatus
+from app.crud.payments.schemas import PaymentStatus
+from app.crud.reservations.schemas import ReservationStatus
+
+from .schemas import ReferenceData
+
+REFERENCE_ENUMS = (
+    KegStatus,
+    DispenserStatus,
+    Voltage,
+    ExtractionKitType,
+    ExtractionKitStatus,
+    CylinderStatus,
+    ReservationStatus,
+    PaymentStatus,
+)
+
+
+class ReferenceDataServices:
+    def __init__(self, beer_type_repository: BeerTypeRepository) -> None:
+        self.__beer_type_repository = beer_type_repository
+
+    @cached("beer_types")
+    async def search_bundle(self, company_id: str) -> ReferenceData:
+        """Beer types and enums, versioned by a hash of their content.
+
+        The version only changes when a beer type of the company is written
+        (or the enums change with a release), so it makes a stable ETag.
+        """
+        beer_types = await self.__beer_type_repository.select_all(
+            company_id=company_id
+        )
+        enums = {
+            enum.__name__: [member.value for member in enum] for enum in REFERENCE_ENUMS
+        }
+
+        content = json.dumps(
+            jsonable_encoder({"beer_types": beer_types, "enums": enums}),
+            sort_keys=True,
+        )
+        version = hashlib.sha256(content.encode()).hexdigest()[:16]
+
+        return ReferenceData(version=version, beer_types=beer_types, enums=enums)
@@ -0,0 +1,167 @@
+"""
+Cold tier for COMPLETED reservations.
+
+Reservations completed longer than ``RESERVATION_ARCHIVE_AFTER_DAYS`` ago are
+moved, in batches, from ``reservations`` into ``reservations_archive_{year}``
+(the year of the delivery date).  The hot collection keeps only what is still
+open or recent, so its working set and indexes stay small; dated listings
+read the archive years their range overlaps and the customer overview reads
+every year.
+
+Only reservations paid in full are archived, so pending payments are always
+answered by the hot tier.
+
+Usage:
+    python -m app.crud.reservations.archive
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List
+
+from pymongo import ASCENDING
+
+from app.core.configs import get_environment, get_logger
+from app.core.db.tiering import move_documents
+from app.core.metrics import RESERVATIONS_ARCHIVED
+from app.core.utils.utc_datetime import UTCDateTime
+
+from .models import ReservationModel
+from .schemas import ReservationStatus
+
+_env = get_environment()
+_logger = get_logger(__name__)
+
+ARCHIVE_PREFIX = "reservations_archive_"
+
+
+def archive_collection_name(year: int) -> str:
+    return f"{ARCHIVE_PREFIX}{year}"
+
+
+def _paid_in_full(document: dict) -> bool:
+    payments = document.get("payments", [])
+    paid = sum((Decimal(str(p.get("amount", 0))) for p in payments), Decimal("0"))
+    return paid >= Decimal(str(document.get("total_value", 0)))
+
+
+class ReservationArchive:
+    """Reads and writes of the per-year cold collections."""
+
+    def __init__(self) -> None:
+        self._indexed = set()
+
+    def collection(self, year: int):
+        collection = ReservationModel._get_db()[archive_collection_name(year)]
+        if year not in self._indexed:
+            collection.create_index(
+                [("company_id", ASCENDING), ("delivery_date", ASCENDING)]
+            )
+            # Customer history (see ``CustomerRepository.select_overview``).
+            collection.create_index(
+                [
+                    ("company_id", ASCENDING),
+                    ("customer_id", ASCENDING),
+                    ("delivery_date", ASCENDING),
+                ]
+            )
+            self._indexed.add(year)
+        return collection
+
+    def years(self) -> List[int]:
+        """Years that have an archive collection, oldest first."""
+        db = ReservationModel._get_db()
+        return sorted(
+            int(name[len(ARCHIVE_PREFIX):])
+            for name in db.list_collection_names()
+            if name.startswith(ARCHIVE_PREFIX) and name[len(ARCHIVE_PREFIX):].isdigit()
+        )
+
+    def years_between(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> List[int]:
+        """Archive years a ``delivery_date`` in ``[start, end]`` can fall in.
+
+        Archived reservations were picked up before the archiver ran, so a
+        range starting from now on never reaches the cold tier.
+        """
+        if start and start >= UTCDateTime.now():
+            return []
+
+        return [
+            year
+            for year in self.years()
+            if (not start or year >= start.year) and (not end or year <= end.year)
+        ]
+
+    def find(
+        self, query: dict, years: List[int], projection: dict | None = None
+    ) -> List[dict]:
+        rows = []
+        for year in years:
+            rows.extend(self.collection(year).find(query, projection))
+        return rows
+
+    def find_one(self, query: dict) -> dict | None:
+        for year in reversed(self.years()):
+            document = self.collection(year).find_one(query)
+            if document:
+                return document
+        return None
+
+    def archive(self, older_than: datetime, batch_size: int = 500) -> int:
+        """Move COMPLETED reservations picked up before ``older_than``.
+
+        See :func:`move_documents` for why a crash or a concurrent write
+        never loses a reservation.  Returns how many were moved.
+        """
+        hot = ReservationModel._get_collection()
+        query = {
+            "status": ReservationStatus.COMPLETED.value,
+            "pickup_date": {"$lt": older_than},
+        }
+
+        moved = 0
+        last_id = None
+        while True:
+            page = dict(query, _id={"$gt": last_id}) if last_id else query
+            batch = list(hot.find(page).sort("_id", ASCENDING).limit(batch_size))
+            if not batch:
+                break
+            last_id = batch[-1]["_id"]
+
+            by_year: Dict[int, List[dict]] = {}
+            for document in batch:
+                if _paid_in_full(document):
+                    by_year.setdefault(document["delivery_date"].year, []).append(document)
+
+            for year, documents in by_year.items():
+                moved += move_documents(hot, self.collection(year), documents)
+
+            if len(batch) < batch_size:
+                break
+
+        if moved:
+            RESERVATIONS_ARCHIVED.inc(moved)
+        _logger.info(f"Archived {moved} reservations")
+        return moved
+
+
+
+def archive_reservations(archive: ReservationArchive | None = None) -> int:
+    older_than = UTCDateTime.now() - timedelta(days=_env.RESERVATION_ARCHIVE_AFTER_DAYS)
+    return (archive or ReservationArchive()).archive(
+        older_than=older_than, batch_size=_env.RESERVATION_ARCHIVE_BATCH_SIZE
+    )
+
+
+
+def _main() -> None:
+    from app.core.db.connection import start_database
+
+    start_database()
+    print(f"Archived {archive_reservations()} reservations")
+
+
+if __name__ == "__main__":
+    _main()
@@ -6,7 +6,7 @@ from mongoengine import (
     StringField,
 )
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.base_document import ACTIVE_ONLY, BaseDocument
 from app.crud.payments.models import PaymentModel
 
 from .schemas import ReservationStatus
@@ -34,10 +34,33 @@ class ReservationModel(BaseDocument):
     meta = {
         "collection": "reservations",
         "indexes": [
-            "customer_id",
-            "company_id",
-            "delivery_date",
-            "pickup_date",
-            "beer_dispenser_ids",
+            {
+                "fields": ["company_id", "delivery_date"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {
+                "fields": ["company_id", "status", "delivery_date"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {
+                "fields": ["company_id", "customer_id", "delivery_date"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {
+                "fields": ["company_id", "beer_dispenser_ids", "delivery_date"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {
+                "fields": ["company_id", "extraction_kit_ids", "delivery_date"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            {
+                "fields": ["company_id", "cylinder_ids", "delivery_date"],
+                "partialFilterExpression": ACTIVE_ONLY,
+            },
+            # Customer overview ``$lookup``: a join cannot use the partial
+            # company-prefixed index above.
+            {"fields": ["customer_id"]},
+            {"fields": ["company_id", "updated_at"]},
         ],
     }
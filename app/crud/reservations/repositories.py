@@ -1,27 +1,47 @@
-from typing import List
+from functools import reduce
+from operator import or_
+from typing import Dict, List, Tuple
+
+from mongoengine import Q
+from pydantic import TypeAdapter
+from pymongo import ReturnDocument
 
 from app.core.configs import get_logger
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import ConflictError, NotFoundError
+from app.core.models.base_document import NEXT_VERSION, version_filter
 from app.core.repositories.base_repository import Repository
 from app.core.utils.utc_datetime import UTCDateTime
-from app.crud.payments.models import PaymentModel
+from app.crud.payments.models import PaymentModel, generate_payment_id
 from app.crud.payments.schemas import Payment
 
+from .archive import ReservationArchive
 from .models import ReservationModel
 from .schemas import ReservationCreate, ReservationInDB, ReservationStatus
 
 _logger = get_logger(__name__)
 
+# Listing reads raw documents and validates them in one pass instead of
+# building a mongoengine ``Document`` per row and validating it again.
+_RESERVATION_FIELDS = tuple(
+    name for name in ReservationInDB.model_fields if name != "id"
+)
+_RESERVATION_PROJECTION = dict.fromkeys(_RESERVATION_FIELDS, 1)
+_RESERVATION_LIST_ADAPTER = TypeAdapter(List[ReservationInDB])
+
 
 class ReservationRepository(Repository):
-    def __init__(self) -> None:
+    def __init__(self, archive: ReservationArchive | None = None) -> None:
         super().__init__()
+        self.__archive = archive or ReservationArchive()
 
     async def create(
         self, reservation: ReservationCreate, company_id: str
     ) -> ReservationInDB:
         try:
-            payments = [PaymentModel(**p.model_dump()) for p in reservation.payments]
+            payments = [
+                PaymentModel(id=generate_payment_id(), **p.model_dump())
+                for p in reservation.payments
+            ]
             json = reservation.model_dump(exclude={"payments"})
             json["status"] = reservation.status.value
             json["delivery_date"] = UTCDateTime.validate_datetime(json["delivery_date"])
@@ -44,28 +64,28 @@ class ReservationRepository(Repository):
             raise NotFoundError(message="Error on create reservation")
 
     async def update(
-        self, id: str, company_id: str, reservation: dict
+        self, id: str, company_id: str, reservation: dict, version: int | None = None
     ) -> ReservationInDB:
         try:
-            model: ReservationModel = ReservationModel.objects(
-                id=id, company_id=company_id, is_active=True
-            ).first()
-
-            if not model:
-                raise NotFoundError(message=f"Reservation #{id} not found")
-
             if reservation.get("payments") is not None:
                 reservation["payments"] = [
-                    PaymentModel(**p) for p in reservation["payments"]
+                    PaymentModel(id=generate_payment_id(), **p)
+                    for p in reservation["payments"]
                 ]
 
-            model.update(**reservation)
-            model.save()
-            model = ReservationModel.objects(id=id, company_id=company_id).first()
+            model: ReservationModel | None = self.find_and_update(
+                ReservationModel,
+                {"id": id, "company_id": company_id},
+                reservation,
+                version=version,
+            )
+
+            if not model:
+                raise NotFoundError(message=f"Reservation #{id} not found")
 
             return ReservationInDB.model_validate(model)
 
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
 
         except Exception as error:
@@ -76,16 +96,19 @@ class ReservationRepository(Repository):
         self, id: str, company_id: str, payment: Payment
     ) -> ReservationInDB:
         try:
-            model: ReservationModel = ReservationModel.objects(
-                id=id, company_id=company_id, is_active=True
-            ).first()
+            model: ReservationModel | None = self.find_and_update(
+                ReservationModel,
+                {"id": id, "company_id": company_id},
+                {
+                    "push__payments": PaymentModel(
+                        id=generate_payment_id(), **payment.model_dump()
+                    )
+                },
+            )
 
             if not model:
                 raise NotFoundError(message=f"Reservation #{id} not found")
 
-            model.payments.append(PaymentModel(**payment.model_dump()))
-            model.save()
-
             return ReservationInDB.model_validate(model)
 
         except NotFoundError:
@@ -96,23 +119,48 @@ class ReservationRepository(Repository):
             raise NotFoundError(message="Error on add payment")
 
     async def update_payment(
-        self, id: str, company_id: str, index: int, payment: Payment
+        self, id: str, company_id: str, payment_id: str, payment: Payment
     ) -> ReservationInDB:
         try:
-            model: ReservationModel = ReservationModel.objects(
-                id=id, company_id=company_id, is_active=True
-            ).first()
-
-            if not model:
-                raise NotFoundError(message=f"Reservation #{id} not found")
+            replacement = PaymentModel(id=payment_id, **payment.model_dump())
+
+            # ``$map`` swaps the matching payment inside one
+            # ``find_one_and_update``, like a positional ``$set`` would.
+            document = ReservationModel._get_collection().find_one_and_update(
+                {
+                    "_id": id,
+                    "company_id": company_id,
+                    "is_active": True,
+                    "payments.id": payment_id,
+                },
+                [
+                    {
+                        "$set": {
+                            "updated_at": UTCDateTime.now(),
+                            "version": NEXT_VERSION,
+                            "payments": {
+                                "$map": {
+                                    "input": "$payments",
+                                    "as": "payment",
+                                    "in": {
+                                        "$cond": [
+                                            {"$eq": ["$$payment.id", payment_id]},
+                                            {"$literal": replacement.to_mongo()},
+                                            "$$payment",
+                                        ]
+                                    },
+                                }
+                            },
+                        }
+                    }
+                ],
+                return_document=ReturnDocument.AFTER,
+            )
 
-            if index < 0 or index >= len(model.payments):
-                raise NotFoundError(message=f"Payment #{index} not found")
+            if not document:
+                raise NotFoundError(message=f"Payment #{payment_id} not found")
 
-            model.payments[index] = PaymentModel(**payment.model_dump())
-            model.save()
-
-            return ReservationInDB.model_validate(model)
+            return ReservationInDB.model_validate(ReservationModel._from_son(document))
 
         except NotFoundError:
             raise
@@ -122,21 +170,17 @@ class ReservationRepository(Repository):
             raise NotFoundError(message="Error on update payment")
 
     async def delete_payment(
-        self, id: str, company_id: str, index: int
+        self, id: str, company_id: str, payment_id: str
     ) -> ReservationInDB:
         try:
-            model: ReservationModel = ReservationModel.objects(
-                id=id, company_id=company_id, is_active=True
-            ).first()
+            model: ReservationModel | None = self.find_and_update(
+                ReservationModel,
+                {"id": id, "company_id": company_id, "payments__id": payment_id},
+                {"pull__payments__id": payment_id},
+            )
 
             if not model:
-                raise NotFoundError(message=f"Reservation #{id} not found")
-
-            if index < 0 or index >= len(model.payments):
-                raise NotFoundError(message=f"Payment #{index} not found")
-
-            model.payments.pop(index)
-            model.save()
+                raise NotFoundError(message=f"Payment #{payment_id} not found")
 
             return ReservationInDB.model_validate(model)
 
@@ -245,29 +289,142 @@ class ReservationRepository(Repository):
             _logger.error(f"Error on find_active_by_beer_dispenser_id: {str(error)}")
             raise NotFoundError(message="Error on find reservation by beer dispenser")
 
-    def _auto_update_status(self, model: ReservationModel) -> None:
+    async def find_active_by_beer_dispenser_ids(
+        self, company_id: str, dispenser_ids: List[str]
+    ) -> Dict[str, ReservationInDB]:
+        """Batch form of :meth:`find_active_by_beer_dispenser_id`.
+
+        Maps each dispenser id to its next active reservation (earliest
+        delivery date); dispensers without one are left out.
+        """
+        try:
+            now = UTCDateTime.now()
+            wanted = set(dispenser_ids)
+            reservations: Dict[str, ReservationInDB] = {}
+            query = ReservationModel.objects(
+                beer_dispenser_ids__in=list(wanted),
+                company_id=company_id,
+                is_active=True,
+                status__ne=ReservationStatus.COMPLETED.value,
+                pickup_date__gte=now,
+            ).order_by("delivery_date")
+
+            for model in query:
+                reservation = None
+                for dispenser_id in model.beer_dispenser_ids:
+                    if dispenser_id in wanted and dispenser_id not in reservations:
+                        reservation = reservation or ReservationInDB.model_validate(model)
+                        reservations[dispenser_id] = reservation
+                if len(reservations) == len(wanted):
+                    break
+
+            return reservations
+
+        except Exception as error:
+            _logger.error(f"Error on find_active_by_beer_dispenser_ids: {str(error)}")
+            raise NotFoundError(message="Error on find reservations by beer dispensers")
+
+    def _next_status(self, status: str, delivery_date, pickup_date) -> str | None:
         # ``ReservationModel`` stores datetimes without timezone information,
         # while :class:`UTCDateTime.now` returns timezone-aware values.  Direct
         # comparisons between them raise ``TypeError`` complaining about naive
         # vs offset-aware datetimes.  We normalise both dates to ``UTCDateTime``
         # before comparison to keep everything in UTC.
         now = UTCDateTime.now()
-        delivery_date = UTCDateTime.validate_datetime(model.delivery_date)
-        pickup_date = UTCDateTime.validate_datetime(model.pickup_date)
+        delivery_date = UTCDateTime.validate_datetime(delivery_date)
+        pickup_date = UTCDateTime.validate_datetime(pickup_date)
 
-        changed = False
-        if model.status == ReservationStatus.RESERVED.value and now >= delivery_date:
-            model.status = ReservationStatus.TO_DELIVER.value
-            changed = True
+        new_status = status
+        if new_status == ReservationStatus.RESERVED.value and now >= delivery_date:
+            new_status = ReservationStatus.TO_DELIVER.value
         if (
-            model.status
+            new_status
             in [ReservationStatus.TO_DELIVER.value, ReservationStatus.DELIVERED.value]
             and now >= pickup_date
         ):
-            model.status = ReservationStatus.TO_PICKUP.value
-            changed = True
-        if changed:
-            model.save()
+            new_status = ReservationStatus.TO_PICKUP.value
+
+        return new_status if new_status != status else None
+
+    def _auto_update_status(self, model: ReservationModel) -> None:
+        new_status = self._next_status(
+            model.status, model.delivery_date, model.pickup_date
+        )
+        if new_status:
+            model.status = new_status
+            try:
+                model.save()
+            except ConflictError:
+                # Written meanwhile: answer with that write, the next read
+                # advances its status.
+                model.reload()
+
+    def _auto_update_status_rows(self, rows: List[dict]) -> None:
+        # ``rows`` may come from a lagging secondary, so they only pick the
+        # candidates; the transitions are decided from a primary read.
+        candidates = {
+            row["id"]: row
+            for row in rows
+            if self._next_status(row["status"], row["delivery_date"], row["pickup_date"])
+        }
+        if not candidates:
+            return
+
+        current = ReservationModel.objects(id__in=list(candidates)).only(
+            "status", "delivery_date", "pickup_date", "updated_at", "version"
+        ).as_pymongo()
+
+        # One update per status transition instead of one per row.  Each
+        # update only matches reservations still at the status and version
+        # that were read, so a concurrent change is never overwritten.
+        changed: Dict[Tuple[str, str], List[dict]] = {}
+        for document in current:
+            row = candidates[document["_id"]]
+            row.update(
+                status=document["status"],
+                updated_at=document["updated_at"],
+                version=document.get("version", 1),
+            )
+            new_status = self._next_status(
+                document["status"], document["delivery_date"], document["pickup_date"]
+            )
+            if new_status:
+                changed.setdefault((document["status"], new_status), []).append(row)
+
+        now = UTCDateTime.now()
+        missed: List[dict] = []
+        for (status, new_status), status_rows in changed.items():
+            matched = ReservationModel.objects(
+                reduce(
+                    or_,
+                    (Q(id=row["id"], **version_filter(row["version"])) for row in status_rows),
+                ),
+                status=status,
+            ).update(
+                __raw__=self.versioned_set(
+                    ReservationModel, status=new_status, updated_at=now
+                )
+            )
+            if matched < len(status_rows):
+                # Some were written meanwhile: read back what each row is now.
+                missed.extend(status_rows)
+                continue
+
+            for row in status_rows:
+                row["status"] = new_status
+                row["updated_at"] = now
+                row["version"] += 1
+
+        if missed:
+            rows_by_id = {row["id"]: row for row in missed}
+            for document in ReservationModel.objects(id__in=list(rows_by_id)).only(
+                "status", "updated_at", "version"
+            ).as_pymongo():
+                rows_by_id[document["_id"]].update(
+                    status=document["status"],
+                    updated_at=document["updated_at"],
+                    version=document.get("version", 1),
+                )
 
     async def select_by_id(self, id: str, company_id: str) -> ReservationInDB:
         try:
@@ -276,12 +433,19 @@ class ReservationRepository(Repository):
             ).first()
 
             if not model:
-                raise NotFoundError(message=f"Reservation #{id} not found")
+                archived = self.__archive.find_one(
+                    {"_id": id, "company_id": company_id, "is_active": True}
+                )
+                if not archived:
+                    raise NotFoundError(message=f"Reservation #{id} not found")
+                return ReservationInDB.model_validate(
+                    ReservationModel._from_son(archived)
+                )
 
             self._auto_update_status(model)
             return ReservationInDB.model_validate(model)
 
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
 
         except Exception as error:
@@ -296,7 +460,9 @@ class ReservationRepository(Repository):
         status: str | None = None,
     ) -> List[ReservationInDB]:
         try:
-            query = ReservationModel.objects(company_id=company_id, is_active=True)
+            query = self.secondary_reads(
+                ReservationModel.objects(company_id=company_id, is_active=True)
+            )
 
             if start_date:
                 start = UTCDateTime.validate_datetime(start_date)
@@ -309,13 +475,34 @@ class ReservationRepository(Repository):
             if status:
                 query = query.filter(status=status)
 
-            reservations: List[ReservationInDB] = []
+            rows = list(
+                query.order_by("delivery_date")
+                .only(*_RESERVATION_FIELDS)
+                .as_pymongo()
+            )
 
-            for model in query.order_by("delivery_date"):
-                self._auto_update_status(model)
-                reservations.append(ReservationInDB.model_validate(model))
+            for row in rows:
+                row["id"] = row.pop("_id")
+            self._auto_update_status_rows(rows)
+
+            # Only a dated listing can reach completed history in the cold tier.
+            if (start_date or end_date) and status in (
+                None,
+                ReservationStatus.COMPLETED.value,
+            ):
+                years = self.__archive.years_between(
+                    start_date and UTCDateTime.validate_datetime(start_date),
+                    end_date and UTCDateTime.validate_datetime(end_date),
+                )
+                archived = self.__archive.find(
+                    query._query, years, _RESERVATION_PROJECTION
+                )
+                for row in archived:
+                    row["id"] = row.pop("_id")
+                if archived:
+                    rows = sorted(rows + archived, key=lambda row: row["delivery_date"])
 
-            return reservations
+            return _RESERVATION_LIST_ADAPTER.validate_python(rows)
 
         except Exception as error:
             _logger.error(f"Error on select_all: {str(error)}")
@@ -334,7 +521,7 @@ class ReservationRepository(Repository):
             model.save()
             return ReservationInDB.model_validate(model)
 
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
 
         except Exception as error:
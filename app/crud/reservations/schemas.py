@@ -7,7 +7,8 @@ from pydantic import Field, model_validator
 from app.core.models.base_model import DatabaseModel
 from app.core.models.base_schema import GenericModel
 from app.core.utils.utc_datetime import UTCDateTime, UTCDateTimeType
-from app.crud.payments.schemas import Payment
+from app.crud.payments.models import legacy_payment_id
+from app.crud.payments.schemas import Payment, PaymentInDB
 
 
 class ReservationStatus(str, Enum):
@@ -112,12 +113,19 @@ class ReservationInDB(DatabaseModel):
     discount: Decimal = Field(example=0.0)
     delivery_date: UTCDateTimeType = Field(example=str(UTCDateTime.now()))
     pickup_date: UTCDateTimeType = Field(example=str(UTCDateTime.now()))
-    payments: List[Payment] = Field(default_factory=list)
+    payments: List[PaymentInDB] = Field(default_factory=list)
     total_value: Decimal = Field(example=200.0)
     total_cost: Decimal = Field(default=0, example=150.0)
     status: ReservationStatus = Field(example=ReservationStatus.RESERVED)
     company_id: str = Field(example="com_123")
 
+    @model_validator(mode="after")
+    def _legacy_payment_ids(self) -> "ReservationInDB":
+        for index, payment in enumerate(self.payments):
+            if payment.id is None:
+                payment.id = legacy_payment_id(self.id, index)
+        return self
+
 
 class UpdateReservation(GenericModel):
     beer_dispenser_ids: List[str] | None = Field(default=None)
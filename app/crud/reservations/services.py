@@ -1,7 +1,7 @@
 from decimal import Decimal
 from typing import List
 
-from app.core.exceptions import BadRequestError
+from app.core.exceptions import BadRequestError, NotFoundError
 from app.core.utils.utc_datetime import UTCDateTime
 from app.crud.beer_dispensers.repositories import BeerDispenserRepository
 from app.crud.beer_dispensers.schemas import DispenserStatus
@@ -54,8 +54,11 @@ class ReservationServices:
 
         total = Decimal("0")
         cost_total = Decimal("0")
+        kegs = await self.__keg_repository.select_by_ids(reservation.keg_ids, company_id)
         for keg_id in reservation.keg_ids:
-            keg = await self.__keg_repository.select_by_id(keg_id, company_id)
+            keg = kegs.get(keg_id)
+            if keg is None:
+                raise NotFoundError(message=f"Keg #{keg_id} not found")
             if keg.status in [KegStatus.EMPTY, KegStatus.IN_USE]:
                 raise BadRequestError(message=f"Keg #{keg_id} not available")
             price = keg.sale_price_per_l or Decimal("0")
@@ -63,10 +66,13 @@ class ReservationServices:
             total += price * Decimal(keg.size_l)
             cost_total += cost * Decimal(keg.size_l)
 
+        cylinders = await self.__cylinder_repository.select_by_ids(
+            reservation.cylinder_ids, company_id
+        )
         for cylinder_id in reservation.cylinder_ids:
-            cylinder = await self.__cylinder_repository.select_by_id(
-                cylinder_id, company_id
-            )
+            cylinder = cylinders.get(cylinder_id)
+            if cylinder is None:
+                raise NotFoundError(message=f"Cylinder #{cylinder_id} not found")
             if cylinder.status != CylinderStatus.AVAILABLE:
                 raise BadRequestError(message=f"Cylinder #{cylinder_id} not available")
             if cylinder.weight_kg <= Decimal("0"):
@@ -118,18 +124,21 @@ class ReservationServices:
         res = await self.__repository.create(
             reservation=res_data, company_id=company_id
         )
-        for keg_id in reservation.keg_ids:
-            await self.__keg_repository.update(
-                keg_id, company_id, {"status": KegStatus.IN_USE.value}
-            )
+        await self.__keg_repository.update_many(
+            reservation.keg_ids, company_id, {"status": KegStatus.IN_USE.value}
+        )
         return res
 
     async def update(
-        self, id: str, company_id: str, reservation: UpdateReservation
+        self,
+        id: str,
+        company_id: str,
+        reservation: UpdateReservation,
+        version: int | None = None,
     ) -> ReservationInDB:
         data = reservation.model_dump(exclude_unset=True, exclude_none=True)
         updated = await self.__repository.update(
-            id=id, company_id=company_id, reservation=data
+            id=id, company_id=company_id, reservation=data, version=version
         )
         if updated.status == ReservationStatus.COMPLETED:
             for dispenser_id in updated.beer_dispenser_ids:
@@ -187,15 +196,15 @@ class ReservationServices:
         )
 
     async def update_payment(
-        self, id: str, company_id: str, index: int, payment: Payment
+        self, id: str, company_id: str, payment_id: str, payment: Payment
     ) -> ReservationInDB:
         return await self.__repository.update_payment(
-            id=id, company_id=company_id, index=index, payment=payment
+            id=id, company_id=company_id, payment_id=payment_id, payment=payment
         )
 
     async def delete_payment(
-        self, id: str, company_id: str, index: int
+        self, id: str, company_id: str, payment_id: str
     ) -> ReservationInDB:
         return await self.__repository.delete_payment(
-            id=id, company_id=company_id, index=index
+            id=id, company_id=company_id, payment_id=payment_id
         )
@@ -0,0 +1,2 @@
+from .schemas import SyncChanges, SyncTombstone
+from .services import SyncServices
@@ -0,0 +1,153 @@
+from typing import Callable, List, Tuple, Type
+
+from pydantic import BaseModel
+from pymongo import ASCENDING
+
+from app.core.configs import get_logger
+from app.core.exceptions import NotFoundError
+from app.core.db.retention import graveyard
+from app.core.models.base_document import BaseDocument
+from app.core.repositories.base_repository import Repository
+from app.core.utils.utc_datetime import UTCDateTime
+
+from .schemas import SyncTombstone
+
+_logger = get_logger(__name__)
+
+
+SyncPosition = Tuple[UTCDateTime, str]
+"""``(updated_at, _id)`` of the last document returned by a page."""
+
+
+def _changed_since(
+    company_id: str, since: UTCDateTime | None, after: SyncPosition | None
+) -> dict:
+    query = {"company_id": company_id}
+    if after:
+        updated_at, id = after
+        # The range keeps the ``(company_id, updated_at)`` index bound; the
+        # ``$or`` only skips what the previous page returned at ``updated_at``.
+        query["updated_at"] = {"$gte": updated_at}
+        query["$or"] = [
+            {"updated_at": {"$gt": updated_at}},
+            {"updated_at": updated_at, "_id": {"$gt": id}},
+        ]
+    elif since:
+        query["updated_at"] = {"$gte": UTCDateTime.validate_datetime(since)}
+    return query
+
+
+def _page(
+    documents: list, limit: int | None, position: Callable[[object], SyncPosition]
+) -> Tuple[list, SyncPosition | None]:
+    """Trim ``documents`` (read with ``limit + 1``) and locate the next page."""
+    if limit is None or len(documents) <= limit:
+        return documents, None
+
+    documents = documents[:limit]
+    return documents, position(documents[-1])
+
+
+class SyncRepository(Repository):
+    def __init__(self) -> None:
+        super().__init__()
+
+    async def select_changed(
+        self,
+        collection: str,
+        model: Type[BaseDocument],
+        schema: Type[BaseModel],
+        company_id: str,
+        since: UTCDateTime | None = None,
+        after: SyncPosition | None = None,
+        limit: int | None = None,
+    ) -> Tuple[List[BaseModel], List[SyncTombstone], SyncPosition | None]:
+        """Return up to ``limit`` documents of ``model`` written at or after ``since``.
+
+        Documents come in ``(updated_at, _id)`` order; the returned position
+        is where the next page starts (pass it as ``after``), or ``None`` once
+        the collection is exhausted.  Soft-deleted documents are returned as
+        tombstones instead of full documents.  The query is bounded by the
+        ``(company_id, updated_at)`` index declared on every company
+        collection.
+        """
+        try:
+            query = model.objects(
+                __raw__=_changed_since(company_id, since, after)
+            ).order_by("updated_at", "id")
+            if limit is not None:
+                query = query.limit(limit + 1)
+
+            documents, position = _page(
+                list(query),
+                limit,
+                lambda document: (
+                    UTCDateTime.validate_datetime(document.updated_at),
+                    str(document.id),
+                ),
+            )
+
+            changed: List[BaseModel] = []
+            deleted: List[SyncTombstone] = []
+
+            for document in documents:
+                if document.is_active:
+                    changed.append(schema.model_validate(document))
+                else:
+                    deleted.append(
+                        SyncTombstone(
+                            collection=collection,
+                            id=str(document.id),
+                            deleted_at=document.updated_at,
+                        )
+                    )
+
+            return changed, deleted, position
+
+        except Exception as error:
+            _logger.error(f"Error on select_changed ({collection}): {str(error)}")
+            raise NotFoundError(message=f"Changes on {collection} not found")
+
+    async def select_compacted(
+        self,
+        collection: str,
+        model: Type[BaseDocument],
+        company_id: str,
+        since: UTCDateTime,
+        after: SyncPosition | None = None,
+        limit: int | None = None,
+    ) -> Tuple[List[SyncTombstone], SyncPosition | None]:
+        """Tombstones of ``model`` already compacted into its graveyard.
+
+        Paged like :meth:`select_changed`.  A first sync has nothing to
+        delete, so there is no variant without ``since``.
+        """
+        try:
+            query = graveyard(model).find(
+                _changed_since(company_id, since, after), {"updated_at": 1}
+            ).sort([("updated_at", ASCENDING), ("_id", ASCENDING)])
+            if limit is not None:
+                query = query.limit(limit + 1)
+
+            documents, position = _page(
+                list(query),
+                limit,
+                lambda document: (
+                    UTCDateTime.validate_datetime(document["updated_at"]),
+                    str(document["_id"]),
+                ),
+            )
+
+            deleted = [
+                SyncTombstone(
+                    collection=collection,
+                    id=str(document["_id"]),
+                    deleted_at=document["updated_at"],
+                )
+                for document in documents
+            ]
+            return deleted, position
+
+        except Exception as error:
+            _logger.error(f"Error on select_compacted ({collection}): {str(error)}")
+            raise NotFoundError(message=f"Compacted changes on {collection} not found")
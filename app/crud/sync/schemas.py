@@ -0,0 +1,37 @@
+from typing import List
+
+from pydantic import Field
+
+from app.core.models.base_schema import GenericModel
+from app.core.utils.utc_datetime import UTCDateTime, UTCDateTimeType
+from app.crud.addresses.schemas import AddressInDB
+from app.crud.beer_dispensers.schemas import BeerDispenserInDB
+from app.crud.beer_types.schemas import BeerTypeInDB
+from app.crud.customers.schemas import CustomerInDB
+from app.crud.cylinders.schemas import CylinderInDB
+from app.crud.extraction_kits.schemas import ExtractionKitInDB
+from app.crud.kegs.schemas import KegInDB
+from app.crud.reservations.schemas import ReservationInDB
+
+
+class SyncTombstone(GenericModel):
+    """Marker for a document soft deleted after the sync cursor."""
+
+    collection: str = Field(example="kegs")
+    id: str = Field(example="keg_12345678")
+    deleted_at: UTCDateTimeType = Field(example=str(UTCDateTime.now()))
+
+
+class SyncChanges(GenericModel):
+    since: UTCDateTimeType | None = Field(default=None, example=None)
+    cursor: UTCDateTimeType = Field(example=str(UTCDateTime.now()))
+    addresses: List[AddressInDB] = Field(default_factory=list)
+    customers: List[CustomerInDB] = Field(default_factory=list)
+    beer_types: List[BeerTypeInDB] = Field(default_factory=list)
+    kegs: List[KegInDB] = Field(default_factory=list)
+    beer_dispensers: List[BeerDispenserInDB] = Field(default_factory=list)
+    extraction_kits: List[ExtractionKitInDB] = Field(default_factory=list)
+    cylinders: List[CylinderInDB] = Field(default_factory=list)
+    reservations: List[ReservationInDB] = Field(default_factory=list)
+    deleted: List[SyncTombstone] = Field(default_factory=list)
+    continuation: str | None = Field(default=None, example=None)
@@ -0,0 +1,146 @@
+import base64
+import json
+from datetime import timedelta
+
+from app.core.configs import get_environment
+from app.core.db.retention import GRAVEYARD_SUFFIX
+from app.core.exceptions import BadRequestError
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.addresses.models import AddressModel
+from app.crud.addresses.schemas import AddressInDB
+from app.crud.beer_dispensers.models import BeerDispenserModel
+from app.crud.beer_dispensers.schemas import BeerDispenserInDB
+from app.crud.beer_types.models import BeerTypeModel
+from app.crud.beer_types.schemas import BeerTypeInDB
+from app.crud.customers.models import CustomerModel
+from app.crud.customers.schemas import CustomerInDB
+from app.crud.cylinders.models import CylinderModel
+from app.crud.cylinders.schemas import CylinderInDB
+from app.crud.extraction_kits.models import ExtractionKitModel
+from app.crud.extraction_kits.schemas import ExtractionKitInDB
+from app.crud.kegs.models import KegModel
+from app.crud.kegs.schemas import KegInDB
+from app.crud.reservations.models import ReservationModel
+from app.crud.reservations.schemas import ReservationInDB
+
+from .repositories import SyncRepository
+from .schemas import SyncChanges
+
+_env = get_environment()
+
+SYNC_COLLECTIONS = {
+    "addresses": (AddressModel, AddressInDB),
+    "customers": (CustomerModel, CustomerInDB),
+    "beer_types": (BeerTypeModel, BeerTypeInDB),
+    "kegs": (KegModel, KegInDB),
+    "beer_dispensers": (BeerDispenserModel, BeerDispenserInDB),
+    "extraction_kits": (ExtractionKitModel, ExtractionKitInDB),
+    "cylinders": (CylinderModel, CylinderInDB),
+    "reservations": (ReservationModel, ReservationInDB),
+}
+
+
+def _encode(state: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(state).encode()).decode()
+
+
+def _decode(continuation: str) -> dict:
+    try:
+        state = json.loads(base64.urlsafe_b64decode(continuation.encode()))
+        return {
+            "since": state["since"] and UTCDateTime.validate_datetime(state["since"]),
+            "cursor": UTCDateTime.validate_datetime(state["cursor"]),
+            "pending": {
+                stream: position and (UTCDateTime.validate_datetime(position[0]), position[1])
+                for stream, position in state["pending"].items()
+            },
+        }
+
+    except (ValueError, TypeError, KeyError, IndexError):
+        raise BadRequestError(message="Continuação da sincronização inválida")
+
+
+class SyncServices:
+    def __init__(self, sync_repository: SyncRepository) -> None:
+        self.__repository = sync_repository
+
+    async def search_changes(
+        self,
+        company_id: str,
+        since: UTCDateTime | None = None,
+        continuation: str | None = None,
+        limit: int | None = None,
+    ) -> SyncChanges:
+        """One page of the changes written at or after ``since``.
+
+        Every collection returns at most ``limit`` documents.  While some
+        have more, the response carries a ``continuation`` to request the
+        next page with; the ``cursor`` to pass as ``since`` on the next sync
+        is the one of the first page, and is only final once
+        ``continuation`` is ``None``.
+        """
+        limit = limit or _env.SYNC_PAGE_SIZE
+
+        if continuation:
+            state = _decode(continuation)
+            since, cursor, pending = state["since"], state["cursor"], state["pending"]
+        else:
+            # ``updated_at`` is stamped before the write lands, so a write
+            # racing with this request can become visible after it with an
+            # ``updated_at`` earlier than now.  The cursor backs off by
+            # ``SYNC_CURSOR_OVERLAP`` seconds so the next sync reads those
+            # again; clients dedupe what is resent by id and version.
+            cursor = UTCDateTime.now() - timedelta(seconds=_env.SYNC_CURSOR_OVERLAP)
+            pending = {collection: None for collection in SYNC_COLLECTIONS}
+            # A first sync has nothing to delete.
+            if since:
+                pending.update(
+                    (collection + GRAVEYARD_SUFFIX, None) for collection in SYNC_COLLECTIONS
+                )
+
+        changes = SyncChanges(since=since, cursor=cursor)
+        following = {}
+
+        for collection, (model, schema) in SYNC_COLLECTIONS.items():
+            if collection in pending:
+                changed, deleted, position = await self.__repository.select_changed(
+                    collection=collection,
+                    model=model,
+                    schema=schema,
+                    company_id=company_id,
+                    since=since,
+                    after=pending[collection],
+                    limit=limit,
+                )
+                setattr(changes, collection, changed)
+                changes.deleted.extend(deleted)
+                if position:
+                    following[collection] = position
+
+            compacted = collection + GRAVEYARD_SUFFIX
+            if compacted in pending:
+                deleted, position = await self.__repository.select_compacted(
+                    collection=collection,
+                    model=model,
+                    company_id=company_id,
+                    since=since,
+                    after=pending[compacted],
+                    limit=limit,
+                )
+                changes.deleted.extend(deleted)
+                if position:
+                    following[compacted] = position
+
+        if following:
+            changes.continuation = _encode(
+                {
+                    "since": since and str(since),
+                    "cursor": str(cursor),
+                    "pending": {
+                        stream: [str(updated_at), id]
+                        for stream, (updated_at, id) in following.items()
+                    },
+                }
+            )
+
+        return changes
@@ -4,6 +4,7 @@ from fastapi.encoders import jsonable_encoder
 from pydantic_core import ValidationError
 from app.core.configs import get_logger, get_environment
 from app.core.exceptions import NotFoundError, UnprocessableEntity
+from app.core.metrics import record_cache
 from app.core.utils.http_client import HTTPClient
 
 from .schemas import UpdateUser, User, UserInDB
@@ -67,9 +68,12 @@ class UserRepository:
 
     async def select_by_id(self, id: str, raise_404: bool = True) -> UserInDB:
         try:
-            if self.__cache_users.get(id):
-                _logger.info("Getting cached user by ID")
-                return self.__cache_users.get(id)
+            cached_user = self.__cache_users.get(id)
+            record_cache("users", hit=cached_user is not None)
+
+            if cached_user:
+                _logger.debug("Getting cached user by ID")
+                return cached_user
 
             _logger.info("Getting user by ID on Management API")
             status_code, response = self.http_client.get(
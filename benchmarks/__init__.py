@@ -0,0 +1,6 @@
+"""
+Benchmarks for the hot paths of the API.
+
+They run against ``mongomock`` so no external service is needed:
+    python -m benchmarks.reservation_listing
+"""
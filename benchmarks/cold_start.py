@@ -0,0 +1,118 @@
+"""
+Cold start report: import time profile and time to first response.
+
+Imports the application in a fresh interpreter under ``python -X importtime``
+and lists the slowest modules, then boots ``main.py`` the way the Fly machine
+does and measures how long ``/health/ready`` takes to answer 200 (imports,
+MongoDB handshake and the Auth0 warm-up).  Either measurement fails the run
+when it exceeds its budget, so CI catches startup regressions.
+
+The server measurement needs a reachable ``DATABASE_HOST``.
+
+Usage:
+    python -m benchmarks.cold_start
+    python -m benchmarks.cold_start --import-budget 1.5 --ready-budget 5
+    python -m benchmarks.cold_start --skip-server --top 30
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+import httpx
+
+
+def import_profile(module: str) -> Tuple[float, List[Tuple[str, float, float]]]:
+    """Seconds to import ``module`` and ``(name, self, cumulative)`` per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(own) / 1e6, int(cumulative) / 1e6))
+
+    total = next(cumulative for name, _, cumulative in modules if name == module)
+    return total, modules
+
+
+def time_to_ready(port: int, timeout: float) -> float:
+    """Seconds from spawning ``main.py`` until ``/health/ready`` answers 200."""
+    env = {
+        **os.environ,
+        "ENVIRONMENT": os.environ.get("ENVIRONMENT", "production"),
+        "APPLICATION_HOST": "127.0.0.1",
+        "APPLICATION_PORT": str(port),
+        "SERVER_WORKERS": "1",
+        "LOG_FILE": "",
+    }
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "main.py"], env=env)
+
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=1) as client:
+            while time.perf_counter() - started < timeout:
+                if process.poll() is not None:
+                    raise RuntimeError("Server exited during startup")
+                try:
+                    if client.get("/health/ready").status_code == 200:
+                        return time.perf_counter() - started
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.02)
+        raise TimeoutError("Server not ready")
+
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.application")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--import-budget", type=float, help="Maximum import seconds")
+    parser.add_argument("--ready-budget", type=float, help="Maximum seconds to ready")
+    parser.add_argument("--skip-server", action="store_true")
+    args = parser.parse_args()
+
+    failures = []
+
+    # The first run also warms the bytecode cache, like a built image.
+    import_profile(args.module)
+    profiles = [import_profile(args.module) for _ in range(args.runs)]
+    import_seconds = statistics.median(total for total, _ in profiles)
+    modules = min(profiles)[1]
+
+    print(f"import {args.module}: {import_seconds * 1000:.0f} ms (median of {args.runs})")
+    print(f"{'self ms':>9} {'cumulative ms':>14}  module")
+    for name, own, cumulative in sorted(modules, key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"{own * 1000:>9.1f} {cumulative * 1000:>14.1f}  {name}")
+
+    if args.import_budget and import_seconds > args.import_budget:
+        failures.append(f"import took {import_seconds:.2f}s, budget {args.import_budget}s")
+
+    if not args.skip_server:
+        ready_seconds = statistics.median(time_to_ready(args.port, timeout=60) for _ in range(args.runs))
+        print(f"time to ready: {ready_seconds * 1000:.0f} ms (median of {args.runs})")
+
+        if args.ready_budget and ready_seconds > args.ready_budget:
+            failures.append(f"ready took {ready_seconds:.2f}s, budget {args.ready_budget}s")
+
+    if failures:
+        print("\n".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
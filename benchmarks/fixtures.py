@@ -0,0 +1,239 @@
+"""
+Seeded tenants for the benchmarks.
+
+Documents are bulk inserted without per-document validation so thousands of
+rows load in seconds, either into mongomock or a local MongoDB.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import List
+
+from app.core.utils.search import build_search_keys
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.addresses.models import AddressModel
+from app.crud.beer_dispensers.models import BeerDispenserModel
+from app.crud.beer_dispensers.schemas import DispenserStatus, Voltage
+from app.crud.companies.schemas import CompanyInDB
+from app.crud.customers.models import CustomerModel
+from app.crud.cylinders.models import CylinderModel
+from app.crud.cylinders.schemas import CylinderStatus
+from app.crud.extraction_kits.models import ExtractionKitModel
+from app.crud.extraction_kits.schemas import ExtractionKitStatus, ExtractionKitType
+from app.crud.kegs.models import KegModel
+from app.crud.kegs.schemas import KegStatus
+from app.crud.payments.models import PaymentModel, generate_payment_id
+from app.crud.reservations.models import ReservationModel
+from app.crud.reservations.schemas import ReservationStatus
+
+
+@dataclass
+class Tenant:
+    company: CompanyInDB
+    customer_ids: List[str] = field(default_factory=list)
+    address_ids: List[str] = field(default_factory=list)
+    dispenser_ids: List[str] = field(default_factory=list)
+    extraction_kit_ids: List[str] = field(default_factory=list)
+    cylinder_ids: List[str] = field(default_factory=list)
+    # Kegs kept AVAILABLE for the reservation creation scenario.
+    free_keg_ids: List[str] = field(default_factory=list)
+
+
+def _stamps() -> dict:
+    now = UTCDateTime.now()
+    return {"is_active": True, "created_at": now, "updated_at": now}
+
+
+def build_company(company_id: str = "com_bench") -> CompanyInDB:
+    now = UTCDateTime.now()
+    return CompanyInDB(
+        id=company_id,
+        name="Benchmark Chopp",
+        address_id="add_bench",
+        phone_number="99999-9999",
+        ddd="47",
+        email="bench@barriil.club",
+        members=[],
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def seed_tenant(
+    company_id: str = "com_bench",
+    kegs: int = 2000,
+    customers: int = 1000,
+    reservations: int = 3000,
+    free_kegs: int = 500,
+    seed: int = 42,
+) -> Tenant:
+    """Insert a realistic tenant and return the ids the scenarios need."""
+    rng = random.Random(seed)
+    now = UTCDateTime.now()
+    tenant = Tenant(company=build_company(company_id))
+
+    AddressModel.objects.insert(
+        [
+            AddressModel(
+                id=f"add_{index:06d}",
+                postal_code=f"89{index % 1000:03d}000",
+                postal_code_key=f"89{index % 1000:03d}000",
+                street="Rua XV de Novembro",
+                number=str(index),
+                district="Centro",
+                city=rng.choice(["Blumenau", "Joinville", "Itajaí"]),
+                state="SC",
+                company_id=company_id,
+                **_stamps(),
+            )
+            for index in range(customers)
+        ],
+        load_bulk=False,
+    )
+    tenant.address_ids = [f"add_{index:06d}" for index in range(customers)]
+
+    CustomerModel.objects.insert(
+        [
+            CustomerModel(
+                id=f"cus_{index:06d}",
+                name=f"Cliente {index:06d}",
+                document=f"{index:011d}",
+                email=f"cliente{index}@example.com",
+                address_ids=[tenant.address_ids[index]],
+                search_keys=build_search_keys(
+                    texts=[f"Cliente {index:06d}", f"cliente{index}@example.com"],
+                    numbers=[f"{index:011d}"],
+                ),
+                company_id=company_id,
+                **_stamps(),
+            )
+            for index in range(customers)
+        ],
+        load_bulk=False,
+    )
+    tenant.customer_ids = [f"cus_{index:06d}" for index in range(customers)]
+
+    tenant.dispenser_ids = [f"bsd_{index:06d}" for index in range(max(kegs // 20, 1))]
+    BeerDispenserModel.objects.insert(
+        [
+            BeerDispenserModel(
+                id=dispenser_id,
+                brand="Memo",
+                model="M1",
+                taps_count=2,
+                voltage=Voltage.V220.value,
+                status=DispenserStatus.ACTIVE.value,
+                company_id=company_id,
+                **_stamps(),
+            )
+            for dispenser_id in tenant.dispenser_ids
+        ],
+        load_bulk=False,
+    )
+
+    tenant.extraction_kit_ids = [f"ext_{index:06d}" for index in range(max(kegs // 20, 1))]
+    ExtractionKitModel.objects.insert(
+        [
+            ExtractionKitModel(
+                id=kit_id,
+                brand="Kit",
+                type=ExtractionKitType.SIMPLE.value,
+                serial_number=kit_id,
+                status=ExtractionKitStatus.ACTIVE.value,
+                company_id=company_id,
+                **_stamps(),
+            )
+            for kit_id in tenant.extraction_kit_ids
+        ],
+        load_bulk=False,
+    )
+
+    tenant.cylinder_ids = [f"cyl_{index:06d}" for index in range(max(kegs // 20, 1))]
+    CylinderModel.objects.insert(
+        [
+            CylinderModel(
+                id=cylinder_id,
+                brand="White Martins",
+                weight_kg=Decimal("6"),
+                number=cylinder_id,
+                status=CylinderStatus.AVAILABLE.value,
+                company_id=company_id,
+                **_stamps(),
+            )
+            for cylinder_id in tenant.cylinder_ids
+        ],
+        load_bulk=False,
+    )
+
+    keg_ids = [f"keg_{index:06d}" for index in range(kegs + free_kegs)]
+    tenant.free_keg_ids = keg_ids[kegs:]
+    KegModel.objects.insert(
+        [
+            KegModel(
+                id=keg_id,
+                number=str(index),
+                size_l=rng.choice([30, 50]),
+                beer_type_id="bty_pilsen",
+                cost_price_per_l=Decimal("9.50"),
+                sale_price_per_l=Decimal("18.00"),
+                status=(
+                    KegStatus.AVAILABLE.value
+                    if index >= kegs
+                    else rng.choice([status.value for status in KegStatus])
+                ),
+                company_id=company_id,
+                **_stamps(),
+            )
+            for index, keg_id in enumerate(keg_ids)
+        ],
+        load_bulk=False,
+    )
+
+    # One reservation every two hours from the start of the year, most of
+    # them with one or two embedded payments.
+    start = UTCDateTime(now.year, 1, 1)
+    ReservationModel.objects.insert(
+        [
+            _reservation(rng, tenant, index, start + timedelta(hours=index * 2), keg_ids[:kegs])
+            for index in range(reservations)
+        ],
+        load_bulk=False,
+    )
+
+    return tenant
+
+
+def _reservation(rng, tenant: Tenant, index: int, delivery, keg_ids) -> ReservationModel:
+    reservation_kegs = rng.sample(keg_ids, rng.choice([1, 1, 2, 3]))
+    total = Decimal("450.00") * len(reservation_kegs)
+    return ReservationModel(
+        id=f"res_{index:06d}",
+        customer_id=rng.choice(tenant.customer_ids),
+        address_id=rng.choice(tenant.address_ids),
+        beer_dispenser_ids=[rng.choice(tenant.dispenser_ids)],
+        keg_ids=reservation_kegs,
+        extractor_ids=[rng.choice(tenant.extraction_kit_ids)],
+        extraction_kit_ids=[rng.choice(tenant.extraction_kit_ids)],
+        cylinder_ids=[rng.choice(tenant.cylinder_ids)],
+        freight_value=Decimal("30.00"),
+        additional_value=Decimal("0"),
+        discount=Decimal("0"),
+        delivery_date=delivery,
+        pickup_date=delivery + timedelta(days=1),
+        payments=[
+            PaymentModel(
+                id=generate_payment_id(),
+                amount=total / 2,
+                method="PIX",
+                paid_at=date.today(),
+            )
+            for _ in range(rng.choice([0, 1, 2]))
+        ],
+        total_value=total,
+        total_cost=Decimal("285.00") * len(reservation_kegs),
+        status=rng.choice([status.value for status in ReservationStatus]),
+        company_id=tenant.company.id,
+        **_stamps(),
+    )
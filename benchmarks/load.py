@@ -0,0 +1,260 @@
+"""
+In-process load test of the hot endpoints.
+
+Seeds a tenant (see ``benchmarks.fixtures``), drives the real FastAPI
+application through ``httpx.ASGITransport`` with authentication stubbed and
+reports p50/p95/p99 latency, throughput and MongoDB queries per request for
+each scenario.  Results can be saved as a JSON baseline and compared against
+a previous one, failing when p95 latency regresses beyond a tolerance.
+
+Uses mongomock by default; pass ``--mongo-host`` to run against a local
+MongoDB instead.
+
+Usage:
+    python -m benchmarks.load --requests 50 --concurrency 4
+    python -m benchmarks.load --output benchmarks/baselines/load.json
+    python -m benchmarks.load --baseline benchmarks/baselines/load.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import timedelta
+from typing import Callable, Dict, List
+
+# Every request comes from the same client address.
+os.environ.setdefault("RATE_LIMIT_REQUESTS", str(10**9))
+
+import httpx  # noqa: E402
+import mongomock  # noqa: E402
+from mongoengine import connect, disconnect, get_db  # noqa: E402
+
+from app.api.dependencies.company import require_user_company  # noqa: E402
+from app.application import app  # noqa: E402
+from app.core.db.query_recorder import record_queries  # noqa: E402
+from app.core.utils.utc_datetime import UTCDateTime  # noqa: E402
+from benchmarks.fixtures import Tenant, seed_tenant  # noqa: E402
+from tests.support.mongomock_queries import record_mongomock_queries  # noqa: E402
+
+
+def scenarios(tenant: Tenant) -> Dict[str, Callable[[int], dict]]:
+    now = UTCDateTime.now()
+    month_start = UTCDateTime(now.year, now.month, 1)
+    # Created reservations are placed after the seeded ones, two days apart,
+    # so they never conflict with each other.
+    create_start = UTCDateTime(now.year + 1, 1, 1)
+
+    def create_reservation(index: int) -> dict:
+        delivery = create_start + timedelta(days=index * 2)
+        return {
+            "method": "POST",
+            "url": "/api/reservations",
+            "json": {
+                "customerId": tenant.customer_ids[index % len(tenant.customer_ids)],
+                "addressId": tenant.address_ids[index % len(tenant.address_ids)],
+                "beerDispenserIds": [tenant.dispenser_ids[index % len(tenant.dispenser_ids)]],
+                "kegIds": [tenant.free_keg_ids[index % len(tenant.free_keg_ids)]],
+                "extractionKitIds": [
+                    tenant.extraction_kit_ids[index % len(tenant.extraction_kit_ids)]
+                ],
+                "cylinderIds": [tenant.cylinder_ids[index % len(tenant.cylinder_ids)]],
+                "freightValue": "30.00",
+                "additionalValue": "0",
+                "discount": "0",
+                "deliveryDate": str(delivery),
+                "pickupDate": str(delivery + timedelta(days=1)),
+                "payments": [],
+            },
+        }
+
+    return {
+        "reservations_month": lambda index: {
+            "method": "GET",
+            "url": "/api/reservations",
+            "params": {
+                "start_date": str(month_start),
+                "end_date": str(month_start + timedelta(days=31)),
+            },
+        },
+        "dashboard_revenue": lambda index: {
+            "method": "GET",
+            "url": "/api/dashboard/revenue",
+            "params": {"year": now.year},
+        },
+        "dashboard_upcoming": lambda index: {
+            "method": "GET",
+            "url": "/api/dashboard/upcoming-reservations",
+        },
+        "dashboard_calendar": lambda index: {
+            "method": "GET",
+            "url": "/api/dashboard/calendar",
+            "params": {"year": now.year, "month": now.month},
+        },
+        "payments": lambda index: {"method": "GET", "url": "/api/payments"},
+        "customer_search": lambda index: {
+            "method": "GET",
+            "url": "/api/customers",
+            "params": {"q": f"cliente {index % 100:04d}"},
+        },
+        "create_reservation": create_reservation,
+    }
+
+
+def percentile(values: List[float], rank: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(rank / 100 * len(ordered)) - 1, 0)]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, build: Callable[[int], dict], requests: int, concurrency: int
+) -> dict:
+    """Send ``requests`` requests from ``concurrency`` workers.
+
+    Query counts are only seen when the application runs in this process.
+    """
+    latencies: List[float] = []
+    queries: List[int] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for index in counter:
+            with record_queries() as recorder:
+                started = time.perf_counter()
+                response = await client.request(**build(index))
+                latencies.append(time.perf_counter() - started)
+            queries.append(len(recorder.queries))
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "throughput_rps": round(requests / elapsed, 2),
+        "queries_per_request": round(sum(queries) / len(queries), 2),
+    }
+
+
+async def run(tenant: Tenant, requests: int, concurrency: int, only: List[str] | None) -> dict:
+    async def stub_company():
+        return tenant.company
+
+    app.dependency_overrides[require_user_company] = stub_company
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, build in scenarios(tenant).items():
+            if only and name not in only:
+                continue
+            # Warm-up request, also settles the write-on-read status updates.
+            await client.request(**build(requests))
+            results[name] = await run_scenario(client, build, requests, concurrency)
+
+    app.dependency_overrides.clear()
+    return results
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Scenarios slower than ``tolerance`` at p95 or issuing more queries."""
+    regressions = []
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        change = current["p95_ms"] / previous["p95_ms"] - 1 if previous["p95_ms"] else 0
+        queries = current["queries_per_request"] - previous["queries_per_request"]
+        print(f"{name:<20} p95 {change:+7.1%}  queries/request {queries:+.2f}")
+        if change > tolerance or queries > 0:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kegs", type=int, default=2000)
+    parser.add_argument("--customers", type=int, default=1000)
+    parser.add_argument("--reservations", type=int, default=3000)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--scenario", action="append", help="Run only these scenarios")
+    parser.add_argument("--mongo-host", help="Use a MongoDB server instead of mongomock")
+    parser.add_argument("--output", help="Save the results as a JSON baseline")
+    parser.add_argument("--baseline", help="Compare against a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    if args.mongo_host:
+        connect("barriil_benchmark", host=args.mongo_host)
+    else:
+        connect("barriil_benchmark", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient)
+        record_mongomock_queries()
+
+    try:
+        get_db().client.drop_database("barriil_benchmark")
+        tenant = seed_tenant(
+            kegs=args.kegs,
+            customers=args.customers,
+            reservations=args.reservations,
+            free_kegs=args.requests + 1,
+        )
+        scenarios = asyncio.run(run(tenant, args.requests, args.concurrency, args.scenario))
+    finally:
+        disconnect()
+
+    results = {
+        "meta": {
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "backend": "mongodb" if args.mongo_host else "mongomock",
+            "kegs": args.kegs,
+            "customers": args.customers,
+            "reservations": args.reservations,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "scenarios": scenarios,
+    }
+
+    print(json.dumps(results, indent=2))
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+            output.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            regressions = compare(results, json.load(baseline), args.tolerance)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Rows per second of ``ReservationRepository.select_all``.
+
+Compares the previous read path (one mongoengine ``Document`` per row
+followed by ``ReservationInDB.model_validate``) with the raw ``as_pymongo``
+path validated by a single ``TypeAdapter`` call.
+
+Usage:
+    python -m benchmarks.reservation_listing --rows 5000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.payments.models import PaymentModel, generate_payment_id
+from app.crud.reservations.models import ReservationModel
+from app.crud.reservations.repositories import ReservationRepository
+from app.crud.reservations.schemas import ReservationInDB, ReservationStatus
+
+COMPANY_ID = "com_bench"
+
+
+def seed(rows: int) -> None:
+    start = UTCDateTime.now() + timedelta(days=1)
+    ReservationModel.objects.insert(
+        [
+            ReservationModel(
+                id=f"res_{index:08d}",
+                customer_id=f"cus_{index % 500:08d}",
+                address_id=f"add_{index % 500:08d}",
+                beer_dispenser_ids=[f"bsd_{index % 50:08d}"],
+                keg_ids=[f"keg_{index:08d}", f"keg_{index + 1:08d}"],
+                extractor_ids=[f"prg_{index % 40:08d}"],
+                extraction_kit_ids=[f"prg_{index % 40:08d}"],
+                cylinder_ids=[f"cyl_{index % 60:08d}"],
+                freight_value=Decimal("25.00"),
+                additional_value=Decimal("0"),
+                discount=Decimal("5.00"),
+                delivery_date=start + timedelta(hours=index),
+                pickup_date=start + timedelta(hours=index + 24),
+                payments=[
+                    PaymentModel(
+                        id=generate_payment_id(),
+                        amount=Decimal("100.00"),
+                        method="PIX",
+                        paid_at=date.today(),
+                    )
+                ],
+                total_value=Decimal("420.00"),
+                total_cost=Decimal("250.00"),
+                status=ReservationStatus.RESERVED.value,
+                company_id=COMPANY_ID,
+                created_at=UTCDateTime.now(),
+                updated_at=UTCDateTime.now(),
+            )
+            for index in range(rows)
+        ],
+        load_bulk=False,
+    )
+
+
+def document_path() -> int:
+    query = ReservationModel.objects(company_id=COMPANY_ID, is_active=True)
+    rows = [
+        ReservationInDB.model_validate(model)
+        for model in query.order_by("delivery_date")
+    ]
+    return len(rows)
+
+
+def raw_path() -> int:
+    rows = asyncio.run(ReservationRepository().select_all(company_id=COMPANY_ID))
+    return len(rows)
+
+
+def measure(function, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = function()
+        best = min(best, time.perf_counter() - started)
+    return rows / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    connect(
+        "benchmark",
+        host="mongodb://localhost",
+        mongo_client_class=mongomock.MongoClient,
+    )
+    try:
+        seed(args.rows)
+        before = measure(document_path, args.repeat)
+        after = measure(raw_path, args.repeat)
+    finally:
+        disconnect()
+
+    print(f"rows: {args.rows}")
+    print(f"document + model_validate: {before:,.0f} rows/s")
+    print(f"as_pymongo + TypeAdapter:  {after:,.0f} rows/s")
+    print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Serving-mode benchmark: the seeded load test over real HTTP.
+
+Starts the application with ``uvicorn`` using the production options from
+``main.server_options`` for each worker/loop/http combination, waits for the
+``/health/ready`` gate and runs the ``benchmarks.load`` scenarios against it.
+
+With mongomock every worker seeds its own identical tenant, so the run is
+CPU bound and extra workers only help with more than one core.  With
+``--mongo-host`` the tenant is seeded once and shared; this is where workers
+pay off even on one shared CPU, because pymongo calls block the event loop
+while they wait on the network and another process can serve meanwhile.
+
+Usage:
+    python -m benchmarks.serving --workers 1 2 --loop asyncio uvloop
+    python -m benchmarks.serving --mongo-host mongodb://localhost:27017
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+
+os.environ.setdefault("RATE_LIMIT_REQUESTS", str(10**9))
+
+import httpx  # noqa: E402
+import mongomock  # noqa: E402
+from mongoengine import connect, disconnect, get_db  # noqa: E402
+
+from benchmarks.fixtures import build_company, seed_tenant  # noqa: E402
+from benchmarks.load import run_scenario, scenarios  # noqa: E402
+
+DATABASE = "barriil_benchmark"
+SIZE_VARIABLES = {
+    "kegs": "BENCH_KEGS",
+    "customers": "BENCH_CUSTOMERS",
+    "reservations": "BENCH_RESERVATIONS",
+    "free_kegs": "BENCH_FREE_KEGS",
+}
+
+
+def _connect(mongo_host: str | None) -> None:
+    if mongo_host:
+        connect(DATABASE, host=mongo_host)
+    else:
+        connect(DATABASE, host="mongodb://localhost", mongo_client_class=mongomock.MongoClient)
+
+
+def create_app():
+    """``uvicorn --factory`` entry point, run once per worker process."""
+    from app.api.dependencies.company import require_user_company
+    from app.application import app
+    from app.core.health import HealthChecker
+
+    mongo_host = os.environ.get("BENCH_MONGO_HOST")
+    _connect(mongo_host)
+    if not mongo_host:
+        seed_tenant(
+            **{name: int(os.environ[variable]) for name, variable in SIZE_VARIABLES.items()}
+        )
+
+    company = build_company()
+
+    async def stub_company():
+        return company
+
+    async def ping():
+        # mongomock has no topology to report, only the ping.
+        get_db().command("ping")
+        return {}
+
+    @asynccontextmanager
+    async def lifespan(app):
+        app.state.health = HealthChecker({"mongo": ping})
+        app.state.ready = True
+        yield
+        app.state.ready = False
+
+    app.dependency_overrides[require_user_company] = stub_company
+    app.router.lifespan_context = lifespan
+    return app
+
+
+def serve() -> None:
+    import uvicorn
+
+    from app.core.configs.environment import Environment
+    from main import server_options
+
+    uvicorn.run("benchmarks.serving:create_app", factory=True, **server_options(Environment()))
+
+
+async def _wait_ready(base_url: str, process: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError("Server exited during startup")
+            try:
+                if (await client.get("/health/ready")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise TimeoutError("Server not ready")
+
+
+async def _load(base_url: str, tenant, requests: int, concurrency: int, only) -> dict:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    results = {}
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        for name, build in scenarios(tenant).items():
+            if only and name not in only:
+                continue
+            await client.request(**build(requests))
+            result = await run_scenario(client, build, requests, concurrency)
+            result.pop("queries_per_request")
+            results[name] = result
+    return results
+
+
+def run_configuration(args, tenant, workers: int, loop: str, http: str) -> dict:
+    env = {
+        **os.environ,
+        "ENVIRONMENT": "benchmark",
+        "APPLICATION_HOST": "127.0.0.1",
+        "APPLICATION_PORT": str(args.port),
+        "SERVER_WORKERS": str(workers),
+        "SERVER_LOOP": loop,
+        "SERVER_HTTP": http,
+        "LOG_LEVEL": "WARNING",
+        "DATABASE_BUILD_INDEXES_ON_STARTUP": "false",
+        **{variable: str(getattr(args, name)) for name, variable in SIZE_VARIABLES.items()},
+    }
+    if args.mongo_host:
+        env["BENCH_MONGO_HOST"] = args.mongo_host
+
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.serving", "serve"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        asyncio.run(_wait_ready(base_url, process, timeout=args.startup_timeout))
+        return asyncio.run(
+            _load(base_url, tenant, args.requests, args.concurrency, args.scenario)
+        )
+    finally:
+        # SIGTERM exercises the graceful shutdown path.
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=60)
+
+
+def main() -> None:
+    if sys.argv[1:2] == ["serve"]:
+        serve()
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--loop", nargs="+", default=["asyncio", "uvloop"])
+    parser.add_argument("--http", nargs="+", default=["httptools"])
+    parser.add_argument("--kegs", type=int, default=2000)
+    parser.add_argument("--customers", type=int, default=1000)
+    parser.add_argument("--reservations", type=int, default=3000)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--scenario", action="append", help="Run only these scenarios")
+    parser.add_argument("--mongo-host", help="Use a MongoDB server instead of mongomock")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--startup-timeout", type=float, default=300)
+    parser.add_argument("--output", help="Save the results as JSON")
+    args = parser.parse_args()
+    args.free_kegs = args.requests + 1
+
+    # The scenarios need the tenant ids; with MongoDB this is the shared seed.
+    _connect(args.mongo_host)
+    try:
+        get_db().client.drop_database(DATABASE)
+        tenant = seed_tenant(
+            kegs=args.kegs,
+            customers=args.customers,
+            reservations=args.reservations,
+            free_kegs=args.free_kegs,
+        )
+    finally:
+        disconnect()
+
+    results = {}
+    for workers, loop, http in itertools.product(args.workers, args.loop, args.http):
+        label = f"workers={workers} loop={loop} http={http}"
+        results[label] = run_configuration(args, tenant, workers, loop, http)
+        print(label)
+        for name, result in results[label].items():
+            print(
+                f"  {name:<20} p50 {result['p50_ms']:>9.2f} ms  p95 {result['p95_ms']:>9.2f} ms"
+                f"  {result['throughput_rps']:>8.2f} req/s  errors {result['errors']}"
+            )
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+            output.write("\n")
+
+
+if __name__ == "__main__":
+    main()
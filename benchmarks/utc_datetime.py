@@ -0,0 +1,53 @@
+"""
+Micro-benchmarks for ``UTCDateTime``.
+
+Covers the hot paths hit on every document read and write: parsing strings
+(cached and uncached), validating ``datetime`` values, serializing with
+``str`` and ``UTCDateTime.now``.
+
+Usage:
+    python -m benchmarks.utc_datetime --number 100000 --repeat 5
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from app.core.utils import utc_datetime
+from app.core.utils.utc_datetime import UTCDateTime
+
+ISO_Z = "2025-09-01T18:31:47.914Z"
+ISO_OFFSET = "2025-09-01T15:31:47.914000-03:00"
+UTC_VALUE = UTCDateTime(2025, 9, 1, 18, 31, 47, 914000)
+NAIVE_VALUE = datetime(2025, 9, 1, 18, 31, 47, 914000)
+AWARE_VALUE = datetime(
+    2025, 9, 1, 15, 31, 47, 914000, tzinfo=timezone(timedelta(hours=-3))
+)
+
+CASES = {
+    "parse iso Z (cached)": lambda: UTCDateTime.validate_datetime(ISO_Z),
+    "parse iso Z (uncached)": lambda: utc_datetime._parse.__wrapped__(ISO_Z),
+    "parse offset (uncached)": lambda: utc_datetime._parse.__wrapped__(ISO_OFFSET),
+    "validate UTCDateTime": lambda: UTCDateTime.validate_datetime(UTC_VALUE),
+    "validate naive datetime": lambda: UTCDateTime.validate_datetime(NAIVE_VALUE),
+    "validate aware datetime": lambda: UTCDateTime.validate_datetime(AWARE_VALUE),
+    "serialize str()": lambda: str(UTC_VALUE),
+    "now()": UTCDateTime.now,
+    "add timedelta": lambda: UTC_VALUE + timedelta(days=1),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    width = max(len(name) for name in CASES)
+    for name, function in CASES.items():
+        best = min(timeit.repeat(function, number=args.number, repeat=args.repeat))
+        print(f"{name:<{width}}  {best / args.number * 1e9:8.0f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
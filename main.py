@@ -1,14 +1,37 @@
 import uvicorn
 
 from app.core.configs import get_environment
+from app.core.configs.environment import Environment
 
 _env = get_environment()
 
 
+def server_options(env: Environment) -> dict:
+    """``uvicorn.run`` options for the given environment.
+
+    Local runs keep auto-reload; every other environment serves with the
+    configured worker processes (reload and workers are exclusive).
+    """
+    options = {
+        "host": env.APPLICATION_HOST,
+        "port": env.APPLICATION_PORT,
+        "loop": env.SERVER_LOOP,
+        "http": env.SERVER_HTTP,
+        "backlog": env.SERVER_BACKLOG,
+        "timeout_keep_alive": env.SERVER_KEEP_ALIVE,
+        "timeout_graceful_shutdown": env.SERVER_GRACEFUL_SHUTDOWN,
+        "limit_concurrency": env.SERVER_LIMIT_CONCURRENCY,
+        "proxy_headers": True,
+        "forwarded_allow_ips": env.SERVER_FORWARDED_ALLOW_IPS,
+    }
+
+    if env.ENVIRONMENT == "local":
+        options["reload"] = True
+    else:
+        options["workers"] = env.SERVER_WORKERS
+
+    return options
+
+
 if __name__ == "__main__":
-    uvicorn.run(
-        "app.application:app",
-        host=_env.APPLICATION_HOST,
-        port=_env.APPLICATION_PORT,
-        reload=True,
-    )
+    uvicorn.run("app.application:app", **server_options(_env))
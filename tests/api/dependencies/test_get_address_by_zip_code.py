@@ -0,0 +1,43 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from app.api.dependencies import get_address_by_zip_code as module
+
+
+class TestGetAddressByZipCode(unittest.TestCase):
+    def _client(self, handler):
+        return httpx.AsyncClient(
+            base_url="https://viacep.test/ws", transport=httpx.MockTransport(handler)
+        )
+
+    def test_returns_via_cep_json(self):
+        def handler(request):
+            self.assertEqual(request.url.path, "/ws/89010000/json/")
+            return httpx.Response(200, json={"cep": "89010-000"})
+
+        async def run():
+            async with self._client(handler) as client:
+                with patch.object(module, "_get_client", return_value=client):
+                    return await module.get_address_by_zip_code("89010000")
+
+        self.assertEqual(asyncio.run(run()), {"cep": "89010-000"})
+
+    def test_raises_on_error_status(self):
+        async def run():
+            async with self._client(lambda request: httpx.Response(400)) as client:
+                with patch.object(module, "_get_client", return_value=client):
+                    await module.get_address_by_zip_code("abc")
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(run())
+
+    def test_client_is_reused_within_a_loop(self):
+        async def clients():
+            return module._get_client(), module._get_client()
+
+        first, second = asyncio.run(clients())
+        self.assertIs(first, second)
+        self.assertIsNot(asyncio.run(clients())[0], first)
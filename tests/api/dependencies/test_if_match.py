@@ -0,0 +1,19 @@
+import asyncio
+import unittest
+
+from app.api.dependencies.if_match import if_match_version
+from app.core.exceptions import BadRequestError
+
+
+class TestIfMatchVersion(unittest.TestCase):
+    def test_parses_strong_and_weak_tags(self):
+        self.assertEqual(asyncio.run(if_match_version('"3"')), 3)
+        self.assertEqual(asyncio.run(if_match_version('W/"4"')), 4)
+
+    def test_absent_or_wildcard_is_unconditional(self):
+        self.assertIsNone(asyncio.run(if_match_version(None)))
+        self.assertIsNone(asyncio.run(if_match_version("*")))
+
+    def test_rejects_tags_that_are_not_versions(self):
+        with self.assertRaises(BadRequestError):
+            asyncio.run(if_match_version('"abc"'))
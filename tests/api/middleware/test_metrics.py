@@ -0,0 +1,62 @@
+import unittest
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.middleware.metrics import UNMATCHED_ROUTE, MetricsMiddleware
+from app.core.metrics import (
+    HTTP_REQUEST_DURATION,
+    MONGO_REQUEST_COMMANDS,
+    MONGO_REQUEST_DURATION,
+    MongoCommandListener,
+)
+
+ROUTE = "/metrics-test/items/{item_id}"
+
+
+class TestMetricsMiddleware(unittest.TestCase):
+    def setUp(self) -> None:
+        app = FastAPI()
+        listener = MongoCommandListener()
+
+        @app.get(ROUTE)
+        async def read_item(item_id: str):
+            for _ in range(3):
+                listener.succeeded(
+                    SimpleNamespace(command_name="find", duration_micros=1000)
+                )
+            return {"id": item_id}
+
+        app.add_middleware(MetricsMiddleware)
+        self.client = TestClient(app)
+
+    def test_records_route_template_and_mongo_commands(self):
+        before = HTTP_REQUEST_DURATION.count(method="GET", route=ROUTE, status=200)
+        commands = MONGO_REQUEST_COMMANDS.sum(method="GET", route=ROUTE)
+        duration = MONGO_REQUEST_DURATION.sum(method="GET", route=ROUTE)
+
+        self.client.get("/metrics-test/items/1")
+        self.client.get("/metrics-test/items/2")
+
+        self.assertEqual(
+            HTTP_REQUEST_DURATION.count(method="GET", route=ROUTE, status=200), before + 2
+        )
+        self.assertEqual(MONGO_REQUEST_COMMANDS.sum(method="GET", route=ROUTE), commands + 6)
+        self.assertAlmostEqual(
+            MONGO_REQUEST_DURATION.sum(method="GET", route=ROUTE), duration + 0.006
+        )
+
+    def test_unknown_paths_share_one_label(self):
+        before = HTTP_REQUEST_DURATION.count(method="GET", route=UNMATCHED_ROUTE, status=404)
+
+        self.client.get("/metrics-test/unknown/1")
+
+        self.assertEqual(
+            HTTP_REQUEST_DURATION.count(method="GET", route=UNMATCHED_ROUTE, status=404),
+            before + 1,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
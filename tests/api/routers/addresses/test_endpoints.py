@@ -153,7 +153,7 @@ class TestAddressEndpoints(unittest.TestCase):
         self.assertEqual(resp.status_code, 400)
 
     def test_update_address_returns_400_when_not_updated(self):
-        async def fake_update(id, company_id, address):
+        async def fake_update(id, company_id, address, version=None):
             return None
 
         self.services.update = fake_update
@@ -123,11 +123,11 @@ class TestBeerDispenserEndpoints(unittest.TestCase):
 
     def test_list_dispensers_shows_reservation_id_when_reserved(self):
         class FakeReservationRepo:
-            async def find_active_by_beer_dispenser_id(self, company_id, dispenser_id):
+            async def find_active_by_beer_dispenser_ids(self, company_id, dispenser_ids):
                 class Res:
                     id = "res_123"
 
-                return Res()
+                return {dispenser_id: Res() for dispenser_id in dispenser_ids}
 
         self.services._BeerDispenserServices__reservation_repository = (
             FakeReservationRepo()
@@ -192,7 +192,7 @@ class TestBeerDispenserEndpoints(unittest.TestCase):
         self.assertEqual(resp.status_code, 400)
 
     def test_update_dispenser_returns_400_when_not_updated(self):
-        async def fake_update(id, company_id, dispenser):
+        async def fake_update(id, company_id, dispenser, version=None):
             return None
 
         self.services.update = fake_update
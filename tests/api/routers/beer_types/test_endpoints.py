@@ -130,7 +130,7 @@ class TestBeerTypeEndpoints(unittest.TestCase):
         self.assertEqual(resp.status_code, 400)
 
     def test_update_beer_type_returns_400_when_not_updated(self):
-        async def fake_update(id, company_id, beer_type):
+        async def fake_update(id, company_id, beer_type, version=None):
             return None
 
         self.services.update = fake_update
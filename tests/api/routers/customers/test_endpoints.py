@@ -110,6 +110,46 @@ class TestCustomerEndpoints(unittest.TestCase):
         self.assertEqual(resp.status_code, 200)
         self.assertGreaterEqual(len(resp.json()["data"]), 1)
 
+    def test_search_customers(self):
+        resp = self.client.get("/api/customers", params={"q": "JOH", "pageSize": 5})
+        self.assertEqual(resp.status_code, 200)
+        body = resp.json()
+        self.assertEqual(body["pagination"]["total"], 1)
+        self.assertEqual(body["pagination"]["pageSize"], 5)
+        self.assertEqual(
+            body["data"],
+            [
+                {
+                    "id": self.customer.id,
+                    "name": "John",
+                    "document": "10000000019",
+                    "email": "john@example.com",
+                    "mobile": "999",
+                }
+            ],
+        )
+
+    def test_search_customers_without_matches(self):
+        resp = self.client.get("/api/customers", params={"q": "nobody"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["data"], [])
+        self.assertEqual(resp.json()["pagination"]["total"], 0)
+
+    def test_get_customer_overview(self):
+        resp = self.client.get(f"/api/customers/{self.customer.id}/overview")
+        self.assertEqual(resp.status_code, 200)
+        body = resp.json()
+        self.assertEqual(body["data"]["customer"]["id"], self.customer.id)
+        # The seed address belongs to another company.
+        self.assertEqual(body["data"]["addresses"], [])
+        self.assertEqual(body["data"]["reservations"], [])
+        self.assertEqual(body["data"]["balance"]["reservations"], 0)
+        self.assertEqual(body["pagination"]["total"], 0)
+
+    def test_get_customer_overview_not_found(self):
+        with self.assertRaises(NotFoundError):
+            self.client.get("/api/customers/cus_unknown/overview")
+
     def test_update_customer_endpoint(self):
         resp = self.client.put(
             f"/api/customers/{self.customer.id}",
@@ -135,7 +175,7 @@ class TestCustomerEndpoints(unittest.TestCase):
         self.assertEqual(resp.status_code, 400)
 
     def test_update_customer_returns_400_when_not_updated(self):
-        async def fake_update(id, company_id, customer):
+        async def fake_update(id, company_id, customer, version=None):
             return None
 
         self.services.update = fake_update
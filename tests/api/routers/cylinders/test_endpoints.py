@@ -135,7 +135,7 @@ class TestCylinderEndpoints(unittest.TestCase):
         self.assertEqual(resp.status_code, 400)
 
     def test_update_cylinder_returns_400_when_not_updated(self):
-        async def fake_update(id, company_id, cylinder):
+        async def fake_update(id, company_id, cylinder, version=None):
             return None
 
         self.services.update = fake_update
@@ -12,6 +12,7 @@ from app.api.composers.dashboard_composite import dashboard_composer
 from app.api.dependencies.company import require_user_company
 from app.api.routers.dashboard import dashboard_router
 from app.api.routers.exception_handlers import not_found_error_404
+from app.core.db.query_recorder import assert_no_n_plus_one
 from app.core.exceptions import NotFoundError
 from app.core.utils.utc_datetime import UTCDateTime
 from app.crud.beer_dispensers.models import BeerDispenserModel
@@ -191,6 +192,12 @@ class TestDashboardEndpoints(unittest.TestCase):
         self.assertEqual(float(jan["profit"]), 50.0)
         self.assertEqual(float(feb["profit"]), 80.0)
 
+    def test_monthly_revenue_loads_kegs_in_batch(self):
+        with assert_no_n_plus_one(threshold=1):
+            data = asyncio.run(self.dashboard_services.monthly_revenue("com1", 2024))
+
+        self.assertEqual(sum(month.liters_sold for month in data), 90)
+
     def test_upcoming_reservations(self):
         resp = self.client.get("/api/dashboard/upcoming-reservations")
         self.assertEqual(resp.status_code, 200)
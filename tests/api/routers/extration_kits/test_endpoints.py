@@ -132,7 +132,7 @@ class TestExtractionKitEndpoints(unittest.TestCase):
         self.assertEqual(resp.status_code, 400)
 
     def test_update_gauge_returns_400_when_not_updated(self):
-        async def fake_update(id, company_id, gauge):
+        async def fake_update(id, company_id, gauge, version=None):
             return None
 
         self.services.update = fake_update
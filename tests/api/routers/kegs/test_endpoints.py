@@ -18,7 +18,7 @@ from app.crud.beer_types.models import BeerTypeModel
 from app.crud.kegs.repositories import KegRepository
 from app.crud.kegs.services import KegServices
 from app.crud.kegs.schemas import Keg, KegStatus
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import ConflictError, NotFoundError
 
 
 class TestKegEndpoints(unittest.TestCase):
@@ -120,6 +120,15 @@ class TestKegEndpoints(unittest.TestCase):
         self.assertEqual(resp.status_code, 200)
         self.assertGreaterEqual(len(resp.json()["data"]), 1)
 
+    def test_keg_stock_summary(self):
+        resp = self.client.get("/api/kegs/summary")
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()["data"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["beerTypeName"], "Pale Ale")
+        self.assertEqual(data[0]["kegs"], 1)
+        self.assertEqual(data[0]["statuses"][0]["status"], "AVAILABLE")
+
     def test_list_kegs_filtered_by_status(self):
         other_keg = Keg(
             number="2",
@@ -149,6 +158,39 @@ class TestKegEndpoints(unittest.TestCase):
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.json()["data"]["number"], "10")
 
+    def test_update_keg_with_if_match(self):
+        resp = self.client.put(
+            f"/api/kegs/{self.keg.id}",
+            json={"number": "10"},
+            headers={"If-Match": '"1"'},
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["data"]["version"], 2)
+
+        with self.assertRaises(ConflictError):
+            self.client.put(
+                f"/api/kegs/{self.keg.id}",
+                json={"number": "11"},
+                headers={"If-Match": '"1"'},
+            )
+
+    def test_stale_if_match_conflicts_after_a_bulk_status_change(self):
+        asyncio.run(
+            self.repository.update_many(
+                [self.keg.id], str(self.company.id), {"status": KegStatus.IN_USE.value}
+            )
+        )
+
+        with self.assertRaises(ConflictError) as context:
+            self.client.put(
+                f"/api/kegs/{self.keg.id}",
+                json={"status": "AVAILABLE"},
+                headers={"If-Match": '"1"'},
+            )
+        self.assertEqual(context.exception.current_version, 2)
+        keg = asyncio.run(self.services.search_by_id(self.keg.id, str(self.company.id)))
+        self.assertEqual(keg.status, KegStatus.IN_USE)
+
     def test_delete_keg_endpoint(self):
         resp = self.client.delete(f"/api/kegs/{self.keg.id}")
         self.assertEqual(resp.status_code, 200)
@@ -164,7 +206,7 @@ class TestKegEndpoints(unittest.TestCase):
         self.assertEqual(resp.status_code, 400)
 
     def test_update_keg_returns_400_when_not_updated(self):
-        async def fake_update(id, company_id, keg):
+        async def fake_update(id, company_id, keg, version=None):
             return None
 
         self.services.update = fake_update
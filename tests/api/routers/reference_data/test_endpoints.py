@@ -0,0 +1,86 @@
+import unittest
+
+import mongomock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from mongoengine import connect, disconnect
+
+from app.api.composers.reference_data_composite import reference_data_composer
+from app.api.dependencies.company import require_user_company
+from app.api.routers.reference_data import reference_data_router
+from app.core.cache import clear_caches
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.beer_types.models import BeerTypeModel
+from app.crud.beer_types.repositories import BeerTypeRepository
+from app.crud.companies.schemas import CompanyInDB
+from app.crud.reference_data import ReferenceDataServices
+
+
+class TestReferenceDataEndpoints(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        BeerTypeModel.drop_collection()
+        clear_caches()
+        self.services = ReferenceDataServices(BeerTypeRepository())
+        self.company = CompanyInDB(
+            id="com1",
+            name="ACME",
+            address_id="add1",
+            phone_number="9999-9999",
+            ddd="11",
+            email="info@acme.com",
+            created_at=UTCDateTime.now(),
+            updated_at=UTCDateTime.now(),
+        )
+
+        self.app = FastAPI()
+        self.app.include_router(reference_data_router, prefix="/api")
+
+        async def override_require_user_company():
+            return self.company
+
+        async def override_composer():
+            return self.services
+
+        self.app.dependency_overrides[require_user_company] = (
+            override_require_user_company
+        )
+        self.app.dependency_overrides[reference_data_composer] = override_composer
+        self.client = TestClient(self.app)
+
+        BeerTypeModel(name="IPA", company_id="com1").save()
+        BeerTypeModel(name="Other", company_id="com2").save()
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def test_returns_beer_types_and_enums_with_cache_headers(self):
+        resp = self.client.get("/api/reference-data")
+
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()["data"]
+        self.assertEqual([b["name"] for b in data["beerTypes"]], ["IPA"])
+        self.assertIn("AVAILABLE", data["enums"]["KegStatus"])
+        self.assertEqual(set(data["enums"]["Voltage"]), {"110V", "220V"})
+        self.assertEqual(resp.headers["etag"], f'"{data["version"]}"')
+        self.assertIn("max-age=", resp.headers["cache-control"])
+
+    def test_if_none_match_returns_304_until_a_beer_type_is_written(self):
+        etag = self.client.get("/api/reference-data").headers["etag"]
+
+        resp = self.client.get("/api/reference-data", headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.headers["etag"], etag)
+
+        BeerTypeModel(name="Other", company_id="com2").save()
+        resp = self.client.get("/api/reference-data", headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_code, 304)
+
+        BeerTypeModel(name="Stout", company_id="com1").save()
+        resp = self.client.get("/api/reference-data", headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp.headers["etag"], etag)
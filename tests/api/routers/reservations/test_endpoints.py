@@ -548,17 +548,20 @@ class TestReservationEndpoints(unittest.TestCase):
         )
         self.assertEqual(resp_add.status_code, 200)
         self.assertEqual(len(resp_add.json()["data"]["payments"]), 2)
+        first_id, second_id = (p["id"] for p in resp_add.json()["data"]["payments"])
         resp_update = self.client.put(
-            f"/api/reservations/{res_id}/payments/1",
+            f"/api/reservations/{res_id}/payments/{second_id}",
             json={"amount": 60.0, "method": "card", "paidAt": str(date.today())},
         )
         self.assertEqual(resp_update.status_code, 200)
         self.assertEqual(resp_update.json()["data"]["payments"][1]["amount"], 60.0)
         resp_delete = self.client.delete(
-            f"/api/reservations/{res_id}/payments/0",
+            f"/api/reservations/{res_id}/payments/{first_id}",
         )
         self.assertEqual(resp_delete.status_code, 200)
-        self.assertEqual(len(resp_delete.json()["data"]["payments"]), 1)
+        self.assertEqual(
+            [p["id"] for p in resp_delete.json()["data"]["payments"]], [second_id]
+        )
 
     def test_list_reservations_with_filters(self):
         resp1 = self.client.post("/api/reservations", json=self._payload())
@@ -0,0 +1,83 @@
+import unittest
+from datetime import timedelta
+
+import mongomock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from mongoengine import connect, disconnect
+
+from app.api.composers.sync_composite import sync_composer
+from app.api.dependencies.company import require_user_company
+from app.api.routers.sync import sync_router
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.beer_types.models import BeerTypeModel
+from app.crud.companies.schemas import CompanyInDB
+from app.crud.sync.repositories import SyncRepository
+from app.crud.sync.services import SyncServices
+
+
+class TestSyncEndpoints(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        self.company = CompanyInDB(
+            id="com1",
+            name="ACME",
+            address_id="add1",
+            phone_number="9999-9999",
+            ddd="11",
+            email="info@acme.com",
+            created_at=UTCDateTime.now(),
+            updated_at=UTCDateTime.now(),
+        )
+        self.services = SyncServices(SyncRepository())
+        self.app = FastAPI()
+        self.app.include_router(sync_router, prefix="/api")
+
+        async def override_require_user_company():
+            return self.company
+
+        async def override_sync_composer():
+            return self.services
+
+        self.app.dependency_overrides[require_user_company] = (
+            override_require_user_company
+        )
+        self.app.dependency_overrides[sync_composer] = override_sync_composer
+        self.client = TestClient(self.app)
+
+        self.beer_type = BeerTypeModel(name="Pale Ale", company_id="com1")
+        self.beer_type.save()
+
+    def tearDown(self) -> None:
+        self.app.dependency_overrides = {}
+        disconnect()
+
+    def test_full_sync(self):
+        resp = self.client.get("/api/sync")
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()["data"]
+        self.assertEqual(len(data["beerTypes"]), 1)
+        self.assertIn("cursor", data)
+
+    def test_sync_since_cursor(self):
+        since = str(UTCDateTime.now() + timedelta(minutes=1))
+        resp = self.client.get("/api/sync", params={"since": since})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["data"]["beerTypes"], [])
+
+    def test_sync_reports_deleted_documents(self):
+        self.beer_type.soft_delete()
+        self.beer_type.save()
+        resp = self.client.get("/api/sync")
+        self.assertEqual(resp.status_code, 200)
+        deleted = resp.json()["data"]["deleted"]
+        self.assertEqual(deleted[0]["id"], self.beer_type.id)
+        self.assertEqual(deleted[0]["collection"], "beer_types")
+
+
+if __name__ == "__main__":
+    unittest.main()
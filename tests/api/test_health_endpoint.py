@@ -0,0 +1,72 @@
+import os
+from fastapi.testclient import TestClient
+
+os.environ["DATABASE_HOST"] = "mongomock://localhost"
+
+from app.application import app
+from app.core.health import HealthChecker
+
+
+async def healthy_probe():
+    return {"latency_ms": 1.5}
+
+
+async def failing_probe():
+    raise ConnectionError("connection refused")
+
+
+def _set_state(ready, probes=None):
+    app.state.ready = ready
+    app.state.health = HealthChecker(probes or {"mongo": healthy_probe}, ttl=0)
+
+
+def test_liveness_touches_nothing():
+    client = TestClient(app)
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json()["message"] == "I'm alive!"
+
+
+def test_readiness_waits_for_startup():
+    client = TestClient(app)
+
+    _set_state(ready=False)
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["message"] == "Not ready"
+
+    _set_state(ready=True)
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["message"] == "Ready"
+    assert response.json()["data"]["checks"]["mongo"]["details"] == {"latency_ms": 1.5}
+
+    _set_state(ready=False)
+
+
+def test_readiness_fails_when_mongo_is_down():
+    client = TestClient(app)
+
+    _set_state(ready=True, probes={"mongo": failing_probe})
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["data"]["checks"]["mongo"]["healthy"] is False
+
+    _set_state(ready=False)
+
+
+def test_deep_health_reports_every_probe():
+    client = TestClient(app)
+
+    _set_state(ready=True, probes={"mongo": healthy_probe, "jwks": healthy_probe})
+    response = client.get("/health/deep")
+    assert response.status_code == 200
+    assert set(response.json()["data"]["checks"]) == {"mongo", "jwks"}
+
+    _set_state(ready=True, probes={"mongo": healthy_probe, "jwks": failing_probe})
+    response = client.get("/health/deep")
+    assert response.status_code == 503
+    assert response.json()["message"] == "Unhealthy"
+    assert response.json()["data"]["healthy"] is False
+
+    _set_state(ready=False)
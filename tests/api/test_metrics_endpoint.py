@@ -0,0 +1,40 @@
+import os
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+os.environ["DATABASE_HOST"] = "mongomock://localhost"
+
+from app.application import app
+from app.core.configs.environment import Environment
+
+
+def _get(env: Environment, authorization: str | None = None):
+    client = TestClient(app)
+    headers = {"Authorization": authorization} if authorization else {}
+    with patch("app.application._env", env):
+        return client.get("/metrics", headers=headers)
+
+
+def test_metrics_are_not_served_without_a_token():
+    assert _get(Environment(METRICS_TOKEN=None)).status_code == 404
+
+
+def test_metrics_require_the_bearer_token():
+    env = Environment(METRICS_TOKEN="secret")
+
+    assert _get(env).status_code == 401
+    assert _get(env, "Bearer wrong").status_code == 401
+
+    response = _get(env, "Bearer secret")
+    assert response.status_code == 200
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+    assert 'worker="' not in response.text
+
+
+def test_samples_name_the_worker_with_several_workers():
+    env = Environment(METRICS_TOKEN="secret", SERVER_WORKERS=2)
+
+    response = _get(env, "Bearer secret")
+
+    assert f'worker="{os.getpid()}"' in response.text
@@ -0,0 +1,5 @@
+from tests.support.mongomock_bulk import patch_mongomock_bulk_writes
+from tests.support.mongomock_queries import record_mongomock_queries
+
+patch_mongomock_bulk_writes()
+record_mongomock_queries()
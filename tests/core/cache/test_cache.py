@@ -0,0 +1,260 @@
+import asyncio
+import time
+import unittest
+from typing import List
+
+import mongomock
+from mongoengine import connect, disconnect
+from pydantic import TypeAdapter
+
+from app.core.cache import (
+    Cache,
+    CacheVersions,
+    LocalTier,
+    MongoCacheVersions,
+    MongoSharedTier,
+    cache_versions,
+    clear_caches,
+    invalidate,
+)
+from app.core.cache.versions import build_cache_versions
+from app.core.configs.environment import Environment
+from app.core.metrics import CACHE_REQUESTS
+from app.crud.beer_types.models import BeerTypeModel
+from app.crud.beer_types.repositories import BeerTypeRepository
+from app.crud.beer_types.services import BeerTypeServices
+from app.crud.kegs.services import KegServices
+
+
+class CountingLoader:
+    def __init__(self, value="value", delay: float = 0) -> None:
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return f"{self.value}-{self.calls}"
+
+
+class TestLocalTier(unittest.TestCase):
+    def test_evicts_the_least_recently_used(self):
+        tier = LocalTier(maxsize=2, ttl=60)
+        tier.set("a", 1)
+        tier.set("b", 2)
+        tier.get("a")
+        tier.set("c", 3)
+
+        self.assertIsNone(tier.get("b"))
+        self.assertEqual(tier.get("a").value, 1)
+        self.assertEqual(len(tier), 2)
+
+    def test_entries_go_stale_then_expire(self):
+        tier = LocalTier(maxsize=2, ttl=0.01, stale_ttl=0.05)
+        tier.set("a", 1)
+        time.sleep(0.02)
+
+        entry = tier.get("a")
+        self.assertFalse(entry.is_fresh(time.monotonic()))
+        time.sleep(0.05)
+        self.assertIsNone(tier.get("a"))
+
+
+class TestCache(unittest.TestCase):
+    def test_concurrent_misses_share_one_load(self):
+        cache = Cache("test_single_flight", maxsize=8, ttl=60)
+        loader = CountingLoader(delay=0.01)
+
+        async def load_many():
+            return await asyncio.gather(
+                *(cache.get_or_load("k", "com1", ("kegs",), loader) for _ in range(5))
+            )
+
+        self.assertEqual(asyncio.run(load_many()), ["value-1"] * 5)
+        self.assertEqual(loader.calls, 1)
+        self.assertEqual(CACHE_REQUESTS.value(cache="test_single_flight", result="miss"), 5)
+
+    def test_failed_load_is_not_cached(self):
+        cache = Cache("test_failure", maxsize=8, ttl=60)
+
+        async def failing():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(cache.get_or_load("k", "com1", ("kegs",), failing))
+        self.assertIsNone(cache.local.get("k"))
+
+    def test_stale_entry_is_served_while_revalidated(self):
+        cache = Cache("test_swr", maxsize=8, ttl=0.05, stale_ttl=60)
+        loader = CountingLoader()
+
+        async def scenario():
+            first = await cache.get_or_load("k", "com1", ("kegs",), loader)
+            await asyncio.sleep(0.06)
+            stale = await cache.get_or_load("k", "com1", ("kegs",), loader)
+            await asyncio.sleep(0.001)
+            refreshed = await cache.get_or_load("k", "com1", ("kegs",), loader)
+            return first, stale, refreshed
+
+        self.assertEqual(asyncio.run(scenario()), ("value-1", "value-1", "value-2"))
+        self.assertEqual(CACHE_REQUESTS.value(cache="test_swr", result="stale"), 1)
+
+
+class TestCachedServices(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        BeerTypeModel.drop_collection()
+        clear_caches()
+        self.repository = BeerTypeRepository()
+        self.services = BeerTypeServices(self.repository)
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def test_search_all_is_cached_until_a_write_bumps_the_version(self):
+        BeerTypeModel(name="IPA", company_id="com1").save()
+        calls = []
+        select_all = self.repository.select_all
+
+        async def counting_select_all(company_id):
+            calls.append(company_id)
+            return await select_all(company_id=company_id)
+
+        self.repository.select_all = counting_select_all
+
+        first = asyncio.run(self.services.search_all("com1"))
+        second = asyncio.run(self.services.search_all("com1"))
+        self.assertEqual(len(calls), 1)
+        self.assertIs(first, second)
+
+        version = cache_versions.get("com1", "beer_types")
+        BeerTypeModel(name="Stout", company_id="com1").save()
+        self.assertEqual(cache_versions.get("com1", "beer_types"), version + 1)
+
+        third = asyncio.run(self.services.search_all("com1"))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(sorted(b.name for b in third), ["IPA", "Stout"])
+
+        asyncio.run(self.services.search_all("com2"))
+        self.assertEqual(calls, ["com1", "com1", "com2"])
+
+    def test_invalidate_ignores_documents_without_a_company(self):
+        invalidate(None, "beer_types")
+        self.assertEqual(cache_versions.get("None", "beer_types"), 0)
+
+    def test_invalidate_skips_collections_no_read_is_cached_on(self):
+        invalidate("com1", "addresses")
+        self.assertEqual(cache_versions.get("com1", "addresses"), 0)
+
+    def test_read_over_several_collections_is_dropped_by_either(self):
+        calls = []
+
+        class CountingKegRepository:
+            async def select_stock_summary(self, company_id):
+                calls.append(company_id)
+                return []
+
+        services = KegServices(CountingKegRepository())
+        asyncio.run(services.search_stock_summary("com1"))
+        asyncio.run(services.search_stock_summary("com1"))
+        self.assertEqual(len(calls), 1)
+
+        invalidate("com1", "beer_types")
+        asyncio.run(services.search_stock_summary("com1"))
+        invalidate("com1", "kegs")
+        asyncio.run(services.search_stock_summary("com1"))
+        self.assertEqual(len(calls), 3)
+
+    def test_shared_versions_of_several_collections_are_read_at_once(self):
+        versions = MongoCacheVersions(collection="test_cache_versions")
+        versions.clear()
+        versions.bump("com1", "beer_types")
+
+        self.assertEqual(versions.get_many("com1", ("kegs", "beer_types")), (0, 1))
+
+
+class TestSharedTier(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        self.shared = MongoSharedTier(collection="test_cache_entries")
+        self.shared._collection().delete_many({})
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def test_processes_share_entries_until_invalidated(self):
+        adapter = TypeAdapter(List[str])
+        loader = CountingLoader()
+
+        async def load():
+            return [await loader()]
+
+        # Two processes: same shared tier, separate local tiers.
+        first = Cache("test_shared_a", 8, 60, shared=self.shared, adapter=adapter)
+        second = Cache("test_shared_b", 8, 60, shared=self.shared, adapter=adapter)
+        key = ("search", 0, "com1", "[]")
+
+        asyncio.run(first.get_or_load(key, "com1", ("beer_types",), load))
+        value = asyncio.run(second.get_or_load(key, "com1", ("beer_types",), load))
+
+        self.assertEqual(value, ["value-1"])
+        self.assertEqual(loader.calls, 1)
+        self.assertEqual(
+            CACHE_REQUESTS.value(cache="test_shared_b", result="shared_hit"), 1
+        )
+
+        self.shared.invalidate("com1", "beer_types")
+        self.assertEqual(self.shared._collection().count_documents({}), 0)
+
+    def test_entry_read_from_several_collections_is_dropped_by_either(self):
+        for collection in ("kegs", "beer_types"):
+            self.shared.set(
+                "summary", ["value"], 60, company_id="com1", collections=("kegs", "beer_types")
+            )
+            self.shared.invalidate("com1", collection)
+            self.assertIsNone(self.shared.get("summary"))
+
+
+class TestSharedVersions(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        MongoCacheVersions(collection="test_cache_versions").clear()
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def test_a_bump_is_seen_by_every_process(self):
+        first = MongoCacheVersions(collection="test_cache_versions")
+        second = MongoCacheVersions(collection="test_cache_versions")
+
+        self.assertEqual(second.get("com1", "kegs"), 0)
+        self.assertEqual(first.bump("com1", "kegs"), 1)
+        self.assertEqual(second.get("com1", "kegs"), 1)
+        self.assertEqual(second.get("com2", "kegs"), 0)
+
+    def test_shared_by_default_with_several_workers(self):
+        self.assertIsInstance(
+            build_cache_versions(Environment(SERVER_WORKERS=1)), CacheVersions
+        )
+        self.assertIsInstance(
+            build_cache_versions(Environment(SERVER_WORKERS=2)), MongoCacheVersions
+        )
+        self.assertIsInstance(
+            build_cache_versions(
+                Environment(SERVER_WORKERS=2, CACHE_SHARED_INVALIDATION=False)
+            ),
+            CacheVersions,
+        )
@@ -0,0 +1,86 @@
+import json
+import logging
+import unittest
+from logging.handlers import RotatingFileHandler
+from queue import SimpleQueue
+
+from asgi_correlation_id import CorrelationIdFilter, correlation_id
+
+from app.core.configs.environment import Environment
+from app.core.configs.logger import (
+    DebugSamplingFilter,
+    JsonFormatter,
+    Logger,
+    _QueueHandler,
+)
+
+
+class TestLogger(unittest.TestCase):
+    def test_levels_use_longest_module_prefix(self):
+        environment = Environment(
+            LOG_LEVEL="WARNING",
+            LOG_LEVELS={"app.crud": "INFO", "app.crud.kegs": "DEBUG"},
+        )
+
+        def level(name):
+            return Logger(name=name, environment=environment).get_logger().level
+
+        self.assertEqual(level("tests.logger.other"), logging.WARNING)
+        self.assertEqual(level("app.crud.customers.repositories"), logging.INFO)
+        self.assertEqual(level("app.crud.kegs.repositories"), logging.DEBUG)
+        self.assertEqual(level("app.crudity"), logging.WARNING)
+
+    def test_log_file_is_only_written_by_a_single_worker(self):
+        def handlers(**settings):
+            environment = Environment(**settings)
+            logger = Logger(name="tests.logger.file", environment=environment)
+            return [type(handler) for handler in logger._Logger__build_handlers()]
+
+        self.assertEqual(handlers(LOG_FILE=None), [logging.StreamHandler])
+        self.assertEqual(
+            handlers(LOG_FILE="app.log", SERVER_WORKERS=1),
+            [logging.StreamHandler, RotatingFileHandler],
+        )
+        self.assertEqual(
+            handlers(LOG_FILE="app.log", SERVER_WORKERS=2), [logging.StreamHandler]
+        )
+
+    def test_debug_sampling_only_drops_debug_records(self):
+        sampler = DebugSamplingFilter(rate=0)
+
+        def record(level):
+            return logging.LogRecord("test", level, __file__, 1, "message", None, None)
+
+        self.assertFalse(sampler.filter(record(logging.DEBUG)))
+        self.assertTrue(sampler.filter(record(logging.INFO)))
+        self.assertTrue(DebugSamplingFilter(rate=1).filter(record(logging.DEBUG)))
+
+    def test_queued_record_is_rendered_as_json(self):
+        queue = SimpleQueue()
+        handler = _QueueHandler(queue)
+        handler.addFilter(CorrelationIdFilter())
+
+        token = correlation_id.set("abc123")
+        try:
+            try:
+                raise ValueError("boom")
+            except ValueError as error:
+                record = logging.LogRecord(
+                    "tests.logger.json", logging.ERROR, __file__, 10,
+                    "Error on %s", ("select_all",), (type(error), error, error.__traceback__),
+                )
+            handler.handle(record)
+        finally:
+            correlation_id.reset(token)
+
+        payload = json.loads(JsonFormatter().format(queue.get_nowait()))
+
+        self.assertEqual(payload["level"], "ERROR")
+        self.assertEqual(payload["logger"], "tests.logger.json")
+        self.assertEqual(payload["message"], "Error on select_all")
+        self.assertEqual(payload["correlation_id"], "abc123")
+        self.assertIn("ValueError: boom", payload["exception"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.db.migrations.address_postal_code_key import LEGACY_INDEX, migrate
+from app.crud.addresses.models import AddressModel
+
+
+class TestAddressPostalCodeKeyMigration(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        AddressModel.drop_collection()
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def _insert_legacy(self, address_id: str, postal_code: str) -> None:
+        AddressModel._get_collection().insert_one(
+            {
+                "_id": address_id,
+                "postal_code": postal_code,
+                "street": "Main",
+                "number": "1",
+                "district": "Center",
+                "city": "City",
+                "state": "ST",
+                "company_id": "com1",
+                "is_active": True,
+            }
+        )
+
+    def test_backfills_keys_and_drops_legacy_index(self):
+        collection = AddressModel._get_collection()
+        collection.create_index([("company_id", 1), ("postal_code", 1)])
+        self._insert_legacy("add_1", "89010-000")
+        self._insert_legacy("add_2", "89010000")
+        self._insert_legacy("add_3", "12345")
+
+        self.assertEqual(migrate(), 3)
+
+        keys = {doc["_id"]: doc["postal_code_key"] for doc in collection.find()}
+        self.assertEqual(
+            keys, {"add_1": "89010000", "add_2": "89010000", "add_3": "12345"}
+        )
+        indexes = collection.index_information()
+        self.assertNotIn(LEGACY_INDEX, indexes)
+        self.assertIn("company_id_1_postal_code_key_1", indexes)
+
+    def test_is_idempotent(self):
+        self._insert_legacy("add_1", "89010-000")
+
+        self.assertEqual(migrate(), 1)
+        self.assertEqual(migrate(), 0)
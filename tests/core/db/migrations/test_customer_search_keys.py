@@ -0,0 +1,43 @@
+import unittest
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.db.migrations.customer_search_keys import migrate
+from app.crud.customers.models import CustomerModel
+
+
+class TestCustomerSearchKeysMigration(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        CustomerModel.drop_collection()
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def test_backfills_search_keys_once(self):
+        CustomerModel._get_collection().insert_one(
+            {
+                "_id": "cus_1",
+                "name": "Ana Lúcia",
+                "document": "10000000019",
+                "company_id": "com1",
+                "is_active": True,
+            }
+        )
+
+        self.assertEqual(migrate(), 1)
+        self.assertEqual(migrate(), 0)
+
+        document = CustomerModel._get_collection().find_one({"_id": "cus_1"})
+        self.assertEqual(
+            document["search_keys"], ["ana lucia", "ana", "lucia", "10000000019"]
+        )
+        self.assertIn(
+            "company_id_1_search_keys_1",
+            CustomerModel._get_collection().index_information(),
+        )
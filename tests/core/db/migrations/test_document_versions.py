@@ -0,0 +1,31 @@
+import unittest
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.db.migrations.document_versions import migrate
+from app.crud.kegs.models import KegModel
+
+
+class TestDocumentVersionsMigration(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        KegModel.drop_collection()
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def test_sets_missing_versions_once(self):
+        collection = KegModel._get_collection()
+        collection.insert_many(
+            [{"_id": "keg_1"}, {"_id": "keg_2", "version": 4}]
+        )
+
+        self.assertEqual(migrate(), 1)
+        self.assertEqual(collection.find_one({"_id": "keg_1"})["version"], 1)
+        self.assertEqual(collection.find_one({"_id": "keg_2"})["version"], 4)
+        self.assertEqual(migrate(), 0)
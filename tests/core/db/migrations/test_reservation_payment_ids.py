@@ -0,0 +1,63 @@
+import unittest
+from datetime import datetime
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.db.migrations.reservation_payment_ids import migrate
+from app.crud.payments.models import legacy_payment_id
+from app.crud.reservations.models import ReservationModel
+
+
+class TestReservationPaymentIdsMigration(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        ReservationModel.drop_collection()
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def test_sets_missing_payment_ids_once(self):
+        collection = ReservationModel._get_collection()
+        paid_at = datetime(2024, 1, 1)
+        collection.insert_many(
+            [
+                {
+                    "_id": "res_1",
+                    "payments": [
+                        {"amount": 10.0, "method": "PIX", "paid_at": paid_at},
+                        {"id": "pay_kept", "amount": 5.0, "method": "PIX", "paid_at": paid_at},
+                    ],
+                },
+                {"_id": "res_2", "payments": []},
+            ]
+        )
+
+        self.assertEqual(migrate(), 1)
+        self.assertEqual(migrate(), 0)
+
+        reservation = collection.find_one({"_id": "res_1"})
+        payments = reservation["payments"]
+        self.assertEqual(payments[0]["id"], legacy_payment_id("res_1", 0))
+        self.assertEqual(payments[0]["amount"], 10.0)
+        self.assertEqual(payments[1]["id"], "pay_kept")
+        self.assertEqual(reservation["version"], 2)
+        self.assertIn("updated_at", reservation)
+
+    def test_legacy_payment_ids_are_the_same_on_every_load(self):
+        ReservationModel._get_collection().insert_one(
+            {
+                "_id": "res_1",
+                "payments": [
+                    {"amount": 10.0, "method": "PIX", "paid_at": datetime(2024, 1, 1)}
+                ],
+            }
+        )
+
+        loads = [ReservationModel.objects.get(id="res_1") for _ in range(2)]
+
+        self.assertEqual([load.payments[0].id for load in loads], [None, None])
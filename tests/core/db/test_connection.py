@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from pymongo import MongoClient, ReadPreference
+
+from app.core.configs.environment import Environment
+from app.core.db import connection
+from app.core.db.connection import connection_options
+
+
+class TestWarmUp(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = patch.multiple(
+            connection._env,
+            AUTH0_DOMAIN="https://tenant.auth0.com",
+            AUTH0_MANAGEMENT_API_CLIENT_ID="client",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _app(self, jwks):
+        return SimpleNamespace(
+            state=SimpleNamespace(auth=SimpleNamespace(warm_up=jwks), access_token=None)
+        )
+
+    def test_runs_dependencies_concurrently(self):
+        # Each call waits for the other two, so a sequential warm-up would
+        # break the barrier.
+        barrier = threading.Barrier(3, timeout=2)
+        token = {"access_token": "abc"}
+
+        def wait(result=None):
+            barrier.wait()
+            return result
+
+        app = self._app(jwks=wait)
+        with patch.object(connection, "start_database", wait), patch.object(
+            connection, "issue_access_token", lambda: wait(token)
+        ):
+            asyncio.run(connection.warm_up(app))
+
+        self.assertEqual(app.state.access_token, token)
+
+    def test_auth0_failures_do_not_block_startup(self):
+        def fail():
+            raise RuntimeError("Auth0 unavailable")
+
+        app = self._app(jwks=fail)
+        with patch.object(connection, "start_database", lambda: None), patch.object(
+            connection, "issue_access_token", fail
+        ):
+            asyncio.run(connection.warm_up(app))
+
+        self.assertIsNone(app.state.access_token)
+
+    def test_database_failure_aborts_startup(self):
+        def fail():
+            raise ConnectionError("MongoDB unavailable")
+
+        app = self._app(jwks=lambda: 1)
+        with patch.object(connection, "start_database", fail), patch.object(
+            connection, "issue_access_token", lambda: {}
+        ):
+            with self.assertRaises(ConnectionError):
+                asyncio.run(connection.warm_up(app))
+
+
+class TestConnectionOptions(unittest.TestCase):
+    def test_options_are_accepted_by_pymongo(self):
+        env = Environment(
+            DATABASE_MAX_POOL_SIZE=20,
+            DATABASE_WAIT_QUEUE_TIMEOUT_MS=1000,
+            DATABASE_READ_PREFERENCE="secondaryPreferred",
+            DATABASE_COMPRESSORS="zstd,zlib",
+        )
+        client = MongoClient(
+            "mongodb://localhost", connect=False, **connection_options(env)
+        )
+        self.addCleanup(client.close)
+
+        self.assertEqual(client.options.pool_options.max_pool_size, 20)
+        self.assertEqual(client.options.pool_options.wait_queue_timeout, 1)
+        self.assertEqual(client.read_preference, ReadPreference.SECONDARY_PREFERRED)
+
+    def test_unset_options_keep_pymongo_defaults(self):
+        options = connection_options(
+            Environment(DATABASE_SOCKET_TIMEOUT_MS=None, DATABASE_COMPRESSORS=None)
+        )
+
+        self.assertNotIn("socketTimeoutMS", options)
+        self.assertNotIn("compressors", options)
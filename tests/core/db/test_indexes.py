@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from mongoengine.queryset.queryset import QuerySet
+
+from app.core.db.indexes import build_indexes, get_models, plan_query, report_indexes
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.addresses.repositories import AddressRepository
+from app.crud.beer_dispensers.repositories import BeerDispenserRepository
+from app.crud.beer_types.repositories import BeerTypeRepository
+from app.crud.companies.repositories import CompanyRepository
+from app.crud.customers.repositories import CustomerRepository
+from app.crud.cylinders.repositories import CylinderRepository
+from app.crud.extraction_kits.repositories import ExtractionKitRepository
+from app.crud.kegs.models import KegModel
+from app.crud.kegs.repositories import KegRepository
+from app.crud.reservations.repositories import ReservationRepository
+
+
+@contextmanager
+def capture_querysets():
+    """Record the querysets iterated by repository code."""
+    captured = []
+    original = QuerySet.__iter__
+
+    def recording_iter(queryset):
+        captured.append(queryset)
+        return original(queryset)
+
+    with patch.object(QuerySet, "__iter__", recording_iter):
+        yield captured
+
+
+class TestIndexes(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def test_build_creates_partial_compound_indexes(self):
+        build_indexes([KegModel])
+        info = KegModel._get_collection().index_information()
+        self.assertIn("company_id_1_status_1_number_1", info)
+        self.assertEqual(
+            info["company_id_1_status_1_number_1"]["partialFilterExpression"],
+            {"is_active": True},
+        )
+
+    def test_report_flags_missing_and_undeclared_indexes(self):
+        build_indexes([KegModel])
+        collection = KegModel._get_collection()
+        collection.drop_index("company_id_1_number_1")
+        collection.create_index("status")
+
+        report = report_indexes([KegModel])[0]
+
+        self.assertEqual(report.collection, "kegs")
+        self.assertEqual(report.missing, ["company_id_1_number_1"])
+        self.assertEqual(report.undeclared, ["status_1"])
+
+    def test_every_model_declares_indexes(self):
+        for model in get_models():
+            self.assertTrue(model._meta["index_specs"], model.__name__)
+
+    def test_select_all_queries_use_an_index(self):
+        calls = [
+            lambda: KegRepository().select_all("com1"),
+            lambda: KegRepository().select_all("com1", status="AVAILABLE"),
+            lambda: CylinderRepository().select_all("com1"),
+            lambda: BeerDispenserRepository().select_all("com1"),
+            lambda: ExtractionKitRepository().select_all("com1"),
+            lambda: BeerTypeRepository().select_all("com1"),
+            lambda: CustomerRepository().select_all("com1"),
+            lambda: AddressRepository().select_all("com1"),
+            lambda: CompanyRepository().select_all(),
+            lambda: ReservationRepository().select_all("com1"),
+            lambda: ReservationRepository().select_all(
+                "com1",
+                start_date=UTCDateTime(2024, 1, 1),
+                end_date=UTCDateTime(2024, 12, 31),
+                status="RESERVED",
+            ),
+        ]
+
+        for call in calls:
+            with capture_querysets() as captured:
+                asyncio.run(call())
+
+            self.assertTrue(captured)
+            for queryset in captured:
+                plan = plan_query(
+                    queryset._document, queryset._query, queryset._ordering
+                )
+                with self.subTest(query=queryset._query):
+                    self.assertIsNotNone(plan.index)
+                    self.assertTrue(plan.covers_sort)
+
+
+if __name__ == "__main__":
+    unittest.main()
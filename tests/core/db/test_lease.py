@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+from datetime import timedelta
+
+import mongomock
+from mongoengine import connect, disconnect, get_db
+
+from app.core.db.lease import Lease
+from app.core.utils.periodic_task import PeriodicTask
+from app.core.utils.utc_datetime import UTCDateTime
+
+
+class TestLease(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        get_db()["job_leases"].delete_many({})
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def test_only_one_owner_holds_the_lease_until_it_expires(self):
+        first, second = Lease("archive", ttl=60), Lease("archive", ttl=60)
+
+        self.assertTrue(first.acquire())
+        self.assertFalse(second.acquire())
+        self.assertTrue(first.acquire())
+        self.assertTrue(Lease("compact", ttl=60).acquire())
+
+        get_db()["job_leases"].update_one(
+            {"_id": "archive"},
+            {"$set": {"expires_at": UTCDateTime.now() - timedelta(seconds=1)}},
+        )
+        self.assertTrue(second.acquire())
+        self.assertFalse(first.acquire())
+
+    def test_periodic_task_skips_the_tick_without_the_lease(self):
+        runs = []
+        Lease("archive", ttl=60).acquire()
+        task = PeriodicTask(
+            "archive", lambda: runs.append(1), interval=60, lease=Lease("archive", ttl=60)
+        )
+
+        task._tick()
+        self.assertEqual(runs, [])
+
+        task.lease = Lease("compact", ttl=60)
+        task._tick()
+        self.assertEqual(runs, [1])
+
+    def test_periodic_task_waits_for_the_delay_before_the_first_run(self):
+        runs = []
+
+        async def run():
+            task = PeriodicTask("archive", lambda: runs.append(1), interval=60, delay=60)
+            task.start()
+            await asyncio.sleep(0.05)
+            await task.stop()
+
+        asyncio.run(run())
+        self.assertEqual(runs, [])
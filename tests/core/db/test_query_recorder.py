@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from types import SimpleNamespace
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.db.query_recorder import (
+    NPlusOneError,
+    QueryRecorderListener,
+    assert_no_n_plus_one,
+    query_shape,
+    record_queries,
+)
+from app.crud.kegs.models import KegModel
+from app.crud.kegs.repositories import KegRepository
+
+
+class TestQueryRecorder(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        self.repository = KegRepository()
+        self.keg_ids = []
+        for number in range(5):
+            keg = KegModel(
+                number=str(number),
+                size_l=30,
+                beer_type_id="bee1",
+                cost_price_per_l=Decimal("10"),
+                status="AVAILABLE",
+                company_id="com1",
+            )
+            keg.save()
+            self.keg_ids.append(keg.id)
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def test_query_shape_blanks_values(self):
+        self.assertEqual(
+            query_shape({"_id": "keg_1", "company_id": "com1", "status": {"$in": ["A", "B"]}}),
+            {"_id": "?", "company_id": "?", "status": {"$in": "?"}},
+        )
+        self.assertEqual(
+            query_shape({"_id": "keg_1"}), query_shape({"_id": "keg_2"})
+        )
+
+    def test_per_item_queries_are_reported(self):
+        async def load_one_by_one():
+            for keg_id in self.keg_ids:
+                await self.repository.select_by_id(keg_id, "com1")
+
+        with self.assertRaises(NPlusOneError) as context:
+            with assert_no_n_plus_one(threshold=3):
+                asyncio.run(load_one_by_one())
+
+        self.assertIn("5x kegs.find", str(context.exception))
+
+    def test_batch_query_passes(self):
+        with assert_no_n_plus_one(threshold=1) as recorder:
+            kegs = asyncio.run(self.repository.select_by_ids(self.keg_ids, "com1"))
+
+        self.assertEqual(len(kegs), 5)
+        self.assertEqual(len(recorder.queries), 1)
+
+    def test_listener_records_pymongo_commands(self):
+        listener = QueryRecorderListener()
+
+        with record_queries(threshold=1) as recorder:
+            for keg_id in self.keg_ids[:2]:
+                listener.started(
+                    SimpleNamespace(
+                        command_name="find",
+                        command={"find": "kegs", "filter": {"_id": keg_id}},
+                    )
+                )
+            listener.started(SimpleNamespace(command_name="ping", command={"ping": 1}))
+
+        self.assertEqual(len(recorder.queries), 2)
+        self.assertEqual(recorder.repeated()[0][1], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import asyncio
+import unittest
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from mongomock.collection import Collection
+
+from app.core.db.read_preference import analytics_read_preference, build_read_preference
+from app.crud.customers.models import CustomerModel
+from app.crud.customers.repositories import CustomerRepository
+from app.crud.payments.services import PaymentServices
+from app.crud.reservations.models import ReservationModel
+from app.crud.reservations.repositories import ReservationRepository
+from app.crud.reservations.schemas import ReservationStatus
+
+
+@contextmanager
+def replica_set_reads():
+    """Replica set stand-in: record the read preference of every read."""
+    reads = []
+    find = Collection.find
+    aggregate = Collection.aggregate
+
+    def recording_find(collection, *args, **kwargs):
+        reads.append((collection.name, collection.read_preference.name))
+        return find(collection, *args, **kwargs)
+
+    def recording_aggregate(collection, *args, **kwargs):
+        reads.append((collection.name, collection.read_preference.name))
+        return aggregate(collection, *args, **kwargs)
+
+    with patch.object(Collection, "find", recording_find), patch.object(
+        Collection, "aggregate", recording_aggregate
+    ):
+        yield reads
+
+
+class TestBuildReadPreference(unittest.TestCase):
+    def test_secondary_keeps_staleness_bound(self):
+        preference = build_read_preference("secondaryPreferred", 120)
+
+        self.assertEqual(preference.name, "SecondaryPreferred")
+        self.assertEqual(preference.max_staleness, 120)
+
+    def test_primary_drops_staleness_bound(self):
+        preference = build_read_preference("primary", 90)
+
+        self.assertEqual(preference.name, "Primary")
+        self.assertEqual(preference.max_staleness, -1)
+
+    def test_analytics_default(self):
+        self.assertEqual(analytics_read_preference().name, "SecondaryPreferred")
+        self.assertEqual(analytics_read_preference().max_staleness, 90)
+
+
+class TestReadRouting(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        customer = CustomerModel(name="John", document="10000000019", company_id="com1")
+        customer.save()
+
+        delivery = datetime.now() + timedelta(days=3)
+        self.reservation = ReservationModel(
+            customer_id=str(customer.id),
+            address_id="add1",
+            beer_dispenser_ids=["bsd1"],
+            keg_ids=["keg1"],
+            extractor_ids=["ext1"],
+            extraction_kit_ids=["prg1"],
+            cylinder_ids=["cyl1"],
+            freight_value=0,
+            additional_value=0,
+            discount=0,
+            delivery_date=delivery,
+            pickup_date=delivery + timedelta(days=1),
+            payments=[],
+            total_value=Decimal("100.0"),
+            total_cost=Decimal("0.0"),
+            status=ReservationStatus.RESERVED.value,
+            company_id="com1",
+        )
+        self.reservation.save()
+        self.repository = ReservationRepository()
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def test_payment_summary_reads_from_secondaries(self):
+        services = PaymentServices(self.repository, CustomerRepository())
+
+        with replica_set_reads() as reads:
+            payments = asyncio.run(services.search_all(company_id="com1"))
+
+        self.assertEqual(len(payments), 1)
+        self.assertEqual(
+            set(reads),
+            {("reservations", "SecondaryPreferred"), ("customers", "SecondaryPreferred")},
+        )
+
+    def test_read_your_writes_paths_stay_on_primary(self):
+        with replica_set_reads() as reads:
+            asyncio.run(
+                self.repository.select_by_id(id=str(self.reservation.id), company_id="com1")
+            )
+            asyncio.run(
+                self.repository.find_beer_dispenser_conflict(
+                    company_id="com1",
+                    beer_dispenser_ids=["bsd1"],
+                    delivery_date=self.reservation.delivery_date,
+                    pickup_date=self.reservation.pickup_date,
+                )
+            )
+            asyncio.run(CustomerRepository().select_by_ids([self.reservation.customer_id], "com1"))
+
+        self.assertTrue(reads)
+        self.assertEqual({preference for _, preference in reads}, {"Primary"})
@@ -0,0 +1,69 @@
+import unittest
+from datetime import datetime, timedelta
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.db.retention import compact_tombstones, graveyard
+from app.crud.beer_types.models import BeerTypeModel
+
+
+class TestCompactTombstones(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        BeerTypeModel.drop_collection()
+        graveyard(BeerTypeModel).delete_many({})
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def _beer_type(self, name: str, deleted_days_ago: int | None = None) -> BeerTypeModel:
+        beer_type = BeerTypeModel(name=name, company_id="com1")
+        beer_type.save()
+        if deleted_days_ago is not None:
+            beer_type.soft_delete()
+            beer_type.save()
+            BeerTypeModel._get_collection().update_one(
+                {"_id": beer_type.id},
+                {
+                    "$set": {
+                        "updated_at": datetime.now() - timedelta(days=deleted_days_ago)
+                    }
+                },
+            )
+        return beer_type
+
+    def test_dry_run_reports_without_moving(self):
+        self._beer_type("IPA", deleted_days_ago=120)
+        self._beer_type("Stout", deleted_days_ago=10)
+        self._beer_type("Lager")
+
+        [report] = compact_tombstones(days=90, models=[BeerTypeModel], dry_run=True)
+
+        self.assertEqual(report.collection, "beer_types")
+        self.assertEqual(report.tombstones, 1)
+        self.assertGreater(report.reclaimable_bytes, 0)
+        self.assertEqual(report.moved, 0)
+        self.assertEqual(BeerTypeModel.objects.count(), 3)
+
+    def test_moves_old_tombstones_to_the_graveyard(self):
+        old = self._beer_type("IPA", deleted_days_ago=120)
+        recent = self._beer_type("Stout", deleted_days_ago=10)
+        live = self._beer_type("Lager")
+
+        [report] = compact_tombstones(days=90, models=[BeerTypeModel])
+
+        self.assertEqual(report.moved, 1)
+        self.assertEqual(
+            sorted(BeerTypeModel.objects.scalar("id")), sorted([recent.id, live.id])
+        )
+        buried = graveyard(BeerTypeModel).find_one({"_id": old.id})
+        self.assertEqual(buried["name"], "IPA")
+        self.assertFalse(buried["is_active"])
+
+        [report] = compact_tombstones(days=90, models=[BeerTypeModel])
+        self.assertEqual((report.tombstones, report.moved), (0, 0))
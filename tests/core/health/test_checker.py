@@ -0,0 +1,117 @@
+import asyncio
+import time
+import unittest
+
+from unittest.mock import patch
+
+from pymongo import MongoClient
+from pymongo.database import Database
+
+from app.core.health import EventLoopMonitor, HealthChecker, event_loop_probe, mongo_probe
+
+
+class TestHealthChecker(unittest.TestCase):
+    def test_results_are_cached_and_shared_between_callers(self):
+        calls = 0
+
+        async def probe():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"latency_ms": 1}
+
+        checker = HealthChecker({"mongo": probe}, ttl=60)
+
+        async def run():
+            await asyncio.gather(*(checker.check() for _ in range(5)))
+            return await checker.check()
+
+        report = asyncio.run(run())
+
+        self.assertEqual(calls, 1)
+        self.assertTrue(report.healthy)
+        self.assertEqual(report.checks["mongo"].details, {"latency_ms": 1})
+
+    def test_expired_results_are_probed_again(self):
+        calls = 0
+
+        async def probe():
+            nonlocal calls
+            calls += 1
+            return {}
+
+        checker = HealthChecker({"mongo": probe}, ttl=0)
+
+        async def run():
+            await checker.check()
+            await checker.check()
+
+        asyncio.run(run())
+        self.assertEqual(calls, 2)
+
+    def test_failures_and_timeouts_are_unhealthy(self):
+        async def failing():
+            raise ConnectionError("refused")
+
+        async def slow():
+            await asyncio.sleep(1)
+            return {}
+
+        async def degraded():
+            return {"healthy": False, "lag_ms": 900}
+
+        checker = HealthChecker(
+            {"failing": failing, "slow": slow, "degraded": degraded}, timeout=0.05
+        )
+        report = asyncio.run(checker.check())
+
+        self.assertFalse(report.healthy)
+        self.assertEqual(report.checks["failing"].details, {"error": "refused"})
+        self.assertEqual(report.checks["slow"].details, {"error": "TimeoutError"})
+        self.assertFalse(report.checks["degraded"].healthy)
+        self.assertEqual(report.checks["degraded"].details, {"lag_ms": 900})
+
+    def test_subset_of_probes(self):
+        async def probe():
+            return {}
+
+        checker = HealthChecker({"mongo": probe, "jwks": probe})
+        report = asyncio.run(checker.check(["mongo"]))
+
+        self.assertEqual(list(report.checks), ["mongo"])
+
+
+class TestProbes(unittest.TestCase):
+    def test_mongo_probe_reports_ping_and_pool(self):
+        client = MongoClient("mongodb://db.internal:27017", connect=False, maxPoolSize=20)
+        self.addCleanup(client.close)
+
+        with patch("app.core.health.probes.get_connection", return_value=client), patch.object(
+            Database, "command", return_value={"ok": 1}
+        ) as command:
+            details = asyncio.run(mongo_probe()())
+
+        command.assert_called_once_with("ping")
+        self.assertGreaterEqual(details["latency_ms"], 0)
+        self.assertEqual(details["pool"], {"max_size": 20, "min_size": 0})
+        self.assertEqual(details["servers"][0]["address"], "db.internal:27017")
+
+    def test_event_loop_probe_flags_blocked_loop(self):
+        monitor = EventLoopMonitor(interval=0.01)
+        probe = event_loop_probe(monitor, max_lag=0.05)
+
+        async def run():
+            monitor.start()
+            await asyncio.sleep(0.02)
+            time.sleep(0.1)
+            await asyncio.sleep(0.02)
+            blocked = await probe()
+            idle = await probe()
+            await monitor.stop()
+            return blocked, idle
+
+        blocked, idle = asyncio.run(run())
+
+        self.assertFalse(blocked["healthy"])
+        self.assertGreaterEqual(blocked["max_lag_ms"], 50)
+        self.assertTrue(idle["healthy"])
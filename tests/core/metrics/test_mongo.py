@@ -0,0 +1,50 @@
+import unittest
+from types import SimpleNamespace
+
+from app.core.metrics import (
+    MONGO_POOL_CHECKOUT_FAILURES,
+    MONGO_POOL_CHECKOUT_WAIT,
+    MONGO_POOL_CONNECTIONS,
+    MONGO_POOL_UTILIZATION,
+    MongoPoolListener,
+)
+
+ADDRESS = ("pool-test", 27017)
+LABEL = "pool-test:27017"
+
+
+def event(**kwargs):
+    return SimpleNamespace(address=ADDRESS, connection_id=1, **kwargs)
+
+
+class TestMongoPoolListener(unittest.TestCase):
+    def test_tracks_checkout_wait_and_utilization(self):
+        listener = MongoPoolListener(max_pool_size=4)
+        waits = MONGO_POOL_CHECKOUT_WAIT.count(address=LABEL)
+
+        listener.pool_created(event(options={}))
+        listener.connection_created(event())
+        listener.connection_created(event())
+        listener.connection_checked_out(event(duration=0.002))
+        listener.connection_checked_out(event(duration=0.2))
+
+        self.assertEqual(MONGO_POOL_CONNECTIONS.value(address=LABEL, state="open"), 2)
+        self.assertEqual(MONGO_POOL_CONNECTIONS.value(address=LABEL, state="in_use"), 2)
+        self.assertEqual(MONGO_POOL_UTILIZATION.value(address=LABEL), 0.5)
+        self.assertEqual(MONGO_POOL_CHECKOUT_WAIT.count(address=LABEL), waits + 2)
+
+        listener.connection_checked_in(event())
+        listener.connection_closed(event(reason="idle"))
+
+        self.assertEqual(MONGO_POOL_CONNECTIONS.value(address=LABEL, state="open"), 1)
+        self.assertEqual(MONGO_POOL_UTILIZATION.value(address=LABEL), 0.25)
+
+    def test_counts_checkout_failures(self):
+        listener = MongoPoolListener(max_pool_size=4)
+        before = MONGO_POOL_CHECKOUT_FAILURES.value(address=LABEL, reason="timeout")
+
+        listener.connection_check_out_failed(event(reason="timeout", duration=5.0))
+
+        self.assertEqual(
+            MONGO_POOL_CHECKOUT_FAILURES.value(address=LABEL, reason="timeout"), before + 1
+        )
@@ -0,0 +1,74 @@
+import unittest
+from types import SimpleNamespace
+
+from app.core.metrics import (
+    MONGO_COMMAND_DURATION,
+    MetricsRegistry,
+    MongoCommandListener,
+    get_request_stats,
+    start_request_stats,
+)
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_render_prometheus_text(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("cache_total", "Lookups.", labels=("cache",))
+        histogram = registry.histogram(
+            "latency_seconds", "Latency.", labels=("route",), buckets=(0.1, 1.0)
+        )
+
+        counter.inc(cache="jwks")
+        counter.inc(cache="jwks")
+        histogram.observe(0.05, route='/api/"kegs"')
+        histogram.observe(0.5, route='/api/"kegs"')
+        histogram.observe(5, route='/api/"kegs"')
+
+        text = registry.render()
+
+        self.assertIn("# TYPE cache_total counter", text)
+        self.assertIn('cache_total{cache="jwks"} 2', text)
+        self.assertIn('latency_seconds_bucket{route="/api/\\"kegs\\"",le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{route="/api/\\"kegs\\"",le="1.0"} 2', text)
+        self.assertIn('latency_seconds_bucket{route="/api/\\"kegs\\"",le="+Inf"} 3', text)
+        self.assertIn('latency_seconds_count{route="/api/\\"kegs\\""} 3', text)
+        self.assertIn('latency_seconds_sum{route="/api/\\"kegs\\""} 5.55', text)
+
+    def test_render_adds_labels_to_every_sample(self):
+        registry = MetricsRegistry()
+        registry.counter("cache_total", "Lookups.", labels=("cache",)).inc(cache="a b")
+        registry.gauge("pool_size", "Pool size.").set(3)
+        registry.histogram("latency_seconds", "Latency.", buckets=(1.0,)).observe(0.5)
+
+        text = registry.render({"worker": "42"})
+
+        self.assertIn('cache_total{cache="a b",worker="42"} 1', text)
+        self.assertIn('pool_size{worker="42"} 3', text)
+        self.assertIn('latency_seconds_bucket{le="1.0",worker="42"} 1', text)
+        self.assertIn('latency_seconds_count{worker="42"} 1', text)
+
+    def test_duplicated_metric_is_rejected(self):
+        registry = MetricsRegistry()
+        registry.gauge("pool_size", "Pool size.")
+
+        with self.assertRaises(ValueError):
+            registry.gauge("pool_size", "Pool size.")
+
+    def test_command_listener_records_request_stats(self):
+        listener = MongoCommandListener()
+        before = MONGO_COMMAND_DURATION.count(command="find", status="success")
+
+        stats = start_request_stats()
+        listener.succeeded(SimpleNamespace(command_name="find", duration_micros=1500))
+        listener.failed(SimpleNamespace(command_name="find", duration_micros=500))
+
+        self.assertIs(get_request_stats(), stats)
+        self.assertEqual(stats.commands, 2)
+        self.assertAlmostEqual(stats.duration, 0.002)
+        self.assertEqual(
+            MONGO_COMMAND_DURATION.count(command="find", status="success"), before + 1
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
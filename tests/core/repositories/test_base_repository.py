@@ -0,0 +1,195 @@
+import asyncio
+import unittest
+from datetime import datetime
+from decimal import Decimal
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.db.query_recorder import record_queries
+from app.core.exceptions import ConflictError, NotFoundError
+from app.core.repositories.base_repository import Repository
+from app.crud.kegs.models import KegModel
+from app.crud.kegs.repositories import KegRepository
+
+
+class TestFindAndUpdate(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        KegModel.drop_collection()
+        self.keg = KegModel(
+            number="1",
+            size_l=30,
+            beer_type_id="bty_1",
+            cost_price_per_l=Decimal("9.50"),
+            sale_price_per_l=Decimal("18.00"),
+            status="AVAILABLE",
+            company_id="com1",
+        )
+        self.keg.save()
+        KegModel._get_collection().update_one(
+            {"_id": self.keg.id}, {"$set": {"updated_at": datetime(2024, 1, 1)}}
+        )
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def test_returns_the_updated_document(self):
+        model = Repository.find_and_update(
+            KegModel, {"id": self.keg.id, "company_id": "com1"}, {"number": "2"}
+        )
+
+        self.assertEqual(model.number, "2")
+        self.assertGreater(model.updated_at.replace(tzinfo=None), datetime(2024, 1, 1))
+        self.assertEqual(KegModel.objects(id=self.keg.id).first().number, "2")
+
+    def test_is_scoped_to_active_documents_of_the_company(self):
+        self.assertIsNone(
+            Repository.find_and_update(
+                KegModel, {"id": self.keg.id, "company_id": "com2"}, {"number": "2"}
+            )
+        )
+
+        KegModel.objects(id=self.keg.id).update_one(set__is_active=False)
+        self.assertIsNone(
+            Repository.find_and_update(
+                KegModel, {"id": self.keg.id, "company_id": "com1"}, {"number": "2"}
+            )
+        )
+
+    def test_repository_update_is_one_round_trip(self):
+        with record_queries() as recorder:
+            keg = asyncio.run(
+                KegRepository().update(self.keg.id, "com1", {"number": "7"})
+            )
+
+        self.assertEqual(keg.number, "7")
+        self.assertEqual(
+            [operation for _, operation, _ in recorder.queries], ["find_one_and_update"]
+        )
+
+        with self.assertRaises(NotFoundError):
+            asyncio.run(KegRepository().update("keg_missing", "com1", {"number": "7"}))
+
+    def test_writes_when_the_version_matches(self):
+        model = Repository.find_and_update(
+            KegModel, {"id": self.keg.id, "company_id": "com1"}, {"number": "2"}, version=1
+        )
+
+        self.assertEqual(model.number, "2")
+        self.assertEqual(model.version, 2)
+
+    def test_stale_version_raises_a_conflict_with_the_current_version(self):
+        Repository.find_and_update(
+            KegModel, {"id": self.keg.id, "company_id": "com1"}, {"number": "2"}
+        )
+
+        with self.assertRaises(ConflictError) as context:
+            Repository.find_and_update(
+                KegModel, {"id": self.keg.id, "company_id": "com1"}, {"number": "3"}, version=1
+            )
+
+        self.assertEqual(context.exception.current_version, 2)
+        self.assertEqual(KegModel.objects(id=self.keg.id).first().number, "2")
+
+    def test_missing_document_is_not_a_conflict(self):
+        self.assertIsNone(
+            Repository.find_and_update(
+                KegModel, {"id": "keg_missing", "company_id": "com1"}, {"number": "2"}, version=1
+            )
+        )
+
+    def test_documents_without_a_version_match_the_first_one(self):
+        KegModel._get_collection().update_one({"_id": self.keg.id}, {"$unset": {"version": ""}})
+
+        model = Repository.find_and_update(
+            KegModel, {"id": self.keg.id, "company_id": "com1"}, {"number": "2"}, version=1
+        )
+
+        self.assertEqual(model.version, 2)
+
+    def test_first_unversioned_write_of_a_legacy_document_advances_it(self):
+        collection = KegModel._get_collection()
+        filters = {"id": self.keg.id, "company_id": "com1"}
+        for fields in ({"number": "2"}, {"set__notes": "x"}):
+            collection.update_one({"_id": self.keg.id}, {"$unset": {"version": ""}})
+
+            model = Repository.find_and_update(KegModel, filters, fields)
+
+            self.assertEqual(model.version, 2)
+            with self.assertRaises(ConflictError):
+                Repository.find_and_update(KegModel, filters, {"number": "3"}, version=1)
+
+    def test_versioned_set_bumps_the_version_of_bulk_writes(self):
+        other = KegModel(
+            number="2",
+            size_l=30,
+            beer_type_id="bty_1",
+            cost_price_per_l=Decimal("9.50"),
+            status="AVAILABLE",
+            company_id="com1",
+        )
+        other.save()
+        KegModel._get_collection().update_one({"_id": other.id}, {"$unset": {"version": ""}})
+
+        KegModel.objects(company_id="com1").update(
+            __raw__=Repository.versioned_set(KegModel, status="IN_USE", notes="$5 off")
+        )
+
+        for keg in KegModel.objects(company_id="com1"):
+            self.assertEqual((keg.status, keg.notes, keg.version), ("IN_USE", "$5 off", 2))
+
+
+class TestSaveVersion(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        KegModel.drop_collection()
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def _keg(self) -> KegModel:
+        keg = KegModel(
+            number="1",
+            size_l=30,
+            beer_type_id="bty_1",
+            cost_price_per_l=Decimal("9.50"),
+            sale_price_per_l=Decimal("18.00"),
+            status="AVAILABLE",
+            company_id="com1",
+        )
+        keg.save()
+        return keg
+
+    def test_save_bumps_the_version(self):
+        keg = self._keg()
+        self.assertEqual(keg.version, 1)
+
+        keg.number = "2"
+        keg.save()
+
+        self.assertEqual(keg.version, 2)
+        self.assertEqual(KegModel.objects(id=keg.id).first().version, 2)
+
+    def test_save_of_a_stale_copy_raises_a_conflict(self):
+        keg = self._keg()
+        stale = KegModel.objects(id=keg.id).first()
+
+        keg.number = "2"
+        keg.save()
+
+        stale.number = "3"
+        with self.assertRaises(ConflictError) as context:
+            stale.save()
+
+        self.assertEqual(context.exception.current_version, 2)
+        self.assertEqual(stale.version, 1)
+        self.assertEqual(KegModel.objects(id=keg.id).first().number, "2")
@@ -0,0 +1,31 @@
+import unittest
+
+from app.core.utils.search import build_search_keys, normalize_text, search_terms
+
+
+class TestSearch(unittest.TestCase):
+    def test_normalize_text_folds_accents_case_and_spaces(self):
+        self.assertEqual(normalize_text("  João  da SILVA Çé "), "joao da silva ce")
+
+    def test_build_search_keys(self):
+        keys = build_search_keys(
+            texts=["José Álvares", "Jose@Example.com"],
+            numbers=["123.456.789-09", "(47) 99988-7766", None],
+        )
+        self.assertEqual(
+            keys,
+            [
+                "jose alvares",
+                "jose",
+                "alvares",
+                "jose@example.com",
+                "12345678909",
+                "47999887766",
+            ],
+        )
+
+    def test_search_terms(self):
+        self.assertEqual(search_terms("Álv JOS"), ["alv", "jos"])
+        self.assertEqual(search_terms("123.456"), ["123456"])
+        self.assertEqual(search_terms("(47) 9998"), ["479998"])
+        self.assertEqual(search_terms("   "), [])
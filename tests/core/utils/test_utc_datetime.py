@@ -0,0 +1,68 @@
+import copy
+import pickle
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from app.core.utils.utc_datetime import UTCDateTime
+
+BRT = timezone(timedelta(hours=-3))
+
+
+class TestUTCDateTime(unittest.TestCase):
+    def test_constructor_converts_other_timezones(self):
+        value = UTCDateTime(2025, 9, 1, 15, 0, tzinfo=BRT)
+
+        self.assertIs(value.tzinfo, timezone.utc)
+        self.assertEqual(value.hour, 18)
+
+    def test_arithmetic_and_copies_keep_type(self):
+        value = UTCDateTime(2025, 9, 1, 18, 0)
+
+        for result in (
+            value + timedelta(days=1),
+            value.replace(hour=3),
+            copy.deepcopy(value),
+            pickle.loads(pickle.dumps(value)),
+        ):
+            self.assertIsInstance(result, UTCDateTime)
+            self.assertIs(result.tzinfo, timezone.utc)
+
+        self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+
+    def test_validate_strings(self):
+        expected = UTCDateTime(2025, 9, 1, 18, 31, 47, 914000)
+
+        self.assertEqual(UTCDateTime.validate_datetime("2025-09-01T18:31:47.914Z"), expected)
+        self.assertEqual(
+            UTCDateTime.validate_datetime("2025-09-01T15:31:47.914-03:00"), expected
+        )
+        self.assertEqual(UTCDateTime.validate_datetime("2025-09-01T18:31:47.914"), expected)
+        with self.assertRaises(ValueError):
+            UTCDateTime.validate_datetime("not a date")
+
+    def test_validate_datetimes(self):
+        value = UTCDateTime(2025, 9, 1, 18, 0)
+
+        self.assertIs(UTCDateTime.validate_datetime(value), value)
+        naive = value.replace(tzinfo=None)
+        self.assertIs(UTCDateTime.validate_datetime(naive).tzinfo, timezone.utc)
+        self.assertEqual(UTCDateTime.validate_datetime(datetime(2025, 9, 1, 18, 0)), value)
+        self.assertEqual(
+            UTCDateTime.validate_datetime(datetime(2025, 9, 1, 15, 0, tzinfo=BRT)), value
+        )
+        with self.assertRaises(ValueError):
+            UTCDateTime.validate_datetime(1)
+
+    def test_str_and_now(self):
+        value = UTCDateTime(2025, 9, 1, 18, 31, 47, 914567)
+        self.assertEqual(str(value), "2025-09-01T18:31:47.914Z")
+        self.assertEqual(str(UTCDateTime(2025, 9, 1)), "2025-09-01T00:00:00.000Z")
+
+        now = UTCDateTime.now()
+        self.assertIsInstance(now, UTCDateTime)
+        self.assertIs(now.tzinfo, timezone.utc)
+        self.assertEqual(now.microsecond % 1000, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
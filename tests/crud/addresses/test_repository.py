@@ -7,6 +7,7 @@ from mongoengine import connect, disconnect
 from app.crud.addresses.repositories import AddressRepository
 from app.crud.addresses.models import AddressModel
 from app.crud.addresses.schemas import Address
+from app.core.db.indexes import plan_query
 from app.core.exceptions import NotFoundError
 
 
@@ -89,6 +90,35 @@ class TestAddressRepository(unittest.TestCase):
         res = asyncio.run(repository.select_by_zip_code("12345", "com1"))
         self.assertEqual(res.id, doc.id)
 
+    def test_select_by_zip_code_matches_any_format(self):
+        doc = AddressModel(**self._build_address("89010-000").model_dump(), company_id="com1")
+        doc.save()
+        self.assertEqual(doc.postal_code_key, "89010000")
+        repository = AddressRepository()
+
+        for zip_code in ("89010000", "89010-000", " 89010 000"):
+            res = asyncio.run(repository.select_by_zip_code(zip_code, "com1"))
+            self.assertEqual(res.id, doc.id)
+
+    def test_update_address_refreshes_postal_code_key(self):
+        doc = AddressModel(**self._build_address("89010-000").model_dump(), company_id="com1")
+        doc.save()
+        repository = AddressRepository()
+        asyncio.run(repository.update(doc.id, "com1", {"postal_code": "01001-000"}))
+
+        res = asyncio.run(repository.select_by_zip_code("01001000", "com1"))
+        self.assertEqual(res.id, doc.id)
+        self.assertIsNone(
+            asyncio.run(repository.select_by_zip_code("89010000", "com1", raise_404=False))
+        )
+
+    def test_select_by_zip_code_uses_postal_code_key_index(self):
+        plan = plan_query(
+            AddressModel,
+            {"postal_code_key": "89010000", "company_id": "com1", "is_active": True},
+        )
+        self.assertEqual(plan.index, "company_id_1_postal_code_key_1")
+
     def test_select_by_zip_code_not_found(self):
         repository = AddressRepository()
         with self.assertRaises(NotFoundError):
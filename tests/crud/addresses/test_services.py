@@ -9,8 +9,13 @@ from app.crud.addresses.services import AddressServices
 from app.crud.addresses.schemas import Address, UpdateAddress
 from app.crud.addresses.models import AddressModel
 from app.core.exceptions import NotFoundError
+from app.core.exceptions.internal import InternalErrorException
+from app.crud.postal_codes.models import PostalCodeModel
+from app.crud.postal_codes.repositories import PostalCodeRepository
 from unittest.mock import patch
 
+import httpx
+
 
 class TestAddressServices(unittest.TestCase):
     def setUp(self) -> None:
@@ -20,6 +25,8 @@ class TestAddressServices(unittest.TestCase):
             mongo_client_class=mongomock.MongoClient,
         )
         AddressModel.drop_collection()
+        PostalCodeModel.drop_collection()
+        PostalCodeRepository.clear_local_cache()
         self.repository = AddressRepository()
         self.services = AddressServices(self.repository)
 
@@ -93,6 +100,61 @@ class TestAddressServices(unittest.TestCase):
         self.assertEqual(res.postal_code, "99999-000")
         mock_get.assert_called_once()
 
+    @patch("app.api.dependencies.get_address_by_zip_code.get_address_by_zip_code")
+    def test_search_by_zip_code_caches_valid_cep(self, mock_get):
+        mock_get.return_value = {
+            "cep": "89010-000",
+            "logradouro": "Rua XV de Novembro",
+            "complemento": "",
+            "bairro": "Centro",
+            "localidade": "Blumenau",
+            "uf": "SC",
+        }
+        first = asyncio.run(self.services.search_by_zip_code("89010-000", "com1"))
+
+        # Another instance (services are built per request), other format.
+        services = AddressServices(AddressRepository())
+        second = asyncio.run(services.search_by_zip_code("89010000", "com1"))
+
+        PostalCodeRepository.clear_local_cache()
+        third = asyncio.run(services.search_by_zip_code(" 89010 000", "com1"))
+
+        mock_get.assert_called_once_with(zip_code="89010000")
+        self.assertEqual(first, second)
+        self.assertEqual(third.city, "Blumenau")
+        self.assertEqual(third.postal_code, "89010-000")
+
+    @patch("app.api.dependencies.get_address_by_zip_code.get_address_by_zip_code")
+    def test_search_by_zip_code_caches_not_found(self, mock_get):
+        mock_get.return_value = {"erro": True}
+
+        for _ in range(2):
+            with self.assertRaises(NotFoundError):
+                asyncio.run(self.services.search_by_zip_code("00000-000", "com1"))
+
+        mock_get.assert_called_once()
+
+    @patch("app.api.dependencies.get_address_by_zip_code.get_address_by_zip_code")
+    def test_search_by_zip_code_falls_back_to_nearby_cep(self, mock_get):
+        mock_get.return_value = {
+            "cep": "89010-100",
+            "logradouro": "Rua XV de Novembro",
+            "bairro": "Centro",
+            "localidade": "Blumenau",
+            "uf": "SC",
+        }
+        asyncio.run(self.services.search_by_zip_code("89010-100", "com1"))
+
+        mock_get.side_effect = httpx.ConnectTimeout("timed out")
+        result = asyncio.run(self.services.search_by_zip_code("89010-200", "com1"))
+
+        self.assertEqual(result.postal_code, "89010-200")
+        self.assertEqual(result.city, "Blumenau")
+        self.assertEqual(result.street, "")
+
+        with self.assertRaises(InternalErrorException):
+            asyncio.run(self.services.search_by_zip_code("01001-000", "com1"))
+
 
 if __name__ == "__main__":
     unittest.main()
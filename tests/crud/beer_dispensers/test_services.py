@@ -13,6 +13,7 @@ from app.crud.beer_dispensers.schemas import (
     Voltage,
 )
 from app.crud.beer_dispensers.models import BeerDispenserModel
+from app.core.db.query_recorder import assert_no_n_plus_one
 from app.core.exceptions import NotFoundError
 
 
@@ -68,6 +69,19 @@ class TestBeerDispenserServices(unittest.TestCase):
         res = asyncio.run(self.services.search_all("com1"))
         self.assertEqual(len(res), 1)
 
+    def test_search_all_loads_reservations_in_batch(self):
+        for index in range(5):
+            BeerDispenserModel(
+                **self._build_dispenser(serial_number=f"SN{index}").model_dump(),
+                company_id="com1",
+            ).save()
+
+        with assert_no_n_plus_one():
+            res = asyncio.run(self.services.search_all("com1"))
+
+        self.assertEqual(len(res), 5)
+        self.assertTrue(all(dispenser.reservation_id is None for dispenser in res))
+
     def test_update_dispenser(self):
         doc = BeerDispenserModel(**self._build_dispenser().model_dump(), company_id="com1")
         doc.save()
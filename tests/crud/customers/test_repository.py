@@ -4,7 +4,15 @@ import unittest
 import mongomock
 from mongoengine import connect, disconnect
 
-from app.crud.customers.repositories import CustomerRepository
+from datetime import date
+from decimal import Decimal
+
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.addresses.models import AddressModel
+from app.crud.customers.repositories import CustomerRepository, overview_pipeline
+from app.crud.payments.models import PaymentModel
+from app.crud.reservations.archive import ReservationArchive
+from app.crud.reservations.models import ReservationModel
 from app.crud.customers.models import CustomerModel
 from app.crud.customers.schemas import Customer
 from app.core.exceptions import NotFoundError, UnprocessableEntity
@@ -103,6 +111,146 @@ class TestCustomerRepository(unittest.TestCase):
         self.assertEqual(result.id, doc.id)
         self.assertFalse(CustomerModel.objects(id=doc.id).first().is_active)
 
+    def _create(self, name: str, document: str, **fields) -> None:
+        CustomerModel(
+            name=name, document=document, company_id=fields.pop("company_id", "com1"), **fields
+        ).save()
+
+    def test_search_by_prefix_ignoring_accents_and_case(self):
+        self._create("José Álvares", "10000000019", email="ze@example.com", mobile="(47) 99988-7766")
+        self._create("Maria Alves", "10000000108")
+        self._create("Josefina Alves", "10000000280", company_id="com2")
+        repository = CustomerRepository()
+
+        for query in ("jose", "ALVA", "álvares jo", "ze@ex", "100.000.000-1", "4799988"):
+            with self.subTest(query=query):
+                total, customers = asyncio.run(repository.search("com1", query))
+                self.assertEqual(total, 1)
+                self.assertEqual(customers[0].name, "José Álvares")
+
+        total, customers = asyncio.run(repository.search("com1", "alv"))
+        self.assertEqual(total, 2)
+        self.assertEqual([c.name for c in customers], ["José Álvares", "Maria Alves"])
+        self.assertEqual(asyncio.run(repository.search("com1", "silva")), (0, []))
+
+    def test_search_paginates(self):
+        for index, document in enumerate(("10000000019", "10000000108", "10000000280")):
+            self._create(f"Cliente {index}", document)
+        repository = CustomerRepository()
+
+        total, customers = asyncio.run(repository.search("com1", "cli", offset=2, limit=2))
+
+        self.assertEqual(total, 3)
+        self.assertEqual([c.name for c in customers], ["Cliente 2"])
+
+    def test_update_rebuilds_search_keys(self):
+        customer = asyncio.run(CustomerRepository().create(self._build_customer(), "com1"))
+        repository = CustomerRepository()
+        asyncio.run(repository.update(customer.id, "com1", {"name": "Ângela"}))
+
+        self.assertEqual(asyncio.run(repository.search("com1", "doe"))[0], 0)
+        self.assertEqual(asyncio.run(repository.search("com1", "angela"))[0], 1)
+
+    def _reservation(self, id: str, day: int, total: str, paid=(), **fields) -> None:
+        ReservationModel(
+            id=id,
+            customer_id=fields.pop("customer_id", "cus_1"),
+            address_id="add_1",
+            delivery_date=UTCDateTime(2024, 1, day),
+            pickup_date=UTCDateTime(2024, 1, day + 1),
+            total_value=Decimal(total),
+            payments=[
+                PaymentModel(amount=Decimal(amount), method="PIX", paid_at=date(2024, 1, day))
+                for amount in paid
+            ],
+            status="COMPLETED",
+            company_id=fields.pop("company_id", "com1"),
+            **fields,
+        ).save()
+
+    def test_select_overview(self):
+        for id, is_active in (("add_1", True), ("add_2", False)):
+            AddressModel(
+                id=id, postal_code="89010-000", street="Rua XV", number="1",
+                district="Centro", city="Blumenau", state="SC", company_id="com1",
+                is_active=is_active,
+            ).save()
+        CustomerModel(
+            id="cus_1", name="Ana", document="10000000019",
+            address_ids=["add_1", "add_2"], company_id="com1",
+        ).save()
+        self._reservation("res_1", 1, "100.10", paid=["100.10"])
+        self._reservation("res_2", 5, "200.20", paid=["50.10", "50.00"])
+        self._reservation("res_3", 9, "300.30")
+        self._reservation("res_4", 12, "999", is_active=False)
+        self._reservation("res_5", 15, "999", company_id="com2")
+        self._reservation("res_6", 18, "999", customer_id="cus_2")
+
+        overview = asyncio.run(
+            CustomerRepository().select_overview("cus_1", "com1", offset=1, limit=1)
+        )
+
+        self.assertEqual(overview.customer.id, "cus_1")
+        self.assertEqual([address.id for address in overview.addresses], ["add_1"])
+        self.assertEqual(len(overview.reservations), 1)
+        reservation = overview.reservations[0]
+        self.assertEqual(reservation.id, "res_2")
+        self.assertEqual(reservation.paid_value, Decimal("100.10"))
+        self.assertEqual(reservation.pending_value, Decimal("100.10"))
+        self.assertEqual(overview.balance.reservations, 3)
+        self.assertEqual(overview.balance.total_value, Decimal("600.60"))
+        self.assertEqual(overview.balance.paid_value, Decimal("200.20"))
+        self.assertEqual(overview.balance.pending_value, Decimal("400.40"))
+
+    def test_select_overview_includes_archived_reservations(self):
+        CustomerModel(id="cus_1", name="Ana", document="10000000019", company_id="com1").save()
+        self._reservation("res_1", 1, "100.10", paid=["100.10"])
+        self._reservation("res_2", 5, "200.20", paid=["50.10", "50.00"])
+        self._reservation("res_3", 9, "300.30")
+        self._reservation("res_4", 3, "999", paid=["999"], company_id="com2")
+        archive = ReservationArchive()
+        self.assertEqual(archive.archive(older_than=UTCDateTime(2024, 1, 7)), 2)
+        repository = CustomerRepository(archive=archive)
+
+        first = asyncio.run(repository.select_overview("cus_1", "com1", offset=0, limit=2))
+        last = asyncio.run(repository.select_overview("cus_1", "com1", offset=2, limit=2))
+
+        self.assertEqual([r.id for r in first.reservations], ["res_3", "res_2"])
+        self.assertEqual([r.id for r in last.reservations], ["res_1"])
+        self.assertEqual(last.reservations[0].paid_value, Decimal("100.10"))
+        self.assertEqual(first.balance.reservations, 3)
+        self.assertEqual(first.balance.total_value, Decimal("600.60"))
+        self.assertEqual(first.balance.paid_value, Decimal("200.20"))
+        self.assertEqual(first.balance.pending_value, Decimal("400.40"))
+
+    def test_select_overview_without_reservations(self):
+        CustomerModel(id="cus_1", name="Ana", document="10000000019", company_id="com1").save()
+
+        overview = asyncio.run(CustomerRepository().select_overview("cus_1", "com1"))
+
+        self.assertEqual(overview.customer.name, "Ana")
+        self.assertEqual(overview.reservations, [])
+        self.assertEqual(overview.balance.reservations, 0)
+        self.assertEqual(overview.balance.pending_value, Decimal("0"))
+
+    def test_overview_unwinds_right_after_the_reservation_lookup(self):
+        pipeline = overview_pipeline("cus_1", "com1", offset=0, limit=15)
+        stages = [next(iter(stage)) for stage in pipeline]
+        lookup = next(
+            index
+            for index, stage in enumerate(pipeline)
+            if stage.get("$lookup", {}).get("as") == "reservation"
+        )
+
+        self.assertEqual(pipeline[lookup + 1]["$unwind"]["path"], "$reservation")
+        self.assertNotIn("$sort", stages)
+
+    def test_select_overview_not_found(self):
+        CustomerModel(id="cus_1", name="Ana", document="10000000019", company_id="com1").save()
+
+        with self.assertRaises(NotFoundError):
+            asyncio.run(CustomerRepository().select_overview("cus_1", "com2"))
+
     def test_delete_customer_not_found(self):
         repository = CustomerRepository()
         with self.assertRaises(NotFoundError):
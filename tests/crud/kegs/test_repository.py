@@ -1,14 +1,19 @@
 import asyncio
+import os
 import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import patch
 
 import mongomock
 from mongoengine import connect, disconnect
 
-from app.crud.kegs.repositories import KegRepository
+from app.crud.kegs.repositories import KegRepository, stock_summary_pipeline
 from app.crud.kegs.models import KegModel
 from app.crud.kegs.schemas import Keg, KegStatus
 from app.crud.beer_types.models import BeerTypeModel
-from app.core.exceptions import NotFoundError
+from app.core.db.indexes import plan_query
+from app.core.exceptions import ConflictError, NotFoundError
 
 
 class TestKegRepository(unittest.TestCase):
@@ -81,6 +86,57 @@ class TestKegRepository(unittest.TestCase):
         self.assertEqual(len(res), 1)
         self.assertEqual(res[0].status, KegStatus.AVAILABLE)
 
+    def test_select_stock_summary_groups_by_beer_type_and_status(self):
+        ipa = BeerTypeModel(name="IPA", company_id="com1")
+        ipa.save()
+        pale_ale = str(self.beer_type.id)
+        kegs = [
+            ("1", pale_ale, KegStatus.AVAILABLE, 50, Decimal("50")),
+            ("2", pale_ale, KegStatus.AVAILABLE, 30, Decimal("30")),
+            ("3", pale_ale, KegStatus.IN_USE, 50, Decimal("12.5")),
+            ("4", str(ipa.id), KegStatus.EMPTY, 30, Decimal("0")),
+        ]
+        for number, beer_type_id, status, size, volume in kegs:
+            keg = self._build_keg(number)
+            keg.beer_type_id = beer_type_id
+            keg.status = status
+            keg.size_l = size
+            keg.current_volume_l = volume
+            KegModel(**keg.model_dump(), company_id="com1").save()
+        deleted = KegModel(**self._build_keg("5").model_dump(), company_id="com1")
+        deleted.soft_delete()
+        deleted.save()
+        KegModel(**self._build_keg("6").model_dump(), company_id="com2").save()
+
+        summary = asyncio.run(KegRepository().select_stock_summary("com1"))
+
+        self.assertEqual([row.beer_type_name for row in summary], ["IPA", "Pale Ale"])
+        ipa_row, pale_ale_row = summary
+        self.assertEqual(ipa_row.kegs, 1)
+        self.assertEqual(ipa_row.current_volume_l, Decimal("0.00"))
+        self.assertEqual(pale_ale_row.kegs, 3)
+        self.assertEqual(pale_ale_row.size_l, 130)
+        self.assertEqual(pale_ale_row.current_volume_l, Decimal("92.50"))
+        self.assertEqual(
+            [(s.status, s.kegs, s.size_l, s.current_volume_l) for s in pale_ale_row.statuses],
+            [
+                (KegStatus.AVAILABLE, 2, 80, Decimal("80.00")),
+                (KegStatus.IN_USE, 1, 50, Decimal("12.50")),
+            ],
+        )
+
+    def test_select_stock_summary_uses_covering_index(self):
+        plan = plan_query(
+            KegModel,
+            {"company_id": "com1", "is_active": True},
+            [("status", 1), ("beer_type_id", 1)],
+        )
+        self.assertEqual(
+            plan.index,
+            "company_id_1_is_active_1_status_1_beer_type_id_1_size_l_1_current_volume_l_1",
+        )
+        self.assertTrue(plan.covers_sort)
+
     def test_update_keg(self):
         doc = KegModel(**self._build_keg().model_dump(), company_id="com1")
         doc.save()
@@ -98,11 +154,86 @@ class TestKegRepository(unittest.TestCase):
         self.assertEqual(result.id, doc.id)
         self.assertFalse(KegModel.objects(id=doc.id).first().is_active)
 
+    def test_delete_keg_written_meanwhile_is_a_conflict(self):
+        doc = KegModel(**self._build_keg().model_dump(), company_id="com1")
+        doc.save()
+        soft_delete = KegModel.soft_delete
+
+        def concurrent_write(model):
+            KegModel.objects(id=doc.id).update(set__lot="L2", inc__version=1)
+            soft_delete(model)
+
+        with patch.object(KegModel, "soft_delete", concurrent_write):
+            with self.assertRaises(ConflictError):
+                asyncio.run(KegRepository().delete_by_id(doc.id, doc.company_id))
+        self.assertTrue(KegModel.objects(id=doc.id).first().is_active)
+
     def test_delete_keg_not_found(self):
         repository = KegRepository()
         with self.assertRaises(NotFoundError):
             asyncio.run(repository.delete_by_id("invalid", "com1"))
 
 
+def _stages(plan, winning: bool = False) -> List[dict]:
+    """Stages of the winning plans nested anywhere in an ``explain`` output."""
+    if isinstance(plan, list):
+        return [stage for item in plan for stage in _stages(item, winning)]
+    if not isinstance(plan, dict):
+        return []
+    own = [plan] if winning and "stage" in plan else []
+    return own + [
+        stage
+        for key, value in plan.items()
+        if key != "rejectedPlans"
+        for stage in _stages(value, winning or key == "winningPlan")
+    ]
+
+
+@unittest.skipUnless(
+    os.environ.get("MONGODB_TEST_URL"), "needs a MongoDB server (MONGODB_TEST_URL)"
+)
+class TestKegStockSummaryPlan(unittest.TestCase):
+    """``mongomock`` has no ``explain``; CI runs this against its MongoDB service."""
+
+    def setUp(self) -> None:
+        connect("barriil_explain_test", host=os.environ["MONGODB_TEST_URL"])
+        KegModel.drop_collection()
+        KegModel.ensure_indexes()
+
+    def tearDown(self) -> None:
+        KegModel.drop_collection()
+        disconnect()
+
+    def test_stock_summary_is_answered_from_the_index_keys(self):
+        for number in range(20):
+            KegModel(
+                number=str(number),
+                size_l=50,
+                beer_type_id="bty1",
+                cost_price_per_l=5.0,
+                current_volume_l=Decimal("10"),
+                status=KegStatus.AVAILABLE.value,
+                company_id="com1",
+            ).save()
+
+        explain = KegModel._get_db().command(
+            "explain",
+            {
+                "aggregate": KegModel._get_collection_name(),
+                "pipeline": stock_summary_pipeline("com1"),
+                "cursor": {},
+            },
+            verbosity="queryPlanner",
+        )
+        stages = _stages(explain)
+
+        self.assertIn(
+            "company_id_1_is_active_1_status_1_beer_type_id_1_size_l_1_current_volume_l_1",
+            [stage.get("indexName") for stage in stages if stage["stage"] == "IXSCAN"],
+        )
+        self.assertNotIn("FETCH", [stage["stage"] for stage in stages])
+        self.assertNotIn("COLLSCAN", [stage["stage"] for stage in stages])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,7 @@ from decimal import Decimal
 import mongomock
 from mongoengine import connect, disconnect
 
+from app.core.db.query_recorder import assert_no_n_plus_one
 from app.crud.customers.models import CustomerModel
 from app.crud.customers.repositories import CustomerRepository
 from app.crud.payments.models import PaymentModel
@@ -112,6 +113,43 @@ class TestPaymentServices(unittest.TestCase):
         self.assertEqual(len(payments), 1)
         self.assertEqual(payments[0].status, PaymentStatus.PENDING)
 
+    def test_search_all_loads_customers_in_batch(self):
+        for index in range(5):
+            customer = CustomerModel(
+                name=f"Customer {index}",
+                document=f"{index}" * 11,
+                company_id="com1",
+            )
+            customer.save(validate=False)
+            ReservationModel(
+                customer_id=str(customer.id),
+                address_id="add1",
+                beer_dispenser_ids=["bsd1"],
+                keg_ids=["keg1"],
+                extractor_ids=["ext1"],
+                extraction_kit_ids=["prg1"],
+                cylinder_ids=["cyl1"],
+                freight_value=0,
+                additional_value=0,
+                discount=0,
+                delivery_date=datetime.now(),
+                pickup_date=datetime.now(),
+                payments=[],
+                total_value=Decimal("100.0"),
+                total_cost=Decimal("0.0"),
+                status=ReservationStatus.DELIVERED.value,
+                company_id="com1",
+            ).save()
+
+        with assert_no_n_plus_one():
+            payments = asyncio.run(self.services.search_all(company_id="com1"))
+
+        self.assertEqual(len(payments), 7)
+        self.assertEqual(
+            {payment.customer.name for payment in payments},
+            {"John", "Jane"} | {f"Customer {index}" for index in range(5)},
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
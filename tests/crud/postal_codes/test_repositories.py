@@ -0,0 +1,110 @@
+import asyncio
+import csv
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.db.query_recorder import record_queries
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.postal_codes.loader import load_dataset
+from app.crud.postal_codes.models import PostalCodeModel
+from app.crud.postal_codes.repositories import PostalCodeRepository
+from app.crud.postal_codes.schemas import PostalCode, PostalCodeSource
+
+
+class TestPostalCodeRepository(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        PostalCodeModel.drop_collection()
+        PostalCodeRepository.clear_local_cache()
+        self.repository = PostalCodeRepository()
+
+    def tearDown(self) -> None:
+        PostalCodeRepository.clear_local_cache()
+        disconnect()
+
+    def _postal_code(self, postal_code="89010-000"):
+        return PostalCode(
+            postal_code=postal_code,
+            street="Rua XV de Novembro",
+            district="Centro",
+            city="Blumenau",
+            state="SC",
+        )
+
+    def test_upsert_then_select_is_served_locally(self):
+        asyncio.run(self.repository.upsert(self._postal_code(), timedelta(days=1)))
+
+        with record_queries() as recorder:
+            result = asyncio.run(PostalCodeRepository().select_by_key("89010000"))
+
+        self.assertEqual(result.city, "Blumenau")
+        self.assertEqual(result.source, PostalCodeSource.VIACEP)
+        self.assertEqual(recorder.queries, [])
+
+    def test_select_reads_store_when_not_local(self):
+        asyncio.run(self.repository.upsert(self._postal_code(), timedelta(days=1)))
+        PostalCodeRepository.clear_local_cache()
+
+        with record_queries() as recorder:
+            first = asyncio.run(self.repository.select_by_key("89010000"))
+            second = asyncio.run(self.repository.select_by_key("89010000"))
+
+        self.assertEqual(first.to_postal_code().postal_code, "89010-000")
+        self.assertEqual(second.id, first.id)
+        self.assertEqual(len(recorder.queries), 1)
+
+    def test_expired_entries_are_ignored(self):
+        PostalCodeModel(
+            id="89010000",
+            city="Blumenau",
+            source=PostalCodeSource.VIACEP.value,
+            expires_at=UTCDateTime.now() - timedelta(minutes=1),
+        ).save()
+
+        self.assertIsNone(asyncio.run(self.repository.select_by_key("89010000")))
+
+    def test_select_nearby_uses_sector(self):
+        asyncio.run(self.repository.upsert(self._postal_code("89010-100")))
+
+        nearby = asyncio.run(self.repository.select_nearby("89010999"))
+        self.assertEqual(nearby.city, "Blumenau")
+        self.assertIsNone(asyncio.run(self.repository.select_nearby("01001000")))
+
+    def test_load_dataset_upserts_rows_without_expiry(self):
+        asyncio.run(
+            self.repository.upsert(
+                PostalCode(postal_code="89010-000", found=False), timedelta(hours=1)
+            )
+        )
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="") as file:
+            writer = csv.DictWriter(
+                file, fieldnames=["cep", "logradouro", "complemento", "bairro", "localidade", "uf"]
+            )
+            writer.writeheader()
+            writer.writerow({"cep": "89010-000", "logradouro": "Rua XV", "bairro": "Centro", "localidade": "Blumenau", "uf": "SC"})
+            writer.writerow({"cep": "01001000", "logradouro": "Praça da Sé", "bairro": "Sé", "localidade": "São Paulo", "uf": "SP"})
+            writer.writerow({"cep": "89010000", "logradouro": "Rua XV", "bairro": "Centro", "localidade": "Blumenau", "uf": "SC"})
+            writer.writerow({"cep": "invalid", "localidade": "Nowhere", "uf": "XX"})
+        self.addCleanup(os.remove, file.name)
+
+        self.assertEqual(load_dataset(file.name), 2)
+
+        PostalCodeRepository.clear_local_cache()
+        loaded = asyncio.run(self.repository.select_by_key("89010000"))
+        self.assertTrue(loaded.found)
+        self.assertEqual(loaded.source, PostalCodeSource.DATASET)
+        self.assertIsNone(loaded.expires_at)
+        self.assertEqual(PostalCodeModel.objects.count(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
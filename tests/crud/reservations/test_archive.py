@@ -0,0 +1,167 @@
+import asyncio
+import unittest
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.db.tiering import move_documents
+from app.core.exceptions import NotFoundError
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.payments.models import PaymentModel, generate_payment_id
+from app.crud.payments.schemas import Payment
+from app.crud.reservations.archive import (
+    ReservationArchive,
+    archive_collection_name,
+)
+from app.crud.reservations.models import ReservationModel
+from app.crud.reservations.repositories import ReservationRepository
+from app.crud.reservations.schemas import ReservationStatus
+
+
+class TestReservationArchive(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        ReservationModel.drop_collection()
+        self.archive = ReservationArchive()
+        self.db = ReservationModel._get_db()
+        for year in self.archive.years():
+            self.db.drop_collection(archive_collection_name(year))
+        self.repository = ReservationRepository(archive=self.archive)
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def _reservation(
+        self,
+        delivery: datetime,
+        status: ReservationStatus = ReservationStatus.COMPLETED,
+        paid: str = "100.00",
+        company_id: str = "com1",
+    ) -> ReservationModel:
+        reservation = ReservationModel(
+            customer_id="cus1",
+            address_id="add1",
+            beer_dispenser_ids=["bdi1"],
+            keg_ids=["keg1"],
+            extractor_ids=["ext1"],
+            extraction_kit_ids=["exk1"],
+            cylinder_ids=["cyl1"],
+            delivery_date=delivery,
+            pickup_date=delivery + timedelta(days=1),
+            payments=[
+                PaymentModel(
+                    id=generate_payment_id(),
+                    amount=Decimal(paid),
+                    method="cash",
+                    paid_at=date(2020, 1, 1),
+                )
+            ],
+            total_value=Decimal("100.00"),
+            status=status.value,
+            company_id=company_id,
+        )
+        reservation.save()
+        return reservation
+
+    def test_moves_old_paid_completed_reservations_by_year(self):
+        old = self._reservation(datetime(2022, 5, 1))
+        older = self._reservation(datetime(2021, 5, 1))
+        unpaid = self._reservation(datetime(2022, 6, 1), paid="10.00")
+        open_ = self._reservation(datetime(2022, 7, 1), status=ReservationStatus.TO_PICKUP)
+        recent = self._reservation(datetime.now() - timedelta(days=2))
+
+        moved = self.archive.archive(older_than=datetime(2023, 1, 1), batch_size=2)
+
+        self.assertEqual(moved, 2)
+        self.assertEqual(self.archive.years(), [2021, 2022])
+        self.assertEqual(
+            sorted(ReservationModel.objects.scalar("id")),
+            sorted([unpaid.id, open_.id, recent.id]),
+        )
+        self.assertEqual(
+            self.db[archive_collection_name(2022)].find_one()["_id"], old.id
+        )
+        self.assertEqual(
+            self.db[archive_collection_name(2021)].find_one()["_id"], older.id
+        )
+        self.assertEqual(self.archive.archive(older_than=datetime(2023, 1, 1)), 0)
+
+    def test_rerun_after_a_partial_move_does_not_duplicate(self):
+        reservation = self._reservation(datetime(2022, 5, 1))
+        cold = self.archive.collection(2022)
+        cold.insert_one(ReservationModel._get_collection().find_one())
+
+        self.assertEqual(self.archive.archive(older_than=datetime(2023, 1, 1)), 1)
+        self.assertEqual(cold.count_documents({"_id": reservation.id}), 1)
+
+    def test_payment_edited_during_the_move_stays_in_the_hot_tier(self):
+        reservation = self._reservation(datetime(2022, 5, 1))
+        hot = ReservationModel._get_collection()
+        cold = self.archive.collection(2022)
+        batch = list(hot.find({"_id": reservation.id}))
+
+        asyncio.run(
+            self.repository.update_payment(
+                reservation.id,
+                "com1",
+                reservation.payments[0].id,
+                Payment(amount=Decimal("90.00"), method="pix", paid_at=date(2020, 1, 2)),
+            )
+        )
+
+        self.assertEqual(move_documents(hot, cold, batch), 0)
+        self.assertEqual(cold.count_documents({"_id": reservation.id}), 0)
+        self.assertEqual(hot.find_one({"_id": reservation.id})["payments"][0]["amount"], 90.0)
+
+    def test_dated_listing_unions_the_archive_years_in_range(self):
+        archived = self._reservation(datetime(2022, 5, 1))
+        self._reservation(datetime(2021, 5, 1))
+        hot = self._reservation(datetime(2022, 6, 1), status=ReservationStatus.TO_PICKUP)
+        self._reservation(datetime(2022, 5, 2), company_id="com2")
+        self.archive.archive(older_than=datetime(2023, 1, 1))
+
+        reservations = asyncio.run(
+            self.repository.select_all(
+                "com1",
+                start_date=UTCDateTime(2022, 1, 1),
+                end_date=UTCDateTime(2022, 12, 31),
+            )
+        )
+        self.assertEqual([r.id for r in reservations], [archived.id, hot.id])
+
+        undated = asyncio.run(self.repository.select_all("com1"))
+        self.assertEqual([r.id for r in undated], [hot.id])
+
+        not_completed = asyncio.run(
+            self.repository.select_all(
+                "com1",
+                start_date=UTCDateTime(2022, 1, 1),
+                status=ReservationStatus.TO_PICKUP.value,
+            )
+        )
+        self.assertEqual([r.id for r in not_completed], [hot.id])
+
+    def test_select_by_id_falls_back_to_the_archive(self):
+        archived = self._reservation(datetime(2022, 5, 1))
+        self.archive.archive(older_than=datetime(2023, 1, 1))
+
+        reservation = asyncio.run(self.repository.select_by_id(archived.id, "com1"))
+
+        self.assertEqual(reservation.id, archived.id)
+        self.assertEqual(reservation.payments[0].amount, Decimal("100.00"))
+        with self.assertRaises(NotFoundError):
+            asyncio.run(self.repository.select_by_id(archived.id, "com2"))
+
+    def test_future_ranges_skip_the_archive(self):
+        self._reservation(datetime(2022, 5, 1))
+        self.archive.archive(older_than=datetime(2023, 1, 1))
+
+        self.assertEqual(self.archive.years_between(UTCDateTime.now()), [])
+        self.assertEqual(self.archive.years_between(UTCDateTime(2023, 1, 1)), [])
+        self.assertEqual(self.archive.years_between(end=UTCDateTime(2022, 1, 1)), [2022])
@@ -1,5 +1,6 @@
 import asyncio
 import unittest
+from unittest.mock import patch
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 
@@ -14,7 +15,9 @@ from app.crud.extraction_kits.models import ExtractionKitModel
 from app.crud.extraction_kits.schemas import ExtractionKitStatus, ExtractionKitType
 from app.crud.kegs.models import KegModel
 from app.crud.kegs.schemas import KegStatus
+from app.core.exceptions import ConflictError, NotFoundError
 from app.crud.payments.schemas import Payment
+from app.crud.reservations.models import ReservationModel
 from app.crud.reservations.repositories import ReservationRepository
 from app.crud.reservations.schemas import ReservationCreate, ReservationStatus
 
@@ -105,17 +108,231 @@ class TestReservationRepository(unittest.TestCase):
         )
         res = asyncio.run(self.repository.create(reservation, self.company_id))
         pay = Payment(amount=Decimal("50.00"), method="cash", paid_at=date.today())
+        asyncio.run(self.repository.add_payment(res.id, self.company_id, pay))
         updated = asyncio.run(self.repository.add_payment(res.id, self.company_id, pay))
-        self.assertEqual(len(updated.payments), 1)
+        self.assertEqual(len(updated.payments), 2)
+        first_id, second_id = (payment.id for payment in updated.payments)
+        self.assertNotEqual(first_id, second_id)
+
         new_pay = Payment(amount=Decimal("60.00"), method="card", paid_at=date.today())
         updated = asyncio.run(
-            self.repository.update_payment(res.id, self.company_id, 0, new_pay)
+            self.repository.update_payment(res.id, self.company_id, second_id, new_pay)
+        )
+        self.assertEqual(
+            [(p.id, p.amount) for p in updated.payments],
+            [(first_id, Decimal("50.00")), (second_id, Decimal("60.00"))],
         )
-        self.assertEqual(updated.payments[0].amount, Decimal("60.00"))
+
         updated = asyncio.run(
-            self.repository.delete_payment(res.id, self.company_id, 0)
+            self.repository.delete_payment(res.id, self.company_id, first_id)
+        )
+        self.assertEqual([p.id for p in updated.payments], [second_id])
+
+        for call in (
+            lambda: self.repository.update_payment(res.id, self.company_id, first_id, new_pay),
+            lambda: self.repository.delete_payment(res.id, self.company_id, first_id),
+            lambda: self.repository.add_payment("res_missing", self.company_id, pay),
+        ):
+            with self.assertRaises(NotFoundError):
+                asyncio.run(call())
+
+    def test_payment_edit_bumps_the_version(self):
+        pay = Payment(amount=Decimal("50.00"), method="cash", paid_at=date.today())
+        reservation = ReservationCreate(
+            customer_id="cus1",
+            address_id="add2",
+            beer_dispenser_ids=[str(self.dispenser.id)],
+            keg_ids=[str(self.keg.id)],
+            extraction_kit_ids=[str(self.pg.id)],
+            cylinder_ids=[str(self.cylinder.id)],
+            freight_value=Decimal("0"),
+            additional_value=Decimal("0"),
+            discount=Decimal("0"),
+            delivery_date=datetime.now() + timedelta(days=1),
+            pickup_date=datetime.now() + timedelta(days=2),
+            payments=[pay],
+            total_value=Decimal("400.00"),
+            total_cost=Decimal("250.00"),
+            status=ReservationStatus.RESERVED,
+        )
+        res = asyncio.run(self.repository.create(reservation, self.company_id))
+        new_pay = Payment(amount=Decimal("60.00"), method="card", paid_at=date.today())
+
+        updated = asyncio.run(
+            self.repository.update_payment(
+                res.id, self.company_id, res.payments[0].id, new_pay
+            )
+        )
+
+        self.assertEqual(updated.version, res.version + 1)
+        with self.assertRaises(ConflictError):
+            asyncio.run(
+                self.repository.update(
+                    res.id,
+                    self.company_id,
+                    {"payments": [pay.model_dump()]},
+                    version=res.version,
+                )
+            )
+        stored = asyncio.run(self.repository.select_by_id(res.id, self.company_id))
+        self.assertEqual(stored.payments[0].amount, Decimal("60.00"))
+
+    def test_select_all_returns_reservations_with_payments(self):
+        reservation = ReservationCreate(
+            customer_id="cus1",
+            address_id="add2",
+            beer_dispenser_ids=[str(self.dispenser.id)],
+            keg_ids=[str(self.keg.id)],
+            extraction_kit_ids=[str(self.pg.id)],
+            cylinder_ids=[str(self.cylinder.id)],
+            freight_value=Decimal("10.50"),
+            additional_value=Decimal("0"),
+            discount=Decimal("0"),
+            delivery_date=datetime.now() + timedelta(days=1),
+            pickup_date=datetime.now() + timedelta(days=2),
+            payments=[
+                Payment(amount=Decimal("50.00"), method="cash", paid_at=date.today())
+            ],
+            total_value=Decimal("400.00"),
+            total_cost=Decimal("250.00"),
+            status=ReservationStatus.RESERVED,
         )
-        self.assertEqual(len(updated.payments), 0)
+        created = asyncio.run(self.repository.create(reservation, self.company_id))
+        result = asyncio.run(self.repository.select_all(self.company_id))
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].id, created.id)
+        self.assertEqual(result[0].freight_value, Decimal("10.50"))
+        self.assertEqual(result[0].payments[0].amount, Decimal("50.00"))
+        self.assertEqual(result[0].payments[0].paid_at, date.today())
+        self.assertEqual(result[0].delivery_date, created.delivery_date)
+
+    def test_select_all_updates_overdue_status(self):
+        reservation = ReservationCreate(
+            customer_id="cus1",
+            address_id="add2",
+            beer_dispenser_ids=[str(self.dispenser.id)],
+            keg_ids=[str(self.keg.id)],
+            extraction_kit_ids=[str(self.pg.id)],
+            cylinder_ids=[str(self.cylinder.id)],
+            freight_value=Decimal("0"),
+            additional_value=Decimal("0"),
+            discount=Decimal("0"),
+            delivery_date=datetime.now() - timedelta(hours=1),
+            pickup_date=datetime.now() + timedelta(days=1),
+            payments=[],
+            total_value=Decimal("400.00"),
+            total_cost=Decimal("250.00"),
+            status=ReservationStatus.RESERVED,
+        )
+        created = asyncio.run(self.repository.create(reservation, self.company_id))
+        result = asyncio.run(self.repository.select_all(self.company_id))
+        self.assertEqual(result[0].status, ReservationStatus.TO_DELIVER)
+        stored = asyncio.run(self.repository.select_by_id(created.id, self.company_id))
+        self.assertEqual(stored.status, ReservationStatus.TO_DELIVER)
+        self.assertEqual(stored.version, created.version + 1)
+
+    def test_status_update_does_not_overwrite_a_concurrent_change(self):
+        reservation = ReservationCreate(
+            customer_id="cus1",
+            address_id="add2",
+            beer_dispenser_ids=[str(self.dispenser.id)],
+            keg_ids=[str(self.keg.id)],
+            extraction_kit_ids=[str(self.pg.id)],
+            cylinder_ids=[str(self.cylinder.id)],
+            freight_value=Decimal("0"),
+            additional_value=Decimal("0"),
+            discount=Decimal("0"),
+            delivery_date=datetime.now() - timedelta(hours=1),
+            pickup_date=datetime.now() + timedelta(days=1),
+            payments=[],
+            total_value=Decimal("400.00"),
+            total_cost=Decimal("250.00"),
+            status=ReservationStatus.RESERVED,
+        )
+        created = asyncio.run(self.repository.create(reservation, self.company_id))
+        stale = created.model_dump()
+        stale["status"] = ReservationStatus.RESERVED.value
+        asyncio.run(
+            self.repository.update(
+                created.id,
+                self.company_id,
+                {"status": ReservationStatus.DELIVERED.value},
+            )
+        )
+
+        self.repository._auto_update_status_rows([stale])
+
+        stored = asyncio.run(self.repository.select_by_id(created.id, self.company_id))
+        self.assertEqual(stored.status, ReservationStatus.DELIVERED)
+        self.assertEqual(stored.version, created.version + 1)
+
+    def test_rows_written_during_the_status_update_are_read_back(self):
+        reservation = ReservationCreate(
+            customer_id="cus1",
+            address_id="add2",
+            beer_dispenser_ids=[str(self.dispenser.id)],
+            keg_ids=[str(self.keg.id)],
+            extraction_kit_ids=[str(self.pg.id)],
+            cylinder_ids=[str(self.cylinder.id)],
+            freight_value=Decimal("0"),
+            additional_value=Decimal("0"),
+            discount=Decimal("0"),
+            delivery_date=datetime.now() - timedelta(hours=1),
+            pickup_date=datetime.now() + timedelta(days=1),
+            payments=[],
+            total_value=Decimal("400.00"),
+            total_cost=Decimal("250.00"),
+            status=ReservationStatus.RESERVED,
+        )
+        created = asyncio.run(self.repository.create(reservation, self.company_id))
+        row = created.model_dump()
+        versioned_set = ReservationRepository.versioned_set
+
+        def after_a_concurrent_edit(model, **fields):
+            ReservationModel.objects(id=created.id).update(
+                set__discount=Decimal("5.00"), inc__version=1
+            )
+            return versioned_set(model, **fields)
+
+        with patch.object(
+            ReservationRepository, "versioned_set", staticmethod(after_a_concurrent_edit)
+        ):
+            self.repository._auto_update_status_rows([row])
+
+        self.assertEqual(row["status"], ReservationStatus.RESERVED.value)
+        self.assertEqual(row["version"], created.version + 1)
+        stored = ReservationModel.objects.get(id=created.id)
+        self.assertEqual(stored.status, ReservationStatus.RESERVED.value)
+
+    def test_status_update_is_decided_from_the_primary(self):
+        reservation = ReservationCreate(
+            customer_id="cus1",
+            address_id="add2",
+            beer_dispenser_ids=[str(self.dispenser.id)],
+            keg_ids=[str(self.keg.id)],
+            extraction_kit_ids=[str(self.pg.id)],
+            cylinder_ids=[str(self.cylinder.id)],
+            freight_value=Decimal("0"),
+            additional_value=Decimal("0"),
+            discount=Decimal("0"),
+            delivery_date=datetime.now() - timedelta(days=2),
+            pickup_date=datetime.now() - timedelta(days=1),
+            payments=[],
+            total_value=Decimal("400.00"),
+            total_cost=Decimal("250.00"),
+            status=ReservationStatus.COMPLETED,
+        )
+        created = asyncio.run(self.repository.create(reservation, self.company_id))
+        # As a lagging secondary would still return it.
+        stale = created.model_dump()
+        stale["status"] = ReservationStatus.TO_DELIVER.value
+
+        self.repository._auto_update_status_rows([stale])
+
+        self.assertEqual(stale["status"], ReservationStatus.COMPLETED.value)
+        self.assertEqual(stale["version"], created.version)
+        stored = asyncio.run(self.repository.select_by_id(created.id, self.company_id))
+        self.assertEqual(stored.status, ReservationStatus.COMPLETED)
 
     def test_find_active_by_beer_dispenser_id_within_period(self):
         reservation = ReservationCreate(
@@ -6,6 +6,7 @@ from decimal import Decimal
 import mongomock
 from mongoengine import connect, disconnect
 
+from app.core.db.query_recorder import assert_no_n_plus_one
 from app.core.exceptions import BadRequestError
 from app.crud.beer_dispensers.models import BeerDispenserModel
 from app.crud.beer_dispensers.schemas import DispenserStatus, Voltage
@@ -115,6 +116,55 @@ class TestReservationServices(unittest.TestCase):
         dispenser = BeerDispenserModel.objects(id=self.dispenser.id).first()
         self.assertEqual(dispenser.status, DispenserStatus.ACTIVE.value)
 
+    def test_create_loads_kegs_and_cylinders_in_batch(self):
+        kegs = [self.keg]
+        cylinders = [self.cylinder]
+        for number in range(2, 6):
+            keg = KegModel(
+                number=str(number),
+                size_l=50,
+                beer_type_id="bty1",
+                cost_price_per_l=5.0,
+                sale_price_per_l=8.0,
+                status=KegStatus.AVAILABLE.value,
+                company_id=self.company_id,
+            )
+            keg.save()
+            kegs.append(keg)
+            cylinder = CylinderModel(
+                brand="Acme",
+                weight_kg=10,
+                number=f"C{number}",
+                status=CylinderStatus.AVAILABLE.value,
+                company_id=self.company_id,
+            )
+            cylinder.save()
+            cylinders.append(cylinder)
+
+        reservation = Reservation(
+            customer_id="cus1",
+            address_id="add2",
+            beer_dispenser_ids=[str(self.dispenser.id)],
+            keg_ids=[str(keg.id) for keg in kegs],
+            extraction_kit_ids=[str(self.pg.id)],
+            cylinder_ids=[str(cylinder.id) for cylinder in cylinders],
+            freight_value=Decimal("0"),
+            additional_value=Decimal("0"),
+            discount=Decimal("0"),
+            delivery_date=datetime.now() + timedelta(days=1),
+            pickup_date=datetime.now() + timedelta(days=2),
+            payments=[],
+        )
+
+        with assert_no_n_plus_one():
+            res = asyncio.run(self.services.create(reservation, self.company_id))
+
+        self.assertEqual(res.total_value, Decimal("2000.00"))
+        self.assertEqual(
+            {keg.status for keg in KegModel.objects(id__in=res.keg_ids)},
+            {KegStatus.IN_USE.value},
+        )
+
     def test_create_reservation_conflict(self):
         reservation = Reservation(
             customer_id="cus1",
@@ -395,11 +445,14 @@ class TestReservationServices(unittest.TestCase):
         updated = asyncio.run(self.services.add_payment(res.id, self.company_id, pay))
         self.assertEqual(len(updated.payments), 1)
         new_pay = Payment(amount=Decimal("60.00"), method="card", paid_at=date.today())
+        payment_id = updated.payments[0].id
         updated = asyncio.run(
-            self.services.update_payment(res.id, self.company_id, 0, new_pay)
+            self.services.update_payment(res.id, self.company_id, payment_id, new_pay)
         )
         self.assertEqual(updated.payments[0].amount, Decimal("60.00"))
-        updated = asyncio.run(self.services.delete_payment(res.id, self.company_id, 0))
+        updated = asyncio.run(
+            self.services.delete_payment(res.id, self.company_id, payment_id)
+        )
         self.assertEqual(len(updated.payments), 0)
 
     def test_total_value_with_charges(self):
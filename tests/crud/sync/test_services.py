@@ -0,0 +1,165 @@
+import asyncio
+import unittest
+from datetime import timedelta
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.configs import get_environment
+from app.core.db.retention import compact_tombstones, graveyard
+from app.core.exceptions import BadRequestError
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.beer_types.models import BeerTypeModel
+from app.crud.cylinders.models import CylinderModel
+from app.crud.cylinders.schemas import CylinderStatus
+from app.crud.kegs.models import KegModel
+from app.crud.kegs.schemas import KegStatus
+from app.crud.sync.repositories import SyncRepository
+from app.crud.sync.services import SyncServices
+
+_env = get_environment()
+
+
+class TestSyncServices(unittest.TestCase):
+    def setUp(self) -> None:
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        self.services = SyncServices(SyncRepository())
+        self.beer_type = BeerTypeModel(name="Pale Ale", company_id="com1")
+        self.beer_type.save()
+
+    def tearDown(self) -> None:
+        disconnect()
+
+    def _create_keg(self, number: str, company_id: str = "com1") -> KegModel:
+        keg = KegModel(
+            number=number,
+            size_l=50,
+            beer_type_id=str(self.beer_type.id),
+            cost_price_per_l=5.0,
+            status=KegStatus.AVAILABLE.value,
+            company_id=company_id,
+        )
+        keg.save()
+        return keg
+
+    def test_full_sync_without_cursor(self):
+        self._create_keg("1")
+        CylinderModel(
+            brand="Acme",
+            weight_kg=10,
+            number="C1",
+            status=CylinderStatus.AVAILABLE.value,
+            company_id="com1",
+        ).save()
+        self._create_keg("2", company_id="com2")
+
+        changes = asyncio.run(self.services.search_changes(company_id="com1"))
+
+        self.assertEqual(len(changes.kegs), 1)
+        self.assertEqual(len(changes.cylinders), 1)
+        self.assertEqual(len(changes.beer_types), 1)
+        self.assertEqual(changes.deleted, [])
+        self.assertIsNotNone(changes.cursor)
+
+    def test_sync_returns_only_changes_after_cursor(self):
+        old = self._create_keg("1")
+        KegModel.objects(id=old.id).update(
+            set__updated_at=UTCDateTime.now() - timedelta(days=2)
+        )
+        recent = self._create_keg("2")
+
+        since = UTCDateTime.now() - timedelta(days=1)
+        changes = asyncio.run(
+            self.services.search_changes(company_id="com1", since=since)
+        )
+
+        self.assertEqual([keg.id for keg in changes.kegs], [recent.id])
+
+    def test_sync_returns_tombstones_for_soft_deleted(self):
+        keg = self._create_keg("1")
+        keg.soft_delete()
+        keg.save()
+
+        changes = asyncio.run(self.services.search_changes(company_id="com1"))
+
+        self.assertEqual(changes.kegs, [])
+        self.assertEqual(len(changes.deleted), 1)
+        self.assertEqual(changes.deleted[0].collection, "kegs")
+        self.assertEqual(changes.deleted[0].id, keg.id)
+
+    def test_sync_returns_tombstones_moved_to_the_graveyard(self):
+        graveyard(KegModel).delete_many({})
+        since = UTCDateTime.now() - timedelta(seconds=1)
+        keg = self._create_keg("1")
+        keg.soft_delete()
+        keg.save()
+
+        compact_tombstones(days=-1, models=[KegModel])
+        self.assertEqual(KegModel.objects(id=keg.id).count(), 0)
+
+        changes = asyncio.run(
+            self.services.search_changes(company_id="com1", since=since)
+        )
+        self.assertEqual([tombstone.id for tombstone in changes.deleted], [keg.id])
+
+        first_sync = asyncio.run(self.services.search_changes(company_id="com1"))
+        self.assertEqual(first_sync.deleted, [])
+
+    def test_cursor_trails_the_request_by_the_overlap(self):
+        overlap = timedelta(seconds=_env.SYNC_CURSOR_OVERLAP)
+        before = UTCDateTime.now()
+
+        changes = asyncio.run(self.services.search_changes(company_id="com1"))
+
+        self.assertGreaterEqual(changes.cursor, before - overlap)
+        self.assertLessEqual(changes.cursor, UTCDateTime.now() - overlap)
+        self.assertIsNone(changes.continuation)
+
+    def test_pages_each_collection_with_a_continuation(self):
+        since = UTCDateTime.now() - timedelta(seconds=1)
+        kegs = [self._create_keg(str(number)) for number in range(5)]
+        # Several documents on the same ``updated_at`` are split across pages.
+        KegModel.objects(id__in=[keg.id for keg in kegs[:3]]).update(
+            set__updated_at=UTCDateTime.now()
+        )
+        graveyard(KegModel).delete_many({})
+        dead = self._create_keg("6")
+        dead.soft_delete()
+        dead.save()
+        compact_tombstones(days=-1, models=[KegModel])
+
+        first = asyncio.run(
+            self.services.search_changes(company_id="com1", since=since, limit=2)
+        )
+        self.assertEqual(len(first.kegs), 2)
+        self.assertEqual([tombstone.id for tombstone in first.deleted], [dead.id])
+        self.assertIsNotNone(first.continuation)
+
+        seen = [keg.id for keg in first.kegs]
+        page = first
+        while page.continuation:
+            page = asyncio.run(
+                self.services.search_changes(
+                    company_id="com1", continuation=page.continuation, limit=2
+                )
+            )
+            self.assertEqual(page.cursor, first.cursor)
+            self.assertEqual(page.beer_types, [])
+            self.assertEqual(page.deleted, [])
+            seen.extend(keg.id for keg in page.kegs)
+
+        self.assertEqual(sorted(seen), sorted(keg.id for keg in kegs))
+
+    def test_rejects_an_invalid_continuation(self):
+        with self.assertRaises(BadRequestError):
+            asyncio.run(
+                self.services.search_changes(company_id="com1", continuation="nope")
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
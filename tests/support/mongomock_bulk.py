@@ -0,0 +1,34 @@
+"""
+``bulk_write`` for ``mongomock``.
+
+PyMongo 4.11+ passes a ``sort`` option to every bulk update and replace,
+which ``mongomock`` does not accept yet.  It is always ``None`` for the
+operations this repo builds, so it is dropped before ``mongomock`` sees it.
+"""
+
+from functools import wraps
+
+from mongomock.collection import BulkOperationBuilder
+
+_installed = False
+
+
+def _without_sort(method):
+    @wraps(method)
+    def wrapper(builder, *args, sort=None, **kwargs):
+        if sort is not None:
+            raise NotImplementedError("mongomock does not support sorted bulk writes")
+        return method(builder, *args, **kwargs)
+
+    return wrapper
+
+
+def patch_mongomock_bulk_writes() -> None:
+    """Accept PyMongo's ``sort`` option, once per process."""
+    global _installed
+    if _installed:
+        return
+
+    for name in ("add_update", "add_replace"):
+        setattr(BulkOperationBuilder, name, _without_sort(getattr(BulkOperationBuilder, name)))
+    _installed = True
@@ -0,0 +1,68 @@
+"""
+Query recording for ``mongomock``.
+
+``mongomock`` has no command monitoring, so its collection methods are
+wrapped to feed :func:`app.core.db.query_recorder.active_recorder`, which
+lets tests and benchmarks use :func:`record_queries` unchanged.
+"""
+
+from contextvars import ContextVar
+from functools import wraps
+
+from mongomock.collection import Collection
+
+from app.core.db.query_recorder import active_recorder
+
+_METHODS = (
+    "find",
+    "find_one",
+    "count_documents",
+    "distinct",
+    "aggregate",
+    "insert_one",
+    "insert_many",
+    "update_one",
+    "update_many",
+    "replace_one",
+    "delete_one",
+    "delete_many",
+    "find_one_and_update",
+    "find_one_and_replace",
+    "find_one_and_delete",
+)
+# ``mongomock`` methods call each other (``find_one`` runs ``find``); only
+# the outermost call is a query.
+_nested: ContextVar[bool] = ContextVar("mongomock_query_nested", default=False)
+_installed = False
+
+
+def _record(method):
+    @wraps(method)
+    def wrapper(collection, *args, **kwargs):
+        recorder = active_recorder()
+        if recorder is None or _nested.get():
+            return method(collection, *args, **kwargs)
+
+        query = args[0] if args else kwargs.get("filter", kwargs.get("pipeline"))
+        if method.__name__.startswith("insert") or not isinstance(query, (dict, list)):
+            query = None
+        recorder.record(collection.name, method.__name__, query)
+
+        token = _nested.set(True)
+        try:
+            return method(collection, *args, **kwargs)
+        finally:
+            _nested.reset(token)
+
+    return wrapper
+
+
+def record_mongomock_queries() -> None:
+    """Wrap the ``mongomock`` collection methods, once per process."""
+    global _installed
+    if _installed:
+        return
+
+    for name in _METHODS:
+        setattr(Collection, name, _record(getattr(Collection, name)))
+    _installed = True
@@ -0,0 +1,23 @@
+import unittest
+
+from app.core.configs.environment import Environment
+from main import server_options
+
+
+class TestServerOptions(unittest.TestCase):
+    def test_local_environment_reloads(self):
+        options = server_options(Environment(ENVIRONMENT="local", SERVER_WORKERS=4))
+
+        self.assertTrue(options["reload"])
+        self.assertNotIn("workers", options)
+
+    def test_production_uses_workers_and_proxy_timeouts(self):
+        options = server_options(
+            Environment(ENVIRONMENT="production", SERVER_WORKERS=2, SERVER_LOOP="uvloop")
+        )
+
+        self.assertEqual(options["workers"], 2)
+        self.assertEqual(options["loop"], "uvloop")
+        self.assertNotIn("reload", options)
+        self.assertGreater(options["timeout_keep_alive"], 60)
+        self.assertTrue(options["proxy_headers"])